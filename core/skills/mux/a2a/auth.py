@@ -8,6 +8,19 @@ A2A Authentication Layer.
 Supports bearer token authentication for A2A requests.
 Tokens are validated against environment variable or config file.
 
+Tokens are held by a TokenStore as SHA-256 digests in a dict, so a request
+costs one hash and one lookup instead of a file read and a linear scan. The
+store reloads when A2A_BEARER_TOKENS changes, when the tokens file's
+mtime/size/inode changes (one stat per request), or after SIGHUP.
+
+Token file lines may carry optional fields after the token:
+    <token> [scopes=tasks:read,tasks:write,artifacts:read] [rate=<requests/s>]
+Without scopes a token may call every method; with rate, requests beyond
+that rate (burst of the same size) are rejected as rate limited.
+
+Per-request overhead, token store vs. the old read-and-scan path:
+    uv run auth.py bench --iterations 10000 --tokens 50
+
 SECURITY WARNING:
 - Production deployments MUST configure tokens via A2A_BEARER_TOKENS env var or .a2a/tokens file
 - Dev mode bypass (AGENTIC_MUX_DEV_MODE=true) allows ANY token - NEVER use in production
@@ -17,13 +30,173 @@ SECURITY WARNING:
 from __future__ import annotations
 
 import hashlib
-import hmac
 import logging
 import os
+import signal
+import threading
+import time
+from dataclasses import dataclass
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+TOKENS_FILE = Path(".a2a/tokens")
+TOKENS_ENV = "A2A_BEARER_TOKENS"
+SCOPES = ("tasks:read", "tasks:write", "artifacts:read")
+
+# authenticate() outcomes
+AUTH_OK = "ok"
+AUTH_UNAUTHORIZED = "unauthorized"
+AUTH_FORBIDDEN = "forbidden"
+AUTH_RATE_LIMITED = "rate_limited"
+
+
+@dataclass
+class TokenPolicy:
+    """Scopes and rate limit of one configured token."""
+
+    scopes: frozenset[str] | None = None  # None: all scopes
+    rate: float | None = None  # requests per second; None: unlimited
+
+
+def _parse_token_line(line: str) -> tuple[str, TokenPolicy] | None:
+    """Parse '<token> [scopes=a,b] [rate=N]'; None for blanks and comments."""
+    fields = line.split()
+    if not fields or fields[0].startswith("#"):
+        return None
+    policy = TokenPolicy()
+    for field in fields[1:]:
+        key, _, value = field.partition("=")
+        if key == "scopes":
+            policy.scopes = frozenset(s for s in value.split(",") if s)
+        elif key == "rate":
+            try:
+                policy.rate = float(value)
+            except ValueError:
+                logger.warning("Ignoring invalid rate for token in %s: %s", TOKENS_FILE, value)
+    return fields[0], policy
+
+
+def _digest(token: str) -> bytes:
+    return hashlib.sha256(token.encode()).digest()
+
+
+def _dev_mode() -> bool:
+    return os.environ.get("AGENTIC_MUX_DEV_MODE", "").lower() in {"true", "1", "yes"}
+
+
+class TokenStore:
+    """Configured tokens as SHA-256 digests, reloaded when their sources change.
+
+    Lookups hash the presented token and probe a dict, so their timing does
+    not depend on how much of a configured token was guessed.
+
+    Args:
+        tokens_file: Tokens file (relative paths follow the working directory)
+        env_var: Environment variable with comma-separated tokens
+    """
+
+    def __init__(self, tokens_file: Path = TOKENS_FILE, env_var: str = TOKENS_ENV) -> None:
+        self.tokens_file = tokens_file
+        self.env_var = env_var
+        self.tokens: dict[bytes, TokenPolicy] = {}
+        self.loads = 0
+        self._signature: tuple | None = None
+        self._force_reload = True
+        self._buckets: dict[bytes, tuple[float, float]] = {}  # digest -> (tokens, last refill)
+        self._lock = threading.Lock()
+
+    def _current_signature(self) -> tuple:
+        try:
+            st = self.tokens_file.stat()
+            file_sig = (st.st_mtime_ns, st.st_size, st.st_ino, st.st_dev)
+        except OSError:
+            file_sig = None
+        return (os.environ.get(self.env_var, ""), file_sig)
+
+    def reload(self) -> None:
+        """Reload on the next lookup (e.g. from a SIGHUP handler)."""
+        self._force_reload = True
+
+    def _refresh(self) -> None:
+        signature = self._current_signature()
+        if signature == self._signature and not self._force_reload:
+            return
+        tokens: dict[bytes, TokenPolicy] = {}
+        env_tokens, _ = signature
+        for token in env_tokens.split(","):
+            if token.strip():
+                tokens[_digest(token.strip())] = TokenPolicy()
+        try:
+            lines = self.tokens_file.read_text().splitlines()
+        except OSError:
+            lines = []
+        for line in lines:
+            parsed = _parse_token_line(line)
+            if parsed:
+                tokens[_digest(parsed[0])] = parsed[1]
+        with self._lock:
+            self.tokens = tokens
+            self._signature = signature
+            self._force_reload = False
+            self._buckets = {d: b for d, b in self._buckets.items() if d in tokens}
+            self.loads += 1
+
+    def authenticate(self, token: str, scope: str | None = None) -> str:
+        """Check a bearer token (without the 'Bearer ' prefix).
+
+        Returns:
+            AUTH_OK, AUTH_UNAUTHORIZED, AUTH_FORBIDDEN (missing scope) or
+            AUTH_RATE_LIMITED
+        """
+        self._refresh()
+        digest = _digest(token)
+        policy = self.tokens.get(digest)
+        if policy is None:
+            return AUTH_UNAUTHORIZED
+        if scope is not None and policy.scopes is not None and scope not in policy.scopes:
+            return AUTH_FORBIDDEN
+        if policy.rate is not None and not self._take(digest, policy.rate):
+            return AUTH_RATE_LIMITED
+        return AUTH_OK
+
+    def authorize(self, token: str, scope: str) -> str:
+        """Check only that a token holds a scope (no rate limit is consumed).
+
+        Returns:
+            AUTH_OK, AUTH_UNAUTHORIZED or AUTH_FORBIDDEN
+        """
+        self._refresh()
+        policy = self.tokens.get(_digest(token))
+        if policy is None:
+            return AUTH_UNAUTHORIZED
+        if policy.scopes is not None and scope not in policy.scopes:
+            return AUTH_FORBIDDEN
+        return AUTH_OK
+
+    def _take(self, digest: bytes, rate: float) -> bool:
+        """Token bucket: capacity max(1, rate), refilled at rate per second."""
+        capacity = max(1.0, rate)
+        now = time.monotonic()
+        with self._lock:
+            available, last = self._buckets.get(digest, (capacity, now))
+            available = min(capacity, available + (now - last) * rate)
+            if available < 1.0:
+                self._buckets[digest] = (available, now)
+                return False
+            self._buckets[digest] = (available - 1.0, now)
+            return True
+
+
+token_store = TokenStore()
+
+
+def install_sighup_reload(store: TokenStore | None = None) -> None:
+    """Reload tokens on SIGHUP (call from the main thread)."""
+    target = store or token_store
+    if hasattr(signal, "SIGHUP"):
+        signal.signal(signal.SIGHUP, lambda signum, frame: target.reload())
+
 
 def get_valid_tokens() -> set[str]:
     """Get set of valid bearer tokens.
@@ -43,17 +216,69 @@ def get_valid_tokens() -> set[str]:
         tokens.update(t.strip() for t in env_tokens.split(",") if t.strip())
 
     # From file
-    tokens_file = Path(".a2a/tokens")
+    tokens_file = TOKENS_FILE
     if tokens_file.exists():
         for line in tokens_file.read_text().splitlines():
-            line = line.strip()
-            if line and not line.startswith("#"):
-                tokens.add(line)
+            parsed = _parse_token_line(line)
+            if parsed:
+                tokens.add(parsed[0])
 
     return tokens
 
 
-def verify_token(auth_header: str) -> bool:
+def _bearer_token(auth_header: str) -> str | None:
+    """The token of a 'Bearer <token>' header; None if malformed."""
+    parts = auth_header.split(" ", 1)
+    if len(parts) != 2 or parts[0].lower() != "bearer":
+        return None
+    return parts[1].strip() or None
+
+
+def authenticate(auth_header: str, scope: str | None = None) -> str:
+    """Check an Authorization header against the token store.
+
+    Production mode (default): Requires a configured token (with the scope,
+    if the token is scoped) within its rate limit
+    Dev mode (AGENTIC_MUX_DEV_MODE=true): Bypasses validation, accepts any well-formed token
+
+    Args:
+        auth_header: Authorization header value (e.g., "Bearer token123")
+        scope: Scope required by the request (e.g., "tasks:write")
+
+    Returns:
+        AUTH_OK, AUTH_UNAUTHORIZED, AUTH_FORBIDDEN or AUTH_RATE_LIMITED
+    """
+    token = _bearer_token(auth_header)
+    if token is None:
+        return AUTH_UNAUTHORIZED
+
+    # Check for explicit dev mode bypass
+    if _dev_mode():
+        logger.warning("SECURITY: Dev mode active - bypassing token validation")
+        return AUTH_OK
+
+    # Production mode: no configured tokens means nothing matches
+    return token_store.authenticate(token, scope)
+
+
+def authorize(auth_header: str, scope: str | None) -> str:
+    """Check that an already authenticated header's token holds a scope.
+
+    For requests whose scope is only known after authenticate() (e.g. a
+    JSON-RPC method in the body); the rate limit is not charged again.
+
+    Returns:
+        AUTH_OK, AUTH_UNAUTHORIZED or AUTH_FORBIDDEN
+    """
+    token = _bearer_token(auth_header)
+    if token is None:
+        return AUTH_UNAUTHORIZED
+    if scope is None or _dev_mode():
+        return AUTH_OK
+    return token_store.authorize(token, scope)
+
+
+def verify_token(auth_header: str, scope: str | None = None) -> bool:
     """Verify bearer token from Authorization header.
 
     Production mode (default): Requires exact token match against configured tokens
@@ -61,44 +286,51 @@ def verify_token(auth_header: str) -> bool:
 
     Args:
         auth_header: Authorization header value (e.g., "Bearer token123")
+        scope: Scope required by the request (e.g., "tasks:write")
 
     Returns:
         True if token is valid, False otherwise
     """
-    if not auth_header:
-        return False
-
-    parts = auth_header.split(" ", 1)
-    if len(parts) != 2 or parts[0].lower() != "bearer":
-        return False
+    return authenticate(auth_header, scope) == AUTH_OK
 
-    token = parts[1].strip()
-    if not token:
-        return False
 
-    # Check for explicit dev mode bypass
-    dev_mode = os.environ.get("AGENTIC_MUX_DEV_MODE", "").lower() in {
-        "true",
-        "1",
-        "yes",
-    }
+def _verify_token_uncached(auth_header: str) -> bool:
+    """verify_token as it worked before TokenStore (benchmark baseline)."""
+    import hmac
 
-    if dev_mode:
-        logger.warning("SECURITY: Dev mode active - bypassing token validation")
-        return True
+    token = auth_header.split(" ", 1)[1].strip()
+    return any(hmac.compare_digest(token, valid) for valid in get_valid_tokens())
 
-    valid_tokens = get_valid_tokens()
 
-    # Production mode: require tokens to be configured
-    if not valid_tokens:
-        return False
+def run_benchmark(iterations: int, n_tokens: int) -> dict[str, float]:
+    """Per-request auth overhead (microseconds) with and without the token store.
 
-    # Constant-time comparison to prevent timing attacks
-    for valid_token in valid_tokens:
-        if hmac.compare_digest(token, valid_token):
-            return True
-
-    return False
+    Runs in a temporary directory with n_tokens tokens in .a2a/tokens and
+    checks the last one.
+    """
+    import tempfile
+
+    old_cwd = os.getcwd()
+    old_dev = os.environ.pop("AGENTIC_MUX_DEV_MODE", None)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        try:
+            os.chdir(tmpdir)
+            TOKENS_FILE.parent.mkdir(parents=True)
+            tokens = [generate_token() for _ in range(n_tokens)]
+            TOKENS_FILE.write_text("".join(f"{t}\n" for t in tokens))
+            header = f"Bearer {tokens[-1]}"
+            results = {}
+            for name, check in (("uncached_us", _verify_token_uncached), ("cached_us", verify_token)):
+                assert check(header)
+                start = time.perf_counter()
+                for _ in range(iterations):
+                    check(header)
+                results[name] = (time.perf_counter() - start) / iterations * 1e6
+            return results
+        finally:
+            os.chdir(old_cwd)
+            if old_dev is not None:
+                os.environ["AGENTIC_MUX_DEV_MODE"] = old_dev
 
 
 def generate_token() -> str:
@@ -116,15 +348,15 @@ def add_token(token: str) -> None:
     Args:
         token: Token to add
     """
-    tokens_file = Path(".a2a/tokens")
+    tokens_file = TOKENS_FILE
     tokens_file.parent.mkdir(parents=True, exist_ok=True)
 
     existing = set()
     if tokens_file.exists():
         existing = {
-            line.strip()
+            parsed[0]
             for line in tokens_file.read_text().splitlines()
-            if line.strip() and not line.startswith("#")
+            if (parsed := _parse_token_line(line))
         }
 
     if token not in existing:
@@ -136,8 +368,10 @@ if __name__ == "__main__":
     import argparse
 
     parser = argparse.ArgumentParser(description="A2A Token Management")
-    parser.add_argument("action", choices=["generate", "add", "verify"])
+    parser.add_argument("action", choices=["generate", "add", "verify", "bench"])
     parser.add_argument("--token", help="Token for add/verify actions")
+    parser.add_argument("--iterations", type=int, default=10000, help="bench: requests per mode")
+    parser.add_argument("--tokens", type=int, default=50, help="bench: configured tokens")
     args = parser.parse_args()
 
     if args.action == "generate":
@@ -158,3 +392,8 @@ if __name__ == "__main__":
             header = f"Bearer {args.token}"
             valid = verify_token(header)
             print(f"Token valid: {valid}")
+    elif args.action == "bench":
+        results = run_benchmark(args.iterations, args.tokens)
+        print(f"Auth overhead per request ({args.tokens} tokens, {args.iterations} iterations):")
+        print(f"  uncached (file read + scan): {results['uncached_us']:.1f} us")
+        print(f"  token store:                 {results['cached_us']:.1f} us")
@@ -12,15 +12,30 @@ Example usage:
         time.sleep(5)
         task = client.get_task(task["id"])
     print(task["artifacts"])
+
+    # Or block until done; on the server's machine, pass the session's
+    # .signals/ dir to wake on signal writes instead of sleeping
+    task = client.wait_for_completion(task["id"], signals_dir=Path(".../.signals"))
+
+    # Or stream status/artifact updates as the server sees signals land
+    for event in client.subscribe(message="Research AI orchestration patterns"):
+        print(event)
 """
 
 from __future__ import annotations
 
+import json
+import sys
 import time
+from collections.abc import Iterator
+from pathlib import Path
 from typing import Any
 
 import httpx
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from lib.signal_watch import SignalWatcher
+
 
 class A2AError(Exception):
     """A2A client error."""
@@ -148,18 +163,114 @@ class A2AClient:
         """
         return self._call("tasks/cancel", {"id": task_id})
 
+    def download_artifact(self, uri: str, dest: Path, resume: bool = True) -> Path:
+        """Stream a by-reference artifact (file part uri) to a local file.
+
+        Args:
+            uri: Artifact URI from a file part (e.g. "/artifacts/<sha256>")
+            dest: Destination file
+            resume: Continue a partial dest with a Range request
+
+        Returns:
+            dest
+        """
+        url = uri if uri.startswith(("http://", "https://")) else f"{self.base_url}{uri}"
+        headers = self._get_headers()
+        offset = dest.stat().st_size if resume and dest.exists() else 0
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+        with httpx.Client(timeout=httpx.Timeout(self.timeout, read=None)) as client:
+            with client.stream("GET", url, headers=headers) as response:
+                if response.status_code == 416:
+                    return dest  # Already complete
+                response.raise_for_status()
+                mode = "ab" if response.status_code == 206 else "wb"
+                with open(dest, mode) as f:
+                    for chunk in response.iter_bytes():
+                        f.write(chunk)
+        return dest
+
+    def subscribe(
+        self,
+        task_id: str | None = None,
+        message: str | None = None,
+        skill: str = "swarm:research",
+        last_event_id: int | None = None,
+        max_reconnects: int = 5,
+    ) -> Iterator[dict[str, Any]]:
+        """Stream a task's updates (tasks/sendSubscribe, tasks/resubscribe).
+
+        Yields TaskStatusUpdateEvent ({id, status, final}) and
+        TaskArtifactUpdateEvent ({id, artifact}) results until the final
+        status. With message, the task is created first. If the stream drops
+        before the final event, it is resumed from the last event id.
+
+        Args:
+            task_id: Existing task ID
+            message: Task description, to create the task
+            skill: Skill ID to invoke (with message)
+            last_event_id: Resume after this event id
+            max_reconnects: Resume attempts before giving up
+
+        Raises:
+            A2AError: If server returns error
+            ValueError: If neither task_id nor message is given
+        """
+        if task_id is None and message is None:
+            raise ValueError("task_id or message is required")
+        if task_id is None:
+            method, params = "tasks/sendSubscribe", {"message": message, "skill": skill}
+        else:
+            method, params = "tasks/resubscribe", {"id": task_id}
+
+        for _ in range(max_reconnects + 1):
+            if last_event_id is not None:
+                params["lastEventId"] = last_event_id
+            payload = {"jsonrpc": "2.0", "method": method, "params": params, "id": self._next_id()}
+            timeout = httpx.Timeout(self.timeout, read=None)
+            with httpx.Client(timeout=timeout) as client:
+                with client.stream("POST", f"{self.base_url}/a2a", json=payload, headers=self._get_headers()) as response:
+                    response.raise_for_status()
+                    if not response.headers.get("content-type", "").startswith("text/event-stream"):
+                        data = json.loads(response.read())
+                        raise A2AError(data["error"]["code"], data["error"]["message"])
+                    event_id: int | None = None
+                    for line in response.iter_lines():
+                        if line.startswith("id:"):
+                            event_id = int(line[3:].strip())
+                        elif line.startswith("data:"):
+                            data = json.loads(line[5:])
+                            if data.get("error"):
+                                raise A2AError(data["error"]["code"], data["error"]["message"])
+                            event = data["result"]
+                            last_event_id = event_id
+                            yield event
+                            if event.get("final"):
+                                return
+                            # Later attempts resume the created task
+                            method, params = "tasks/resubscribe", {"id": event["id"]}
+        raise A2AError(-1, "Subscription closed before the task finished")
+
     def wait_for_completion(
         self,
         task_id: str,
         poll_interval: float = 5.0,
         timeout: float = 300.0,
+        signals_dir: Path | None = None,
     ) -> dict[str, Any]:
         """Wait for task to complete.
 
+        With signals_dir (the task session's .signals/ directory, when the
+        client runs on the server's machine), the client sleeps on a
+        SignalWatcher and re-checks status as soon as a signal lands, rather
+        than up to poll_interval later. poll_interval still bounds how long
+        it waits between checks.
+
         Args:
             task_id: Task ID
             poll_interval: Seconds between status checks
             timeout: Maximum wait time in seconds
+            signals_dir: Local .signals/ directory of the task's session
 
         Returns:
             Completed task object
@@ -168,17 +279,26 @@ class A2AClient:
             TimeoutError: If task doesn't complete within timeout
             A2AError: If task fails
         """
-        start = time.time()
-        while time.time() - start < timeout:
-            task = self.get_task(task_id)
-            state = task["status"]["state"]
-
-            if state == "completed":
-                return task
-            if state in ("failed", "canceled"):
-                raise A2AError(-1, f"Task {state}: {task['status']['message']}")
-
-            time.sleep(poll_interval)
+        watcher = SignalWatcher(signals_dir) if signals_dir is not None else None
+        try:
+            start = time.time()
+            while time.time() - start < timeout:
+                task = self.get_task(task_id)
+                state = task["status"]["state"]
+
+                if state == "completed":
+                    return task
+                if state in ("failed", "canceled"):
+                    raise A2AError(-1, f"Task {state}: {task['status']['message']}")
+
+                wait = min(poll_interval, max(timeout - (time.time() - start), 0))
+                if watcher is not None:
+                    watcher.wait(wait)
+                else:
+                    time.sleep(wait)
+        finally:
+            if watcher is not None:
+                watcher.close()
 
         raise TimeoutError(f"Task {task_id} did not complete within {timeout}s")
 
@@ -186,7 +306,6 @@ class A2AClient:
 def main() -> None:
     """CLI interface for testing."""
     import argparse
-    import json
 
     parser = argparse.ArgumentParser(description="A2A Client CLI")
     parser.add_argument("--url", default="http://localhost:8000", help="Server URL")
@@ -202,6 +321,27 @@ def main() -> None:
     send_parser.add_argument("message", help="Task message")
     send_parser.add_argument("--skill", default="swarm:research", help="Skill ID")
     send_parser.add_argument("--wait", action="store_true", help="Wait for completion")
+    send_parser.add_argument(
+        "--signals-dir", type=Path, help="Local .signals/ dir to watch while waiting"
+    )
+
+    # watch command
+    watch_parser = subparsers.add_parser("watch", help="Wait for a task to complete")
+    watch_parser.add_argument("task_id", help="Task ID")
+    watch_parser.add_argument("--timeout", type=float, default=300.0, help="Maximum wait in seconds")
+    watch_parser.add_argument(
+        "--signals-dir", type=Path, help="Local .signals/ dir to watch instead of sleeping"
+    )
+
+    # stream command
+    stream_parser = subparsers.add_parser("stream", help="Stream task updates as JSON lines")
+    stream_parser.add_argument("task_id", help="Task ID")
+    stream_parser.add_argument("--last-event-id", type=int, help="Resume after this event id")
+
+    # download command
+    download_parser = subparsers.add_parser("download", help="Download a by-reference artifact")
+    download_parser.add_argument("uri", help="Artifact URI (/artifacts/<sha256>)")
+    download_parser.add_argument("dest", type=Path, help="Destination file")
 
     # get command
     get_parser = subparsers.add_parser("get", help="Get task status")
@@ -220,7 +360,17 @@ def main() -> None:
         elif args.command == "send":
             result = client.send_task(args.message, args.skill)
             if args.wait:
-                result = client.wait_for_completion(result["id"])
+                result = client.wait_for_completion(result["id"], signals_dir=args.signals_dir)
+        elif args.command == "watch":
+            result = client.wait_for_completion(
+                args.task_id, timeout=args.timeout, signals_dir=args.signals_dir
+            )
+        elif args.command == "stream":
+            for event in client.subscribe(args.task_id, last_event_id=args.last_event_id):
+                print(json.dumps(event), flush=True)
+            return
+        elif args.command == "download":
+            result = {"path": str(client.download_artifact(args.uri, args.dest))}
         elif args.command == "get":
             result = client.get_task(args.task_id)
         elif args.command == "cancel":
@@ -7,21 +7,42 @@ A2A JSON-RPC 2.0 Server for Swarm Orchestration.
 
 Endpoints:
   GET  /.well-known/agent.json  - Agent Card discovery
-  POST /a2a                     - JSON-RPC 2.0 methods
+  GET  /metrics                 - Launch queue depth and latency (Prometheus)
+  GET  /artifacts/{sha256}      - Stored artifact content (supports Range)
+  POST /a2a                     - JSON-RPC 2.0 methods; tasks/sendSubscribe and
+                                  tasks/resubscribe answer with an SSE stream
 """
 
 from __future__ import annotations
 
-import subprocess
+import asyncio
+import json
+import os
+import shlex
+import sys
 from pathlib import Path
 from typing import Any
 
 from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from pydantic import BaseModel
 
-from auth import verify_token
+from auth import (
+    AUTH_FORBIDDEN,
+    AUTH_OK,
+    AUTH_RATE_LIMITED,
+    AUTH_UNAUTHORIZED,
+    authenticate,
+    authorize,
+    install_sighup_reload,
+)
+from task_launcher import Launch, TaskLauncher
 from task_manager import TaskManager, TaskState, sync_from_signals
+from task_stream import TaskStreamHub
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+from session import create_session
 
 app = FastAPI(title="Swarm A2A Server", version="1.0.0")
 
@@ -37,6 +58,32 @@ app.add_middleware(
 # Initialize task manager
 STORAGE_DIR = Path(".a2a/tasks")
 task_manager = TaskManager(STORAGE_DIR)
+SWARM_DIR = Path("tmp/swarm")
+
+# Workflow command run per task as: <command> <skill> <session_dir> <message>.
+# Unset: the task is only marked working and follows its session's signals.
+WORKFLOW_COMMAND = shlex.split(os.environ.get("A2A_WORKFLOW_COMMAND", ""))
+
+# Token scope required per JSON-RPC method (see auth.py)
+METHOD_SCOPES = {
+    "tasks/send": "tasks:write",
+    "tasks/cancel": "tasks:write",
+    "tasks/sendSubscribe": "tasks:write",
+    "tasks/get": "tasks:read",
+    "tasks/resubscribe": "tasks:read",
+}
+_AUTH_RPC_ERRORS = {
+    AUTH_UNAUTHORIZED: (-32001, "Unauthorized"),
+    AUTH_FORBIDDEN: (-32003, "Forbidden: token lacks scope {scope}"),
+    AUTH_RATE_LIMITED: (-32029, "Rate limit exceeded"),
+}
+_AUTH_HTTP_STATUS = {AUTH_UNAUTHORIZED: 401, AUTH_FORBIDDEN: 403, AUTH_RATE_LIMITED: 429}
+
+# Artifact downloads are streamed in chunks of this many bytes
+ARTIFACT_CHUNK_SIZE = 1 << 16
+
+# Streaming subscriptions: seconds between keepalive comments
+STREAM_KEEPALIVE = 15.0
 
 # Load agent card
 AGENT_CARD_PATH = Path(__file__).parent / "agent-card.json"
@@ -60,6 +107,56 @@ class JsonRpcResponse(BaseModel):
     id: str | int | None = None
 
 
+def signals_dir_for(session_id: str) -> Path:
+    """The .signals/ directory of a swarm session."""
+    return SWARM_DIR / session_id / ".signals"
+
+
+def _task_dict(task_id: str) -> dict[str, Any] | None:
+    task = task_manager.get_task(task_id)
+    return task.to_dict() if task else None
+
+
+def _sync_task(task_id: str) -> None:
+    task = task_manager.get_task(task_id)
+    if task:
+        sync_from_signals(task_manager, task_id, signals_dir_for(task.session_id))
+
+
+task_streams = TaskStreamHub(_task_dict, _sync_task, signals_dir_for)
+
+
+async def _start_workflow(launch: Launch) -> None:
+    """Mark the task working and run its workflow command, if configured."""
+    task = task_manager.update_status(launch.task_id, TaskState.WORKING, "Workflow started")
+    if task is None:
+        return  # Canceled while queued
+    task_streams.notify(task.session_id)
+    if not WORKFLOW_COMMAND:
+        return
+    process = await asyncio.create_subprocess_exec(
+        *WORKFLOW_COMMAND,
+        launch.skill,
+        launch.session_dir,
+        launch.message,
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    _, stderr = await process.communicate()
+    if process.returncode != 0:
+        raise RuntimeError(f"Workflow exited {process.returncode}: {stderr.decode(errors='replace')[-500:]}")
+
+
+def _launch_failed(launch: Launch, error: BaseException) -> None:
+    task = task_manager.update_status(launch.task_id, TaskState.FAILED, f"Workflow launch failed: {error}")
+    if task:
+        task_streams.notify(task.session_id)
+
+
+task_launcher = TaskLauncher(_start_workflow, _launch_failed)
+
+
 @app.get("/.well-known/agent.json")
 async def get_agent_card() -> Response:
     """Return Agent Card for discovery."""
@@ -71,16 +168,85 @@ async def get_agent_card() -> Response:
     )
 
 
-@app.post("/a2a")
-async def handle_jsonrpc(request: Request) -> JsonRpcResponse:
+@app.get("/metrics")
+async def get_metrics() -> PlainTextResponse:
+    """Return launcher queue depth, in-flight launches and latency in Prometheus format."""
+    return PlainTextResponse(task_launcher.prometheus(), media_type="text/plain")
+
+
+def _parse_range(header: str, size: int) -> tuple[int, int] | None:
+    """(start, end) inclusive for a single 'bytes=' range; None if unsatisfiable."""
+    unit, _, spec = header.partition("=")
+    if unit.strip() != "bytes" or "," in spec:
+        return None
+    first, _, last = spec.strip().partition("-")
+    try:
+        if not first:
+            length = int(last)
+            return (max(0, size - length), size - 1) if length > 0 and size else None
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+    except ValueError:
+        return None
+    return (start, end) if start <= end else None
+
+
+@app.get("/artifacts/{digest}", response_model=None)
+async def get_artifact(digest: str, request: Request) -> StreamingResponse | Response:
+    """Stream a stored artifact, honouring a single-range Range header."""
+    outcome = authenticate(request.headers.get("Authorization", ""), "artifacts:read")
+    if outcome != AUTH_OK:
+        raise HTTPException(status_code=_AUTH_HTTP_STATUS[outcome], detail=outcome.replace("_", " ").capitalize())
+    try:
+        path = task_manager.artifact_path(digest)
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Artifact not found") from None
+    if not path.is_file():
+        raise HTTPException(status_code=404, detail="Artifact not found")
+
+    size = path.stat().st_size
+    headers = {"Accept-Ranges": "bytes", "ETag": f'"{digest}"'}
+    start, end, status = 0, size - 1, 200
+    range_header = request.headers.get("range")
+    if range_header:
+        byte_range = _parse_range(range_header, size)
+        if byte_range is None:
+            return Response(status_code=416, headers={"Content-Range": f"bytes */{size}"})
+        start, end = byte_range
+        status = 206
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    headers["Content-Length"] = str(end - start + 1)
+
+    def chunks():
+        with open(path, "rb") as f:
+            f.seek(start)
+            remaining = end - start + 1
+            while remaining > 0:
+                chunk = f.read(min(ARTIFACT_CHUNK_SIZE, remaining))
+                if not chunk:
+                    return
+                remaining -= len(chunk)
+                yield chunk
+
+    return StreamingResponse(chunks(), status_code=status, media_type="application/octet-stream", headers=headers)
+
+
+@app.on_event("shutdown")
+async def stop_launcher() -> None:
+    """Cancel launcher workers and flush the task store on shutdown."""
+    await task_launcher.close()
+    task_manager.flush()
+
+
+@app.post("/a2a", response_model=None)
+async def handle_jsonrpc(request: Request) -> JsonRpcResponse | StreamingResponse:
     """Handle JSON-RPC 2.0 requests."""
-    # Verify auth
+    # Verify auth before reading the body; the method's scope is checked once parsed
     auth_header = request.headers.get("Authorization", "")
-    if not verify_token(auth_header):
-        return JsonRpcResponse(
-            error={"code": -32001, "message": "Unauthorized"},
-            id=None,
-        )
+    outcome = authenticate(auth_header)
+    if outcome != AUTH_OK:
+        code, message = _AUTH_RPC_ERRORS[outcome]
+        return JsonRpcResponse(error={"code": code, "message": message}, id=None)
 
     try:
         body = await request.json()
@@ -91,12 +257,22 @@ async def handle_jsonrpc(request: Request) -> JsonRpcResponse:
             id=None,
         )
 
+    scope = METHOD_SCOPES.get(rpc_request.method)
+    outcome = authorize(auth_header, scope)
+    if outcome != AUTH_OK:
+        code, message = _AUTH_RPC_ERRORS[outcome]
+        return JsonRpcResponse(
+            error={"code": code, "message": message.format(scope=scope)},
+            id=None,
+        )
+
     # Route methods
     method_handlers = {
         "tasks/send": handle_tasks_send,
         "tasks/get": handle_tasks_get,
         "tasks/cancel": handle_tasks_cancel,
         "tasks/sendSubscribe": handle_tasks_subscribe,
+        "tasks/resubscribe": handle_tasks_resubscribe,
     }
 
     handler = method_handlers.get(rpc_request.method)
@@ -106,8 +282,14 @@ async def handle_jsonrpc(request: Request) -> JsonRpcResponse:
             id=rpc_request.id,
         )
 
+    params = rpc_request.params or {}
+    if handler in (handle_tasks_subscribe, handle_tasks_resubscribe):
+        params = dict(params, lastEventId=params.get("lastEventId", request.headers.get("last-event-id")))
+
     try:
-        result = await handler(rpc_request.params or {})
+        result = await handler(params)
+        if isinstance(result, TaskSubscription):
+            return result.response(request, rpc_request.id)
         return JsonRpcResponse(result=result, id=rpc_request.id)
     except Exception as e:
         return JsonRpcResponse(
@@ -117,7 +299,10 @@ async def handle_jsonrpc(request: Request) -> JsonRpcResponse:
 
 
 async def handle_tasks_send(params: dict[str, Any]) -> dict[str, Any]:
-    """Create and start a new task (tasks/send).
+    """Create a new task and queue its workflow (tasks/send).
+
+    Returns the task in the submitted state; a launcher worker moves it to
+    working. Fails if the launch queue is full.
 
     Params:
         message: str - Task description
@@ -129,25 +314,18 @@ async def handle_tasks_send(params: dict[str, Any]) -> dict[str, Any]:
     if not message:
         raise ValueError("message is required")
 
-    # Create swarm session
-    session_result = subprocess.run(
-        ["uv", "run", "tools/session.py", skill.replace(":", "-")],
-        capture_output=True,
-        text=True,
-        cwd=Path(__file__).parent.parent,
-    )
-    if session_result.returncode != 0:
-        raise RuntimeError(f"Session creation failed: {session_result.stderr}")
-
-    session_dir = session_result.stdout.strip()
-    session_id = Path(session_dir).name
+    # Create swarm session in-process (off the event loop: it may walk the
+    # process tree for the mux-active marker)
+    session_dir, _, _ = await asyncio.to_thread(create_session, skill.replace(":", "-"), SWARM_DIR)
+    session_id = session_dir.name
 
-    # Create A2A task
+    # Create A2A task and queue its workflow; returns while still submitted
     task = task_manager.create_task(session_id, message)
-
-    # Start swarm workflow (non-blocking)
-    # Note: In production, this would invoke the swarm skill
-    task_manager.update_status(task.id, TaskState.WORKING, "Workflow started")
+    try:
+        task_launcher.submit(Launch(task.id, str(session_dir), message, skill))
+    except Exception as e:
+        task_manager.update_status(task.id, TaskState.FAILED, str(e))
+        raise
 
     return task.to_dict()
 
@@ -166,11 +344,9 @@ async def handle_tasks_get(params: dict[str, Any]) -> dict[str, Any]:
     if not task:
         raise ValueError(f"Task not found: {task_id}")
 
-    # Sync from signals if working
-    if task.status.state == TaskState.WORKING:
-        session_dir = Path("tmp/swarm") / task.session_id
-        signals_dir = session_dir / ".signals"
-        sync_from_signals(task_manager, task_id, signals_dir)
+    # Sync from signals if working (unless a subscription already keeps it in sync)
+    if task.status.state == TaskState.WORKING and not task_streams.is_watching(task.session_id):
+        sync_from_signals(task_manager, task_id, signals_dir_for(task.session_id))
         task = task_manager.get_task(task_id)
 
     return task.to_dict() if task else {}
@@ -190,24 +366,98 @@ async def handle_tasks_cancel(params: dict[str, Any]) -> dict[str, Any]:
     if not task:
         raise ValueError(f"Task not found: {task_id}")
 
+    task_streams.notify(task.session_id)
     return task.to_dict()
 
 
-async def handle_tasks_subscribe(params: dict[str, Any]) -> dict[str, Any]:
-    """Subscribe to task updates (tasks/sendSubscribe).
+class TaskSubscription:
+    """A task whose updates are streamed back as Server-Sent Events.
+
+    Each event is a JSON-RPC response (same id as the request) whose result
+    is a TaskStatusUpdateEvent ({id, status, final}) or a
+    TaskArtifactUpdateEvent ({id, artifact}). The stream ends after the
+    final status update.
+    """
+
+    def __init__(self, task_id: str, session_id: str, last_event_id: int | None):
+        self.task_id = task_id
+        self.session_id = session_id
+        self.last_event_id = last_event_id
+
+    def response(self, request: Request, rpc_id: str | int | None) -> StreamingResponse:
+        queue = task_streams.subscribe(self.task_id, self.session_id, self.last_event_id)
+
+        async def stream():
+            try:
+                yield "retry: 2000\n\n"
+                while True:
+                    try:
+                        item = await asyncio.wait_for(queue.get(), STREAM_KEEPALIVE)
+                    except asyncio.TimeoutError:
+                        if await request.is_disconnected():
+                            return
+                        yield ": keepalive\n\n"
+                        continue
+                    if item is None:
+                        return
+                    event_id, event = item
+                    data = json.dumps({"jsonrpc": "2.0", "id": rpc_id, "result": event}, separators=(",", ":"))
+                    yield f"id: {event_id}\ndata: {data}\n\n"
+            finally:
+                task_streams.unsubscribe(self.session_id, queue)
+
+        return StreamingResponse(
+            stream(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
 
-    Note: SSE streaming not implemented in MVP. Returns current state.
+def _last_event_id(params: dict[str, Any]) -> int | None:
+    value = params.get("lastEventId")
+    try:
+        return int(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+async def handle_tasks_subscribe(params: dict[str, Any]) -> TaskSubscription:
+    """Create a task and stream its updates (tasks/sendSubscribe).
+
+    Params:
+        message: str - Task description (creates the task, as tasks/send)
+        skill: str - Skill ID (e.g., "swarm:research")
+        id: str - Existing task ID, instead of message
+    """
+    if params.get("id"):
+        return await handle_tasks_resubscribe(params)
+    task = await handle_tasks_send(params)
+    return TaskSubscription(task["id"], task["sessionId"], None)
+
+
+async def handle_tasks_resubscribe(params: dict[str, Any]) -> TaskSubscription:
+    """Stream updates of an existing task (tasks/resubscribe).
 
     Params:
         id: str - Task ID
+        lastEventId: int - Resume after this event (or the Last-Event-ID header)
     """
-    return await handle_tasks_get(params)
+    task_id = params.get("id", "")
+    if not task_id:
+        raise ValueError("id is required")
+
+    task = task_manager.get_task(task_id)
+    if not task:
+        raise ValueError(f"Task not found: {task_id}")
+
+    return TaskSubscription(task_id, task.session_id, _last_event_id(params))
 
 
 def run_server(host: str = "0.0.0.0", port: int = 8000) -> None:
     """Run the A2A server."""
     import uvicorn
 
+    install_sighup_reload()
     uvicorn.run(app, host=host, port=port)
 
 
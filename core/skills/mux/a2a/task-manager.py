@@ -9,18 +9,33 @@ State transitions:
   submitted -> working -> [input-required] -> completed
                      \                        /
                       -> failed -> canceled
+
+Tasks are persisted in SQLite (<storage_dir>/tasks.db, WAL); see TaskManager.
 """
 
 from __future__ import annotations
 
+import atexit
+import hashlib
 import json
+import os
+import sqlite3
+import sys
+import threading
 import uuid
-from dataclasses import dataclass, field
+import weakref
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
+from functools import partial
 from pathlib import Path
 from typing import Any
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from lib.signal_journal import JournalReader, journal_path
+
 
 class TaskState(Enum):
     """A2A task states per specification."""
@@ -107,19 +122,102 @@ class Task:
         }
 
 
+ARTIFACT_INLINE_LIMIT = 4096  # bytes; larger artifacts are stored by reference
+ARTIFACTS_SUBDIR = "artifacts"
+ARTIFACT_URI_PREFIX = "/artifacts/"
+_CHUNK_SIZE = 1 << 16
+
+FLUSH_BATCH = 64
+FLUSH_INTERVAL = 0.5
+DB_FILENAME = "tasks.db"
+ACTIVE_STATES = (TaskState.SUBMITTED, TaskState.WORKING, TaskState.INPUT_REQUIRED)
+
+
+def _file_part(name: str, mime_type: str, digest: str, size: int) -> dict[str, Any]:
+    """A2A file part referencing a stored artifact."""
+    return {
+        "type": "file",
+        "file": {"name": name, "mimeType": mime_type, "uri": f"{ARTIFACT_URI_PREFIX}{digest}"},
+        "metadata": {"size": size, "sha256": digest},
+    }
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id TEXT PRIMARY KEY,
+    session_id TEXT NOT NULL,
+    state TEXT NOT NULL,
+    message TEXT NOT NULL,
+    timestamp TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tasks_session ON tasks (session_id);
+CREATE INDEX IF NOT EXISTS tasks_state ON tasks (state);
+CREATE TABLE IF NOT EXISTS task_items (
+    task_id TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS task_items_task ON task_items (task_id);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+JSON_IMPORT_KEY = "json_import"
+
+
+def _close_at_exit(ref: weakref.ref[TaskManager]) -> None:
+    """atexit hook holding only a weak reference, so managers can be collected."""
+    manager = ref()
+    if manager is not None:
+        manager.close()
+
+
 class TaskManager:
-    """Manages A2A tasks and swarm session mapping."""
+    """Manages A2A tasks and swarm session mapping.
+
+    Tasks live in a SQLite database (WAL) at <storage_dir>/tasks.db, indexed
+    by task id, session id and state. Task creation and status changes are
+    written through; artifact and history appends are buffered and written
+    in one transaction with the next status change, once FLUSH_BATCH are
+    pending, or FLUSH_INTERVAL seconds after the first one (and on close()
+    or interpreter exit). Startup warm-loads the active tasks and the
+    session -> task index; other tasks are loaded by primary key on demand.
+    Legacy per-task <task_id>.json files are imported once (recorded in the
+    meta table); malformed files are skipped.
+
+    Artifacts above inline_limit bytes are not kept in the task: their
+    content goes to <storage_dir>/artifacts/<sha256> (content-addressed, so
+    identical reports are stored once) and the task holds a file part with
+    its URI, size and hash, downloadable from the server's /artifacts/
+    endpoint. Smaller artifacts stay inline as text parts.
+    """
 
-    def __init__(self, storage_dir: Path | None = None) -> None:
+    def __init__(self, storage_dir: Path | None = None, inline_limit: int = ARTIFACT_INLINE_LIMIT) -> None:
         """Initialize task manager.
 
         Args:
             storage_dir: Directory for task persistence (default: .a2a/tasks/)
+            inline_limit: Largest artifact (bytes) kept inline in the task
         """
         self.storage_dir = storage_dir or Path(".a2a/tasks")
         self.storage_dir.mkdir(parents=True, exist_ok=True)
+        self.artifacts_dir = self.storage_dir / ARTIFACTS_SUBDIR
+        self.inline_limit = inline_limit
         self._tasks: dict[str, Task] = {}
         self._session_to_task: dict[str, str] = {}  # session_id -> task_id
+        self._pending: list[tuple[str, str, str]] = []  # (task_id, kind, data)
+        self._flush_timer: threading.Timer | None = None
+        self._lock = threading.RLock()
+
+        self._db = sqlite3.connect(self.storage_dir / DB_FILENAME, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+        self._import_json_tasks()
+        self._warm_load()
+        self._atexit_hook = partial(_close_at_exit, weakref.ref(self))
+        atexit.register(self._atexit_hook)
 
     def create_task(self, session_id: str, input_text: str) -> Task:
         """Create a new A2A task for a swarm session.
@@ -132,15 +230,18 @@ class TaskManager:
             Created Task object
         """
         task_id = f"task-{uuid.uuid4().hex[:12]}"
+        message = Message(role="user", parts=[{"type": "text", "text": input_text}])
         task = Task(
             id=task_id,
             session_id=session_id,
             status=TaskStatus(state=TaskState.SUBMITTED, message="Task submitted"),
-            history=[Message(role="user", parts=[{"type": "text", "text": input_text}])],
+            history=[message],
         )
-        self._tasks[task_id] = task
-        self._session_to_task[session_id] = task_id
-        self._persist(task)
+        with self._lock:
+            self._tasks[task_id] = task
+            self._session_to_task[session_id] = task_id
+            self._pending.append((task_id, "message", json.dumps(asdict(message))))
+            self._write_status(task, insert=True)
         return task
 
     def get_task(self, task_id: str) -> Task | None:
@@ -151,9 +252,29 @@ class TaskManager:
         return self._load(task_id)
 
     def get_task_by_session(self, session_id: str) -> Task | None:
-        """Get task by swarm session ID."""
+        """Get task by swarm session ID (the latest one, if several)."""
         task_id = self._session_to_task.get(session_id)
-        return self.get_task(task_id) if task_id else None
+        if task_id is None:
+            with self._lock:
+                row = self._db.execute(
+                    "SELECT id FROM tasks WHERE session_id = ? ORDER BY rowid DESC LIMIT 1",
+                    (session_id,),
+                ).fetchone()
+            if row is None:
+                return None
+            task_id = self._session_to_task[session_id] = row[0]
+        return self.get_task(task_id)
+
+    def list_tasks(self, state: TaskState | None = None) -> list[Task]:
+        """Tasks in a given state (all tasks if None), oldest first."""
+        with self._lock:
+            if state is None:
+                rows = self._db.execute("SELECT id FROM tasks ORDER BY rowid").fetchall()
+            else:
+                rows = self._db.execute(
+                    "SELECT id FROM tasks WHERE state = ? ORDER BY rowid", (state.value,)
+                ).fetchall()
+        return [task for (task_id,) in rows if (task := self.get_task(task_id))]
 
     def update_status(
         self, task_id: str, state: TaskState, message: str
@@ -180,14 +301,15 @@ class TaskManager:
             # Invalid transition - return None to signal error
             return None
 
-        task.status = TaskStatus(state=state, message=message)
-        self._persist(task)
+        with self._lock:
+            task.status = TaskStatus(state=state, message=message)
+            self._write_status(task)
         return task
 
     def add_artifact(
         self, task_id: str, name: str, mime_type: str, content: str
     ) -> Task | None:
-        """Add artifact to task.
+        """Add artifact to task (by reference if above inline_limit bytes).
 
         Args:
             task_id: Task ID
@@ -201,13 +323,68 @@ class TaskManager:
         task = self.get_task(task_id)
         if not task:
             return None
-        artifact = Artifact(
-            name=name,
-            type=mime_type,
-            parts=[{"type": "text", "text": content}],
-        )
-        task.artifacts.append(artifact)
-        self._persist(task)
+        data = content.encode()
+        if len(data) <= self.inline_limit:
+            parts = [{"type": "text", "text": content}]
+        else:
+            digest = hashlib.sha256(data).hexdigest()
+            path = self.artifact_path(digest)
+            if not path.exists():
+                self._store_blob(path, data)
+            parts = [_file_part(name, mime_type, digest, len(data))]
+        return self._add_artifact(task, Artifact(name=name, type=mime_type, parts=parts))
+
+    def add_artifact_file(self, task_id: str, path: Path, mime_type: str) -> Task | None:
+        """Add a file as artifact without reading it into memory (unless small).
+
+        Args:
+            task_id: Task ID
+            path: File to attach (copied into the artifact store)
+            mime_type: MIME type
+
+        Returns:
+            Updated task or None if not found
+        """
+        task = self.get_task(task_id)
+        if not task:
+            return None
+        if path.stat().st_size <= self.inline_limit:
+            return self.add_artifact(task_id, path.name, mime_type, path.read_text())
+
+        self.artifacts_dir.mkdir(parents=True, exist_ok=True)
+        tmp = self.artifacts_dir / f".{uuid.uuid4().hex}.tmp"
+        hasher = hashlib.sha256()
+        size = 0
+        with open(path, "rb") as src, open(tmp, "wb") as dst:
+            while chunk := src.read(_CHUNK_SIZE):
+                hasher.update(chunk)
+                dst.write(chunk)
+                size += len(chunk)
+        digest = hasher.hexdigest()
+        os.replace(tmp, self.artifact_path(digest))
+        part = _file_part(path.name, mime_type, digest, size)
+        return self._add_artifact(task, Artifact(name=path.name, type=mime_type, parts=[part]))
+
+    def artifact_path(self, digest: str) -> Path:
+        """Store path of an artifact by its SHA-256 hex digest.
+
+        Raises:
+            ValueError: If digest is not a SHA-256 hex digest
+        """
+        if len(digest) != 64 or any(c not in "0123456789abcdef" for c in digest):
+            raise ValueError(f"Invalid artifact digest: {digest}")
+        return self.artifacts_dir / digest
+
+    def _store_blob(self, path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.parent / f".{uuid.uuid4().hex}.tmp"
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+
+    def _add_artifact(self, task: Task, artifact: Artifact) -> Task:
+        with self._lock:
+            task.artifacts.append(artifact)
+            self._append(task.id, "artifact", artifact)
         return task
 
     def add_agent_message(self, task_id: str, message: str) -> Task | None:
@@ -223,8 +400,10 @@ class TaskManager:
         task = self.get_task(task_id)
         if not task:
             return None
-        task.history.append(Message(role="agent", parts=[{"type": "text", "text": message}]))
-        self._persist(task)
+        entry = Message(role="agent", parts=[{"type": "text", "text": message}])
+        with self._lock:
+            task.history.append(entry)
+            self._append(task_id, "message", entry)
         return task
 
     def cancel_task(self, task_id: str) -> Task | None:
@@ -239,43 +418,156 @@ class TaskManager:
         # update_status will validate transition to CANCELED
         return self.update_status(task_id, TaskState.CANCELED, "Task canceled by user")
 
-    def _persist(self, task: Task) -> None:
-        """Persist task to storage."""
-        path = self.storage_dir / f"{task.id}.json"
-        path.write_text(json.dumps(task.to_dict(), indent=2))
+    def flush(self) -> None:
+        """Write buffered artifact and history appends."""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._pending or self._db is None:
+                return
+            with self._transaction():
+                self._db.executemany(
+                    "INSERT INTO task_items (task_id, kind, data) VALUES (?, ?, ?)", self._pending
+                )
+            self._pending = []
+
+    def close(self) -> None:
+        """Flush pending appends and close the database."""
+        with self._lock:
+            if self._db is None:
+                return
+            self.flush()
+            self._db.close()
+            self._db = None
+        atexit.unregister(self._atexit_hook)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        self._db.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self._db.execute("ROLLBACK")
+            raise
+        self._db.execute("COMMIT")
+
+    def _append(self, task_id: str, kind: str, item: Artifact | Message) -> None:
+        """Buffer an append; flushed by batch size or FLUSH_INTERVAL."""
+        self._pending.append((task_id, kind, json.dumps(asdict(item))))
+        if len(self._pending) >= FLUSH_BATCH:
+            self.flush()
+        elif self._flush_timer is None:
+            self._flush_timer = threading.Timer(FLUSH_INTERVAL, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def _write_status(self, task: Task, insert: bool = False) -> None:
+        """Write the task row, together with any buffered appends."""
+        row = (task.session_id, task.status.state.value, task.status.message, task.status.timestamp, task.id)
+        with self._transaction():
+            if insert:
+                self._db.execute(
+                    "INSERT INTO tasks (session_id, state, message, timestamp, id) VALUES (?, ?, ?, ?, ?)", row
+                )
+            else:
+                self._db.execute(
+                    "UPDATE tasks SET session_id = ?, state = ?, message = ?, timestamp = ? WHERE id = ?", row
+                )
+            if self._pending:
+                self._db.executemany(
+                    "INSERT INTO task_items (task_id, kind, data) VALUES (?, ?, ?)", self._pending
+                )
+        self._pending = []
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+    def _warm_load(self) -> None:
+        """Index every session and load the tasks still in flight."""
+        with self._lock:
+            for task_id, session_id in self._db.execute("SELECT id, session_id FROM tasks ORDER BY rowid"):
+                self._session_to_task[session_id] = task_id
+            placeholders = ", ".join("?" for _ in ACTIVE_STATES)
+            active = self._db.execute(
+                f"SELECT id FROM tasks WHERE state IN ({placeholders})",
+                [state.value for state in ACTIVE_STATES],
+            ).fetchall()
+        for (task_id,) in active:
+            self._load(task_id)
 
     def _load(self, task_id: str) -> Task | None:
         """Load task from storage."""
-        path = self.storage_dir / f"{task_id}.json"
-        if not path.exists():
-            return None
-        data = json.loads(path.read_text())
+        with self._lock:
+            if self._db is None:
+                return None
+            row = self._db.execute(
+                "SELECT session_id, state, message, timestamp FROM tasks WHERE id = ?", (task_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            items = self._db.execute(
+                "SELECT kind, data FROM task_items WHERE task_id = ? ORDER BY rowid", (task_id,)
+            ).fetchall()
+        session_id, state, message, timestamp = row
         task = Task(
-            id=data["id"],
-            session_id=data["sessionId"],
-            status=TaskStatus(
-                state=TaskState(data["status"]["state"]),
-                message=data["status"]["message"],
-                timestamp=data["status"]["timestamp"],
-            ),
-            artifacts=[
-                Artifact(name=a["name"], type=a["type"], parts=a["parts"])
-                for a in data.get("artifacts", [])
-            ],
-            history=[
-                Message(role=m["role"], parts=m["parts"])
-                for m in data.get("history", [])
-            ],
+            id=task_id,
+            session_id=session_id,
+            status=TaskStatus(state=TaskState(state), message=message, timestamp=timestamp),
         )
+        for kind, data in items:
+            item = json.loads(data)
+            if kind == "artifact":
+                task.artifacts.append(Artifact(**item))
+            else:
+                task.history.append(Message(**item))
         self._tasks[task_id] = task
-        self._session_to_task[task.session_id] = task_id
+        self._session_to_task.setdefault(session_id, task_id)
         return task
 
+    def _import_json_tasks(self) -> None:
+        """One-time import of legacy <task_id>.json files, skipping malformed ones."""
+        with self._transaction():
+            if self._db.execute("SELECT 1 FROM meta WHERE key = ?", (JSON_IMPORT_KEY,)).fetchone():
+                return
+            for path in sorted(self.storage_dir.glob("task-*.json"), key=lambda p: p.stat().st_mtime):
+                try:
+                    data = json.loads(path.read_text())
+                    status = data["status"]
+                    row = (data["id"], data["sessionId"], TaskState(status["state"]).value,
+                           status["message"], status["timestamp"])
+                    items = [("message", json.dumps(asdict(Message(**m)))) for m in data.get("history", [])]
+                    items += [("artifact", json.dumps(asdict(Artifact(**a)))) for a in data.get("artifacts", [])]
+                except (OSError, ValueError, KeyError, TypeError, AttributeError):
+                    continue
+                inserted = self._db.execute(
+                    "INSERT OR IGNORE INTO tasks (id, session_id, state, message, timestamp) VALUES (?, ?, ?, ?, ?)",
+                    row,
+                ).rowcount
+                if not inserted:
+                    continue  # Already imported by a database that predates the meta table
+                self._db.executemany(
+                    "INSERT INTO task_items (task_id, kind, data) VALUES (?, ?, ?)",
+                    [(row[0], kind, item) for kind, item in items],
+                )
+            self._db.execute(
+                "INSERT INTO meta (key, value) VALUES (?, ?)",
+                (JSON_IMPORT_KEY, datetime.now(timezone.utc).isoformat()),
+            )
+
 
 # Swarm integration helpers
+
+# One incremental reader per journal-format signals dir, kept across polls
+_journal_readers: dict[Path, JournalReader] = {}
+
+
 def sync_from_signals(manager: TaskManager, task_id: str, signals_dir: Path) -> None:
     """Sync task state from swarm signal files.
 
+    Journal-format sessions (.signals/journal.jsonl) are tailed: each call
+    parses only the records appended since the previous call.
+
     Args:
         manager: Task manager
         task_id: Task ID to update
@@ -284,13 +576,26 @@ def sync_from_signals(manager: TaskManager, task_id: str, signals_dir: Path) ->
     if not signals_dir.exists():
         return
 
-    done_signals = list(signals_dir.glob("*.done"))
-    fail_signals = list(signals_dir.glob("*.fail"))
+    if journal_path(signals_dir).exists():
+        reader = _journal_readers.setdefault(signals_dir.resolve(), JournalReader(signals_dir))
+        reader.poll()
+        journaled = dict(reader.signals)
+        done_signals = sorted(name for name in journaled if name.endswith(".done"))
+        fail_signals = sorted(name for name in journaled if name.endswith(".fail"))
+
+        def load_signal(name: str) -> dict:
+            return journaled[name]
+    else:
+        done_signals = [f.name for f in signals_dir.glob("*.done")]
+        fail_signals = [f.name for f in signals_dir.glob("*.fail")]
+
+        def load_signal(name: str) -> dict:
+            return json.loads((signals_dir / name).read_text())
 
     if fail_signals:
         # Read first failure with error handling
         try:
-            fail_data = json.loads(fail_signals[0].read_text())
+            fail_data = load_signal(fail_signals[0])
             error_msg = fail_data.get('error', 'unknown')
         except (json.JSONDecodeError, OSError) as e:
             error_msg = f"malformed signal file: {e}"
@@ -300,19 +605,13 @@ def sync_from_signals(manager: TaskManager, task_id: str, signals_dir: Path) ->
 
     if done_signals:
         # Check if all expected signals present (heuristic: sentinel.done = final)
-        sentinel_done = signals_dir / "sentinel.done"
-        if sentinel_done.exists():
+        if "sentinel.done" in done_signals:
             # Read deliverable path from sentinel signal with error handling
             try:
-                sentinel_data = json.loads(sentinel_done.read_text())
+                sentinel_data = load_signal("sentinel.done")
                 deliverable_path = Path(sentinel_data.get("path", ""))
-                if deliverable_path.exists():
-                    manager.add_artifact(
-                        task_id,
-                        deliverable_path.name,
-                        "text/markdown",
-                        deliverable_path.read_text(),
-                    )
+                if deliverable_path.is_file():
+                    manager.add_artifact_file(task_id, deliverable_path, "text/markdown")
             except (json.JSONDecodeError, OSError, KeyError) as e:
                 # Log error but continue with completion
                 # (signal exists but malformed - task did complete)
@@ -0,0 +1,163 @@
+"""Bounded background launch of A2A swarm workflows.
+
+tasks/send creates the session and the task, hands the workflow to a
+TaskLauncher and returns the still-submitted task at once; it never waits on
+a subprocess in the event loop. The launcher admits at most QUEUE_SIZE
+pending launches (beyond that tasks/send is rejected with LaunchQueueFull)
+and runs them on WORKERS coroutines, so a burst of submissions cannot start
+an unbounded number of workflows.
+
+Queue depth, launches in flight (held by a worker until the workflow command
+exits) and launch latency (submission to workflow start) are exported in
+Prometheus text format by prometheus().
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+WORKERS = 4
+QUEUE_SIZE = 64
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class LaunchQueueFull(RuntimeError):
+    """The admission queue is at capacity; the client should retry later."""
+
+
+@dataclass
+class Launch:
+    """One queued workflow launch."""
+
+    task_id: str
+    session_dir: str
+    message: str
+    skill: str
+    submitted: float = field(default_factory=time.monotonic)
+
+
+class TaskLauncher:
+    """Admission queue and worker pool for workflow launches.
+
+    Args:
+        start: Coroutine function that starts one workflow; it returns when
+            the workflow has been handed off (or finished, for a blocking
+            workflow command). Exceptions are passed to on_error.
+        on_error: Called with (launch, exception) when start raises
+        workers: Concurrent launches
+        queue_size: Pending launches admitted before submit() rejects
+    """
+
+    def __init__(
+        self,
+        start: Callable[[Launch], Awaitable[None]],
+        on_error: Callable[[Launch, BaseException], None],
+        workers: int = WORKERS,
+        queue_size: int = QUEUE_SIZE,
+    ) -> None:
+        self.start = start
+        self.on_error = on_error
+        self.workers = workers
+        self.queue_size = queue_size
+        self.queue: asyncio.Queue[Launch] | None = None
+        self.tasks: list[asyncio.Task] = []
+        self.in_flight = 0
+        self.counters = {"submitted": 0, "rejected": 0, "started": 0, "failed": 0}
+        self.latency_buckets = [0] * len(LATENCY_BUCKETS)
+        self.latency_sum = 0.0
+        self.latency_count = 0
+
+    def submit(self, launch: Launch) -> None:
+        """Admit a launch, starting the worker pool on first use.
+
+        Raises:
+            LaunchQueueFull: If queue_size launches are already pending
+        """
+        if self.queue is None:
+            self.queue = asyncio.Queue(maxsize=self.queue_size)
+        if not self.tasks:
+            self.tasks = [asyncio.create_task(self._work()) for _ in range(self.workers)]
+        try:
+            self.queue.put_nowait(launch)
+        except asyncio.QueueFull:
+            self.counters["rejected"] += 1
+            raise LaunchQueueFull(f"Launch queue full ({self.queue_size} pending); retry later") from None
+        self.counters["submitted"] += 1
+
+    @property
+    def depth(self) -> int:
+        """Launches waiting for a worker."""
+        return self.queue.qsize() if self.queue is not None else 0
+
+    async def close(self) -> None:
+        """Stop the workers; pending launches are dropped."""
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        self.tasks = []
+
+    def _observe_latency(self, seconds: float) -> None:
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                self.latency_buckets[i] += 1
+        self.latency_sum += seconds
+        self.latency_count += 1
+
+    async def _work(self) -> None:
+        assert self.queue is not None
+        while True:
+            launch = await self.queue.get()
+            self.in_flight += 1
+            self._observe_latency(time.monotonic() - launch.submitted)
+            try:
+                await self.start(launch)
+                self.counters["started"] += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.counters["failed"] += 1
+                self.on_error(launch, e)
+            finally:
+                self.in_flight -= 1
+                self.queue.task_done()
+
+    def stats(self) -> dict[str, Any]:
+        """Current queue depth, in-flight launches and counters."""
+        return {
+            "queueDepth": self.depth,
+            "queueSize": self.queue_size,
+            "inFlight": self.in_flight,
+            "workers": self.workers,
+            **self.counters,
+        }
+
+    def prometheus(self) -> str:
+        """Launcher gauges, counters and launch latency histogram."""
+        lines = [
+            "# HELP a2a_launch_queue_depth Workflow launches waiting for a worker",
+            "# TYPE a2a_launch_queue_depth gauge",
+            f"a2a_launch_queue_depth {self.depth}",
+            "# HELP a2a_launch_in_flight Workflow launches held by a worker",
+            "# TYPE a2a_launch_in_flight gauge",
+            f"a2a_launch_in_flight {self.in_flight}",
+            "# HELP a2a_launches_total Workflow launches by outcome",
+            "# TYPE a2a_launches_total counter",
+        ]
+        for outcome, value in self.counters.items():
+            lines.append(f'a2a_launches_total{{outcome="{outcome}"}} {value}')
+        lines += [
+            "# HELP a2a_launch_latency_seconds Time from tasks/send to workflow start",
+            "# TYPE a2a_launch_latency_seconds histogram",
+        ]
+        for bound, count in zip(LATENCY_BUCKETS, self.latency_buckets):
+            lines.append(f'a2a_launch_latency_seconds_bucket{{le="{bound}"}} {count}')
+        lines += [
+            f'a2a_launch_latency_seconds_bucket{{le="+Inf"}} {self.latency_count}',
+            f"a2a_launch_latency_seconds_sum {self.latency_sum:.6f}",
+            f"a2a_launch_latency_seconds_count {self.latency_count}",
+        ]
+        return "\n".join(lines) + "\n"
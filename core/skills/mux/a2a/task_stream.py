@@ -0,0 +1,209 @@
+"""Push A2A task updates to streaming subscribers as signals land.
+
+tasks/sendSubscribe and tasks/resubscribe stream TaskStatusUpdateEvent and
+TaskArtifactUpdateEvent results over Server-Sent Events. TaskStreamHub keeps
+one channel per swarm session, however many clients follow it: a single
+SignalWatcher (inotify, or stat polling where unavailable) wakes the channel,
+the channel runs sync_from_signals once, and any status or artifact change
+is fanned out to every subscriber of that task.
+
+Events are numbered per session; the SSE id lets a client resume with
+Last-Event-ID (or params.lastEventId) and be replayed what it missed from the
+last HISTORY_SIZE events. A subscriber that falls QUEUE_SIZE events behind
+is closed rather than buffered without bound; on resubscribe it gets the
+replay, or a fresh status snapshot if its id has left the history.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from collections import deque
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from lib.signal_watch import SignalWatcher
+
+HISTORY_SIZE = 256
+QUEUE_SIZE = 256
+WATCH_INTERVAL = 1.0
+MAX_CHANNELS = 128
+TERMINAL_STATES = ("completed", "failed", "canceled")
+
+
+def status_event(task: dict[str, Any]) -> dict[str, Any]:
+    """TaskStatusUpdateEvent for a serialized task."""
+    return {
+        "id": task["id"],
+        "status": task["status"],
+        "final": task["status"]["state"] in TERMINAL_STATES,
+    }
+
+
+def artifact_event(task: dict[str, Any], artifact: dict[str, Any]) -> dict[str, Any]:
+    """TaskArtifactUpdateEvent for one artifact of a serialized task."""
+    return {"id": task["id"], "artifact": artifact}
+
+
+class _SessionChannel:
+    """Watcher, history and subscribers for one swarm session."""
+
+    def __init__(self, session_id: str, signals_dir: Path) -> None:
+        self.session_id = session_id
+        self.signals_dir = signals_dir
+        self.subscribers: dict[asyncio.Queue, str] = {}  # queue -> task id
+        self.history: deque[tuple[int, dict]] = deque(maxlen=HISTORY_SIZE)
+        self.last_id = 0
+        # Last published (status, artifact count) per task
+        self.published: dict[str, tuple[str, int]] = {}
+        self.wakeup = asyncio.Event()
+        self.task: asyncio.Task | None = None
+
+
+class TaskStreamHub:
+    """Shares one signal watcher per session among streaming subscribers.
+
+    Args:
+        get_task: task id -> serialized task (dict) or None
+        sync_task: task id -> None; refreshes the task from its signals
+        signals_dir_for: session id -> its .signals/ directory
+    """
+
+    def __init__(
+        self,
+        get_task: Callable[[str], dict[str, Any] | None],
+        sync_task: Callable[[str], None],
+        signals_dir_for: Callable[[str], Path],
+    ) -> None:
+        self.get_task = get_task
+        self.sync_task = sync_task
+        self.signals_dir_for = signals_dir_for
+        self.channels: dict[str, _SessionChannel] = {}
+
+    def is_watching(self, session_id: str) -> bool:
+        """True while a channel keeps this session's tasks in sync."""
+        channel = self.channels.get(session_id)
+        return channel is not None and channel.task is not None and not channel.task.done()
+
+    def subscribe(self, task_id: str, session_id: str, last_event_id: int | None = None) -> asyncio.Queue:
+        """Queue of (event id, result) for one task; None marks the end of the stream.
+
+        The queue starts with the events after last_event_id when they are
+        still in the history, otherwise with the task's current status and
+        artifacts.
+        """
+        channel = self.channels.get(session_id)
+        if channel is None:
+            self._evict_idle()
+            channel = self.channels[session_id] = _SessionChannel(session_id, self.signals_dir_for(session_id))
+        queue: asyncio.Queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+        task = self.get_task(task_id)
+
+        oldest = channel.history[0][0] if channel.history else None
+        if last_event_id is not None and oldest is not None and oldest - 1 <= last_event_id <= channel.last_id:
+            replay = [item for item in channel.history if item[0] > last_event_id and item[1]["id"] == task_id]
+            if replay and replay[-1][1].get("final"):
+                for item in replay[-(QUEUE_SIZE - 1):]:
+                    queue.put_nowait(item)
+                queue.put_nowait(None)
+                return queue
+            if task is None or not status_event(task)["final"]:
+                for item in replay[-QUEUE_SIZE:]:
+                    queue.put_nowait(item)
+                return self._add_subscriber(channel, queue, task_id)
+
+        if task is not None:
+            channel.last_id += 1
+            queue.put_nowait((channel.last_id, status_event(task)))
+            for artifact in task["artifacts"][: QUEUE_SIZE - 2]:
+                channel.last_id += 1
+                queue.put_nowait((channel.last_id, artifact_event(task, artifact)))
+            channel.published.setdefault(task_id, (task["status"]["state"], len(task["artifacts"])))
+            if status_event(task)["final"]:
+                queue.put_nowait(None)
+                return queue
+        return self._add_subscriber(channel, queue, task_id)
+
+    def _add_subscriber(self, channel: _SessionChannel, queue: asyncio.Queue, task_id: str) -> asyncio.Queue:
+        channel.subscribers[queue] = task_id
+        if channel.task is None or channel.task.done():
+            channel.task = asyncio.create_task(self._watch(channel))
+        return queue
+
+    def _evict_idle(self) -> None:
+        """Forget the oldest idle sessions beyond MAX_CHANNELS."""
+        idle = [sid for sid, ch in self.channels.items() if not ch.subscribers and (ch.task is None or ch.task.done())]
+        for session_id in idle[: max(0, len(self.channels) - MAX_CHANNELS + 1)]:
+            del self.channels[session_id]
+
+    def unsubscribe(self, session_id: str, queue: asyncio.Queue) -> None:
+        channel = self.channels.get(session_id)
+        if channel is None:
+            return
+        channel.subscribers.pop(queue, None)
+        channel.wakeup.set()
+
+    def notify(self, session_id: str) -> None:
+        """Re-check a session now (e.g. after tasks/cancel)."""
+        channel = self.channels.get(session_id)
+        if channel is not None:
+            channel.wakeup.set()
+
+    def _publish(self, channel: _SessionChannel, task_id: str, event: dict) -> None:
+        channel.last_id += 1
+        item = (channel.last_id, event)
+        channel.history.append(item)
+        final = event.get("final", False)
+        for queue, subscribed in list(channel.subscribers.items()):
+            if subscribed != task_id:
+                continue
+            if queue.full():
+                # Too slow: end its stream; it resumes from the history
+                del channel.subscribers[queue]
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(None)
+                continue
+            queue.put_nowait(item)
+            if final:
+                del channel.subscribers[queue]
+                if queue.full():
+                    queue.get_nowait()
+                queue.put_nowait(None)
+
+    def _refresh(self, channel: _SessionChannel, sync: bool) -> None:
+        """Publish what changed for every followed task (syncing it from signals first)."""
+        for task_id in set(channel.subscribers.values()):
+            task = self.get_task(task_id)
+            if task is None:
+                continue
+            if sync and task["status"]["state"] == "working":
+                self.sync_task(task_id)
+                task = self.get_task(task_id) or task
+            state, artifacts = channel.published.get(task_id, ("", 0))
+            for artifact in task["artifacts"][artifacts:]:
+                self._publish(channel, task_id, artifact_event(task, artifact))
+            if task["status"]["state"] != state:
+                self._publish(channel, task_id, status_event(task))
+            channel.published[task_id] = (task["status"]["state"], len(task["artifacts"]))
+
+    async def _watch(self, channel: _SessionChannel) -> None:
+        watcher = SignalWatcher(channel.signals_dir)
+        try:
+            watcher.new_signals()  # Already present: covered by the first sync
+            sync = True
+            while channel.subscribers:
+                self._refresh(channel, sync)
+                if not channel.subscribers:
+                    break
+                channel.wakeup.clear()
+                signal_wait = asyncio.ensure_future(asyncio.to_thread(watcher.wait, WATCH_INTERVAL))
+                poke = asyncio.ensure_future(channel.wakeup.wait())
+                await asyncio.wait({signal_wait, poke}, return_when=asyncio.FIRST_COMPLETED)
+                poke.cancel()
+                # Bounded by WATCH_INTERVAL; the watcher is not thread-safe
+                sync = bool(await signal_wait)
+        finally:
+            watcher.close()
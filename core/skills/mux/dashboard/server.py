@@ -17,19 +17,33 @@ Endpoints:
     GET /               - Dashboard UI
     GET /api/metrics    - All session metrics (JSON)
     GET /api/prometheus - Prometheus format metrics
+    GET /api/events     - Server-Sent Events: live-report lines, signals and
+                          updated session metrics as they land
     GET /api/health     - Health check
+
+/api/events is fed by one EventHub: a single poller tails every session
+(lib/event_tail.py) while at least one client is connected, and fans each
+event out to all clients. Events carry increasing ids; a reconnecting
+EventSource sends Last-Event-ID and gets what it missed from the recent
+history. A client that falls EVENT_QUEUE_SIZE events behind is disconnected
+(it reconnects and catches up from the history) instead of holding memory.
 """
 
 import argparse
+import asyncio
+import json
 import sys
+from collections import deque
 from pathlib import Path
 
-from fastapi import FastAPI
-from fastapi.responses import FileResponse, JSONResponse, PlainTextResponse
+from fastapi import FastAPI, Request
+from fastapi.responses import FileResponse, JSONResponse, PlainTextResponse, StreamingResponse
 
-# Import metrics module (same directory parent)
+# Import metrics module (same directory parent) and the mux lib
 sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
-from metrics import collect_session_metrics, export_prometheus
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from lib.event_tail import EventTail
+from metrics import SessionIndex, export_prometheus
 
 app = FastAPI(title="Swarm Observability Dashboard", version="1.0.0")
 
@@ -37,6 +51,98 @@ app = FastAPI(title="Swarm Observability Dashboard", version="1.0.0")
 SESSIONS_DIR = Path("tmp/swarm")
 DASHBOARD_DIR = Path(__file__).parent
 MAX_SESSIONS = 50
+EVENT_POLL_INTERVAL = 0.5
+EVENT_HISTORY = 1000
+EVENT_QUEUE_SIZE = 500
+EVENT_KEEPALIVE = 15.0
+
+_session_index: SessionIndex | None = None
+
+
+def session_index() -> SessionIndex:
+    """The session index for SESSIONS_DIR (rebuilt if SESSIONS_DIR changed)."""
+    global _session_index
+    if _session_index is None or _session_index.sessions_base != SESSIONS_DIR:
+        _session_index = SessionIndex(SESSIONS_DIR)
+    return _session_index
+
+
+def recent_sessions() -> list[dict]:
+    """Newest MAX_SESSIONS sessions' metrics, served from the session index."""
+    return session_index().recent(MAX_SESSIONS)
+
+
+class EventHub:
+    """Polls session directories once and fans events out to subscribers.
+
+    The poller runs only while someone is subscribed; it starts from the
+    current end of every session, so an idle dashboard costs nothing.
+    """
+
+    def __init__(self) -> None:
+        self.subscribers: set[asyncio.Queue] = set()
+        self.history: deque[tuple[int, dict]] = deque(maxlen=EVENT_HISTORY)
+        self.last_id = 0
+        self._task: asyncio.Task | None = None
+
+    def subscribe(self, last_event_id: int | None = None) -> asyncio.Queue:
+        """New subscriber queue, primed with history after last_event_id."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=EVENT_QUEUE_SIZE)
+        if last_event_id is not None:
+            for event_id, event in self.history:
+                if event_id > last_event_id and not queue.full():
+                    queue.put_nowait((event_id, event))
+        self.subscribers.add(queue)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        self.subscribers.discard(queue)
+
+    def publish(self, events: list[dict]) -> None:
+        """Number events and hand them to every subscriber."""
+        for event in events:
+            self.last_id += 1
+            item = (self.last_id, event)
+            self.history.append(item)
+            for queue in list(self.subscribers):
+                try:
+                    queue.put_nowait(item)
+                except asyncio.QueueFull:
+                    # Too slow: drop it; None tells its stream to close
+                    self.subscribers.discard(queue)
+                    while not queue.empty():
+                        queue.get_nowait()
+                    queue.put_nowait(None)
+
+    def collect(self, tail: EventTail) -> list[dict]:
+        """One poll: tailed events plus fresh metrics for sessions that signalled."""
+        events = tail.poll()
+        changed = {e["session"] for e in events if e["type"] in ("signal", "session_started")}
+        index = session_index()
+        for name in sorted(changed):
+            events.append({
+                "type": "session",
+                "session": name,
+                "metrics": index.session_metrics(tail.sessions_base / name),
+            })
+        return events
+
+    async def _run(self) -> None:
+        tail = EventTail(SESSIONS_DIR, MAX_SESSIONS)
+        while self.subscribers:
+            # Tailing and metrics scans hit the filesystem: keep them off the event loop
+            self.publish(await asyncio.to_thread(self.collect, tail))
+            await asyncio.sleep(EVENT_POLL_INTERVAL)
+
+
+_event_hub = EventHub()
+
+
+def format_sse(event_id: int, event: dict) -> str:
+    """One Server-Sent Events message."""
+    return f"id: {event_id}\nevent: {event['type']}\ndata: {json.dumps(event, separators=(',', ':'))}\n\n"
 
 
 @app.get("/")
@@ -48,32 +154,47 @@ async def dashboard() -> FileResponse:
 @app.get("/api/metrics")
 async def get_metrics() -> JSONResponse:
     """Return all session metrics as JSON."""
-    sessions = []
-    session_dirs = sorted(
-        SESSIONS_DIR.glob("*-*-*"), key=lambda p: p.name, reverse=True
-    )
-
-    for session_dir in session_dirs[:MAX_SESSIONS]:
-        if session_dir.is_dir():
-            sessions.append(collect_session_metrics(session_dir))
-
-    return JSONResponse({"sessions": sessions})
+    return JSONResponse({"sessions": recent_sessions()})
 
 
+@app.get("/metrics")
 @app.get("/api/prometheus")
 async def get_prometheus() -> PlainTextResponse:
-    """Return metrics in Prometheus exposition format."""
-    sessions = []
-    session_dirs = sorted(
-        SESSIONS_DIR.glob("*-*-*"), key=lambda p: p.name, reverse=True
+    """Return session gauges and agentic_* histograms/counters in Prometheus format."""
+    return PlainTextResponse(export_prometheus(recent_sessions()), media_type="text/plain")
+
+
+@app.get("/api/events")
+async def get_events(request: Request, session: str | None = None) -> StreamingResponse:
+    """Stream live events as Server-Sent Events (optionally for one session)."""
+    last_event_id = request.headers.get("last-event-id")
+    queue = _event_hub.subscribe(int(last_event_id) if last_event_id and last_event_id.isdigit() else None)
+
+    async def stream():
+        try:
+            yield "retry: 2000\n\n"
+            while True:
+                try:
+                    item = await asyncio.wait_for(queue.get(), EVENT_KEEPALIVE)
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        return
+                    yield ": keepalive\n\n"
+                    continue
+                if item is None:
+                    return
+                event_id, event = item
+                if session is None or event["session"] == session:
+                    yield format_sse(event_id, event)
+        finally:
+            _event_hub.unsubscribe(queue)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
 
-    for session_dir in session_dirs[:MAX_SESSIONS]:
-        if session_dir.is_dir():
-            sessions.append(collect_session_metrics(session_dir))
-
-    return PlainTextResponse(export_prometheus(sessions), media_type="text/plain")
-
 
 @app.get("/api/health")
 async def health() -> JSONResponse:
@@ -0,0 +1,143 @@
+"""Follow live progress across session directories.
+
+Backs the dashboard's /api/events stream. SessionTail follows one session:
+lines appended to .live-report (see core/tools/agentic/lib/observability.py
+P6) and .done/.fail signals, from the journal or as files. EventTail follows
+every session under a base directory. Each poll() costs a few stat() calls
+per session; files are only read, and .signals/ only listed, when they
+changed.
+
+Example:
+    tail = EventTail(Path("tmp/swarm"))
+    while True:
+        for event in tail.poll():
+            print(event["type"], event["session"])
+        time.sleep(0.5)
+"""
+import os
+from pathlib import Path
+from typing import Optional
+
+from .signal_journal import JournalReader, read_signal_file
+
+LIVE_REPORT_FILENAME = ".live-report"
+SIGNAL_SUFFIXES = (".done", ".fail")
+
+
+class SessionTail:
+    """Reports what a session appended since the previous poll().
+
+    Args:
+        session_dir: Session directory
+        from_start: Report existing lines and signals on the first poll();
+            otherwise only what arrives after construction
+    """
+
+    def __init__(self, session_dir: Path, from_start: bool = False):
+        self.session_dir = Path(session_dir)
+        self.name = self.session_dir.name
+        self.report_path = self.session_dir / LIVE_REPORT_FILENAME
+        self.signals_dir = self.session_dir / ".signals"
+        self.report_offset = 0
+        self.seen: set[str] = set()
+        self._journal = JournalReader(self.signals_dir)
+        self._signals_mtime = 0
+        if not from_start:
+            self.poll()
+
+    def _report_lines(self) -> list[str]:
+        try:
+            size = self.report_path.stat().st_size
+        except FileNotFoundError:
+            return []
+        if size < self.report_offset:
+            self.report_offset = 0  # Truncated or replaced
+        if size == self.report_offset:
+            return []
+        with open(self.report_path, "rb") as f:
+            f.seek(self.report_offset)
+            data = f.read(size - self.report_offset)
+        end = data.rfind(b"\n") + 1  # A partly written line waits for the next poll
+        self.report_offset += end
+        return data[:end].decode("utf-8", errors="replace").splitlines()
+
+    def _new_signals(self) -> list[tuple[str, dict]]:
+        found = []
+        for record in self._journal.poll():
+            name = record["signal"]
+            if name.endswith(SIGNAL_SUFFIXES) and name not in self.seen:
+                found.append((name, record))
+        try:
+            mtime = self.signals_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime = 0
+        if mtime and mtime != self._signals_mtime:
+            self._signals_mtime = mtime
+            try:
+                entries = sorted(self.signals_dir.iterdir())
+            except FileNotFoundError:
+                entries = []
+            for entry in entries:
+                if entry.suffix in SIGNAL_SUFFIXES and entry.name not in self.seen:
+                    try:
+                        found.append((entry.name, read_signal_file(entry)))
+                    except OSError:
+                        continue
+        self.seen.update(name for name, _ in found)
+        return found
+
+    def poll(self) -> list[dict]:
+        """New events: {"type": "report", "line"} and {"type": "signal", "signal", "fields"}."""
+        events: list[dict] = [
+            {"type": "report", "session": self.name, "line": line}
+            for line in self._report_lines()
+        ]
+        for name, fields in self._new_signals():
+            fields = {k: v for k, v in fields.items() if k != "signal"}
+            events.append({"type": "signal", "session": self.name, "signal": name, "fields": fields})
+        return events
+
+
+class EventTail:
+    """Follows the newest `limit` sessions under a base directory.
+
+    Sessions present at construction are followed from their current end;
+    sessions created later are reported in full, preceded by a
+    {"type": "session_started"} event.
+    """
+
+    def __init__(self, sessions_base: Path, limit: Optional[int] = None):
+        self.sessions_base = Path(sessions_base)
+        self.limit = limit
+        self.tails: dict[str, SessionTail] = {}
+        self._started = False
+
+    def _session_dirs(self) -> list[Path]:
+        try:
+            entries = list(os.scandir(self.sessions_base))
+        except FileNotFoundError:
+            return []
+        dirs = sorted(
+            (Path(e.path) for e in entries if e.is_dir() and not e.name.startswith(".")),
+            key=lambda p: p.name,
+            reverse=True,
+        )
+        return dirs[: self.limit] if self.limit is not None else dirs
+
+    def poll(self) -> list[dict]:
+        """Events from every followed session since the previous poll()."""
+        events: list[dict] = []
+        current = self._session_dirs()
+        names = {d.name for d in current}
+        for name in set(self.tails) - names:
+            del self.tails[name]
+        for session_dir in current:
+            tail = self.tails.get(session_dir.name)
+            if tail is None:
+                tail = SessionTail(session_dir, from_start=self._started)
+                self.tails[session_dir.name] = tail
+                if self._started:
+                    events.append({"type": "session_started", "session": session_dir.name})
+            events.extend(tail.poll())
+        self._started = True
+        return events
@@ -0,0 +1,170 @@
+"""Signal journal support for mux tools.
+
+Sessions in journal format keep every signal as one JSON line in
+`.signals/journal.jsonl` instead of one `.done`/`.fail` file per signal
+(the format is written by the agentic hierarchy's lib/signal_journal.py and
+by signal.py). Each record's "signal" key is the file name the signal would
+otherwise have had, and a later record with the same key supersedes an
+earlier one.
+
+One-shot tools (check-signals.py, verify.py, metrics.py) remember how far
+they have read in `.signals/.journal.cursor`, so a status check parses only
+the records appended since the previous check, and never walks the session
+tree. Long-running readers (the A2A server) keep a JournalReader in memory.
+"""
+import fcntl
+import json
+import os
+from pathlib import Path
+from typing import Optional
+
+JOURNAL_FILENAME = "journal.jsonl"
+CURSOR_FILENAME = ".journal.cursor"
+SIGNAL_FORMAT_ENV_VAR = "AGENTIC_SIGNAL_FORMAT"
+HEAD_BYTES = 256
+
+
+def journal_path(signals_dir: Path) -> Path:
+    """Path of the journal for a .signals/ directory."""
+    return Path(signals_dir) / JOURNAL_FILENAME
+
+
+def journal_enabled(signals_dir: Path) -> bool:
+    """True if new signals for this directory belong in the journal."""
+    requested = os.environ.get(SIGNAL_FORMAT_ENV_VAR, "").strip().lower()
+    return requested == "journal" or journal_path(signals_dir).exists()
+
+
+def append_signal(signals_dir: Path, record: dict) -> Path:
+    """Append one signal record under an exclusive lock.
+
+    Args:
+        signals_dir: The session's .signals/ directory
+        record: Signal fields, including "signal" (the equivalent file name)
+
+    Returns:
+        Path to the journal
+    """
+    signals_dir = Path(signals_dir)
+    signals_dir.mkdir(parents=True, exist_ok=True)
+    path = journal_path(signals_dir)
+    line = (json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8")
+    while True:
+        fd = os.open(str(path), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            # A compaction may have replaced the file while we waited
+            if os.fstat(fd).st_ino == os.stat(path).st_ino:
+                os.write(fd, line)
+                return path
+        except FileNotFoundError:
+            pass
+        finally:
+            os.close(fd)
+
+
+class JournalReader:
+    """Incremental journal reader.
+
+    poll() parses only records appended since the previous poll. If the
+    journal's first line changed (compaction), it starts over.
+
+    Attributes:
+        signals: Latest record per signal key
+    """
+
+    def __init__(self, signals_dir: Path):
+        self.signals_dir = Path(signals_dir)
+        self.path = journal_path(self.signals_dir)
+        self.offset = 0
+        self.head = b""
+        self.signals: dict[str, dict] = {}
+
+    def poll(self) -> list[dict]:
+        """Fold newly appended records into signals and return them."""
+        try:
+            f = open(self.path, "rb")
+        except FileNotFoundError:
+            return []
+        with f:
+            if self.offset and f.read(len(self.head)) != self.head:
+                self.offset = 0
+                self.signals.clear()
+            f.seek(self.offset)
+            data = f.read()
+
+        end = data.rfind(b"\n") + 1
+        records = []
+        for raw in data[:end].splitlines():
+            try:
+                record = json.loads(raw)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(record, dict) and "signal" in record:
+                records.append(record)
+                self.signals[record["signal"]] = record
+        if self.offset == 0 and end:
+            self.head = data[: min(data.find(b"\n") + 1, HEAD_BYTES)]
+        self.offset += end
+        return records
+
+    @classmethod
+    def load(cls, signals_dir: Path) -> "JournalReader":
+        """Reader resumed from the directory's saved cursor (if any)."""
+        reader = cls(signals_dir)
+        try:
+            state = json.loads((reader.signals_dir / CURSOR_FILENAME).read_text())
+            reader.offset = int(state["offset"])
+            reader.head = bytes.fromhex(state["head"])
+            reader.signals = dict(state["signals"])
+        except (OSError, ValueError, KeyError, TypeError):
+            reader = cls(signals_dir)
+        return reader
+
+    def save(self) -> None:
+        """Persist the cursor atomically (best effort: read-only dirs are fine)."""
+        cursor = self.signals_dir / CURSOR_FILENAME
+        tmp_path = self.signals_dir / f".{CURSOR_FILENAME}.tmp.{os.getpid()}"
+        state = {"offset": self.offset, "head": self.head.hex(), "signals": self.signals}
+        try:
+            tmp_path.write_text(json.dumps(state))
+            os.replace(str(tmp_path), str(cursor))
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+
+
+def read_signal_file(signal_path: Path) -> dict[str, str]:
+    """Parse a `key: value` signal file."""
+    data = {}
+    for line in signal_path.read_text().strip().split("\n"):
+        if ": " in line:
+            key, value = line.split(": ", 1)
+            data[key] = value
+    return data
+
+
+def load_journal_signals(signals_dir: Path) -> Optional[dict[str, dict]]:
+    """All signals of a journal-format directory, keyed by signal name.
+
+    Tails the journal from the saved cursor, then adds any plain signal
+    files in the same directory (written by tools that predate the journal).
+    Only the directory itself is listed; the session tree is not walked.
+
+    Returns:
+        Mapping of signal name to fields, or None if the directory has no
+        journal (callers then fall back to file globbing).
+    """
+    signals_dir = Path(signals_dir)
+    if not journal_path(signals_dir).exists():
+        return None
+    reader = JournalReader.load(signals_dir)
+    reader.poll()
+    reader.save()
+    signals = dict(reader.signals)
+    for entry in signals_dir.iterdir():
+        if entry.suffix in (".done", ".fail") and entry.name not in signals:
+            try:
+                signals[entry.name] = read_signal_file(entry)
+            except OSError:
+                continue
+    return signals
@@ -0,0 +1,206 @@
+"""Block until signals land in a .signals/ directory, without polling.
+
+On Linux the watcher uses inotify (through ctypes, no dependencies): the
+directory is watched for renames (signal.py's atomic write), creates and
+writes (journal appends), and the caller sleeps in select() until one
+arrives. Elsewhere, or if inotify is unavailable (e.g. the per-user watch
+limit is exhausted), it falls back to polling two stat() calls (directory
+mtime and journal size) every FALLBACK_POLL_INTERVAL seconds; the
+directory is only listed when one of them changes.
+
+Both file-per-signal and journal-format sessions are supported (see
+signal_journal.py).
+
+Example:
+    for name, fields in iter_new_signals(signals_dir, timeout=600):
+        print(name, fields.get("path"))
+"""
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Iterator, Optional
+
+from .signal_journal import JournalReader, journal_path, read_signal_file
+
+SIGNAL_SUFFIXES = (".done", ".fail")
+FALLBACK_POLL_INTERVAL = 0.5
+
+# <sys/inotify.h>
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class _Inotify:
+    """Minimal inotify handle for one directory."""
+
+    def __init__(self, directory: Path):
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        if libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK) < 0:
+            errno = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(errno, f"inotify_add_watch failed for {directory}")
+
+    def wait(self, timeout: float) -> list[str]:
+        """Names of entries changed within timeout (empty list on timeout)."""
+        readable, _, _ = select.select([self.fd], [], [], max(timeout, 0))
+        if not readable:
+            return []
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        names = []
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            _, _, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            names.append(os.fsdecode(data[offset:offset + length].rstrip(b"\0")))
+            offset += length
+        return names
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class SignalWatcher:
+    """Reports signals that land in a .signals/ directory.
+
+    Signals already present when the watcher starts are reported by the
+    first call to new_signals() (or the first wait()).
+
+    Args:
+        signals_dir: Directory to watch (created if missing)
+        use_inotify: Set False to force the polling fallback
+    """
+
+    def __init__(self, signals_dir: Path, use_inotify: bool = True):
+        self.signals_dir = Path(signals_dir)
+        self.signals_dir.mkdir(parents=True, exist_ok=True)
+        self.seen: dict[str, dict] = {}
+        self._journal = JournalReader(self.signals_dir)
+        self._snapshot: Optional[tuple[int, int]] = None
+        self._inotify: Optional[_Inotify] = None
+        if use_inotify and sys.platform.startswith("linux"):
+            try:
+                self._inotify = _Inotify(self.signals_dir)
+            except (OSError, AttributeError):
+                self._inotify = None
+
+    @property
+    def mode(self) -> str:
+        return "inotify" if self._inotify is not None else "poll"
+
+    def _stat_snapshot(self) -> tuple[int, int]:
+        try:
+            dir_mtime = self.signals_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            dir_mtime = 0
+        try:
+            journal_size = journal_path(self.signals_dir).stat().st_size
+        except FileNotFoundError:
+            journal_size = 0
+        return dir_mtime, journal_size
+
+    def new_signals(self) -> list[tuple[str, dict]]:
+        """Scan once and return signals not reported before."""
+        found: list[tuple[str, dict]] = []
+        for record in self._journal.poll():
+            name = record["signal"]
+            if name.endswith(SIGNAL_SUFFIXES) and name not in self.seen:
+                found.append((name, record))
+        for entry in sorted(self.signals_dir.iterdir()):
+            if entry.suffix in SIGNAL_SUFFIXES and entry.name not in self.seen:
+                try:
+                    found.append((entry.name, read_signal_file(entry)))
+                except OSError:
+                    continue
+        for name, fields in found:
+            self.seen[name] = fields
+        return found
+
+    def wait(self, timeout: float) -> list[tuple[str, dict]]:
+        """Block until at least one new signal lands or timeout expires.
+
+        Returns:
+            New (name, fields) pairs, or [] on timeout
+        """
+        deadline = time.monotonic() + timeout
+        found = self.new_signals()
+        while not found:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return []
+            if self._inotify is not None:
+                changed = self._inotify.wait(remaining)
+                if not any(n.endswith(SIGNAL_SUFFIXES) or n == journal_path(self.signals_dir).name for n in changed):
+                    continue
+            else:
+                time.sleep(min(FALLBACK_POLL_INTERVAL, remaining))
+                snapshot = self._stat_snapshot()
+                if snapshot == self._snapshot:
+                    continue
+                self._snapshot = snapshot
+            found = self.new_signals()
+        return found
+
+    def close(self) -> None:
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+
+    def __enter__(self) -> "SignalWatcher":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        self.close()
+        return False
+
+
+def iter_new_signals(
+    signals_dir: Path,
+    timeout: float,
+    use_inotify: bool = True,
+) -> Iterator[tuple[str, dict]]:
+    """Yield (name, fields) for each signal as it lands, until timeout.
+
+    Signals already present are yielded first.
+    """
+    deadline = time.monotonic() + timeout
+    with SignalWatcher(signals_dir, use_inotify=use_inotify) as watcher:
+        while True:
+            remaining = deadline - time.monotonic()
+            batch = watcher.wait(max(remaining, 0))
+            if not batch:
+                return
+            yield from batch
+
+
+def wait_for_signals(
+    signals_dir: Path,
+    expected: int,
+    timeout: float,
+    use_inotify: bool = True,
+) -> dict[str, dict]:
+    """Block until `expected` .done/.fail signals exist or timeout expires.
+
+    Returns:
+        All signals seen (name -> fields); fewer than expected on timeout
+    """
+    signals: dict[str, dict] = {}
+    for name, fields in iter_new_signals(signals_dir, timeout, use_inotify=use_inotify):
+        signals[name] = fields
+        if len(signals) >= expected:
+            break
+    return signals
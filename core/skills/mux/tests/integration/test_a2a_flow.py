@@ -3,6 +3,8 @@
 import json
 import sys
 import tempfile
+import threading
+import time
 from importlib.util import module_from_spec, spec_from_file_location
 from pathlib import Path
 
@@ -127,3 +129,38 @@ def test_concurrent_task_submissions():
             updated = manager.get_task(task.id)
             expected_state = TaskState.WORKING if i % 2 == 0 else TaskState.COMPLETED
             assert updated.status.state == expected_state
+
+
+def test_wait_for_completion_wakes_on_signal():
+    """Client waiting with a signals dir returns when the sentinel lands, not at poll_interval."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage_dir = Path(tmpdir) / "storage"
+        signals_dir = Path(tmpdir) / "signals"
+        signals_dir.mkdir(parents=True)
+
+        manager = TaskManager(storage_dir)
+        task = manager.create_task("session-001", "Test task")
+        manager.update_status(task.id, TaskState.WORKING, "Started")
+
+        client = a2a_client.A2AClient("http://localhost:0")
+
+        def get_task(task_id):
+            sync_from_signals(manager, task_id, signals_dir)
+            return manager.get_task(task_id).to_dict()
+
+        client.get_task = get_task
+
+        def finish():
+            time.sleep(0.3)
+            tmp = signals_dir / ".sentinel.tmp"
+            tmp.write_text(json.dumps({"path": "", "status": "completed"}))
+            tmp.rename(signals_dir / "sentinel.done")
+
+        writer = threading.Thread(target=finish)
+        writer.start()
+        start = time.monotonic()
+        result = client.wait_for_completion(task.id, poll_interval=30, timeout=60, signals_dir=signals_dir)
+        writer.join()
+
+        assert result["status"]["state"] == "completed"
+        assert time.monotonic() - start < 5
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""Integration tests for A2A streaming: task subscriptions (tasks/sendSubscribe) and artifact downloads."""
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+
+a2a_dir = Path(__file__).parent.parent.parent / "a2a"
+sys.path.insert(0, str(a2a_dir))
+
+spec_tm = spec_from_file_location("task_manager", a2a_dir / "task-manager.py")
+task_manager = module_from_spec(spec_tm)
+sys.modules["task_manager"] = task_manager
+spec_tm.loader.exec_module(task_manager)
+
+import task_stream  # noqa: E402
+from task_stream import TaskStreamHub  # noqa: E402
+
+TaskManager = task_manager.TaskManager
+TaskState = task_manager.TaskState
+sync_from_signals = task_manager.sync_from_signals
+
+
+def _hub(base: Path) -> tuple[TaskManager, TaskStreamHub]:
+    manager = TaskManager(base / "tasks")
+
+    def get_task(task_id):
+        task = manager.get_task(task_id)
+        return task.to_dict() if task else None
+
+    def sync_task(task_id):
+        task = manager.get_task(task_id)
+        sync_from_signals(manager, task_id, base / task.session_id / ".signals")
+
+    return manager, TaskStreamHub(get_task, sync_task, lambda session_id: base / session_id / ".signals")
+
+
+def _working_task(manager: TaskManager, base: Path, session_id: str = "20260101-0900-topic"):
+    (base / session_id / ".signals").mkdir(parents=True)
+    task = manager.create_task(session_id, "Research")
+    manager.update_status(task.id, TaskState.WORKING, "Workflow started")
+    return task
+
+
+def _finish(base: Path, session_id: str) -> None:
+    deliverable = base / "report.md"
+    deliverable.write_text("# Report\n")
+    (base / session_id / ".signals" / "sentinel.done").write_text(json.dumps({"path": str(deliverable)}))
+
+
+async def _drain(queue: asyncio.Queue, timeout: float = 5.0) -> list:
+    items = []
+    while True:
+        item = await asyncio.wait_for(queue.get(), timeout)
+        if item is None:
+            return items
+        items.append(item)
+
+
+def test_subscribers_share_one_watcher_per_session():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        base = Path(tmpdir)
+        manager, hub = _hub(base)
+        task = _working_task(manager, base)
+
+        async def run():
+            first = hub.subscribe(task.id, task.session_id)
+            second = hub.subscribe(task.id, task.session_id)
+            assert len(hub.channels) == 1
+            assert hub.is_watching(task.session_id)
+            await asyncio.sleep(0.1)
+            _finish(base, task.session_id)
+            return await _drain(first), await _drain(second)
+
+        first, second = asyncio.run(run())
+        for items in (first, second):
+            events = [event for _, event in items]
+            assert events[0]["status"]["state"] == "working"
+            assert events[1]["artifact"]["name"] == "report.md"
+            assert events[-1]["status"]["state"] == "completed"
+            assert events[-1]["final"] is True
+        # Live events are shared: same ids for both subscribers
+        assert [i for i, _ in first[1:]] == [i for i, _ in second[1:]]
+
+
+def test_resume_replays_missed_events():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        base = Path(tmpdir)
+        manager, hub = _hub(base)
+        task = _working_task(manager, base)
+
+        async def run():
+            live = hub.subscribe(task.id, task.session_id)
+            snapshot_id, _ = await asyncio.wait_for(live.get(), 5)
+            _finish(base, task.session_id)
+            await _drain(live)
+
+            resumed = await _drain(hub.subscribe(task.id, task.session_id, last_event_id=snapshot_id))
+            expired = await _drain(hub.subscribe(task.id, task.session_id, last_event_id=10_000))
+            return resumed, expired
+
+        resumed, expired = asyncio.run(run())
+        assert [event.get("final") for _, event in resumed] == [None, True]
+        # Unknown id: fresh snapshot of the finished task
+        assert expired[0][1]["status"]["state"] == "completed"
+        assert expired[0][1]["final"] is True
+
+
+def test_slow_subscriber_is_closed(monkeypatch):
+    monkeypatch.setattr(task_stream, "QUEUE_SIZE", 2)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        base = Path(tmpdir)
+        manager, hub = _hub(base)
+        task = _working_task(manager, base)
+
+        async def run():
+            slow = hub.subscribe(task.id, task.session_id)
+            channel = hub.channels[task.session_id]
+            for n in range(3):
+                hub._publish(channel, task.id, {"id": task.id, "status": {"state": "working", "message": str(n)}, "final": False})
+            assert slow not in channel.subscribers
+            return await _drain(slow)
+
+        assert asyncio.run(run()) == []
+
+
+def _load_server(monkeypatch, base: Path):
+    monkeypatch.chdir(base)
+    monkeypatch.setenv("AGENTIC_MUX_DEV_MODE", "true")
+    # Other test modules register their own task_manager; share ours
+    monkeypatch.setitem(sys.modules, "task_manager", task_manager)
+    spec = spec_from_file_location("a2a_server", a2a_dir / "server.py")
+    server = module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, "a2a_server", server)
+    spec.loader.exec_module(server)
+    monkeypatch.setattr(server, "SWARM_DIR", base / "swarm")
+    return server
+
+
+def test_server_streams_sse(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        base = Path(tmpdir)
+        server = _load_server(monkeypatch, base)
+        from fastapi.testclient import TestClient
+
+        task = _working_task(server.task_manager, server.SWARM_DIR)
+        assert server.task_manager.get_task(task.id).session_id == task.session_id
+
+        def finish_later():
+            time.sleep(0.3)
+            _finish(server.SWARM_DIR, task.session_id)
+
+        threading.Thread(target=finish_later).start()
+        payload = {"jsonrpc": "2.0", "method": "tasks/resubscribe", "params": {"id": task.id}, "id": 7}
+        with TestClient(server.app) as client:
+            with client.stream("POST", "/a2a", json=payload, headers={"Authorization": "Bearer dev"}) as response:
+                assert response.headers["content-type"].startswith("text/event-stream")
+                lines = [line for line in response.iter_lines() if line.startswith(("id:", "data:"))]
+
+            messages = [json.loads(line[5:]) for line in lines if line.startswith("data:")]
+            assert all(m["id"] == 7 for m in messages)
+            assert messages[0]["result"]["status"]["state"] == "working"
+            assert messages[-1]["result"]["status"]["state"] == "completed"
+            assert messages[-1]["result"]["final"] is True
+
+            error = client.post(
+                "/a2a",
+                json={"jsonrpc": "2.0", "method": "tasks/resubscribe", "params": {"id": "missing"}, "id": 8},
+                headers={"Authorization": "Bearer dev"},
+            ).json()
+            assert "Task not found" in error["error"]["message"]
+        assert os.path.isdir(base / ".a2a" / "tasks")
+
+
+def test_server_serves_artifact_ranges(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        base = Path(tmpdir)
+        server = _load_server(monkeypatch, base)
+        from fastapi.testclient import TestClient
+
+        content = "".join(f"line {n}\n" for n in range(2000))
+        task = server.task_manager.create_task("20260101-0900-topic", "Research")
+        server.task_manager.add_artifact(task.id, "report.md", "text/markdown", content)
+        uri = server.task_manager.get_task(task.id).artifacts[0].parts[0]["file"]["uri"]
+        auth = {"Authorization": "Bearer dev"}
+
+        with TestClient(server.app) as client:
+            full = client.get(uri, headers=auth)
+            assert full.status_code == 200
+            assert full.text == content
+            partial = client.get(uri, headers={**auth, "Range": "bytes=10-19"})
+            assert partial.status_code == 206
+            assert partial.headers["content-range"] == f"bytes 10-19/{len(content)}"
+            assert partial.text == content[10:20]
+            assert client.get(uri, headers={**auth, "Range": f"bytes={len(content)}-"}).status_code == 416
+            assert client.get("/artifacts/" + "0" * 64, headers=auth).status_code == 404
+            assert client.get("/artifacts/../tasks.db", headers=auth).status_code == 404
+
+
+def test_server_authenticates_before_parsing(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        base = Path(tmpdir)
+        server = _load_server(monkeypatch, base)
+        monkeypatch.delenv("AGENTIC_MUX_DEV_MODE")
+        monkeypatch.delenv("A2A_BEARER_TOKENS", raising=False)
+        (base / ".a2a" / "tokens").write_text("reader scopes=tasks:read\n")
+        from fastapi.testclient import TestClient
+
+        reader = {"Authorization": "Bearer reader"}
+        send = {"jsonrpc": "2.0", "method": "tasks/send", "params": {"message": "x"}, "id": 1}
+        with TestClient(server.app) as client:
+            # Unauthenticated: rejected before the body is read
+            assert client.post("/a2a", content=b"not json").json()["error"]["code"] == -32001
+            assert client.post("/a2a", content=b"not json", headers=reader).json()["error"]["code"] == -32700
+            assert client.post("/a2a", json=send, headers=reader).json()["error"]["code"] == -32003
@@ -10,6 +10,7 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "a2a"))
 
 from auth import verify_token, generate_token, add_token, get_valid_tokens
+from auth import AUTH_FORBIDDEN, AUTH_OK, AUTH_RATE_LIMITED, AUTH_UNAUTHORIZED, TokenStore
 
 
 def test_production_mode_no_tokens_configured():
@@ -181,6 +182,45 @@ def test_add_token():
             os.chdir(old_cwd)
 
 
+def test_token_store_reloads_only_on_change():
+    """The tokens file is read once, then again only after it changes or reload()."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tokens_file = Path(tmpdir) / "tokens"
+        tokens_file.write_text("token-001\n")
+        store = TokenStore(tokens_file, env_var="A2A_TEST_TOKENS")
+
+        for _ in range(5):
+            assert store.authenticate("token-001") == AUTH_OK
+        assert store.authenticate("token-002") == AUTH_UNAUTHORIZED
+        assert store.loads == 1
+
+        tokens_file.write_text("token-001\ntoken-002\n")
+        assert store.authenticate("token-002") == AUTH_OK
+        assert store.loads == 2
+
+        store.reload()  # As on SIGHUP
+        assert store.authenticate("token-002") == AUTH_OK
+        assert store.loads == 3
+        print("✓ Token store reload test passed")
+
+
+def test_token_scopes_and_rate_limit():
+    """Scoped tokens are limited to their scopes; rate-limited ones to their rate."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tokens_file = Path(tmpdir) / "tokens"
+        tokens_file.write_text("# comment\nreader scopes=tasks:read\nlimited rate=2\n")
+        store = TokenStore(tokens_file, env_var="A2A_TEST_TOKENS")
+
+        assert store.authenticate("reader", "tasks:read") == AUTH_OK
+        assert store.authenticate("reader", "tasks:write") == AUTH_FORBIDDEN
+        assert store.authorize("reader", "tasks:write") == AUTH_FORBIDDEN
+        assert store.authorize("limited", "tasks:write") == AUTH_OK
+        assert store.authenticate("limited", "tasks:write") == AUTH_OK
+        assert store.authenticate("limited") == AUTH_OK
+        assert store.authenticate("limited") == AUTH_RATE_LIMITED
+        print("✓ Token scopes and rate limit test passed")
+
+
 if __name__ == "__main__":
     test_production_mode_no_tokens_configured()
     test_dev_mode_allows_any_token()
@@ -190,4 +230,6 @@ if __name__ == "__main__":
     test_malformed_header()
     test_generate_token()
     test_add_token()
+    test_token_store_reloads_only_on_change()
+    test_token_scopes_and_rate_limit()
     print("\n✓ All tests passed")
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Unit tests for lib/event_tail.py and the dashboard EventHub."""
+import asyncio
+import json
+import sys
+import tempfile
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+
+import pytest
+
+MUX_DIR = Path(__file__).parent.parent.parent
+
+sys.path.insert(0, str(MUX_DIR))
+from lib.event_tail import EventTail, SessionTail
+from lib.signal_journal import append_signal
+
+
+def _session(base: Path, name: str = "20260101-0900-topic") -> Path:
+    session_dir = base / name
+    (session_dir / ".signals").mkdir(parents=True)
+    return session_dir
+
+
+def _report(session_dir: Path, text: str) -> None:
+    with open(session_dir / ".live-report", "a") as f:
+        f.write(text)
+
+
+def test_reports_only_new_lines():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        session_dir = _session(Path(tmpdir))
+        _report(session_dir, "[09:00:00.000] [L3] [phase-a] STARTING\n")
+        (session_dir / ".signals" / "old.done").write_text("status: done\n")
+        tail = SessionTail(session_dir)
+        assert tail.poll() == []
+
+        _report(session_dir, "[09:00:01.000] [L3] [phase-a] COMPLETE\n[09:00:02")
+        (session_dir / ".signals" / "worker-1.done").write_text("status: done\npath: out.md\n")
+        events = tail.poll()
+        assert [e["type"] for e in events] == ["report", "signal"]
+        assert events[0]["line"].endswith("COMPLETE")
+        assert events[1]["signal"] == "worker-1.done"
+        assert events[1]["fields"]["path"] == "out.md"
+
+        # The partial line is reported once it is complete
+        _report(session_dir, ".000] [L3] [phase-b] STARTING\n")
+        assert [e["line"] for e in tail.poll()] == ["[09:00:02.000] [L3] [phase-b] STARTING"]
+        assert tail.poll() == []
+
+
+def test_journal_signals_and_truncation():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        session_dir = _session(Path(tmpdir))
+        tail = SessionTail(session_dir, from_start=True)
+        append_signal(session_dir / ".signals", {"signal": "w1.fail", "status": "fail"})
+        _report(session_dir, "first\n")
+        events = tail.poll()
+        assert [e["type"] for e in events] == ["report", "signal"]
+        assert events[1]["fields"] == {"status": "fail"}
+
+        (session_dir / ".live-report").write_text("")
+        _report(session_dir, "x\n")
+        assert [e["line"] for e in tail.poll()] == ["x"]
+
+
+def test_new_sessions_reported_in_full():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        base = Path(tmpdir)
+        _report(_session(base, "20260101-0900-old"), "old line\n")
+        tail = EventTail(base)
+        assert tail.poll() == []
+
+        new = _session(base, "20260101-1000-new")
+        _report(new, "new line\n")
+        events = tail.poll()
+        assert [(e["type"], e["session"]) for e in events] == [
+            ("session_started", "20260101-1000-new"),
+            ("report", "20260101-1000-new"),
+        ]
+
+
+def _load_server():
+    pytest.importorskip("fastapi")
+    spec = spec_from_file_location("dashboard_server", MUX_DIR / "dashboard" / "server.py")
+    if spec is None or spec.loader is None:
+        raise ImportError("Cannot load server.py")
+    module = module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_hub_fans_out_one_poll():
+    server = _load_server()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        server.SESSIONS_DIR = Path(tmpdir)
+        session_dir = _session(Path(tmpdir))
+
+        async def scenario():
+            hub = server.EventHub()
+            first = hub.subscribe()
+            second = hub.subscribe()
+            await asyncio.sleep(0.05)  # Poller primed at the current end
+            (session_dir / ".signals" / "worker-1.done").write_text("status: done\n")
+            received = [await asyncio.wait_for(q.get(), 5) for q in (first, second) for _ in range(2)]
+            hub.unsubscribe(first)
+            hub.unsubscribe(second)
+            await asyncio.wait_for(hub._task, 5)
+            return received
+
+        received = asyncio.run(scenario())
+        first, second = received[:2], received[2:]
+        assert first == second
+        assert [event["type"] for _, event in first] == ["signal", "session"]
+        assert first[1][1]["metrics"]["workers_completed"] == 1
+        assert json.loads(server.format_sse(*first[0]).split("data: ")[1])["signal"] == "worker-1.done"
+
+
+def test_hub_replays_and_drops_slow_subscribers(monkeypatch):
+    server = _load_server()
+    monkeypatch.setattr(server, "EVENT_QUEUE_SIZE", 2)
+
+    async def scenario():
+        hub = server.EventHub()
+        hub._task = asyncio.get_running_loop().create_future()  # No poller
+        slow = hub.subscribe()
+        hub.publish([{"type": "report", "session": "s", "line": str(n)} for n in range(3)])
+        assert slow not in hub.subscribers
+        assert slow.get_nowait() is None
+        resumed = hub.subscribe(last_event_id=1)
+        return [resumed.get_nowait() for _ in range(resumed.qsize())]
+
+    replayed = asyncio.run(scenario())
+    assert [event_id for event_id, _ in replayed] == [2, 3]
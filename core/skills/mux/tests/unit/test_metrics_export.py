@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Unit tests for agentic registry snapshots in metrics.py exports."""
+import json
+import sys
+import tempfile
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+
+MUX_DIR = Path(__file__).parent.parent.parent
+
+sys.path.insert(0, str(MUX_DIR))
+
+
+def _load_metrics():
+    spec = spec_from_file_location("metrics", MUX_DIR / "tools" / "metrics.py")
+    if spec is None or spec.loader is None:
+        raise ImportError("Cannot load metrics.py")
+    module = module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+metrics = _load_metrics()
+
+LABELS = {"layer": "L2", "stage": "ospec:plan", "status": "COMPLETE", "tier": "medium-tier"}
+
+
+def _snapshot(counts: list[int], total: float, retries: float, buckets=(1.0, 10.0)) -> dict:
+    return {
+        "version": 1,
+        "buckets": list(buckets),
+        "types": {
+            "agentic_stage_duration_seconds": {"type": "histogram", "help": "Stage duration"},
+            "agentic_retries_total": {"type": "counter", "help": "Retries"},
+        },
+        "counters": [{"name": "agentic_retries_total", "labels": {"layer": "L2"}, "value": retries}],
+        "histograms": [{
+            "name": "agentic_stage_duration_seconds", "labels": LABELS,
+            "counts": counts, "sum": total, "count": sum(counts),
+        }],
+    }
+
+
+def _session(base: Path) -> Path:
+    session_dir = base / "20260101-0900-topic"
+    metrics_dir = session_dir / ".metrics"
+    metrics_dir.mkdir(parents=True)
+    (metrics_dir / "metrics-1-aa.json").write_text(json.dumps(_snapshot([1, 0, 0], 0.5, 1)))
+    (metrics_dir / "metrics-2-bb.json").write_text(json.dumps(_snapshot([0, 1, 1], 20.0, 2)))
+    # Different bucket layout: skipped rather than mis-added
+    (metrics_dir / "metrics-3-cc.json").write_text(json.dumps(_snapshot([9, 9], 1.0, 9, buckets=(5.0,))))
+    (metrics_dir / "metrics-4-dd.json").write_text("{partial")
+    return session_dir
+
+
+def test_snapshots_merged_per_session():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        registry = metrics.load_session_registry(_session(Path(tmpdir)))
+        (histogram,) = registry["histograms"]
+        assert histogram["counts"] == [1, 1, 1]
+        assert histogram["count"] == 3
+        assert registry["counters"][0]["value"] == 3
+
+
+def test_prometheus_histogram_exposition():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        session = metrics.collect_session_metrics(_session(Path(tmpdir)))
+        text = metrics.export_prometheus([session])
+
+        assert "# TYPE agentic_stage_duration_seconds histogram" in text
+        assert "# TYPE agentic_retries_total counter" in text
+        prefix = 'agentic_stage_duration_seconds_bucket{session="20260101-0900-topic",layer="L2"'
+        assert f'{prefix},stage="ospec:plan",status="COMPLETE",tier="medium-tier",le="1.0"}} 1' in text
+        assert f'{prefix},stage="ospec:plan",status="COMPLETE",tier="medium-tier",le="+Inf"}} 3' in text
+        assert 'agentic_retries_total{session="20260101-0900-topic",layer="L2"} 3' in text
+        # TYPE precedes every sample of its family
+        lines = text.splitlines()
+        type_line = lines.index("# TYPE agentic_stage_duration_seconds histogram")
+        assert all(
+            i > type_line for i, line in enumerate(lines)
+            if line.startswith("agentic_stage_duration_seconds")
+        )
+
+
+def test_sessions_without_snapshots_unchanged():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        session_dir = Path(tmpdir) / "20260101-0900-plain"
+        (session_dir / ".signals").mkdir(parents=True)
+        session = metrics.collect_session_metrics(session_dir)
+        assert "registry" not in session
+        assert "agentic_" not in metrics.export_prometheus([session])
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Unit tests for the incremental session metrics index."""
+import json
+import os
+import sys
+import tempfile
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+
+MUX_DIR = Path(__file__).parent.parent.parent
+
+sys.path.insert(0, str(MUX_DIR))
+
+from lib.signal_journal import append_signal
+
+
+def _load_metrics():
+    spec = spec_from_file_location("metrics", MUX_DIR / "tools" / "metrics.py")
+    if spec is None or spec.loader is None:
+        raise ImportError("Cannot load metrics.py")
+    module = module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+metrics = _load_metrics()
+
+
+def _make_session(base: Path, name: str, done: int = 1) -> Path:
+    signals_dir = base / name / ".signals"
+    signals_dir.mkdir(parents=True)
+    for i in range(done):
+        (signals_dir / f"{i:03d}-w.done").write_text("path: out.md\nsize: 1\n")
+    return base / name
+
+
+def _counting_collect(monkeypatch_target, calls: list):
+    original = monkeypatch_target.collect_session_metrics
+
+    def collect(session_dir):
+        calls.append(session_dir.name)
+        return original(session_dir)
+
+    monkeypatch_target.collect_session_metrics = collect
+    return original
+
+
+def test_unchanged_sessions_not_rescanned():
+    """A second scrape re-collects only the session whose signals changed."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        base = Path(tmpdir)
+        _make_session(base, "20260101-0900-old")
+        live = _make_session(base, "20260102-0900-live")
+
+        calls: list[str] = []
+        original = _counting_collect(metrics, calls)
+        try:
+            sessions = metrics.SessionIndex(base).recent(10)
+            assert [s["session_id"] for s in sessions] == ["20260102-0900-live", "20260101-0900-old"]
+            assert sorted(calls) == ["20260101-0900-old", "20260102-0900-live"]
+
+            calls.clear()
+            (live / ".signals" / "001-w.done").write_text("path: b.md\n")
+            stat = (live / ".signals").stat()
+            os.utime(live / ".signals", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+            # Fresh instance: state comes from the persisted index file
+            sessions = metrics.SessionIndex(base).recent(10)
+            assert calls == ["20260102-0900-live"]
+            assert sessions[0]["workers_completed"] == 2
+        finally:
+            metrics.collect_session_metrics = original
+
+
+def test_journal_append_invalidates_entry():
+    """Journal sessions are re-collected when the journal grows."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        base = Path(tmpdir)
+        signals_dir = base / "20260101-0900-j" / ".signals"
+        append_signal(signals_dir, {"signal": "001-a.done", "size": "1"})
+
+        index = metrics.SessionIndex(base)
+        assert index.recent()[0]["workers_completed"] == 1
+
+        calls: list[str] = []
+        original = _counting_collect(metrics, calls)
+        try:
+            assert index.recent()[0]["workers_completed"] == 1
+            assert calls == []
+            append_signal(signals_dir, {"signal": "002-b.done", "size": "1"})
+            assert index.recent()[0]["workers_completed"] == 2
+            assert calls == ["20260101-0900-j"]
+        finally:
+            metrics.collect_session_metrics = original
+
+
+def test_removed_sessions_pruned_and_limit():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        base = Path(tmpdir)
+        for day in range(1, 4):
+            _make_session(base, f"2026010{day}-0900-s")
+        index = metrics.SessionIndex(base)
+        assert len(index.recent(2)) == 2
+
+        for entry in (base / "20260103-0900-s" / ".signals").iterdir():
+            entry.unlink()
+        (base / "20260103-0900-s" / ".signals").rmdir()
+        (base / "20260103-0900-s").rmdir()
+        index.recent()
+
+        data = json.loads((base / metrics.INDEX_FILENAME).read_text())
+        assert sorted(data["sessions"]) == ["20260101-0900-s", "20260102-0900-s"]
+
+
+def test_corrupt_index_is_rebuilt():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        base = Path(tmpdir)
+        _make_session(base, "20260101-0900-s", done=2)
+        (base / metrics.INDEX_FILENAME).write_text("{not json")
+        assert metrics.SessionIndex(base).recent()[0]["workers_completed"] == 2
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Unit tests for journal-format signal sessions."""
+import json
+import sys
+import tempfile
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+
+TOOLS_DIR = Path(__file__).parent.parent.parent / "tools"
+
+# Add lib to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "lib"))
+
+from signal_journal import (
+    CURSOR_FILENAME,
+    JOURNAL_FILENAME,
+    JournalReader,
+    append_signal,
+    load_journal_signals,
+)
+
+
+def _load_tool(filename: str, module_name: str):
+    spec = spec_from_file_location(module_name, TOOLS_DIR / filename)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Cannot load {module_name} from {TOOLS_DIR / filename}")
+    module = module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+check_signals = _load_tool("check-signals.py", "check_signals")
+verify = _load_tool("verify.py", "verify")
+
+
+def _session(tmpdir: str) -> tuple[Path, Path]:
+    session_dir = Path(tmpdir)
+    signals_dir = session_dir / ".signals"
+    append_signal(signals_dir, {"signal": "001-a.done", "path": "a.md", "size": "10"})
+    append_signal(signals_dir, {"signal": "002-b.done", "path": "b.md", "size": "5"})
+    append_signal(signals_dir, {"signal": "003-c.fail", "path": "c.md", "error": "timeout"})
+    return session_dir, signals_dir
+
+
+def test_cursor_resumes_from_offset():
+    """A second check only parses records appended after the first."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        _, signals_dir = _session(tmpdir)
+        assert len(load_journal_signals(signals_dir)) == 3
+
+        state = json.loads((signals_dir / CURSOR_FILENAME).read_text())
+        assert state["offset"] == (signals_dir / JOURNAL_FILENAME).stat().st_size
+
+        append_signal(signals_dir, {"signal": "004-d.done", "size": "1"})
+        reader = JournalReader.load(signals_dir)
+        assert [r["signal"] for r in reader.poll()] == ["004-d.done"]
+
+
+def test_no_journal_returns_none():
+    """Sessions without a journal fall back to file globbing."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        assert load_journal_signals(Path(tmpdir) / ".signals") is None
+
+
+def test_plain_files_merged_with_journal():
+    """Signal files written by older tools still count in journal sessions."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        session_dir, signals_dir = _session(tmpdir)
+        (signals_dir / "005-e.done").write_text("path: e.md\nsize: 3\nstatus: success\n")
+        # Misplaced signals are not searched for in journal sessions
+        (session_dir / "006-f.done").write_text("path: f.md\n")
+
+        assert check_signals.count_signals(session_dir) == (3, 1)
+
+
+def test_verify_reads_journal():
+    """verify.py actions work on journal records."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        session_dir, _ = _session(tmpdir)
+        assert verify.count_completions(session_dir) == 2
+        assert verify.get_paths(session_dir) == ["a.md", "b.md"]
+        assert verify.get_sizes(session_dir) == [("001-a", 10), ("002-b", 5)]
+        assert verify.get_total_size(session_dir) == 15
+        assert verify.list_failures(session_dir) == [
+            {"signal": "003-c.fail", "path": "c.md", "error": "timeout"}
+        ]
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Unit tests for the inotify/polling signal watcher."""
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+MUX_DIR = Path(__file__).parent.parent.parent
+
+# Add skill root to path so lib/ imports as a package
+sys.path.insert(0, str(MUX_DIR))
+
+from lib.signal_journal import append_signal
+from lib.signal_watch import SignalWatcher, iter_new_signals, wait_for_signals
+
+
+def _write_later(delay: float, path: Path, content: str = "path: out.md\nstatus: success\n") -> threading.Thread:
+    def write():
+        time.sleep(delay)
+        tmp = path.parent / f".{path.name}.tmp"
+        tmp.write_text(content)
+        tmp.rename(path)
+
+    thread = threading.Thread(target=write)
+    thread.start()
+    return thread
+
+
+@pytest.mark.parametrize("use_inotify", [True, False])
+def test_wait_wakes_on_new_signal(use_inotify):
+    """wait() returns as soon as a signal lands, not at the timeout."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        signals_dir = Path(tmpdir) / ".signals"
+        with SignalWatcher(signals_dir, use_inotify=use_inotify) as watcher:
+            assert watcher.wait(0.1) == []
+            writer = _write_later(0.2, signals_dir / "001-a.done")
+            start = time.monotonic()
+            found = watcher.wait(10)
+            writer.join()
+        assert [name for name, _ in found] == ["001-a.done"]
+        assert found[0][1]["path"] == "out.md"
+        assert time.monotonic() - start < 2
+
+
+def test_inotify_mode_on_linux():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with SignalWatcher(Path(tmpdir)) as watcher:
+            expected = "inotify" if sys.platform.startswith("linux") else "poll"
+            assert watcher.mode == expected
+
+
+def test_existing_and_journal_signals():
+    """Signals already present are reported first; journal appends are seen."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        signals_dir = Path(tmpdir) / ".signals"
+        signals_dir.mkdir()
+        (signals_dir / "001-a.done").write_text("path: a.md\n")
+        (signals_dir / "ignored.tmp").write_text("")
+
+        def append():
+            time.sleep(0.2)
+            append_signal(signals_dir, {"signal": "002-b.fail", "error": "boom"})
+
+        thread = threading.Thread(target=append)
+        thread.start()
+        seen = [name for name, _ in iter_new_signals(signals_dir, timeout=1.0)]
+        thread.join()
+        assert seen == ["001-a.done", "002-b.fail"]
+
+
+def test_wait_for_signals_timeout():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        signals_dir = Path(tmpdir) / ".signals"
+        writer = _write_later(0.1, signals_dir / "001-a.done")
+        start = time.monotonic()
+        signals = wait_for_signals(signals_dir, expected=2, timeout=0.5)
+        writer.join()
+        assert list(signals) == ["001-a.done"]
+        assert 0.4 < time.monotonic() - start < 2
+
+
+def test_check_signals_watch_cli():
+    """check-signals.py --watch blocks until the expected count lands."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        session_dir = Path(tmpdir)
+        (session_dir / ".signals").mkdir()
+        proc = subprocess.Popen(
+            [sys.executable, str(MUX_DIR / "tools" / "check-signals.py"), str(session_dir),
+             "--expected", "2", "--watch", "--timeout", "20"],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+        )
+        time.sleep(0.3)
+        (session_dir / ".signals" / "001-a.done").write_text("path: a.md\n")
+        (session_dir / ".signals" / "002-b.fail").write_text("path: b.md\n")
+        stdout, stderr = proc.communicate(timeout=20)
+        assert proc.returncode == 1
+        assert '"complete": 1' in stdout and '"failed": 1' in stdout
+        assert "[signal] 001-a.done a.md" in stderr
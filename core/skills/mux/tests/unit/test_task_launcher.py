@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Unit tests for the A2A workflow launcher and in-process session creation."""
+import asyncio
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+MUX_DIR = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(MUX_DIR / "a2a"))
+sys.path.insert(0, str(MUX_DIR / "tools"))
+
+from session import create_session
+from task_launcher import Launch, LaunchQueueFull, TaskLauncher
+
+
+def _launch(n: int) -> Launch:
+    return Launch(f"task-{n}", f"tmp/swarm/s{n}", "Research", "swarm:research")
+
+
+def test_workers_bound_concurrency_and_record_latency():
+    """At most `workers` launches run at once; every launch is observed."""
+
+    async def run():
+        running = 0
+        peak = 0
+
+        async def start(launch):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        launcher = TaskLauncher(start, lambda launch, error: None, workers=2, queue_size=10)
+        for n in range(6):
+            launcher.submit(_launch(n))
+        assert launcher.depth > 0
+        await launcher.queue.join()
+        await launcher.close()
+        return launcher, peak
+
+    launcher, peak = asyncio.run(run())
+    assert peak == 2
+    assert launcher.stats()["started"] == 6
+    assert launcher.latency_count == 6
+    text = launcher.prometheus()
+    assert 'a2a_launches_total{outcome="started"} 6' in text
+    assert 'a2a_launch_latency_seconds_bucket{le="+Inf"} 6' in text
+    assert "a2a_launch_queue_depth 0" in text
+
+
+def test_full_queue_rejects_and_failures_reach_on_error():
+    async def run():
+        release = asyncio.Event()
+        failed = []
+
+        async def start(launch):
+            await release.wait()
+            if launch.task_id == "task-0":
+                raise RuntimeError("boom")
+
+        launcher = TaskLauncher(start, lambda launch, error: failed.append((launch.task_id, str(error))), workers=1, queue_size=1)
+        launcher.submit(_launch(0))
+        await asyncio.sleep(0)  # Worker takes task-0
+        launcher.submit(_launch(1))
+        with pytest.raises(LaunchQueueFull):
+            launcher.submit(_launch(2))
+        release.set()
+        await launcher.queue.join()
+        await launcher.close()
+        return launcher, failed
+
+    launcher, failed = asyncio.run(run())
+    assert failed == [("task-0", "boom")]
+    assert launcher.stats()["rejected"] == 1
+    assert launcher.stats()["failed"] == 1
+    assert launcher.stats()["started"] == 1
+
+
+def test_create_session_in_process(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        monkeypatch.chdir(tmpdir)
+        session_dir, trace_id, marker = create_session("swarm-research", base=Path(tmpdir) / "swarm")
+        assert session_dir.name.endswith("-swarm-research")
+        assert (session_dir / ".signals").is_dir()
+        assert (session_dir / ".trace").read_text().strip() == trace_id
+        assert marker is not None and marker.exists()
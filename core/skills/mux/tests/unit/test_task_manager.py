@@ -167,10 +167,153 @@ def test_sync_from_signals_malformed():
             raise
 
 
+def test_sync_from_signals_journal():
+    """Journal-format sessions are tailed across syncs."""
+    from lib.signal_journal import append_signal
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage = Path(tmpdir) / "storage"
+        signals = Path(tmpdir) / ".signals"
+        deliverable = Path(tmpdir) / "final.md"
+        deliverable.write_text("# Done")
+
+        manager = TaskManager(storage)
+        task = manager.create_task("session-001", "Test task")
+        manager.update_status(task.id, TaskState.WORKING, "Started")
+
+        append_signal(signals, {"signal": "phase-001.done", "path": "p1.md"})
+        sync_from_signals(manager, task.id, signals)
+        assert manager.get_task(task.id).status.state == TaskState.WORKING
+
+        append_signal(signals, {"signal": "sentinel.done", "path": str(deliverable)})
+        sync_from_signals(manager, task.id, signals)
+        updated_task = manager.get_task(task.id)
+        assert updated_task.status.state == TaskState.COMPLETED
+        assert updated_task.artifacts[0].name == "final.md"
+        print("✓ Journal signal sync test passed")
+
+
+def test_store_survives_restart():
+    """Tasks, appends and the session index are reloaded from SQLite."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage = Path(tmpdir) / "storage"
+        manager = TaskManager(storage)
+        done = manager.create_task("session-001", "Done task")
+        manager.update_status(done.id, TaskState.WORKING, "Started")
+        manager.add_artifact(done.id, "report.md", "text/markdown", "# Report")
+        manager.add_agent_message(done.id, "Almost there")
+        manager.update_status(done.id, TaskState.COMPLETED, "Finished")
+        active = manager.create_task("session-002", "Active task")
+        manager.add_agent_message(active.id, "Buffered")
+        manager.close()
+
+        reopened = TaskManager(storage)
+        # Active tasks are warm-loaded; finished ones load on demand
+        assert active.id in reopened._tasks
+        assert done.id not in reopened._tasks
+        restored = reopened.get_task_by_session("session-001")
+        assert restored.to_dict() == done.to_dict()
+        assert [m.parts[0]["text"] for m in reopened.get_task(active.id).history] == ["Active task", "Buffered"]
+        assert [t.id for t in reopened.list_tasks(TaskState.SUBMITTED)] == [active.id]
+        reopened.close()
+        print("✓ Restart test passed")
+
+
+def test_legacy_json_tasks_imported():
+    """Per-task JSON files from before the SQLite store are imported once."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage = Path(tmpdir) / "storage"
+        storage.mkdir()
+        legacy = {
+            "id": "task-0123456789ab",
+            "sessionId": "session-legacy",
+            "status": {"state": "working", "message": "Started", "timestamp": "2026-01-01T00:00:00+00:00"},
+            "artifacts": [],
+            "history": [{"role": "user", "parts": [{"type": "text", "text": "Old task"}]}],
+        }
+        (storage / "task-0123456789ab.json").write_text(json.dumps(legacy))
+
+        manager = TaskManager(storage)
+        assert manager.get_task_by_session("session-legacy").to_dict() == legacy
+        manager.close()
+        print("✓ Legacy import test passed")
+
+
+def test_malformed_legacy_json_skipped_and_import_recorded():
+    """A bad legacy file does not stop startup; the import runs only once."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage = Path(tmpdir) / "storage"
+        storage.mkdir()
+        (storage / "task-000000000001.json").write_text(json.dumps({"id": "task-000000000001", "sessionId": "s1"}))
+        (storage / "task-000000000002.json").write_text(json.dumps({
+            "id": "task-000000000002",
+            "sessionId": "s2",
+            "status": {"state": "completed", "message": "Done", "timestamp": "2026-01-01T00:00:00+00:00"},
+        }))
+
+        manager = TaskManager(storage)
+        assert manager.get_task("task-000000000001") is None
+        assert manager.get_task("task-000000000002").status.state == TaskState.COMPLETED
+        manager.close()
+
+        (storage / "task-000000000003.json").write_text(json.dumps({
+            "id": "task-000000000003",
+            "sessionId": "s3",
+            "status": {"state": "completed", "message": "Done", "timestamp": "2026-01-01T00:00:00+00:00"},
+        }))
+        manager = TaskManager(storage)
+        assert manager.get_task("task-000000000003") is None
+        manager.close()
+
+
+def test_unclosed_manager_is_collectable():
+    """The exit hook holds the manager weakly."""
+    import gc
+    import weakref
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        ref = weakref.ref(TaskManager(Path(tmpdir)))
+        gc.collect()
+        assert ref() is None
+
+
+def test_large_artifacts_stored_by_reference():
+    """Artifacts above the inline limit become content-addressed file parts."""
+    import hashlib
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = TaskManager(Path(tmpdir) / "storage", inline_limit=16)
+        task = manager.create_task("session-001", "Test task")
+        manager.add_artifact(task.id, "note.md", "text/markdown", "small")
+        report = Path(tmpdir) / "report.md"
+        report.write_text("# Report\n" * 100)
+        manager.add_artifact_file(task.id, report, "text/markdown")
+
+        inline, stored = manager.get_task(task.id).artifacts
+        assert inline.parts == [{"type": "text", "text": "small"}]
+        digest = hashlib.sha256(report.read_bytes()).hexdigest()
+        assert stored.parts[0]["file"]["uri"] == f"/artifacts/{digest}"
+        assert stored.parts[0]["metadata"] == {"size": report.stat().st_size, "sha256": digest}
+        assert manager.artifact_path(digest).read_bytes() == report.read_bytes()
+
+        # Same content through add_artifact: same stored object
+        manager.add_artifact(task.id, "copy.md", "text/markdown", report.read_text())
+        assert manager.get_task(task.id).artifacts[2].parts[0]["file"]["uri"] == f"/artifacts/{digest}"
+        assert len(list(manager.artifacts_dir.iterdir())) == 1
+        manager.close()
+        print("✓ By-reference artifact test passed")
+
+
 if __name__ == "__main__":
     test_valid_transitions()
     test_invalid_transitions()
     test_terminal_state_enforcement()
     test_cancel_task_validation()
     test_sync_from_signals_malformed()
+    test_sync_from_signals_journal()
+    test_store_survives_restart()
+    test_legacy_json_tasks_imported()
+    test_malformed_legacy_json_skipped_and_import_recorded()
+    test_unclosed_manager_is_collectable()
+    test_large_artifacts_stored_by_reference()
     print("\n✓ All tests passed")
@@ -6,12 +6,18 @@
 """
 One-shot signal checker for swarm orchestrator.
 
-Reads .signals/ directory and returns JSON summary of completion status.
+Reads .signals/ directory (or its journal.jsonl) and returns JSON summary of
+completion status.
 No polling loop -- single check, immediate return.
 
 Usage:
     uv run check-signals.py <session_dir> --expected N
     uv run check-signals.py <session_dir> --expected N --signals-dir <path>
+    uv run check-signals.py <session_dir> --expected N --watch --timeout 600
+
+--watch blocks (inotify on Linux, cheap stat polling elsewhere) until N
+signals exist in .signals/ or the timeout expires, printing each signal to
+stderr as it lands, then prints the same JSON summary.
 
 Examples:
     uv run check-signals.py tmp/swarm/20260130-1234-session --expected 5
@@ -24,6 +30,10 @@ import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from lib.signal_journal import load_journal_signals
+from lib.signal_watch import iter_new_signals
+
 
 def count_signals(
     session_dir: Path, signals_dir: Path | None = None
@@ -35,6 +45,9 @@ def count_signals(
     2. Fall back to recursive glob if .signals/ is empty/missing
     3. Exclude .agents/ subdirectory (internal signals)
 
+    Journal-format sessions (.signals/journal.jsonl) skip all globbing and
+    only read records appended since the previous check.
+
     Args:
         session_dir: Root session directory
         signals_dir: Specific signals directory to restrict search (optional)
@@ -42,6 +55,12 @@ def count_signals(
     Returns:
         Tuple of (complete_count, failed_count)
     """
+    journaled = load_journal_signals(signals_dir if signals_dir is not None else session_dir / ".signals")
+    if journaled is not None:
+        complete = sum(1 for name in journaled if name.endswith(".done"))
+        failed = sum(1 for name in journaled if name.endswith(".fail"))
+        return (complete, failed)
+
     if signals_dir is not None:
         if not signals_dir.exists():
             return (0, 0)
@@ -81,6 +100,26 @@ def count_signals(
     return (total_complete, total_failed)
 
 
+def watch_signals(signals_dir: Path, expected: int, timeout: float) -> tuple[int, int]:
+    """Block until expected signals exist in signals_dir or timeout.
+
+    Returns:
+        Tuple of (complete_count, failed_count)
+    """
+    complete = failed = 0
+    if expected <= 0:
+        return count_signals(signals_dir.parent, signals_dir)
+    for name, fields in iter_new_signals(signals_dir, timeout):
+        if name.endswith(".done"):
+            complete += 1
+        else:
+            failed += 1
+        print(f"[signal] {name} {fields.get('path', '')}".rstrip(), file=sys.stderr, flush=True)
+        if complete + failed >= expected:
+            break
+    return (complete, failed)
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="One-shot signal check (no polling)")
     parser.add_argument(
@@ -98,13 +137,27 @@ def main() -> int:
         type=str,
         help="Restrict search to specific signals directory (no fallback)",
     )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Block until --expected signals land (or --timeout) instead of checking once",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=600.0,
+        help="Maximum seconds to wait in --watch mode (default: 600)",
+    )
 
     args = parser.parse_args()
 
     session_dir = Path(args.session_dir)
     signals_dir = Path(args.signals_dir) if args.signals_dir else None
 
-    complete, failed = count_signals(session_dir, signals_dir)
+    if args.watch:
+        complete, failed = watch_signals(signals_dir or session_dir / ".signals", args.expected, args.timeout)
+    else:
+        complete, failed = count_signals(session_dir, signals_dir)
     total = complete + failed
 
     status = (
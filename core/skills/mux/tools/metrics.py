@@ -15,6 +15,15 @@ Usage:
     uv run metrics.py export <sessions_base> --format prometheus
     uv run metrics.py summary <sessions_base>
 
+export/summary (and the dashboard) go through SessionIndex, a JSON cache at
+<sessions_base>/.session-index.json: a session is only re-collected when its
+.signals/ directory mtime or journal size changed since it was indexed.
+
+Sessions written by the agentic tools also carry .metrics/metrics-*.json
+snapshots (one per process, see core/tools/agentic/lib/observability.py P8):
+stage/worker/spawn latency histograms and retry/timeout/spawn counters. They
+are merged per session and exported as agentic_* series.
+
 Metrics collected:
     - session_duration_seconds
     - workers_total
@@ -26,11 +35,80 @@ Metrics collected:
 
 import argparse
 import json
+import os
 import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from lib.signal_journal import journal_path, load_journal_signals
+
+
+METRICS_SUBDIR = ".metrics"
+REGISTRY_SNAPSHOT_VERSION = 1
+
+
+def load_session_registry(session_dir: Path) -> dict[str, Any] | None:
+    """Merge a session's .metrics/metrics-*.json registry snapshots.
+
+    Counters are summed and histograms added bucket-wise; snapshots with a
+    different bucket layout than the first one are skipped.
+
+    Returns:
+        Merged snapshot ({"buckets", "types", "counters", "histograms"}), or
+        None if the session has no snapshots
+    """
+    metrics_dir = session_dir / METRICS_SUBDIR
+    if not metrics_dir.is_dir():
+        return None
+
+    buckets: list[float] | None = None
+    types: dict[str, Any] = {}
+    counters: dict[tuple, float] = {}
+    histograms: dict[tuple, dict[str, Any]] = {}
+    for snapshot_path in sorted(metrics_dir.glob("metrics-*.json")):
+        try:
+            snapshot = json.loads(snapshot_path.read_text())
+        except (OSError, ValueError):
+            continue
+        if not isinstance(snapshot, dict) or snapshot.get("version") != REGISTRY_SNAPSHOT_VERSION:
+            continue
+        if buckets is None:
+            buckets = snapshot.get("buckets", [])
+        elif snapshot.get("buckets", []) != buckets:
+            continue
+        types.update(snapshot.get("types", {}))
+        for series in snapshot.get("counters", []):
+            key = (series["name"], tuple(sorted(series["labels"].items())))
+            counters[key] = counters.get(key, 0.0) + series["value"]
+        for series in snapshot.get("histograms", []):
+            key = (series["name"], tuple(sorted(series["labels"].items())))
+            merged = histograms.get(key)
+            if merged is None:
+                histograms[key] = {
+                    "counts": list(series["counts"]), "sum": series["sum"], "count": series["count"],
+                }
+            else:
+                merged["counts"] = [a + b for a, b in zip(merged["counts"], series["counts"])]
+                merged["sum"] += series["sum"]
+                merged["count"] += series["count"]
+
+    if buckets is None:
+        return None
+    return {
+        "buckets": buckets,
+        "types": types,
+        "counters": [
+            {"name": name, "labels": dict(labels), "value": value}
+            for (name, labels), value in sorted(counters.items())
+        ],
+        "histograms": [
+            {"name": name, "labels": dict(labels), **entry}
+            for (name, labels), entry in sorted(histograms.items())
+        ],
+    }
+
 
 def collect_session_metrics(session_dir: Path) -> dict[str, Any]:
     """Collect metrics from a single session.
@@ -59,26 +137,46 @@ def collect_session_metrics(session_dir: Path) -> dict[str, Any]:
     except (IndexError, ValueError):
         pass
 
-    # Count signals
-    done_signals = list(signals_dir.glob("*.done")) if signals_dir.exists() else []
-    fail_signals = list(signals_dir.glob("*.fail")) if signals_dir.exists() else []
+    # Count signals (journal-format sessions: only new records are parsed)
+    journaled = load_journal_signals(signals_dir)
+    latest_mtime: float | None = None
+    if journaled is not None:
+        done_names = [name for name in journaled if name.endswith(".done")]
+        fail_names = [name for name in journaled if name.endswith(".fail")]
+        total_bytes = 0
+        for name in done_names:
+            try:
+                total_bytes += int(journaled[name].get("size", 0))
+            except (ValueError, TypeError):
+                pass
+        if done_names or fail_names:
+            latest_mtime = journal_path(signals_dir).stat().st_mtime
+        completed, failed = len(done_names), len(fail_names)
+    else:
+        done_signals = list(signals_dir.glob("*.done")) if signals_dir.exists() else []
+        fail_signals = list(signals_dir.glob("*.fail")) if signals_dir.exists() else []
+
+        # Calculate total artifact size
+        total_bytes = 0
+        for signal_file in done_signals:
+            try:
+                content = signal_file.read_text()
+                for line in content.split("\n"):
+                    if line.startswith("size:"):
+                        total_bytes += int(line.split(":")[1].strip())
+            except (ValueError, IndexError):
+                pass
+
+        # Most recent signal mtime is the session end time
+        all_signals = done_signals + fail_signals
+        if all_signals:
+            latest_mtime = max(s.stat().st_mtime for s in all_signals)
+        completed, failed = len(done_signals), len(fail_signals)
 
-    metrics["workers_completed"] = len(done_signals)
-    metrics["workers_failed"] = len(fail_signals)
-    metrics["workers_total"] = len(done_signals) + len(fail_signals)
+    metrics["workers_completed"] = completed
+    metrics["workers_failed"] = failed
+    metrics["workers_total"] = completed + failed
     metrics["signals_total"] = metrics["workers_total"]
-
-    # Calculate total artifact size
-    total_bytes = 0
-    for signal_file in done_signals:
-        try:
-            content = signal_file.read_text()
-            for line in content.split("\n"):
-                if line.startswith("size:"):
-                    total_bytes += int(line.split(":")[1].strip())
-        except (ValueError, IndexError):
-            pass
-
     metrics["artifacts_total_bytes"] = total_bytes
 
     # Get trace ID if available
@@ -87,22 +185,116 @@ def collect_session_metrics(session_dir: Path) -> dict[str, Any]:
         metrics["trace_id"] = trace_file.read_text().strip()
 
     # Calculate duration if session appears complete
-    if metrics["workers_total"] > 0:
-        # Use most recent signal mtime as end time
-        all_signals = done_signals + fail_signals
-        if all_signals:
-            latest_mtime = max(s.stat().st_mtime for s in all_signals)
-            if "started_at" in metrics:
-                try:
-                    start = datetime.fromisoformat(metrics["started_at"])
-                    end = datetime.fromtimestamp(latest_mtime)
-                    metrics["duration_seconds"] = (end - start).total_seconds()
-                except (ValueError, TypeError):
-                    pass
+    if latest_mtime is not None and "started_at" in metrics:
+        try:
+            start = datetime.fromisoformat(metrics["started_at"])
+            end = datetime.fromtimestamp(latest_mtime)
+            metrics["duration_seconds"] = (end - start).total_seconds()
+        except (ValueError, TypeError):
+            pass
+
+    registry = load_session_registry(session_dir)
+    if registry is not None:
+        metrics["registry"] = registry
 
     return metrics
 
 
+INDEX_FILENAME = ".session-index.json"
+INDEX_VERSION = 2
+SESSION_GLOB = "*-*-*"
+
+
+def _session_signature(session_dir: Path) -> list[int]:
+    """Cheap change detector: .signals/ and .metrics/ mtimes, journal size, .trace presence."""
+    signals_dir = session_dir / ".signals"
+    try:
+        signals_mtime = signals_dir.stat().st_mtime_ns
+    except OSError:
+        signals_mtime = 0
+    try:
+        journal_size = journal_path(signals_dir).stat().st_size
+    except OSError:
+        journal_size = 0
+    try:
+        registry_mtime = (session_dir / METRICS_SUBDIR).stat().st_mtime_ns
+    except OSError:
+        registry_mtime = 0
+    return [signals_mtime, journal_size, int((session_dir / ".trace").exists()), registry_mtime]
+
+
+class SessionIndex:
+    """Per-session metrics cache for a sessions base directory.
+
+    A scrape stats each listed session's .signals/ directory (and journal)
+    and re-collects only the sessions whose signature changed, so the cost
+    no longer grows with the number of signal files across history.
+
+    Args:
+        sessions_base: Base directory holding session directories
+    """
+
+    def __init__(self, sessions_base: Path):
+        self.sessions_base = Path(sessions_base)
+        self.path = self.sessions_base / INDEX_FILENAME
+        self.entries: dict[str, dict[str, Any]] = {}
+        self._dirty = False
+        try:
+            data = json.loads(self.path.read_text())
+            if data.get("version") == INDEX_VERSION:
+                self.entries = dict(data["sessions"])
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            self.entries = {}
+
+    def session_names(self) -> list[str]:
+        """Session directory names, newest first (names start with YYYYMMDD-HHMM)."""
+        names = [p.name for p in self.sessions_base.glob(SESSION_GLOB) if p.is_dir()]
+        return sorted(names, reverse=True)
+
+    def session_metrics(self, session_dir: Path) -> dict[str, Any]:
+        """Metrics for one session, re-collected only if its signals changed."""
+        signature = _session_signature(session_dir)
+        entry = self.entries.get(session_dir.name)
+        if entry is None or entry.get("signature") != signature:
+            metrics = collect_session_metrics(session_dir)
+            if signature[1]:
+                # Reading a journal saves its cursor into .signals/, which
+                # bumps the directory mtime; index the post-read state unless
+                # the journal itself grew meanwhile.
+                after = _session_signature(session_dir)
+                if after[1] == signature[1]:
+                    signature = after
+            entry = {"signature": signature, "metrics": metrics}
+            self.entries[session_dir.name] = entry
+            self._dirty = True
+        return entry["metrics"]
+
+    def recent(self, limit: int | None = None) -> list[dict[str, Any]]:
+        """Metrics for the newest `limit` sessions (all if None); saves if changed."""
+        names = self.session_names()
+        stale = set(self.entries) - set(names)
+        for name in stale:
+            del self.entries[name]
+        self._dirty = self._dirty or bool(stale)
+
+        selected = names if limit is None else names[:limit]
+        sessions = [self.session_metrics(self.sessions_base / name) for name in selected]
+        self.save()
+        return sessions
+
+    def save(self) -> None:
+        """Write the index atomically if anything changed (best effort)."""
+        if not self._dirty:
+            return
+        tmp_path = self.path.with_name(f".{INDEX_FILENAME}.tmp.{os.getpid()}")
+        try:
+            tmp_path.write_text(json.dumps({"version": INDEX_VERSION, "sessions": self.entries}))
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+
+
 def export_prometheus(sessions: list[dict[str, Any]]) -> str:
     """Export metrics in Prometheus format.
 
@@ -148,9 +340,52 @@ def export_prometheus(sessions: list[dict[str, Any]]) -> str:
                 f'swarm_duration_seconds{{{labels}}} {session["duration_seconds"]}'
             )
 
+    lines.extend(_export_registries(sessions))
     return "\n".join(lines) + "\n"
 
 
+def _escape_label(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: dict[str, Any]) -> str:
+    return ",".join(f'{key}="{_escape_label(value)}"' for key, value in labels.items())
+
+
+def _export_registries(sessions: list[dict[str, Any]]) -> list[str]:
+    """Exposition lines for the agentic_* series of all sessions, grouped by metric."""
+    types: dict[str, Any] = {}
+    samples: dict[str, list[str]] = {}
+    for session in sessions:
+        registry = session.get("registry")
+        if not registry:
+            continue
+        types.update(registry.get("types", {}))
+        session_label = {"session": session.get("session_id", "unknown")}
+        bounds = [str(b) for b in registry.get("buckets", [])] + ["+Inf"]
+        for series in registry.get("counters", []):
+            labels = _format_labels({**session_label, **series["labels"]})
+            samples.setdefault(series["name"], []).append(f"{series['name']}{{{labels}}} {series['value']}")
+        for series in registry.get("histograms", []):
+            name = series["name"]
+            base = {**session_label, **series["labels"]}
+            cumulative = 0
+            out = samples.setdefault(name, [])
+            for bound, count in zip(bounds, series["counts"]):
+                cumulative += count
+                out.append(f"{name}_bucket{{{_format_labels({**base, 'le': bound})}}} {cumulative}")
+            out.append(f"{name}_sum{{{_format_labels(base)}}} {series['sum']}")
+            out.append(f"{name}_count{{{_format_labels(base)}}} {series['count']}")
+
+    lines: list[str] = []
+    for name in sorted(samples):
+        info = types.get(name, {})
+        lines.append(f"# HELP {name} {info.get('help', name)}")
+        lines.append(f"# TYPE {name} {info.get('type', 'untyped')}")
+        lines.extend(samples[name])
+    return lines
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Swarm metrics collection")
     subparsers = parser.add_subparsers(dest="command", required=True)
@@ -195,13 +430,7 @@ def main() -> int:
         return 0
 
     elif args.command == "export":
-        sessions = []
-        session_dirs = sorted(
-            args.sessions_base.glob("*-*-*"), key=lambda p: p.name, reverse=True
-        )
-        for session_dir in session_dirs[: args.limit]:
-            if session_dir.is_dir():
-                sessions.append(collect_session_metrics(session_dir))
+        sessions = SessionIndex(args.sessions_base).recent(args.limit)
 
         if args.format == "prometheus":
             print(export_prometheus(sessions))
@@ -210,19 +439,17 @@ def main() -> int:
         return 0
 
     elif args.command == "summary":
-        session_dirs = list(args.sessions_base.glob("*-*-*"))
+        sessions = SessionIndex(args.sessions_base).recent()
         total_workers = 0
         total_completed = 0
         total_failed = 0
 
-        for session_dir in session_dirs:
-            if session_dir.is_dir():
-                metrics = collect_session_metrics(session_dir)
-                total_workers += metrics.get("workers_total", 0)
-                total_completed += metrics.get("workers_completed", 0)
-                total_failed += metrics.get("workers_failed", 0)
+        for metrics in sessions:
+            total_workers += metrics.get("workers_total", 0)
+            total_completed += metrics.get("workers_completed", 0)
+            total_failed += metrics.get("workers_failed", 0)
 
-        print(f"Total sessions: {len(session_dirs)}")
+        print(f"Total sessions: {len(sessions)}")
         print(f"Total workers: {total_workers}")
         print(f"Completed: {total_completed}")
         print(f"Failed: {total_failed}")
@@ -95,34 +95,26 @@ def activate_mux_enforcement(session_dir: Path) -> Path | None:
     return marker_file
 
 
-def main() -> int:
-    parser = argparse.ArgumentParser(
-        description="Create mux session directory structure"
-    )
-    parser.add_argument(
-        "topic_slug",
-        help="Topic slug for session ID (e.g., 'auth-research')",
-    )
-    parser.add_argument(
-        "--base",
-        default="tmp/mux",
-        help="Base directory for mux sessions (default: tmp/mux)",
-    )
-    parser.add_argument(
-        "--parent-trace",
-        dest="parent_trace",
-        help="Parent trace ID for child sessions (propagation)",
-    )
-
-    args = parser.parse_args()
-
+def create_session(
+    topic_slug: str,
+    base: str | Path = "tmp/mux",
+    parent_trace: str | None = None,
+) -> tuple[Path, str, Path | None]:
+    """Create a session directory with its subdirectories, trace ID and marker.
+
+    Importable as a library (the A2A server calls it in-process instead of
+    spawning `uv run session.py`).
+
+    Returns:
+        (session_dir, trace_id, marker_file)
+    """
     # Generate session ID: YYYYMMDD-HHMM-topic
     timestamp = datetime.now().strftime("%Y%m%d-%H%M")
-    session_id = f"{timestamp}-{args.topic_slug}"
+    session_id = f"{timestamp}-{topic_slug}"
     # IMPORTANT: session_dir is intentionally RELATIVE to project root.
     # e.g., tmp/mux/20260209-1430-topic (NOT /tmp/mux/...).
     # Subagents must use this path as-is without prepending '/'.
-    session_dir = Path(args.base) / session_id
+    session_dir = Path(base) / session_id
 
     # Create directory structure
     subdirs = ["research", "audits", "consolidated", "spy", ".signals", ".agents"]
@@ -130,9 +122,9 @@ def main() -> int:
         (session_dir / subdir).mkdir(parents=True, exist_ok=True)
 
     # Generate or propagate trace ID
-    if args.parent_trace:
+    if parent_trace:
         # Child session: use parent trace with new span
-        trace_id = args.parent_trace
+        trace_id = parent_trace
     else:
         # Root session: generate new trace ID (16 hex chars)
         trace_id = uuid.uuid4().hex[:16]
@@ -144,6 +136,34 @@ def main() -> int:
     # Create mux-active marker for session observability
     marker_file = activate_mux_enforcement(session_dir)
 
+    return session_dir, trace_id, marker_file
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Create mux session directory structure"
+    )
+    parser.add_argument(
+        "topic_slug",
+        help="Topic slug for session ID (e.g., 'auth-research')",
+    )
+    parser.add_argument(
+        "--base",
+        default="tmp/mux",
+        help="Base directory for mux sessions (default: tmp/mux)",
+    )
+    parser.add_argument(
+        "--parent-trace",
+        dest="parent_trace",
+        help="Parent trace ID for child sessions (propagation)",
+    )
+
+    args = parser.parse_args()
+
+    session_dir, trace_id, marker_file = create_session(
+        args.topic_slug, base=args.base, parent_trace=args.parent_trace
+    )
+
     # Output for shell consumption
     print(f"SESSION_DIR={session_dir}")
     print(f"TRACE_ID={trace_id}")
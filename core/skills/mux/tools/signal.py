@@ -26,6 +26,9 @@ import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from lib.signal_journal import append_signal, journal_enabled
+
 
 def atomic_write(path: Path, content: str):
     """Atomically write content to file using write-temp-rename pattern.
@@ -144,26 +147,32 @@ def main() -> int:
     final_signal_path.parent.mkdir(parents=True, exist_ok=True)
 
     # Build signal content
-    lines = [
-        f"path: {args.path}",
-        f"size: {size}",
-        f"status: {args.status}",
-        f"created_at: {datetime.now(timezone.utc).isoformat()}",
-    ]
+    fields = {
+        "path": args.path,
+        "size": str(size),
+        "status": args.status,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+    }
 
     if args.error:
-        lines.append(f"error: {args.error}")
+        fields["error"] = args.error
 
     if trace_id:
-        lines.append(f"trace_id: {trace_id}")
+        fields["trace_id"] = trace_id
 
     if args.version is not None:
-        lines.append(f"version: {args.version}")
+        fields["version"] = str(args.version)
 
     if args.previous:
-        lines.append(f"previous: {args.previous}")
+        fields["previous"] = args.previous
+
+    # Journal-format session: one appended record instead of a new file
+    if journal_enabled(final_signal_path.parent):
+        journal = append_signal(final_signal_path.parent, {"signal": final_signal_path.name, **fields})
+        print(f"Signal recorded: {final_signal_path.name} in {journal}")
+        return 0
 
-    signal_content = "\n".join(lines) + "\n"
+    signal_content = "".join(f"{key}: {value}\n" for key, value in fields.items())
 
     # Atomically write signal file to final path
     # This eliminates the race condition where partial signals could be visible
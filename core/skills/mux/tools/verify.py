@@ -29,6 +29,9 @@ import argparse
 import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from lib.signal_journal import load_journal_signals
+
 
 def parse_signal(signal_path: Path) -> dict[str, str]:
     """Parse a signal file into key-value pairs."""
@@ -89,18 +92,32 @@ def find_signals(session_dir: Path, signals_dir: Path | None, pattern: str) -> l
     return preferred + misplaced
 
 
+def collect_signals(
+    session_dir: Path, signals_dir: Path | None, suffix: str
+) -> list[tuple[str, dict[str, str]]]:
+    """Signals ending in suffix as (name, fields), sorted by location.
+
+    Journal-format sessions are read from .signals/journal.jsonl (only the
+    records appended since the last run are parsed); otherwise signal files
+    are found with find_signals().
+    """
+    journaled = load_journal_signals(signals_dir if signals_dir is not None else session_dir / ".signals")
+    if journaled is not None:
+        return sorted((name, data) for name, data in journaled.items() if name.endswith(suffix))
+    return [(f.name, parse_signal(f)) for f in sorted(find_signals(session_dir, signals_dir, f"*{suffix}"))]
+
+
 def count_completions(session_dir: Path, signals_dir: Path | None = None) -> int:
-    """Count .done signal files."""
-    return len(find_signals(session_dir, signals_dir, "*.done"))
+    """Count .done signals."""
+    return len(collect_signals(session_dir, signals_dir, ".done"))
 
 
 def list_failures(session_dir: Path, signals_dir: Path | None = None) -> list[dict[str, str]]:
     """List all .fail signals with their error messages."""
     failures = []
-    for fail_file in find_signals(session_dir, signals_dir, "*.fail"):
-        data = parse_signal(fail_file)
+    for name, data in collect_signals(session_dir, signals_dir, ".fail"):
         failures.append({
-            "signal": fail_file.name,
+            "signal": name,
             "path": data.get("path", ""),
             "error": data.get("error", "unknown"),
         })
@@ -109,32 +126,21 @@ def list_failures(session_dir: Path, signals_dir: Path | None = None) -> list[di
 
 def get_paths(session_dir: Path, signals_dir: Path | None = None) -> list[str]:
     """Extract all output paths from .done signals."""
-    paths = []
-    for done_file in sorted(find_signals(session_dir, signals_dir, "*.done")):
-        data = parse_signal(done_file)
-        if "path" in data:
-            paths.append(data["path"])
-    return paths
+    return [data["path"] for _, data in collect_signals(session_dir, signals_dir, ".done") if "path" in data]
 
 
 def get_sizes(session_dir: Path, signals_dir: Path | None = None) -> list[tuple[str, int]]:
     """Extract all output sizes from .done signals."""
-    sizes = []
-    for done_file in sorted(find_signals(session_dir, signals_dir, "*.done")):
-        data = parse_signal(done_file)
-        if "size" in data:
-            sizes.append((done_file.stem, int(data["size"])))
-    return sizes
+    return [
+        (name.removesuffix(".done"), int(data["size"]))
+        for name, data in collect_signals(session_dir, signals_dir, ".done")
+        if "size" in data
+    ]
 
 
 def get_total_size(session_dir: Path, signals_dir: Path | None = None) -> int:
     """Sum all output sizes from .done signals."""
-    total = 0
-    for done_file in find_signals(session_dir, signals_dir, "*.done"):
-        data = parse_signal(done_file)
-        if "size" in data:
-            total += int(data["size"])
-    return total
+    return sum(size for _, size in get_sizes(session_dir, signals_dir))
 
 
 def main() -> int:
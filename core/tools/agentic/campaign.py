@@ -20,6 +20,12 @@ Usage:
     uv run core/tools/agentic/campaign.py --topic "Feature X" --phase PLAN
     uv run core/tools/agentic/campaign.py --topic "Feature X" --phase EXECUTE --session-dir tmp/session/
     uv run core/tools/agentic/campaign.py --topic "Feature X" --resolution path/to/ceo-feedback.md --session-dir tmp/session/
+    uv run core/tools/agentic/campaign.py --resume latest
+    uv run core/tools/agentic/campaign.py --resume tmp/campaigns/20260301-0900-feature-x
+
+State and checkpoints live in <session>/checkpoints/log.jsonl (deltas) and
+snapshot.json (see lib/checkpoint_log.py); .campaign-state mirrors the
+current state for humans and other tools.
 
 Exit codes:
     0  - campaign complete (all phases passed)
@@ -57,11 +63,12 @@ from lib import (
     merge_config,
     resolve_campaign_config,
 )
+from lib.checkpoint_log import CheckpointLog
 from lib.observability import (
     Timer,
     emit_event,
     init_session,
-    run_streaming,
+    run_streaming_manifest,
     signal_completion,
     write_consolidated_report,
     write_live_report,
@@ -90,6 +97,11 @@ STATE_HEAL = "HEAL"
 STATE_REPORT = "REPORT"
 STATE_COMPLETE = "COMPLETE"
 
+CAMPAIGN_STATE_FILENAME = ".campaign-state"
+CHECKPOINT_KEY = "checkpoint"
+CHECKPOINT_VERSION = 2
+DEFAULT_CAMPAIGNS_DIR = Path("tmp") / "campaigns"
+
 # Phase CLI values -> starting states
 PHASE_TO_STATE: dict[str, str] = {
     "PLAN": STATE_PLAN_RESEARCH,
@@ -156,9 +168,24 @@ def init_session_campaign(base_dir: Path | None, topic: str) -> Path:
     )
 
 
+_checkpoint_logs: dict[Path, CheckpointLog] = {}
+
+
+def checkpoint_log(session_dir: Path) -> CheckpointLog:
+    """The session's checkpoint log (kept open across calls)."""
+    checkpoints_dir = session_dir / "checkpoints"
+    log = _checkpoint_logs.get(checkpoints_dir)
+    if log is None:
+        log = _checkpoint_logs[checkpoints_dir] = CheckpointLog(checkpoints_dir)
+    return log
+
+
 def read_state(session_dir: Path) -> dict[str, str]:
-    """Read campaign state from .campaign-state file."""
-    state_file = session_dir / ".campaign-state"
+    """Read campaign state: last snapshot + deltas, or a legacy .campaign-state file."""
+    log = checkpoint_log(session_dir)
+    if log.exists():
+        return {k: str(v) for k, v in log.load().items() if k != CHECKPOINT_KEY}
+    state_file = session_dir / CAMPAIGN_STATE_FILENAME
     if not state_file.exists():
         return {}
     state: dict[str, str] = {}
@@ -170,30 +197,50 @@ def read_state(session_dir: Path) -> dict[str, str]:
 
 
 def write_state(session_dir: Path, state: dict[str, str]) -> None:
-    """Write campaign state to .campaign-state file."""
-    state_file = session_dir / ".campaign-state"
+    """Replace the campaign state: one delta in the log, mirrored to .campaign-state."""
+    log = checkpoint_log(session_dir)
+    log.append(state, unset=[k for k in log.load() if k != CHECKPOINT_KEY])
     content = "\n".join(f"{k}: {v}" for k, v in state.items()) + "\n"
-    state_file.write_text(content, encoding="utf-8")
+    (session_dir / CAMPAIGN_STATE_FILENAME).write_text(content, encoding="utf-8")
 
 
 def write_checkpoint(session_dir: Path, state_name: str, data: dict) -> Path:
-    """Write checkpoint file. Returns checkpoint path. R-18: does not crash on write failure."""
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
-    cp_path = session_dir / "checkpoints" / f"cp-{timestamp}.json"
-    cp_path.parent.mkdir(parents=True, exist_ok=True)
+    """Record a checkpoint in the log. Returns the log path. R-18: does not crash on write failure.
+
+    Large values (manifests) go to content-addressed blobs, so each
+    checkpoint costs one short log line.
+    """
+    log = checkpoint_log(session_dir)
     checkpoint = {
-        "checkpoint_version": 1,
+        "checkpoint_version": CHECKPOINT_VERSION,
         "created_at": datetime.now(timezone.utc).isoformat(),
         "session_dir": str(session_dir),
         "state": state_name,
         **data,
     }
     try:
-        cp_path.write_text(json.dumps(checkpoint, indent=2), encoding="utf-8")
+        log.append({CHECKPOINT_KEY: checkpoint})
     except OSError as e:
         emit_error("CHECKPOINT_WRITE_FAILED", str(e))
-        return cp_path
-    return cp_path
+    return log.log_path
+
+
+def latest_checkpoint(session_dir: Path) -> dict | None:
+    """The most recent checkpoint (blob references resolved), or None."""
+    log = checkpoint_log(session_dir)
+    checkpoint = log.load().get(CHECKPOINT_KEY)
+    return log.resolve(checkpoint) if checkpoint is not None else None
+
+
+def find_latest_session(base_dir: Path) -> Path | None:
+    """Newest campaign session under base_dir that has state and is not COMPLETE."""
+    if not base_dir.is_dir():
+        return None
+    for candidate in sorted((p for p in base_dir.iterdir() if p.is_dir()), reverse=True):
+        state = read_state(candidate)
+        if state and state.get("state") != STATE_COMPLETE:
+            return candidate
+    return None
 
 
 # -- Subprocess helpers -------------------------------------------------------
@@ -204,38 +251,32 @@ def run_subprocess(
     timeout: int,
     label: str,
     session_dir: Path | None = None,
-) -> tuple[int, str, str]:
-    """Run a subprocess with streaming and return (exit_code, stdout, stderr='')."""
+) -> tuple[int, dict | None, str]:
+    """Run a subprocess with streaming and return (exit_code, manifest, error).
+
+    The child's JSON payload arrives through the manifest channel; its stdout
+    is only forwarded for humans.
+    """
     emit_event("L4", label, "STARTING")
     write_live_report(session_dir, "L4", label, "STARTING")
 
     try:
-        with Timer() as t:
-            exit_code, stdout = run_streaming(cmd, timeout=timeout, label=label)
+        with Timer(label, layer="L4") as t:
+            exit_code, manifest = run_streaming_manifest(cmd, timeout=timeout, label=label)
+            t.attributes["exit_code"] = exit_code
     except subprocess.TimeoutExpired:
         emit_event("L4", label, "TIMEOUT", detail=f"{timeout}s limit")
         write_live_report(session_dir, "L4", label, "TIMEOUT")
-        return EXIT_TIMEOUT, "", f"Timeout after {timeout}s"
+        return EXIT_TIMEOUT, None, f"Timeout after {timeout}s"
     except KeyboardInterrupt:
         emit_event("L4", label, "INTERRUPTED")
-        return EXIT_INTERRUPTED, "", "Interrupted"
+        return EXIT_INTERRUPTED, None, "Interrupted"
 
     status = "COMPLETE" if exit_code == EXIT_SUCCESS else f"FAILED:exit={exit_code}"
     emit_event("L4", label, status, elapsed_ms=t.elapsed_ms)
     write_live_report(session_dir, "L4", label, status, elapsed_seconds=t.elapsed_seconds)
 
-    return exit_code, stdout, ""
-
-
-def parse_json_stdout(stdout: str) -> dict | None:
-    """Attempt to parse JSON from subprocess stdout."""
-    text = stdout.strip()
-    if not text:
-        return None
-    try:
-        return json.loads(text)
-    except json.JSONDecodeError:
-        return None
+    return exit_code, manifest, ""
 
 
 # -- Phase A: PLAN -----------------------------------------------------------
@@ -267,9 +308,7 @@ def run_research(
     if cwd:
         cmd.extend(["--cwd", cwd])
 
-    exit_code, stdout, _ = run_subprocess(cmd, timeout=660, label=f"research:round-{round_number}", session_dir=session_dir)
-
-    manifest = parse_json_stdout(stdout)
+    exit_code, manifest, _ = run_subprocess(cmd, timeout=660, label=f"research:round-{round_number}", session_dir=session_dir)
     return exit_code, manifest
 
 
@@ -312,9 +351,7 @@ def evaluate_sufficiency(
     if cwd:
         cmd.extend(["--cwd", cwd])
 
-    exit_code, stdout, _ = run_subprocess(cmd, timeout=300, label="refinement-eval", session_dir=session_dir)
-
-    parsed = parse_json_stdout(stdout)
+    exit_code, parsed, _ = run_subprocess(cmd, timeout=300, label="refinement-eval", session_dir=session_dir)
 
     # Extract the inner result if spawn wraps it
     if parsed and "result" in parsed and isinstance(parsed["result"], dict):
@@ -483,7 +520,7 @@ def run_consolidate(
     if cwd:
         cmd.extend(["--cwd", cwd])
 
-    exit_code, stdout, _ = run_subprocess(cmd, timeout=600, label="consolidate", session_dir=session_dir)
+    exit_code, _, _ = run_subprocess(cmd, timeout=600, label="consolidate", session_dir=session_dir)
 
     if exit_code in NON_ABSORBABLE_EXIT_CODES:
         return exit_code, STATE_PLAN_CONSOLIDATE
@@ -549,7 +586,7 @@ def run_decompose(
     if cwd:
         cmd.extend(["--cwd", cwd])
 
-    exit_code, stdout, _ = run_subprocess(cmd, timeout=300, label="decompose", session_dir=session_dir)
+    exit_code, parsed, _ = run_subprocess(cmd, timeout=300, label="decompose", session_dir=session_dir)
 
     if exit_code in NON_ABSORBABLE_EXIT_CODES:
         return exit_code, STATE_PLAN_DECOMPOSE
@@ -558,8 +595,7 @@ def run_decompose(
         emit_error("DECOMPOSE_FAILED", f"Decomposition failed (exit={exit_code})")
         return EXIT_FAILURE, STATE_PLAN_DECOMPOSE
 
-    # Parse the coordinator config from spawn output
-    parsed = parse_json_stdout(stdout)
+    # Extract the coordinator config from the spawn payload
     config_data: dict | None = None
 
     if parsed:
@@ -674,13 +710,12 @@ def run_execute(
     if cwd:
         cmd.extend(["--cwd", cwd])
 
-    exit_code, stdout, _ = run_subprocess(cmd, timeout=3600, label="execute", session_dir=session_dir)
+    exit_code, manifest, _ = run_subprocess(cmd, timeout=3600, label="execute", session_dir=session_dir)
 
     if exit_code in NON_ABSORBABLE_EXIT_CODES:
         return exit_code, STATE_EXECUTE
 
     # Save coordinator manifest
-    manifest = parse_json_stdout(stdout)
     if manifest:
         manifest_path = session_dir / "coordinator-manifest.json"
         manifest_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
@@ -756,7 +791,7 @@ def run_evaluate(
         if cwd:
             cmd.extend(["--cwd", cwd])
 
-        exit_code, stdout, _ = run_subprocess(cmd, timeout=300, label="evaluate", session_dir=session_dir)
+        exit_code, parsed, _ = run_subprocess(cmd, timeout=300, label="evaluate", session_dir=session_dir)
 
         if exit_code in NON_ABSORBABLE_EXIT_CODES:
             return exit_code, STATE_EVALUATE
@@ -765,7 +800,6 @@ def run_evaluate(
             emit_error("EVALUATION_FAILED", f"Evaluation failed (exit={exit_code})")
             return EXIT_FAILURE, STATE_EVALUATE
 
-        parsed = parse_json_stdout(stdout)
         eval_result: dict | None = None
 
         if parsed:
@@ -919,7 +953,7 @@ def run_campaign(
     current_state = start_state
 
     # R-06: Only write initial state if no existing state (preserve resume values)
-    state_file = session_dir / ".campaign-state"
+    state_file = session_dir / CAMPAIGN_STATE_FILENAME
     if not state_file.exists():
         write_state(session_dir, {
             "state": current_state,
@@ -1033,8 +1067,17 @@ def build_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument(
         "--topic",
-        required=True,
-        help="Campaign subject / goal",
+        default=None,
+        help="Campaign subject / goal (required unless --resume)",
+    )
+    parser.add_argument(
+        "--resume",
+        nargs="?",
+        const="latest",
+        default=None,
+        metavar="SESSION_DIR",
+        help="Resume a session from its checkpoint log: a session directory, or 'latest' "
+        "(newest unfinished session under --session-dir's parent or tmp/campaigns).",
     )
     parser.add_argument(
         "--session-dir",
@@ -1109,6 +1152,8 @@ def build_parser() -> argparse.ArgumentParser:
 def main() -> int:
     parser = build_parser()
     args = parser.parse_args()
+    if args.topic is None and args.resume is None:
+        parser.error("--topic is required unless --resume is given")
 
     script_dir = Path(__file__).resolve().parent
 
@@ -1142,7 +1187,22 @@ def main() -> int:
         return EXIT_SUCCESS
 
     # Initialize or reuse session directory
-    if args.session_dir:
+    if args.resume is not None:
+        if args.resume == "latest":
+            base_dir = Path(args.session_dir).parent if args.session_dir else DEFAULT_CAMPAIGNS_DIR
+            found = find_latest_session(base_dir)
+            if found is None:
+                emit_error("RESUME_NOT_FOUND", f"No unfinished campaign session under {base_dir}")
+                return EXIT_FAILURE
+            session_dir = found
+        else:
+            session_dir = Path(args.resume)
+            if not read_state(session_dir):
+                emit_error("RESUME_NOT_FOUND", f"No campaign state in {session_dir}")
+                return EXIT_FAILURE
+        if args.topic is None:
+            args.topic = read_state(session_dir).get("topic", session_dir.name)
+    elif args.session_dir:
         session_dir = Path(args.session_dir)
         if not session_dir.exists():
             session_dir = init_session_campaign(session_dir.parent, args.topic)
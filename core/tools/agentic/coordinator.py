@@ -4,11 +4,12 @@
 # dependencies = []
 # ///
 """
-Coordinator skeleton (Layer 3): sequences orchestrators per-phase.
+Coordinator skeleton (Layer 3): schedules orchestrators per-phase as a DAG.
 
 Reference implementation for Layer 3 in the composition hierarchy.
 Calls Layer 2 orchestrators (not executors) and tracks phase dependencies,
-checkpoints, and escalation.
+checkpoints, and escalation. Phases whose depends_on are satisfied run
+concurrently (up to max_parallel_phases), longest critical path first.
 
 NEVER reads/writes source files. NEVER calls executors directly.
 
@@ -16,6 +17,8 @@ Usage:
     uv run core/tools/agentic/coordinator.py config.json
     uv run core/tools/agentic/coordinator.py config.json --max-depth 5
     uv run core/tools/agentic/coordinator.py config.json --session-dir /path/to/session
+    uv run core/tools/agentic/coordinator.py config.json --max-parallel-phases 1
+    uv run core/tools/agentic/coordinator.py config.json --session-dir /path/to/session --resume
 
 Exit codes:
     0  - all phases passed
@@ -25,12 +28,14 @@ Exit codes:
     10 - needs refinement (quality gate failed)
     12 - partial success
     20 - interrupted
+    21 - phase timeout (EXIT_TIMEOUT, passthrough)
 """
 
 import argparse
 import json
 import subprocess
 import sys
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -43,6 +48,7 @@ from lib import (
     EXIT_SUCCESS,
     EXIT_TIMEOUT,
     NON_ABSORBABLE_EXIT_CODES,
+    emit_manifest,
     get_project_root,
 )
 from lib.observability import (
@@ -50,12 +56,18 @@ from lib.observability import (
     emit_event,
     init_session,
     propagate_trace_id,
-    run_streaming,
+    run_streaming_manifest,
     signal_completion,
     write_consolidated_report,
     write_live_report,
 )
 
+# -- Constants ----------------------------------------------------------------
+
+DEFAULT_MAX_PARALLEL_PHASES = 4
+ORCHESTRATOR_TIMEOUT = 1800
+CHECKPOINT_VERSION = 2
+
 
 # -- Session management -------------------------------------------------------
 
@@ -82,28 +94,59 @@ def init_session_coordinator(base_dir: Path, topic: str) -> Path:
     )
 
 
-def write_checkpoint(session_dir: Path, completed: list[dict], pending: list[str], depth_used: int, depth_max: int) -> Path:
-    """Write checkpoint file for resume. Returns checkpoint path."""
+def write_checkpoint(
+    session_dir: Path,
+    completed: list[dict],
+    pending: list[str],
+    depth_used: int,
+    depth_max: int,
+    in_flight: list[str] | None = None,
+) -> Path:
+    """Write checkpoint file for resume. Returns checkpoint path.
+
+    in_flight lists phases running when the checkpoint was taken; on resume
+    they are re-run together with pending phases. Names carry microseconds
+    (the DAG checkpoints at every launch and completion, often several per
+    second) and the file is replaced atomically, so resume never reads a
+    torn checkpoint.
+    """
     import os as _os
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
+    timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
     checkpoint_path = session_dir / "checkpoints" / f"cp-{timestamp}.json"
     checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
     trace_id = (session_dir / ".trace").read_text().strip() if (session_dir / ".trace").exists() else _os.urandom(8).hex()
 
     checkpoint = {
-        "checkpoint_version": 1,
+        "checkpoint_version": CHECKPOINT_VERSION,
         "created_at": datetime.now(timezone.utc).isoformat(),
         "session_dir": str(session_dir),
         "trace_id": trace_id,
         "completed_phases": completed,
+        "in_flight_phases": in_flight or [],
         "pending_phases": pending,
         "depth_used": depth_used,
         "depth_max": depth_max,
     }
-    checkpoint_path.write_text(json.dumps(checkpoint, indent=2), encoding="utf-8")
+    tmp_path = checkpoint_path.with_name(f".{checkpoint_path.name}.tmp.{_os.getpid()}")
+    tmp_path.write_text(json.dumps(checkpoint, indent=2), encoding="utf-8")
+    _os.replace(tmp_path, checkpoint_path)
     return checkpoint_path
 
 
+def load_latest_checkpoint(session_dir: Path) -> dict | None:
+    """Read the most recent checkpoint, or None if there is none."""
+    checkpoints = sorted((session_dir / "checkpoints").glob("cp-*.json"))
+    if not checkpoints:
+        return None
+    try:
+        checkpoint = json.loads(checkpoints[-1].read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    if checkpoint.get("checkpoint_version") not in (1, CHECKPOINT_VERSION):
+        return None
+    return checkpoint
+
+
 # -- Phase execution ----------------------------------------------------------
 
 
@@ -114,6 +157,7 @@ def run_orchestrator(
     max_depth: int,
     cwd: str | None,
     session_dir: Path | None = None,
+    timeout: int = ORCHESTRATOR_TIMEOUT,
 ) -> tuple[int, dict | None]:
     """Execute a Layer 2 orchestrator with streaming. Returns (exit_code, manifest)."""
     cmd: list[str] = [
@@ -127,21 +171,93 @@ def run_orchestrator(
         cmd.extend(["--session-dir", str(session_dir)])
 
     try:
-        exit_code, stdout = run_streaming(cmd, timeout=1800, label=f"orchestrator:{modifier}")
+        return run_streaming_manifest(cmd, timeout=timeout, label=f"orchestrator:{modifier}")
     except subprocess.TimeoutExpired:
-        emit_event("L3", f"orchestrator:{modifier}", "TIMEOUT", detail="1800s limit")
+        emit_event("L3", f"orchestrator:{modifier}", "TIMEOUT", detail=f"{timeout}s limit")
         return EXIT_TIMEOUT, None
     except KeyboardInterrupt:
         return EXIT_INTERRUPTED, None
 
-    manifest: dict | None = None
-    if stdout.strip():
-        try:
-            manifest = json.loads(stdout)
-        except json.JSONDecodeError:
-            pass
 
-    return exit_code, manifest
+def phase_name_of(phase: dict, index: int) -> str:
+    """Phase name, defaulting to phase-NN by position."""
+    return phase.get("name", f"phase-{index + 1:02d}")
+
+
+def phase_session_dir(session_dir: Path | None, phase_name: str) -> Path | None:
+    """A phase's own sub-session (<session>/phases/<name>), created on demand.
+
+    Concurrent phases must not share a --session-dir: two oresearch phases
+    would write the same research/*.md files and two ospec phases the same
+    L2-ospec-<STAGE> signals.
+    """
+    if not session_dir:
+        return None
+    path = session_dir / "phases" / phase_name
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def compute_critical_paths(phases: list[dict]) -> dict[str, int]:
+    """Longest cost path from each phase to the end of the DAG.
+
+    A phase's cost is its declared timeout (default ORCHESTRATOR_TIMEOUT),
+    the only duration estimate available before it runs. Phases on a
+    dependency cycle get their own cost only.
+    """
+    names = [phase_name_of(p, i) for i, p in enumerate(phases)]
+    cost = {name: int(p.get("timeout", ORCHESTRATOR_TIMEOUT)) for name, p in zip(names, phases)}
+    children: dict[str, list[str]] = {name: [] for name in names}
+    indegree = dict.fromkeys(names, 0)
+    for name, phase in zip(names, phases):
+        for dep in phase.get("depends_on", []):
+            if dep in children:
+                children[dep].append(name)
+                indegree[name] += 1
+
+    # Kahn topological order, then accumulate from the sinks backwards
+    order = [name for name in names if indegree[name] == 0]
+    for name in order:
+        for child in children[name]:
+            indegree[child] -= 1
+            if indegree[child] == 0:
+                order.append(child)
+
+    critical: dict[str, int] = {}
+    for name in reversed(order):
+        critical[name] = cost[name] + max((critical[c] for c in children[name]), default=0)
+    for name in names:
+        critical.setdefault(name, cost[name])
+    return critical
+
+
+def run_phase(
+    phase_name: str,
+    orchestrator_path: Path,
+    modifier: str,
+    target: str,
+    max_depth: int,
+    cwd: str | None,
+    session_dir: Path | None,
+    timeout: int = ORCHESTRATOR_TIMEOUT,
+) -> tuple[int, dict | None, float]:
+    """Run one phase's orchestrator, retrying once on failure.
+
+    Returns:
+        Tuple of (exit_code, manifest, elapsed_seconds of the last attempt).
+    """
+    with Timer(phase_name, layer="L3", attributes={"agentic.orchestrator": modifier}) as t:
+        exit_code, manifest = run_orchestrator(orchestrator_path, modifier, target, max_depth, cwd, session_dir=session_dir, timeout=timeout)
+        t.attributes["exit_code"] = exit_code
+
+    # Retry once on failure -- but NOT on timeout (A-05)
+    if exit_code == EXIT_FAILURE and exit_code not in (EXIT_TIMEOUT,):
+        emit_event("L3", phase_name, "RETRY")
+        with Timer(phase_name, layer="L3", attributes={"agentic.orchestrator": modifier, "agentic.attempt": 2}) as t:
+            exit_code, manifest = run_orchestrator(orchestrator_path, modifier, target, max_depth, cwd, session_dir=session_dir, timeout=timeout)
+            t.attributes["exit_code"] = exit_code
+
+    return exit_code, manifest, t.elapsed_seconds
 
 
 def execute_phases(
@@ -150,82 +266,155 @@ def execute_phases(
     max_depth: int,
     cwd: str | None,
     session_dir: Path | None,
+    max_parallel_phases: int = DEFAULT_MAX_PARALLEL_PHASES,
+    resume_completed: list[dict] | None = None,
 ) -> tuple[int, list[dict]]:
-    """Execute phases sequentially with observability."""
-    results: list[dict] = []
-
-    for i, phase in enumerate(phases):
-        phase_name = phase.get("name", f"phase-{i+1:02d}")
-        orchestrator_rel = phase["orchestrator"]
-        modifier = phase.get("modifier", "full")
-        target = phase["target"]
-        depends_on = phase.get("depends_on", [])
-
-        # Check dependencies
-        completed_names = {r["name"] for r in results if r["exit_code"] == EXIT_SUCCESS}
-        unmet = [d for d in depends_on if d not in completed_names]
-        if unmet:
-            emit_event("L3", phase_name, "SKIP", detail=f"unmet deps: {unmet}")
-            results.append({"name": phase_name, "status": "skipped", "exit_code": EXIT_FAILURE, "error": f"unmet deps: {unmet}"})
-            continue
-
-        emit_event("L3", phase_name, "STARTING")
-        write_live_report(session_dir, "L3", phase_name, "STARTING")
-
-        orchestrator_path = project_root / orchestrator_rel
-        if not orchestrator_path.is_file():
-            results.append({"name": phase_name, "status": "failed", "exit_code": EXIT_FAILURE, "error": f"orchestrator not found: {orchestrator_rel}"})
-            continue
-
-        with Timer() as t:
-            exit_code, manifest = run_orchestrator(orchestrator_path, modifier, target, max_depth, cwd, session_dir=session_dir)
-
-        # Non-absorbable: propagate
-        if exit_code in NON_ABSORBABLE_EXIT_CODES:
-            emit_event("L3", phase_name, f"ABORT:exit={exit_code}", elapsed_ms=t.elapsed_ms)
-            signal_completion(session_dir, "L3", phase_name, "fail", elapsed_seconds=t.elapsed_seconds)
-            results.append({"name": phase_name, "status": "failed", "exit_code": exit_code})
-            return exit_code, results
-
-        # Retry once on failure -- but NOT on timeout (A-05)
-        if exit_code == EXIT_FAILURE and exit_code not in (EXIT_TIMEOUT,):
-            emit_event("L3", phase_name, "RETRY")
-            with Timer() as t:
-                exit_code, manifest = run_orchestrator(orchestrator_path, modifier, target, max_depth, cwd, session_dir=session_dir)
-            if exit_code in NON_ABSORBABLE_EXIT_CODES:
-                results.append({"name": phase_name, "status": "failed", "exit_code": exit_code})
-                return exit_code, results
-
-        result_entry: dict = {
-            "name": phase_name,
-            "status": "success" if exit_code == EXIT_SUCCESS else "failed",
-            "exit_code": exit_code,
-        }
-        if manifest:
-            result_entry["manifest"] = manifest
-        results.append(result_entry)
-
-        signal_completion(session_dir, "L3", phase_name, "done" if exit_code == EXIT_SUCCESS else "fail", elapsed_seconds=t.elapsed_seconds)
-
-        # Checkpoint after each phase
+    """Execute phases as a DAG with observability.
+
+    Every phase whose depends_on are all satisfied is launched, up to
+    max_parallel_phases at once, longest critical path first. Phases with a
+    failed or skipped ancestor are skipped. A checkpoint is written at every
+    launch and completion with the completed/in-flight/pending frontier.
+    Each phase's orchestrator gets its own --session-dir under
+    <session>/phases/<name>; checkpoints and L3 signals stay at the top level.
+
+    Args:
+        resume_completed: Successful phase results from a checkpoint; these
+            phases are not re-run.
+
+    Returns:
+        Tuple of (overall_exit_code, phase_results in config order).
+    """
+    names = [phase_name_of(p, i) for i, p in enumerate(phases)]
+    by_name = dict(zip(names, phases))
+    index = {name: i for i, name in enumerate(names)}
+    critical = compute_critical_paths(phases)
+
+    results: dict[str, dict] = {}
+    succeeded: set[str] = set()
+    for entry in resume_completed or []:
+        if entry.get("name") in by_name and entry.get("exit_code") == EXIT_SUCCESS:
+            results[entry["name"]] = entry
+            succeeded.add(entry["name"])
+            emit_event("L3", entry["name"], "RESUMED", detail="completed in checkpoint")
+
+    pending = [name for name in names if name not in results]
+    running: dict[Future, str] = {}
+    abort_code: int | None = None
+
+    def checkpoint() -> None:
         if session_dir:
-            completed_phases = [r for r in results if r["exit_code"] == EXIT_SUCCESS]
-            pending_names = [p.get("name", f"phase-{j+1:02d}") for j, p in enumerate(phases) if j > i]
-            write_checkpoint(session_dir, completed_phases, pending_names, i + 1, max_depth)
+            completed_phases = [results[n] for n in names if n in succeeded]
+            write_checkpoint(
+                session_dir, completed_phases, list(pending), len(results), max_depth,
+                in_flight=sorted(running.values(), key=index.__getitem__),
+            )
+
+    def skip(name: str, unmet: list[str]) -> None:
+        pending.remove(name)
+        emit_event("L3", name, "SKIP", detail=f"unmet deps: {unmet}")
+        results[name] = {"name": name, "status": "skipped", "exit_code": EXIT_FAILURE, "error": f"unmet deps: {unmet}"}
+
+    executor = ThreadPoolExecutor(max_workers=max(1, max_parallel_phases))
+    try:
+        while pending or running:
+            if abort_code is None:
+                # Skip propagation: a dep that finished without success (or does not exist) can never be met
+                for name in list(pending):
+                    deps = by_name[name].get("depends_on", [])
+                    unmet = [d for d in deps if d not in succeeded and (d in results or d not in by_name)]
+                    if unmet:
+                        skip(name, unmet)
+
+                # Launch ready phases, longest critical path first
+                ready = [
+                    name for name in pending
+                    if all(d in succeeded for d in by_name[name].get("depends_on", []))
+                ]
+                ready.sort(key=lambda n: (-critical[n], index[n]))
+                launched = False
+                for name in ready[: max(0, max_parallel_phases - len(running))]:
+                    pending.remove(name)
+                    phase = by_name[name]
+                    orchestrator_rel = phase["orchestrator"]
+                    orchestrator_path = project_root / orchestrator_rel
+                    if not orchestrator_path.is_file():
+                        results[name] = {"name": name, "status": "failed", "exit_code": EXIT_FAILURE, "error": f"orchestrator not found: {orchestrator_rel}"}
+                        continue
+                    emit_event("L3", name, "STARTING", detail=f"in-flight {len(running) + 1}/{max_parallel_phases}")
+                    write_live_report(session_dir, "L3", name, "STARTING")
+                    future = executor.submit(
+                        run_phase, name, orchestrator_path, phase.get("modifier", "full"),
+                        phase["target"], max_depth, cwd, phase_session_dir(session_dir, name),
+                        phase.get("timeout", ORCHESTRATOR_TIMEOUT),
+                    )
+                    running[future] = name
+                    launched = True
+                if launched:
+                    checkpoint()
+
+            if not running:
+                if pending and abort_code is None and not any(
+                    all(d in succeeded for d in by_name[n].get("depends_on", [])) for n in pending
+                ):
+                    # Remaining phases wait on each other (dependency cycle)
+                    for name in list(pending):
+                        skip(name, [d for d in by_name[name].get("depends_on", []) if d not in succeeded])
+                    continue
+                if abort_code is not None or not pending:
+                    break
+                continue
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                exit_code, manifest, elapsed_seconds = future.result()
+
+                # Non-absorbable: stop launching, let in-flight phases finish, then propagate
+                if exit_code in NON_ABSORBABLE_EXIT_CODES:
+                    emit_event("L3", name, f"ABORT:exit={exit_code}", elapsed_ms=int(elapsed_seconds * 1000))
+                    signal_completion(session_dir, "L3", name, "fail", elapsed_seconds=elapsed_seconds)
+                    results[name] = {"name": name, "status": "failed", "exit_code": exit_code}
+                    if abort_code is None:
+                        abort_code = exit_code
+                    continue
+
+                result_entry: dict = {
+                    "name": name,
+                    "status": "success" if exit_code == EXIT_SUCCESS else "failed",
+                    "exit_code": exit_code,
+                }
+                if manifest:
+                    result_entry["manifest"] = manifest
+                results[name] = result_entry
+                if exit_code == EXIT_SUCCESS:
+                    succeeded.add(name)
+
+                signal_completion(session_dir, "L3", name, "done" if exit_code == EXIT_SUCCESS else "fail", elapsed_seconds=elapsed_seconds)
+
+                status = "COMPLETE" if exit_code == EXIT_SUCCESS else f"FAILED:exit={exit_code}"
+                emit_event("L3", name, status, elapsed_ms=int(elapsed_seconds * 1000))
+                write_live_report(session_dir, "L3", name, status, elapsed_seconds=elapsed_seconds)
+            checkpoint()
+    except KeyboardInterrupt:
+        executor.shutdown(wait=False, cancel_futures=True)
+        checkpoint()
+        return EXIT_INTERRUPTED, [results[n] for n in names if n in results]
+    executor.shutdown(wait=True)
 
-        status = "COMPLETE" if exit_code == EXIT_SUCCESS else f"FAILED:exit={exit_code}"
-        emit_event("L3", phase_name, status, elapsed_ms=t.elapsed_ms)
-        write_live_report(session_dir, "L3", phase_name, status, elapsed_seconds=t.elapsed_seconds)
+    ordered = [results[n] for n in names if n in results]
+    if abort_code is not None:
+        return abort_code, ordered
 
-    failed = sum(1 for r in results if r["exit_code"] != EXIT_SUCCESS)
+    failed = sum(1 for r in ordered if r["exit_code"] != EXIT_SUCCESS)
     if failed == 0:
         signal_completion(session_dir, "L3", "coordinator", "done")
-        return EXIT_SUCCESS, results
-    if failed < len(results):
+        return EXIT_SUCCESS, ordered
+    if failed < len(ordered):
         signal_completion(session_dir, "L3", "coordinator", "partial")
-        return EXIT_PARTIAL_SUCCESS, results
+        return EXIT_PARTIAL_SUCCESS, ordered
     signal_completion(session_dir, "L3", "coordinator", "fail")
-    return EXIT_FAILURE, results
+    return EXIT_FAILURE, ordered
 
 
 # -- CLI ----------------------------------------------------------------------
@@ -233,12 +422,17 @@ def execute_phases(
 
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
-        description="Layer 3 coordinator: sequences orchestrators per-phase"
+        description="Layer 3 coordinator: schedules orchestrators per-phase as a DAG"
     )
     parser.add_argument("config", metavar="CONFIG", help="Path to phase config JSON file")
     parser.add_argument("--max-depth", dest="max_depth", type=int, default=5)
     parser.add_argument("--cwd", default=None)
     parser.add_argument("--session-dir", dest="session_dir", default=None, help="Session directory for checkpoints")
+    parser.add_argument(
+        "--max-parallel-phases", dest="max_parallel_phases", type=int, default=None,
+        help=f"Maximum phases in flight (default: config max_parallel_phases or {DEFAULT_MAX_PARALLEL_PHASES}; 1 = sequential)",
+    )
+    parser.add_argument("--resume", action="store_true", help="Resume from the latest checkpoint in --session-dir")
     return parser
 
 
@@ -282,8 +476,26 @@ def main() -> int:
         (session_dir / ".signals").mkdir(parents=True, exist_ok=True)
         propagate_trace_id(session_dir)
 
+    max_parallel_phases = args.max_parallel_phases or config.get("max_parallel_phases", DEFAULT_MAX_PARALLEL_PHASES)
+    if max_parallel_phases < 1:
+        print("ERROR: --max-parallel-phases must be >= 1", file=sys.stderr)
+        return EXIT_FAILURE
+
+    # Resume: succeeded phases from the latest checkpoint are not re-run
+    resume_completed: list[dict] | None = None
+    if args.resume:
+        checkpoint = load_latest_checkpoint(session_dir) if session_dir else None
+        if checkpoint is None:
+            print("ERROR: --resume requires --session-dir with a checkpoint", file=sys.stderr)
+            return EXIT_FAILURE
+        resume_completed = checkpoint.get("completed_phases", [])
+
     # Execute phases
-    exit_code, results = execute_phases(phases, project_root, args.max_depth, args.cwd, session_dir)
+    exit_code, results = execute_phases(
+        phases, project_root, args.max_depth, args.cwd, session_dir,
+        max_parallel_phases=max_parallel_phases,
+        resume_completed=resume_completed,
+    )
 
     # Generate consolidated report
     if session_dir:
@@ -300,7 +512,7 @@ def main() -> int:
             "exit_code": exit_code,
         },
     }
-    print(json.dumps(report, indent=2))
+    emit_manifest(report)
 
     return exit_code
 
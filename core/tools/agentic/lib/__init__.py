@@ -14,6 +14,8 @@ import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
+from .signal_journal import append_signal, journal_enabled
+
 # -- Exit Codes ---------------------------------------------------------------
 # From composition-hierarchy.md Section 5
 
@@ -166,9 +168,57 @@ def format_manifest(orchestrator: str, stages: list[dict], exit_code: int) -> di
     }
 
 
+# -- Manifest channel ---------------------------------------------------------
+# A parent that sets AGENTIC_MANIFEST_FILE gets its child's manifest as a file
+# instead of having to json.loads() the child's whole stdout. The channel only
+# applies at the depth it was opened for, so agent sessions (and anything they
+# run) never overwrite their parent script's manifest.
+
+MANIFEST_FILE_ENV_VAR = "AGENTIC_MANIFEST_FILE"
+MANIFEST_DEPTH_ENV_VAR = "AGENTIC_MANIFEST_DEPTH"
+
+# Depth this process was started at; spawn.run_agent may bump the live value
+_startup_depth = os.environ.get(DEPTH_ENV_VAR, "0")
+
+
+def manifest_channel_env(path: Path, env: dict[str, str] | None = None) -> dict[str, str]:
+    """Child environment that routes the child's manifest to path."""
+    child_env = dict(os.environ if env is None else env)
+    child_env[MANIFEST_FILE_ENV_VAR] = str(path)
+    child_env[MANIFEST_DEPTH_ENV_VAR] = child_env.get(DEPTH_ENV_VAR, "0")
+    return child_env
+
+
+def manifest_channel_path() -> Path | None:
+    """Manifest file requested by this process's parent, if any."""
+    path = os.environ.get(MANIFEST_FILE_ENV_VAR)
+    if not path or os.environ.get(MANIFEST_DEPTH_ENV_VAR, "0") != _startup_depth:
+        return None
+    return Path(path)
+
+
+def read_manifest(path: Path) -> dict | None:
+    """Read a manifest written through the channel, or None if absent/invalid."""
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    return manifest if isinstance(manifest, dict) else None
+
+
 def emit_manifest(manifest: dict) -> None:
-    """Write manifest JSON to stdout."""
-    print(json.dumps(manifest, indent=2))
+    """Write manifest JSON to the parent's manifest channel, or stdout if none.
+
+    Channel writes are atomic (temp file + rename), so a parent never reads
+    a partial manifest.
+    """
+    channel = manifest_channel_path()
+    if channel is None:
+        print(json.dumps(manifest, indent=2))
+        return
+    tmp_path = channel.with_name(f"{channel.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    os.replace(tmp_path, channel)
 
 
 def emit_error(code: str, message: str, details: str = "") -> None:
@@ -199,26 +249,52 @@ def write_signal(
     artifact_path: str | None = None,
     artifact_size: int | None = None,
     trace_id: str | None = None,
+    elapsed_seconds: float | None = None,
 ) -> Path:
-    """Write a signal file atomically.
+    """Write a signal atomically.
 
-    Path: <session-dir>/.signals/<layer>-<name>.<status>
+    Path: <session-dir>/.signals/<layer>-<name>.<status>, or one appended
+    record in <session-dir>/.signals/journal.jsonl when the session uses the
+    journal format (see lib/signal_journal.py). Returns the path written.
+    elapsed_seconds, when given, lets lib/timeline.py place the work on the
+    session timeline.
     """
     signals_dir = session_dir / ".signals"
-    signals_dir.mkdir(parents=True, exist_ok=True)
+    signal_key = f"{layer}-{name}.{status}"
+    created_at = datetime.now(timezone.utc).isoformat()
+    trace_id = trace_id or os.urandom(8).hex()
+
+    if journal_enabled(signals_dir):
+        record = {
+            "signal": signal_key,
+            "path": artifact_path or "none",
+            "size": artifact_size or 0,
+            "status": status,
+            "created_at": created_at,
+            "trace_id": trace_id,
+            "layer": layer,
+            "name": name,
+            "version": 1,
+        }
+        if elapsed_seconds is not None:
+            record["elapsed_seconds"] = round(elapsed_seconds, 3)
+        return append_signal(signals_dir, record)
 
-    signal_path = signals_dir / f"{layer}-{name}.{status}"
+    signals_dir.mkdir(parents=True, exist_ok=True)
+    signal_path = signals_dir / signal_key
 
     content_lines = [
         f"path: {artifact_path or 'none'}",
         f"size: {artifact_size or 0}",
         f"status: {status}",
-        f"created_at: {datetime.now(timezone.utc).isoformat()}",
-        f"trace_id: {trace_id or os.urandom(8).hex()}",
+        f"created_at: {created_at}",
+        f"trace_id: {trace_id}",
         f"layer: {layer}",
         f"name: {name}",
         "version: 1",
     ]
+    if elapsed_seconds is not None:
+        content_lines.append(f"elapsed_seconds: {elapsed_seconds:.3f}")
     content = "\n".join(content_lines) + "\n"
 
     # Atomic write: temp file + os.replace
@@ -769,6 +845,11 @@ def validate_l2_oresearch_config(config: dict) -> list[str]:
         "timeout_per_worker",
         "timeout_overall",
         "max_concurrency",
+        "adaptive_concurrency",
+        "concurrency_ceiling",
+        "streaming_consolidation",
+        "hedge_percentile",
+        "hedge_model",
         "session_dir",
         "max_depth",
         "round_number",
@@ -824,6 +905,34 @@ def validate_l2_oresearch_config(config: dict) -> list[str]:
             warnings, "L2-oresearch.max_concurrency", config["max_concurrency"], 1, 8
         )
 
+    # adaptive_concurrency: bool (max_concurrency becomes the starting limit)
+    if "adaptive_concurrency" in config:
+        _check_bool_field(
+            warnings, "L2-oresearch.adaptive_concurrency", config["adaptive_concurrency"]
+        )
+
+    # streaming_consolidation: bool
+    if "streaming_consolidation" in config:
+        _check_bool_field(
+            warnings, "L2-oresearch.streaming_consolidation", config["streaming_consolidation"]
+        )
+
+    # hedge_percentile: int 50-99 (opt-in straggler hedging)
+    if "hedge_percentile" in config:
+        _check_int_range(
+            warnings, "L2-oresearch.hedge_percentile", config["hedge_percentile"], 50, 99
+        )
+
+    # hedge_model: valid tier or claude-*
+    if "hedge_model" in config:
+        _check_model(warnings, "L2-oresearch.hedge_model", config["hedge_model"])
+
+    # concurrency_ceiling: int 1-32, upper bound for adaptive growth
+    if "concurrency_ceiling" in config:
+        _check_int_range(
+            warnings, "L2-oresearch.concurrency_ceiling", config["concurrency_ceiling"], 1, 32
+        )
+
     # max_depth: int 1-10
     if "max_depth" in config:
         _check_int_range(warnings, "L2-oresearch.max_depth", config["max_depth"], 1, 10)
@@ -897,6 +1006,7 @@ def validate_l3_config(config: dict) -> list[str]:
         "cwd",
         "session_dir",
         "checkpoint_enabled",
+        "max_parallel_phases",
     }
 
     # Unknown top-level keys
@@ -916,6 +1026,12 @@ def validate_l3_config(config: dict) -> list[str]:
     if "max_depth" in config:
         _check_int_range(warnings, "L3.max_depth", config["max_depth"], 1, 10)
 
+    # max_parallel_phases: int 1-16 (1 = sequential)
+    if "max_parallel_phases" in config:
+        _check_int_range(
+            warnings, "L3.max_parallel_phases", config["max_parallel_phases"], 1, 16
+        )
+
     # cwd, session_dir: nullable strings
     for key in ("cwd", "session_dir"):
         if key in config:
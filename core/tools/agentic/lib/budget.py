@@ -0,0 +1,194 @@
+"""Machine-wide spawn budget: cross-process semaphore for agent sessions.
+
+AGENTIC_SPAWN_DEPTH bounds how deep spawns nest, not how wide they fan out:
+a campaign running parallel coordinator phases that each run oresearch can
+start dozens of agent sessions at once. Every spawn.run_agent() acquires a
+slot here before calling query().
+
+Slots are lock files under one directory, held with fcntl.flock, so a slot is
+freed automatically when its holder exits or crashes:
+
+    <budget-dir>/<tier>-d<depth>-<n>.lock
+
+Limits are per model tier and apply per depth level: a session holding a
+depth-1 slot waits on its depth-2 children, so children must never compete
+with their parents for the same slots.
+
+Environment (inherited by every child process):
+    AGENTIC_SPAWN_BUDGET          "off", or per-tier limits such as
+                                  "high-tier=2,medium-tier=6,*=8"
+    AGENTIC_SPAWN_BUDGET_DIR      lock directory (default: per-user runtime dir)
+    AGENTIC_SPAWN_BUDGET_TIMEOUT  max seconds to wait for a slot
+"""
+
+from __future__ import annotations
+
+import asyncio
+import fcntl
+import os
+import tempfile
+import time
+from pathlib import Path
+
+BUDGET_ENV_VAR = "AGENTIC_SPAWN_BUDGET"
+BUDGET_DIR_ENV_VAR = "AGENTIC_SPAWN_BUDGET_DIR"
+BUDGET_TIMEOUT_ENV_VAR = "AGENTIC_SPAWN_BUDGET_TIMEOUT"
+BUDGET_ENV_VARS = (BUDGET_ENV_VAR, BUDGET_DIR_ENV_VAR, BUDGET_TIMEOUT_ENV_VAR)
+
+# Per depth level; "*" covers raw model IDs and unknown tiers
+DEFAULT_TIER_LIMITS: dict[str, int] = {
+    "high-tier": 4,
+    "medium-tier": 8,
+    "low-tier": 16,
+    "*": 8,
+}
+DEFAULT_WAIT_TIMEOUT = 1800.0
+POLL_INTERVAL = 0.05
+MAX_POLL_INTERVAL = 0.5
+
+
+def parse_limits(spec: str) -> dict[str, int]:
+    """Parse "tier=N,..." into limits layered over DEFAULT_TIER_LIMITS.
+
+    Raises:
+        ValueError: On malformed entries or non-positive limits.
+    """
+    limits = dict(DEFAULT_TIER_LIMITS)
+    for entry in spec.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        tier, sep, value = entry.partition("=")
+        if not sep or not tier.strip():
+            raise ValueError(f"Invalid spawn budget entry: {entry!r} (expected tier=N)")
+        limit = int(value)
+        if limit < 1:
+            raise ValueError(f"Spawn budget for {tier.strip()} must be >= 1, got {limit}")
+        limits[tier.strip()] = limit
+    return limits
+
+
+def default_budget_dir() -> Path:
+    """Resolve the lock directory: AGENTIC_SPAWN_BUDGET_DIR > $XDG_RUNTIME_DIR > temp dir."""
+    env_path = os.environ.get(BUDGET_DIR_ENV_VAR)
+    if env_path:
+        return Path(env_path)
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return Path(runtime_dir) / f"agentic-spawn-budget-{os.getuid()}"
+
+
+def budget_env() -> dict[str, str]:
+    """Budget variables set in this process, for child session environments."""
+    return {name: os.environ[name] for name in BUDGET_ENV_VARS if name in os.environ}
+
+
+class BudgetSlot:
+    """One held slot. Released explicitly or when the process exits."""
+
+    def __init__(self, path: Path, fd: int, index: int, limit: int):
+        self.path = path
+        self.index = index
+        self.limit = limit
+        self._fd: int | None = fd
+
+    def release(self) -> None:
+        if self._fd is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self) -> BudgetSlot:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.release()
+
+
+class SpawnBudget:
+    """Per-tier, per-depth slot pool shared by every process using budget_dir."""
+
+    def __init__(
+        self,
+        budget_dir: Path,
+        limits: dict[str, int] | None = None,
+        wait_timeout: float = DEFAULT_WAIT_TIMEOUT,
+    ):
+        self.budget_dir = budget_dir
+        self.limits = limits or dict(DEFAULT_TIER_LIMITS)
+        self.wait_timeout = wait_timeout
+
+    @classmethod
+    def from_env(cls) -> SpawnBudget | None:
+        """Budget configured by the environment, or None if disabled.
+
+        Raises:
+            ValueError: If AGENTIC_SPAWN_BUDGET is malformed.
+        """
+        spec = os.environ.get(BUDGET_ENV_VAR, "")
+        if spec.strip().lower() in {"off", "0", "false", "no"}:
+            return None
+        timeout = float(os.environ.get(BUDGET_TIMEOUT_ENV_VAR) or DEFAULT_WAIT_TIMEOUT)
+        return cls(default_budget_dir(), parse_limits(spec), wait_timeout=timeout)
+
+    def limit_for(self, tier: str) -> int:
+        return self.limits.get(tier, self.limits.get("*", DEFAULT_TIER_LIMITS["*"]))
+
+    def _slot_path(self, tier: str, depth: int, index: int) -> Path:
+        safe_tier = "".join(c if c.isalnum() or c in "-_." else "_" for c in tier)
+        return self.budget_dir / f"{safe_tier}-d{depth}-{index}.lock"
+
+    def try_acquire(self, tier: str, depth: int) -> BudgetSlot | None:
+        """Take a free slot without waiting, or return None if all are held."""
+        self.budget_dir.mkdir(parents=True, exist_ok=True)
+        limit = self.limit_for(tier)
+        for index in range(limit):
+            path = self._slot_path(tier, depth, index)
+            fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                os.close(fd)
+                continue
+            return BudgetSlot(path, fd, index, limit)
+        return None
+
+    def held(self, tier: str, depth: int) -> int:
+        """Number of currently held slots for tier at depth (probe, not a reservation)."""
+        count = 0
+        for index in range(self.limit_for(tier)):
+            path = self._slot_path(tier, depth, index)
+            if not path.exists():
+                continue
+            fd = os.open(path, os.O_RDWR)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            except BlockingIOError:
+                count += 1
+            finally:
+                os.close(fd)
+        return count
+
+    async def acquire(self, tier: str, depth: int) -> tuple[BudgetSlot, float]:
+        """Wait (without blocking the event loop) for a slot.
+
+        Returns:
+            Tuple of (slot, seconds_waited).
+
+        Raises:
+            RuntimeError: If no slot frees up within wait_timeout.
+        """
+        started = time.monotonic()
+        interval = POLL_INTERVAL
+        while True:
+            slot = self.try_acquire(tier, depth)
+            if slot is not None:
+                return slot, time.monotonic() - started
+            waited = time.monotonic() - started
+            if waited >= self.wait_timeout:
+                raise RuntimeError(
+                    f"Spawn budget: no {tier} slot at depth {depth} within {self.wait_timeout:.0f}s "
+                    f"(limit {self.limit_for(tier)})"
+                )
+            await asyncio.sleep(min(interval, self.wait_timeout - waited))
+            interval = min(interval * 2, MAX_POLL_INTERVAL)
@@ -0,0 +1,223 @@
+"""Append-only checkpoint log with periodic snapshots.
+
+Campaign state used to be a full, indented JSON file per transition
+(checkpoints/cp-<second>.json, manifests included) plus .campaign-state, so
+checkpoint I/O grew with manifest size and two transitions in one second
+overwrote each other. A CheckpointLog keeps one document per session as:
+
+    checkpoints/log.jsonl       one delta per line:
+                                {"seq", "ts", "set": {key: value}, "unset": [key]}
+    checkpoints/snapshot.json   {"version", "seq", "offset", "head", "document"}:
+                                the document after record `seq`, and how many
+                                log bytes that covers
+    checkpoints/blobs/<sha256>.json
+                                large values (e.g. manifests), stored once and
+                                referenced from the log as {"$blob": "<sha256>"}
+
+Deltas only carry the top-level keys that changed. Every SNAPSHOT_INTERVAL
+records a snapshot is written (atomically), so load() reads the snapshot and
+the log from its offset instead of replaying everything. Appends hold an
+exclusive flock and are sequence-numbered; a torn final line (crash
+mid-write) is ignored by readers and truncated by the next append.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import hashlib
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+LOG_FILENAME = "log.jsonl"
+SNAPSHOT_FILENAME = "snapshot.json"
+BLOBS_DIRNAME = "blobs"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_INTERVAL = 32
+INLINE_MAX_BYTES = 4096
+HEAD_BYTES = 256
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, separators=(",", ":"), sort_keys=True)
+
+
+class CheckpointLog:
+    """One session's checkpoint document, stored as snapshot + delta log.
+
+    Args:
+        checkpoints_dir: Directory holding log.jsonl, snapshot.json, blobs/
+    """
+
+    def __init__(self, checkpoints_dir: Path):
+        self.dir = Path(checkpoints_dir)
+        self.log_path = self.dir / LOG_FILENAME
+        self.snapshot_path = self.dir / SNAPSHOT_FILENAME
+        self.document: dict[str, Any] = {}
+        self.seq = 0
+        self.offset = 0
+        self.head = b""
+        self.snapshot_seq = 0
+        self._loaded = False
+
+    def exists(self) -> bool:
+        return self.log_path.is_file()
+
+    # -- Reading ---------------------------------------------------------------
+
+    def _read_snapshot(self) -> None:
+        try:
+            snapshot = json.loads(self.snapshot_path.read_text(encoding="utf-8"))
+            if snapshot.get("version") != SNAPSHOT_VERSION:
+                return
+            document, seq, offset = dict(snapshot["document"]), int(snapshot["seq"]), int(snapshot["offset"])
+            head = bytes.fromhex(snapshot.get("head", ""))
+        except (OSError, ValueError, KeyError, TypeError):
+            return
+        self.document, self.seq, self.offset, self.head = document, seq, offset, head
+        self.snapshot_seq = seq
+
+    def _apply(self, data: bytes) -> None:
+        end = data.rfind(b"\n") + 1
+        for raw in data[:end].splitlines():
+            try:
+                record = json.loads(raw)
+            except json.JSONDecodeError:
+                continue
+            if not isinstance(record, dict) or int(record.get("seq", 0)) <= self.seq:
+                continue
+            self.document.update(record.get("set", {}))
+            for key in record.get("unset", []):
+                self.document.pop(key, None)
+            self.seq = int(record["seq"])
+        if self.offset == 0 and end:
+            self.head = data[: min(data.find(b"\n") + 1, HEAD_BYTES)]
+        self.offset += end
+
+    def _catch_up(self, f) -> None:
+        """Apply records appended since self.offset (f is the open log)."""
+        f.seek(0)
+        if self.offset and f.read(len(self.head)) != self.head:
+            # Log replaced (e.g. restored from elsewhere): replay from scratch
+            self.document, self.seq, self.offset, self.head = {}, 0, 0, b""
+        f.seek(self.offset)
+        self._apply(f.read())
+
+    def load(self) -> dict[str, Any]:
+        """The current document (snapshot + newer deltas). Blob refs are left in place."""
+        if not self._loaded:
+            self._read_snapshot()
+            self._loaded = True
+        try:
+            with open(self.log_path, "rb") as f:
+                self._catch_up(f)
+        except FileNotFoundError:
+            pass
+        return dict(self.document)
+
+    def resolve(self, value: Any) -> Any:
+        """Replace {"$blob": sha} references (at any depth) with their content."""
+        if isinstance(value, dict):
+            if set(value) == {"$blob"}:
+                path = self.dir / BLOBS_DIRNAME / f"{value['$blob']}.json"
+                return json.loads(path.read_text(encoding="utf-8"))
+            return {k: self.resolve(v) for k, v in value.items()}
+        if isinstance(value, list):
+            return [self.resolve(v) for v in value]
+        return value
+
+    def records(self) -> list[dict]:
+        """Every delta in the log, oldest first."""
+        try:
+            data = self.log_path.read_bytes()
+        except FileNotFoundError:
+            return []
+        records = []
+        for raw in data[: data.rfind(b"\n") + 1].splitlines():
+            try:
+                record = json.loads(raw)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(record, dict):
+                records.append(record)
+        return records
+
+    # -- Writing ---------------------------------------------------------------
+
+    def _externalize(self, value: Any, depth: int = 1) -> Any:
+        """Move large nested values to content-addressed blobs."""
+        if isinstance(value, dict) and depth > 0:
+            return {k: self._externalize(v, depth - 1) for k, v in value.items()}
+        if not isinstance(value, (dict, list)):
+            return value
+        encoded = _dumps(value)
+        if len(encoded) <= INLINE_MAX_BYTES:
+            return value
+        digest = hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+        path = self.dir / BLOBS_DIRNAME / f"{digest}.json"
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f".{path.name}.tmp.{os.getpid()}")
+            tmp_path.write_text(encoded, encoding="utf-8")
+            os.replace(tmp_path, path)
+        return {"$blob": digest}
+
+    def append(self, changes: dict[str, Any], unset: list[str] | tuple[str, ...] = ()) -> int:
+        """Record changed keys (and removed ones). Returns the record's seq.
+
+        Keys whose value is unchanged are left out of the delta; if nothing
+        changed, no record is written.
+        """
+        self.dir.mkdir(parents=True, exist_ok=True)
+        if not self._loaded:
+            self._read_snapshot()
+            self._loaded = True
+        with open(self.log_path, "a+b") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                self._catch_up(f)
+                changed = {}
+                for key, value in changes.items():
+                    value = self._externalize(value)
+                    if key not in self.document or _dumps(self.document[key]) != _dumps(value):
+                        changed[key] = value
+                removed = [key for key in unset if key in self.document and key not in changes]
+                if not changed and not removed:
+                    return self.seq
+                record: dict[str, Any] = {
+                    "seq": self.seq + 1,
+                    "ts": datetime.now(timezone.utc).isoformat(),
+                    "set": changed,
+                }
+                if removed:
+                    record["unset"] = removed
+                line = (json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8")
+                if f.seek(0, os.SEEK_END) > self.offset:
+                    # Drop a torn final line so the new record starts on its own line
+                    f.truncate(self.offset)
+                f.write(line)
+                f.flush()
+                self._apply(line)
+                if self.seq - self.snapshot_seq >= SNAPSHOT_INTERVAL:
+                    self.write_snapshot()
+                return self.seq
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def write_snapshot(self) -> Path:
+        """Write the current document as the snapshot (atomic)."""
+        snapshot = {
+            "version": SNAPSHOT_VERSION,
+            "seq": self.seq,
+            "offset": self.offset,
+            "head": self.head.hex(),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "document": self.document,
+        }
+        tmp_path = self.snapshot_path.with_name(f".{SNAPSHOT_FILENAME}.tmp.{os.getpid()}")
+        tmp_path.write_text(json.dumps(snapshot, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp_path, self.snapshot_path)
+        self.snapshot_seq = self.seq
+        return self.snapshot_path
@@ -0,0 +1,102 @@
+"""Adaptive (AIMD) concurrency limiter for worker fan-out.
+
+A fixed worker limit is either too low (large domain lists queue behind a
+handful of slots while the API has headroom) or too high (every worker hits
+rate limits at once and times out together). AdaptiveLimiter adjusts the
+limit from worker outcomes, the same way TCP congestion control does:
+
+    success   additive increase: limit += 1 (up to max_limit)
+    overload  multiplicative decrease: limit = max(min_limit, limit // 2)
+    failure   no change (a bad prompt says nothing about capacity)
+
+A burst of overloads from workers launched under the same limit counts as
+one congestion signal: each slot remembers the epoch it was acquired in, and
+only an overload from the current epoch halves the limit.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Callable
+
+OUTCOME_SUCCESS = "success"
+OUTCOME_OVERLOAD = "overload"
+OUTCOME_FAILURE = "failure"
+
+
+class AdaptiveLimiter:
+    """Async semaphore whose limit follows AIMD on reported outcomes."""
+
+    def __init__(
+        self,
+        initial: int,
+        max_limit: int,
+        *,
+        min_limit: int = 1,
+        adaptive: bool = True,
+        on_change: Callable[[AdaptiveLimiter, str], None] | None = None,
+    ):
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.limit = min(max(initial, self.min_limit), self.max_limit)
+        self.adaptive = adaptive
+        self.in_flight = 0
+        self._epoch = 0
+        self._waiters: deque[asyncio.Future] = deque()
+        self._on_change = on_change
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of callers waiting for a slot."""
+        return len(self._waiters)
+
+    def _notify(self, reason: str) -> None:
+        if self._on_change is not None:
+            self._on_change(self, reason)
+
+    def _wake(self) -> None:
+        while self._waiters and self.in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+    async def acquire(self) -> int:
+        """Wait for a slot. Returns the epoch token to pass to release()."""
+        if self.in_flight < self.limit and not self._waiters:
+            self.in_flight += 1
+            return self._epoch
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self._notify("queued")
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Slot was handed over just before cancellation: give it back
+                self.in_flight -= 1
+                self._wake()
+            else:
+                self._waiters.remove(waiter)
+            raise
+        return self._epoch
+
+    def release(self, epoch: int, outcome: str) -> None:
+        """Return a slot and adjust the limit from the worker's outcome."""
+        self.in_flight -= 1
+        reason = ""
+        if self.adaptive:
+            if outcome == OUTCOME_SUCCESS and self.limit < self.max_limit:
+                self.limit += 1
+                reason = "increase"
+            elif outcome == OUTCOME_OVERLOAD and epoch == self._epoch:
+                self._epoch += 1
+                new_limit = max(self.min_limit, self.limit // 2)
+                if new_limit != self.limit:
+                    self.limit = new_limit
+                    reason = "decrease"
+        self._wake()
+        if reason:
+            self._notify(reason)
@@ -0,0 +1,126 @@
+"""Client side of the persistent spawn daemon protocol.
+
+spawn_daemon.py keeps the Claude SDK imported in one long-lived process and
+serves run_agent requests over a Unix socket, so each L0 spawn skips SDK
+import and client bootstrap. This module is stdlib-only: callers talk to the
+daemon without importing the SDK themselves.
+
+Wire format: one newline-terminated JSON object per direction, one request
+per connection.
+
+    {"op": "ping"}
+    {"op": "run_agent", "params": {...}, "trace_id": "..."}
+    {"op": "shutdown"}
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import tempfile
+from pathlib import Path
+
+SOCKET_ENV_VAR = "AGENTIC_SPAWN_SOCKET"
+VIA_DAEMON_ENV_VAR = "AGENTIC_SPAWN_VIA_DAEMON"
+
+CONNECT_TIMEOUT = 2.0
+MAX_MESSAGE_BYTES = 64 * 1024 * 1024
+
+
+def default_socket_path() -> Path:
+    """Resolve the daemon socket path.
+
+    Priority: AGENTIC_SPAWN_SOCKET env > $XDG_RUNTIME_DIR > system temp dir.
+    """
+    env_path = os.environ.get(SOCKET_ENV_VAR)
+    if env_path:
+        return Path(env_path)
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return Path(runtime_dir) / f"agentic-spawn-{os.getuid()}.sock"
+
+
+def via_daemon_requested() -> bool:
+    """True if AGENTIC_SPAWN_VIA_DAEMON opts the process tree into daemon mode."""
+    return os.environ.get(VIA_DAEMON_ENV_VAR, "").lower() in {"1", "true", "yes"}
+
+
+def encode_message(message: dict) -> bytes:
+    """Serialize one protocol message (compact JSON + newline)."""
+    return json.dumps(message, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def decode_message(line: bytes) -> dict:
+    """Parse one protocol message.
+
+    Raises:
+        ValueError: If the line is not a JSON object.
+    """
+    message = json.loads(line.decode("utf-8"))
+    if not isinstance(message, dict):
+        raise ValueError(f"Expected JSON object, got {type(message).__name__}")
+    return message
+
+
+def _read_line(sock: socket.socket) -> bytes:
+    """Read until newline or EOF."""
+    chunks: list[bytes] = []
+    total = 0
+    while True:
+        chunk = sock.recv(65536)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        total += len(chunk)
+        if chunk.endswith(b"\n"):
+            break
+        if total > MAX_MESSAGE_BYTES:
+            raise ValueError(f"Daemon response exceeds {MAX_MESSAGE_BYTES} bytes")
+    return b"".join(chunks)
+
+
+def send_request(
+    request: dict,
+    *,
+    socket_path: Path | None = None,
+    timeout: float | None = None,
+) -> dict | None:
+    """Send one request to the daemon and wait for its response.
+
+    Returns:
+        Response dict, or None if no daemon is listening (caller falls back
+        to in-process execution).
+
+    Raises:
+        TimeoutError: If the daemon accepted the request but did not answer
+            within timeout.
+        ConnectionError: If the daemon closed the connection mid-request.
+    """
+    path = socket_path or default_socket_path()
+    if not path.exists():
+        return None
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(CONNECT_TIMEOUT)
+    try:
+        sock.connect(str(path))
+    except OSError:
+        sock.close()
+        return None
+
+    with sock:
+        sock.settimeout(timeout)
+        sock.sendall(encode_message(request))
+        line = _read_line(sock)
+
+    if not line.strip():
+        raise ConnectionError("Spawn daemon closed connection without a response")
+    return decode_message(line)
+
+
+def ping(socket_path: Path | None = None) -> dict | None:
+    """Return daemon status, or None if no daemon is listening."""
+    try:
+        return send_request({"op": "ping"}, socket_path=socket_path, timeout=CONNECT_TIMEOUT)
+    except (OSError, ValueError):
+        return None
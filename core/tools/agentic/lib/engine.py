@@ -0,0 +1,1177 @@
+"""In-process orchestration engine for layers L0-L2.
+
+The CLI chain ospec.py -> spec.py -> spawn.py (and oresearch.py ->
+researcher.py -> spawn.py) launches three interpreters per stage or worker
+and re-parses JSON from stdout at every hop. The coroutines here run the
+same steps on one event loop instead: L1 executors await L0 agent sessions
+(spawn.run_agent) directly and L2 orchestrators await L1 executors, so N
+research workers are N tasks in one process.
+
+Contract preserved from the subprocess chain:
+  - every coroutine returns (exit_code, payload) where payload has the shape
+    the equivalent CLI prints on stdout (spawn JSON, format_manifest(), ...)
+  - NON_ABSORBABLE_EXIT_CODES propagate immediately
+  - signal files, live-report lines and progress events are written at the
+    same points and under the same names
+
+The CLIs (spec.py, researcher.py, ospec.py, oresearch.py) are thin wrappers
+that parse arguments, load config and asyncio.run() one of these coroutines.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+from collections.abc import Callable
+from pathlib import Path
+
+# L0 primitive lives beside lib/ as a script module (SDK import is deferred)
+import spawn
+
+from . import (
+    EXIT_DEPTH_EXCEEDED,
+    EXIT_FAILURE,
+    EXIT_INTERRUPTED,
+    EXIT_PARTIAL_SUCCESS,
+    EXIT_SUCCESS,
+    EXIT_TIMEOUT,
+    NON_ABSORBABLE_EXIT_CODES,
+    emit_error,
+    format_manifest,
+    format_stage_result,
+    resolve_project_file,
+)
+from .concurrency import OUTCOME_FAILURE, OUTCOME_OVERLOAD, OUTCOME_SUCCESS, AdaptiveLimiter
+from .daemon import default_socket_path, via_daemon_requested
+from .observability import Timer, emit_event, get_trace_id, signal_completion, write_live_report
+from .stage_cache import UNCACHEABLE_STAGES, StageCache, compute_stage_key, file_digest, repo_state
+
+# -- Constants ----------------------------------------------------------------
+
+_AGENTIC_DIR = Path(__file__).resolve().parent.parent
+
+SPEC_EXECUTOR_RELATIVE = Path("core", "tools", "agentic", "spec.py")
+RESEARCHER_EXECUTOR_RELATIVE = Path("core", "tools", "agentic", "researcher.py")
+
+SPEC_COMMAND_RELATIVE = Path("core", "commands", "claude", "spec.md")
+RESEARCHER_PROMPT_DIR_RELATIVE = Path("core", "prompts", "executors")
+CONSOLIDATOR_PROMPT_RELATIVE = RESEARCHER_PROMPT_DIR_RELATIVE / "researcher-consolidator.md"
+
+# Stage -> default model tier (spec executor)
+STAGE_MODEL_DEFAULTS: dict[str, str] = {
+    "RESEARCH": "medium-tier",
+    "PLAN": "medium-tier",
+    "IMPLEMENT": "high-tier",
+}
+RESEARCHER_DEFAULT_MODEL = "medium-tier"
+
+STAGE_TIMEOUT = 600
+CONSOLIDATION_TIMEOUT = 600
+
+# Adaptive worker concurrency: upper bound, and worker errors treated as API overload
+DEFAULT_CONCURRENCY_CEILING = 16
+OVERLOAD_ERROR_PATTERN = re.compile(r"\b(429|529)\b|rate.?limit|overloaded|too many requests", re.IGNORECASE)
+
+# Hedged workers: duplicate model per primary tier, peers needed before hedging, poll interval
+HEDGE_MODEL_ALTERNATES: dict[str, str] = {
+    "low-tier": "medium-tier",
+    "medium-tier": "high-tier",
+    "high-tier": "medium-tier",
+}
+HEDGE_MIN_PEERS = 2
+HEDGE_POLL_INTERVAL = 1.0
+
+
+# -- Prompt construction ------------------------------------------------------
+
+
+def build_spec_prompt(stage: str, spec: str, extra: list[str] | None) -> str:
+    """Construct the spec agent prompt: /spec {STAGE} {SPEC} {extra}."""
+    parts = ["/spec", stage, spec]
+    if extra:
+        parts.extend(extra)
+    return " ".join(parts)
+
+
+def build_research_prompt(domain: str, topic: str, output: str) -> str:
+    """Construct the agent prompt for domain-specific research."""
+    return (
+        f"Research domain: {domain}\n"
+        f"Topic: {topic}\n"
+        f"Write findings to: {output}"
+    )
+
+
+def build_consolidation_prompt(
+    topic: str, finding_files: list[str], output: Path, existing: Path | None = None
+) -> str:
+    """Construct the consolidator agent prompt.
+
+    With existing, the prompt asks to fold new findings into an earlier
+    consolidated document (streaming consolidation).
+    """
+    findings_list = "\n".join(f"- {f}" for f in finding_files)
+    if existing is not None:
+        return (
+            f"Fold these new research findings into the existing consolidated document "
+            f"at {existing}. Keep its structure; integrate, deduplicate and note conflicts.\n\n"
+            f"Topic: {topic}\n\n"
+            f"New findings files:\n{findings_list}\n\n"
+            f"Write the updated consolidated output to: {output}"
+        )
+    return (
+        f"Consolidate these research findings into a unified document.\n\n"
+        f"Topic: {topic}\n\n"
+        f"Findings files:\n{findings_list}\n\n"
+        f"Write consolidated output to: {output}"
+    )
+
+
+def format_text_output(exit_code: int, payload: dict) -> str:
+    """Render an L0/L1 payload as spawn.py's shell key=value output."""
+    if payload.get("status") == "success":
+        return spawn.format_shell_output(
+            status="success",
+            depth=payload["depth"],
+            model=payload["model"],
+            result_file=payload.get("result_file"),
+        )
+    error = "depth_limit_exceeded" if exit_code == EXIT_DEPTH_EXCEEDED else payload.get("error")
+    return spawn.format_shell_output(
+        status="error",
+        depth=payload.get("depth", 0),
+        model=payload.get("model", ""),
+        error=error,
+    )
+
+
+# -- L0: agent session --------------------------------------------------------
+
+
+async def _run_session(params: dict) -> tuple[str, dict | None, str | None]:
+    """Run one agent session on the spawn daemon if requested, else in-loop."""
+    if via_daemon_requested():
+        outcome = await asyncio.to_thread(
+            spawn.run_agent_via_daemon, default_socket_path(), params, get_trace_id()
+        )
+        if outcome is not None:
+            return outcome
+        emit_event("L0", "spawn", "DAEMON_UNAVAILABLE", detail="running in-process")
+    # Many sessions share this process: never write depth/trace into os.environ
+    return await spawn.run_agent(**params, mutate_environ=False)
+
+
+async def spawn_agent(
+    prompt: str,
+    *,
+    model: str = "medium-tier",
+    system_prompt_path: Path | None = None,
+    allowed_tools: list[str] | None = None,
+    max_depth: int = 3,
+    current_depth: int | None = None,
+    cwd: str | None = None,
+    output_format_json: bool = True,
+    session_dir: Path | None = None,
+    signal_name: str | None = None,
+) -> tuple[int, dict]:
+    """L0: run one agent session (in-process equivalent of spawn.py).
+
+    Returns:
+        Tuple of (exit_code, payload). On success payload matches spawn.py's
+        JSON output; on failure it is {"status": "error", "error": ...}.
+    """
+    depth = spawn.resolve_depth(current_depth)
+    error_payload = {"status": "error", "depth": depth, "model": model}
+
+    depth_error = spawn.check_depth_limit(depth, max_depth)
+    if depth_error:
+        emit_error("DEPTH_EXCEEDED", depth_error)
+        return EXIT_DEPTH_EXCEEDED, {**error_payload, "error": depth_error}
+
+    system_prompt: str | None = None
+    if system_prompt_path is not None:
+        try:
+            system_prompt = spawn.read_system_prompt(str(system_prompt_path))
+        except FileNotFoundError as e:
+            emit_error("FILE_NOT_FOUND", str(e))
+            return EXIT_FAILURE, {**error_payload, "error": str(e)}
+
+    model_id = spawn.resolve_model(model)
+    params = {
+        "prompt": prompt,
+        "model_id": model_id,
+        "system_prompt": system_prompt,
+        "allowed_tools": allowed_tools,
+        "output_format_json": output_format_json,
+        "cwd": cwd,
+        "current_depth": depth,
+    }
+
+    emit_event("L0", f"spawn:{model}", "STARTING", depth=depth)
+    try:
+        with Timer(f"spawn:{model}", layer="L0", attributes={"agentic.tier": model}) as t:
+            result_text, structured_output, error = await _run_session(params)
+            if error:
+                t.attributes["agentic.error"] = error
+                t.attributes["exit_code"] = EXIT_FAILURE  # Export the span with error status
+    except (OSError, RuntimeError) as e:
+        emit_error("SPAWN_FAILED", str(e), details=type(e).__name__)
+        emit_event("L0", f"spawn:{model}", "FAILED", depth=depth)
+        return EXIT_FAILURE, {**error_payload, "error": str(e)}
+
+    emit_event("L0", f"spawn:{model}", "COMPLETE", elapsed_ms=t.elapsed_ms, depth=depth)
+
+    if error:
+        emit_error("AGENT_ERROR", error)
+        return EXIT_FAILURE, {**error_payload, "error": error}
+
+    result_file = spawn.write_result_file(result_text, structured_output)
+
+    if session_dir is not None and signal_name:
+        signal_completion(
+            session_dir, "L0", signal_name, "success",
+            artifact_path=result_file, elapsed_seconds=t.elapsed_seconds,
+        )
+
+    payload: dict = {
+        "status": "success",
+        "depth": depth,
+        "model": model,
+        "model_id": model_id,
+        "elapsed_seconds": t.elapsed_seconds,
+    }
+    if result_file:
+        payload["result_file"] = result_file
+    payload["result"] = structured_output if structured_output is not None else result_text
+    return EXIT_SUCCESS, payload
+
+
+# -- L1: executors ------------------------------------------------------------
+
+
+async def _run_executor(
+    label: str,
+    prompt: str,
+    system_prompt_relative: Path,
+    *,
+    model: str,
+    max_depth: int,
+    current_depth: int | None,
+    cwd: str | None,
+    output_format_json: bool,
+) -> tuple[int, dict]:
+    """Resolve an executor system prompt and run its agent session."""
+    try:
+        system_prompt_path = resolve_project_file(system_prompt_relative, _AGENTIC_DIR)
+    except FileNotFoundError as e:
+        emit_error("FILE_NOT_FOUND", str(e))
+        return EXIT_FAILURE, {"status": "error", "error": str(e), "model": model}
+
+    emit_event("L1", label, "STARTING", tier=model)
+    with Timer(label, layer="L1", attributes={"agentic.tier": model}) as t:
+        exit_code, payload = await spawn_agent(
+            prompt,
+            model=model,
+            system_prompt_path=system_prompt_path,
+            max_depth=max_depth,
+            current_depth=current_depth,
+            cwd=cwd,
+            output_format_json=output_format_json,
+        )
+        t.attributes["exit_code"] = exit_code
+    status = "COMPLETE" if exit_code == EXIT_SUCCESS else f"FAILED:exit={exit_code}"
+    emit_event("L1", label, status, elapsed_ms=t.elapsed_ms, tier=model)
+    return exit_code, payload
+
+
+async def run_spec_stage(
+    stage: str,
+    spec: str,
+    extra: list[str] | None = None,
+    *,
+    model: str | None = None,
+    max_depth: int = 3,
+    current_depth: int | None = None,
+    cwd: str | None = None,
+    output_format_json: bool = True,
+) -> tuple[int, dict]:
+    """L1: run one /spec stage (in-process equivalent of spec.py)."""
+    return await _run_executor(
+        f"spec:{stage}",
+        build_spec_prompt(stage, spec, extra),
+        SPEC_COMMAND_RELATIVE,
+        model=model or STAGE_MODEL_DEFAULTS.get(stage, "medium-tier"),
+        max_depth=max_depth,
+        current_depth=current_depth,
+        cwd=cwd,
+        output_format_json=output_format_json,
+    )
+
+
+async def run_researcher(
+    domain: str,
+    topic: str,
+    output: str,
+    *,
+    model: str | None = None,
+    max_depth: int = 3,
+    current_depth: int | None = None,
+    cwd: str | None = None,
+    output_format_json: bool = True,
+) -> tuple[int, dict]:
+    """L1: run one domain researcher (in-process equivalent of researcher.py)."""
+    return await _run_executor(
+        f"researcher:{domain}",
+        build_research_prompt(domain, topic, output),
+        RESEARCHER_PROMPT_DIR_RELATIVE / f"researcher-{domain}.md",
+        model=model or RESEARCHER_DEFAULT_MODEL,
+        max_depth=max_depth,
+        current_depth=current_depth,
+        cwd=cwd,
+        output_format_json=output_format_json,
+    )
+
+
+# -- L2: ospec ----------------------------------------------------------------
+
+
+async def run_stage(
+    stage_name: str,
+    spec_path: str,
+    model: str,
+    max_depth: int,
+    extra_args: list[str],
+    cwd: str | None,
+) -> tuple[int, dict | None]:
+    """Execute a single ospec stage with the stage timeout.
+
+    Returns:
+        Tuple of (exit_code, executor_payload_or_None).
+    """
+    try:
+        return await asyncio.wait_for(
+            run_spec_stage(stage_name, spec_path, extra_args, model=model, max_depth=max_depth, cwd=cwd),
+            timeout=STAGE_TIMEOUT,
+        )
+    except TimeoutError:
+        emit_event("L2", f"ospec:{stage_name}", "TIMEOUT", detail=f"{STAGE_TIMEOUT}s limit", tier=model)
+        return EXIT_TIMEOUT, None
+    except asyncio.CancelledError:
+        return EXIT_INTERRUPTED, None
+
+
+async def execute_stages(
+    stages: list[dict],
+    spec_path: str,
+    max_depth: int,
+    extra_args: list[str],
+    cwd: str | None,
+    session_dir: Path | None = None,
+    cache: StageCache | None = None,
+) -> tuple[int, list[dict]]:
+    """Execute all stages sequentially with retry logic.
+
+    With a cache, a stage that succeeded in a prior run which left the tree
+    in its current state (spec bytes and repo HEAD, with the same upstream
+    artifacts, model, system prompt and extra args) is not executed; its
+    cached manifest entry and artifact are reused. Stages that change the
+    code (IMPLEMENT, FIX, AMEND, TEST), and every stage after one, always
+    execute.
+
+    Returns:
+        Tuple of (overall_exit_code, stage_results).
+    """
+    results: list[dict] = []
+    total_stages = len(stages)
+
+    spec_file = Path(spec_path)
+    if cwd and not spec_file.is_absolute():
+        spec_file = Path(cwd) / spec_file
+
+    def tree_state() -> tuple[str, tuple[str, str]] | None:
+        """(spec digest, (repo root, HEAD)) now; None outside git or without the spec."""
+        repo = repo_state(cwd or spec_file.parent)
+        try:
+            return (file_digest(spec_file), repo) if repo is not None else None
+        except OSError:
+            return None
+
+    system_prompt_file: Path | None = None
+    if cache is not None:
+        try:
+            system_prompt_file = resolve_project_file(SPEC_COMMAND_RELATIVE, _AGENTIC_DIR)
+        except FileNotFoundError:
+            cache = None
+        if tree_state() is None:
+            cache = None
+    lookups = cache is not None  # Off from the first stage that changes the code
+    upstream_artifacts: list[Path] = []
+    # Stages of this run a retry may skip: (stage, model id, upstream artifacts,
+    # entry, artifact, (spec digest, HEAD) after the stage)
+    replayable: list[tuple[str, str, list[Path], dict, str | None, tuple[str, str]]] = []
+    stored_keys: set[str] = set()
+
+    def remember() -> None:
+        """Store this run's replayable stages under the state the tree is in now.
+
+        Every stage edits and commits the spec, so a retry starts from the
+        state the last stage left, not from the one the skipped stages saw.
+        """
+        state = tree_state() if cache is not None and replayable else None
+        if state is None:
+            return
+        for name, model_id, artifacts, entry, artifact, after in replayable:
+            key = compute_stage_key(name, state[0], state[1], model_id, system_prompt_file, extra_args, artifacts)
+            if key and key not in stored_keys and (not artifact or Path(artifact).is_file()):
+                cache.store(key, entry, artifact, after=after)
+                stored_keys.add(key)
+
+    try:
+        for stage_idx, stage_config in enumerate(stages):
+            stage_name = stage_config["name"]
+            model = stage_config.get("model", "medium-tier")
+            max_retries = stage_config.get("retry", 0)
+            required = stage_config.get("required", True)
+            counter = f"stage {stage_idx + 1}/{total_stages}"
+
+            if stage_name in UNCACHEABLE_STAGES:
+                # Later stages see this stage's code changes, which are not in the key
+                lookups = False
+            model_id = spawn.resolve_model(model)
+            state = tree_state() if lookups else None
+            if state is not None:
+                cache_key = compute_stage_key(
+                    stage_name, state[0], state[1], model_id, system_prompt_file, extra_args, upstream_artifacts,
+                )
+                cached = cache.lookup(cache_key, state[1]) if cache_key else None
+                if cached is not None:
+                    emit_event("L2", f"ospec:{stage_name}", "CACHE_HIT", detail=f"{counter} key={cache_key[:12]}", tier=model)
+                    stored_keys.add(cache_key)
+                    artifact = cached.get("artifact")
+                    replayable.append(
+                        (stage_name, model_id, list(upstream_artifacts), dict(cached), artifact, (state[0], state[1][1]))
+                    )
+                    cached["cached"] = True
+                    results.append(cached)
+                    if artifact:
+                        upstream_artifacts.append(Path(artifact))
+                    signal_completion(session_dir, "L2", f"ospec-{stage_name}", "done", artifact_path=artifact)
+                    write_live_report(session_dir, "L2", f"ospec:{stage_name}", "COMPLETE", detail=f"{counter} (cached)")
+                    continue
+                emit_event("L2", f"ospec:{stage_name}", "CACHE_MISS", detail=counter, tier=model)
+
+            emit_event("L2", f"ospec:{stage_name}", "STARTING", detail=counter, tier=model)
+            write_live_report(session_dir, "L2", f"ospec:{stage_name}", "STARTING", detail=counter)
+
+            span_attributes = {"agentic.tier": model, "agentic.stage_index": stage_idx}
+            with Timer(f"ospec:{stage_name}", layer="L2", attributes=span_attributes) as t:
+                exit_code, output = await run_stage(stage_name, spec_path, model, max_depth, extra_args, cwd)
+                t.attributes["exit_code"] = exit_code
+
+            # Non-absorbable exit codes propagate immediately
+            if exit_code in NON_ABSORBABLE_EXIT_CODES:
+                emit_event("L2", f"ospec:{stage_name}", f"NON-ABSORBABLE:exit={exit_code}", elapsed_ms=t.elapsed_ms, detail=counter, tier=model)
+                signal_completion(session_dir, "L2", f"ospec-{stage_name}", "fail", elapsed_seconds=t.elapsed_seconds)
+                results.append(format_stage_result(
+                    stage_name, "failed", exit_code,
+                    error=f"Non-absorbable exit code: {exit_code}"
+                ))
+                return exit_code, results
+
+            # Retry logic (R-15: iterate N times, not just once)
+            for attempt in range(max_retries):
+                if exit_code not in (EXIT_FAILURE,):
+                    break
+                emit_event("L2", f"ospec:{stage_name}", f"RETRY:{attempt + 1}/{max_retries}", detail=counter, tier=model)
+                with Timer(f"ospec:{stage_name}", layer="L2", attributes={**span_attributes, "agentic.attempt": attempt + 2}) as t:
+                    exit_code, output = await run_stage(stage_name, spec_path, model, max_depth, extra_args, cwd)
+                    t.attributes["exit_code"] = exit_code
+                    if exit_code in NON_ABSORBABLE_EXIT_CODES:
+                        results.append(format_stage_result(
+                            stage_name, "failed", exit_code,
+                            error=f"Non-absorbable exit code on retry: {exit_code}"
+                        ))
+                        return exit_code, results
+
+            # Record result
+            if exit_code == EXIT_SUCCESS:
+                emit_event("L2", f"ospec:{stage_name}", "COMPLETE", elapsed_ms=t.elapsed_ms, detail=counter, tier=model)
+                artifact = output.get("result_file") if output else None
+                entry = format_stage_result(stage_name, "success", exit_code, artifact=artifact)
+                state = tree_state() if lookups else None
+                if state is not None:
+                    # Keyed by the state this stage left behind (see remember())
+                    after = (state[0], state[1][1])
+                    cache_key = compute_stage_key(
+                        stage_name, state[0], state[1], model_id, system_prompt_file, extra_args, upstream_artifacts,
+                    )
+                    if cache_key:
+                        entry = cache.store(cache_key, entry, artifact, after=after)
+                        stored_keys.add(cache_key)
+                        artifact = entry.get("artifact")
+                        replayable.append((stage_name, model_id, list(upstream_artifacts), entry, artifact, after))
+                results.append(entry)
+                if artifact:
+                    upstream_artifacts.append(Path(artifact))
+                signal_completion(session_dir, "L2", f"ospec-{stage_name}", "done", artifact_path=artifact, elapsed_seconds=t.elapsed_seconds)
+            else:
+                emit_event("L2", f"ospec:{stage_name}", f"FAILED:exit={exit_code}", elapsed_ms=t.elapsed_ms, detail=counter, tier=model)
+                error_msg = output.get("error") if output else f"exit code {exit_code}"
+                results.append(format_stage_result(stage_name, "failed", exit_code, error=str(error_msg)))
+                signal_completion(session_dir, "L2", f"ospec-{stage_name}", "fail", elapsed_seconds=t.elapsed_seconds)
+
+                if required:
+                    return EXIT_FAILURE, results
+
+            write_live_report(session_dir, "L2", f"ospec:{stage_name}", "COMPLETE" if exit_code == EXIT_SUCCESS else "FAILED", elapsed_seconds=t.elapsed_seconds, detail=counter)
+
+        # Determine overall exit code
+        failed_count = sum(1 for r in results if r["exit_code"] != EXIT_SUCCESS)
+        if failed_count == 0:
+            signal_completion(session_dir, "L2", "ospec", "done")
+            return EXIT_SUCCESS, results
+        if failed_count < len(results):
+            signal_completion(session_dir, "L2", "ospec", "partial")
+            return EXIT_PARTIAL_SUCCESS, results
+        signal_completion(session_dir, "L2", "ospec", "fail")
+        return EXIT_FAILURE, results
+
+    finally:
+        # Also after a failure: the retry starts from the state it left
+        remember()
+
+async def run_ospec(
+    stages: list[dict],
+    spec_path: str,
+    *,
+    max_depth: int = 3,
+    extra_args: list[str] | None = None,
+    cwd: str | None = None,
+    session_dir: Path | None = None,
+    cache: StageCache | None = None,
+) -> tuple[int, dict]:
+    """L2: run a spec stage sequence (in-process equivalent of ospec.py).
+
+    Returns:
+        Tuple of (exit_code, manifest).
+    """
+    exit_code, results = await execute_stages(
+        stages, spec_path, max_depth, extra_args or [], cwd, session_dir=session_dir, cache=cache
+    )
+    return exit_code, format_manifest("ospec", results, exit_code)
+
+
+# -- L2: oresearch ------------------------------------------------------------
+
+
+async def run_worker(
+    domain: str,
+    topic: str,
+    output_path: Path,
+    model: str,
+    max_depth: int,
+    timeout: int,
+    refinement_context: str | None,
+    cwd: str | None,
+    session_dir: Path | None = None,
+    worker_counter: str = "",
+    worker_config: dict | None = None,
+    label_suffix: str = "",
+    signal: bool = True,
+) -> dict:
+    """Execute a single research worker.
+
+    label_suffix distinguishes duplicate runs of one domain in events and
+    live-report lines; signal=False leaves the worker signal to the caller.
+
+    Returns:
+        Worker result dict with domain, status, exit_code, artifact, and error.
+    """
+    effective_topic = topic
+    if refinement_context:
+        effective_topic += f"\n\nRefinement context:\n{refinement_context}"
+    if worker_config and worker_config.get("focus"):
+        effective_topic += f"\n\nResearch focus: {worker_config['focus']}"
+
+    label = f"worker:{domain}{label_suffix}"
+
+    def write_worker_signal(status: str, **kwargs) -> None:
+        if signal:
+            signal_completion(session_dir, "L2", f"worker-{domain}{label_suffix}", status, **kwargs)
+
+    emit_event("L2", label, "STARTING", detail=worker_counter, tier=model)
+    write_live_report(session_dir, "L2", label, "STARTING", detail=worker_counter)
+
+    with Timer(label, layer="L2", attributes={"agentic.tier": model}) as t:
+        try:
+            exit_code, payload = await asyncio.wait_for(
+                run_researcher(domain, effective_topic, str(output_path), model=model, max_depth=max_depth, cwd=cwd),
+                timeout=timeout,
+            )
+            t.attributes["exit_code"] = exit_code
+        except TimeoutError:
+            t.attributes["exit_code"] = EXIT_TIMEOUT
+            emit_event("L2", label, "TIMEOUT", detail=f"{timeout}s limit", tier=model)
+            write_worker_signal("fail", elapsed_seconds=t.elapsed_seconds)
+            return {
+                "domain": domain,
+                "status": "failed",
+                "exit_code": EXIT_TIMEOUT,
+                "error": "timeout",
+            }
+        except asyncio.CancelledError:
+            write_worker_signal("fail")
+            raise
+
+    if exit_code == EXIT_SUCCESS:
+        emit_event("L2", label, "COMPLETE", elapsed_ms=t.elapsed_ms, detail=worker_counter, tier=model)
+        write_worker_signal("done", artifact_path=str(output_path), elapsed_seconds=t.elapsed_seconds)
+        write_live_report(session_dir, "L2", label, "COMPLETE", elapsed_seconds=t.elapsed_seconds, detail=worker_counter)
+        return {
+            "domain": domain,
+            "status": "success",
+            "exit_code": exit_code,
+            "artifact": str(output_path),
+            "elapsed_seconds": t.elapsed_seconds,
+        }
+
+    emit_event("L2", label, f"FAILED:exit={exit_code}", elapsed_ms=t.elapsed_ms, detail=worker_counter, tier=model)
+    write_worker_signal("fail", elapsed_seconds=t.elapsed_seconds)
+    write_live_report(session_dir, "L2", label, "FAILED", elapsed_seconds=t.elapsed_seconds, detail=worker_counter)
+    return {
+        "domain": domain,
+        "status": "failed",
+        "exit_code": exit_code,
+        "error": str(payload.get("error") or f"exit code {exit_code}"),
+        "elapsed_seconds": t.elapsed_seconds,
+    }
+
+
+def _percentile(values: list[float], percentile: int) -> float:
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(1, -(-percentile * len(ordered) // 100))
+    return ordered[rank - 1]
+
+
+def _hedge_outcome(task: asyncio.Task | None) -> dict | None:
+    """Summary of one side of a hedged worker for the manifest."""
+    if task is None:
+        return None
+    if task.cancelled():
+        return {"status": "cancelled"}
+    result = task.result()
+    return {key: result[key] for key in ("status", "exit_code", "elapsed_seconds", "error") if key in result}
+
+
+async def run_hedged_worker(
+    worker_kwargs: dict,
+    hedge_model: str,
+    hedge_after: Callable[[], float | None],
+) -> dict:
+    """Run a worker with a speculative duplicate for stragglers.
+
+    The primary runs as usual. Once it has run longer than hedge_after()
+    seconds (None = not enough peer data yet), a duplicate starts on
+    hedge_model. The first successful result wins and the other run is
+    cancelled; a winning duplicate's findings are moved to the primary's
+    output path. The returned result carries a "hedge" entry with both
+    outcomes. This function owns the domain's worker signal.
+    """
+    domain = worker_kwargs["domain"]
+    session_dir = worker_kwargs.get("session_dir")
+    output_path: Path = worker_kwargs["output_path"]
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+
+    primary = asyncio.create_task(run_worker(**worker_kwargs, signal=False))
+    hedge: asyncio.Task | None = None
+    try:
+        threshold: float | None = None
+        while not primary.done():
+            threshold = hedge_after()
+            if threshold is not None and loop.time() - started >= threshold:
+                break
+            wait_for = HEDGE_POLL_INTERVAL
+            if threshold is not None:
+                wait_for = min(wait_for, threshold - (loop.time() - started))
+            await asyncio.wait({primary}, timeout=wait_for)
+
+        winner: asyncio.Task | None = primary if primary.done() else None
+        if winner is None:
+            emit_event(
+                "L2", f"worker:{domain}", "HEDGE",
+                detail=f"{hedge_model} after {loop.time() - started:.1f}s (p-threshold {threshold:.1f}s)",
+            )
+            hedge = asyncio.create_task(run_worker(
+                **{
+                    **worker_kwargs,
+                    "model": hedge_model,
+                    "output_path": output_path.with_name(f"{domain}-findings.hedge.md"),
+                },
+                label_suffix="-hedge",
+                signal=False,
+            ))
+            pending: set[asyncio.Task] = {primary, hedge}
+            while pending and winner is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in (primary, hedge):
+                    if task in done and task.result()["exit_code"] == EXIT_SUCCESS:
+                        winner = task
+                        break
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+    except asyncio.CancelledError:
+        for task in (primary, hedge):
+            if task is not None:
+                task.cancel()
+        await asyncio.gather(*(t for t in (primary, hedge) if t is not None), return_exceptions=True)
+        signal_completion(session_dir, "L2", f"worker-{domain}", "fail")
+        raise
+
+    result = dict((winner or primary).result())
+    if winner is not None and winner is hedge:
+        hedge_output = Path(result["artifact"])
+        if hedge_output.is_file():
+            hedge_output.replace(output_path)
+        result["artifact"] = str(output_path)
+    if hedge is not None:
+        result["hedge"] = {
+            "model": hedge_model,
+            "winner": None if winner is None else "hedge" if winner is hedge else "primary",
+            "primary": _hedge_outcome(primary),
+            "hedge": _hedge_outcome(hedge),
+        }
+
+    if result["exit_code"] == EXIT_SUCCESS:
+        signal_completion(session_dir, "L2", f"worker-{domain}", "done", artifact_path=result["artifact"], elapsed_seconds=loop.time() - started)
+    else:
+        signal_completion(session_dir, "L2", f"worker-{domain}", "fail", elapsed_seconds=loop.time() - started)
+    return result
+
+
+def _worker_outcome(result: dict) -> str:
+    """Classify a worker result for the adaptive limiter."""
+    if result["exit_code"] == EXIT_SUCCESS:
+        return OUTCOME_SUCCESS
+    if result["exit_code"] == EXIT_TIMEOUT or OVERLOAD_ERROR_PATTERN.search(result.get("error", "")):
+        return OUTCOME_OVERLOAD
+    return OUTCOME_FAILURE
+
+
+def _collect_worker_result(task: asyncio.Task, domain: str, error: str) -> dict:
+    """Result of a finished worker task, or a failed entry if it did not finish."""
+    if task.done() and not task.cancelled() and task.exception() is None:
+        return task.result()
+    return {
+        "domain": domain,
+        "status": "failed",
+        "exit_code": EXIT_TIMEOUT,
+        "error": error,
+    }
+
+
+async def execute_workers(
+    workers: list[dict],
+    topic: str,
+    session_dir: Path,
+    max_depth: int,
+    timeout_per_worker: int,
+    timeout_overall: int,
+    refinement_context: str | None,
+    cwd: str | None,
+    max_concurrency: int = 4,
+    adaptive: bool = False,
+    concurrency_ceiling: int = DEFAULT_CONCURRENCY_CEILING,
+    on_result: Callable[[dict], None] | None = None,
+    hedge_percentile: int | None = None,
+    hedge_model: str | None = None,
+) -> tuple[int, list[dict]]:
+    """Execute all workers concurrently (at most max_concurrency at a time).
+
+    With hedge_percentile set, a worker still running after that percentile
+    of its successful peers' elapsed times gets a duplicate on hedge_model
+    (default: HEDGE_MODEL_ALTERNATES of its own tier); see run_hedged_worker.
+    Duplicates do not take a concurrency slot.
+
+    on_result, if given, is called with each worker's result as soon as that
+    worker finishes (streaming consolidation feeds on it).
+
+    With adaptive=True, max_concurrency is only the starting limit: each
+    successful worker raises it by one (up to concurrency_ceiling) and a
+    timeout or rate-limit failure halves it. Limit changes and queue depth
+    are emitted as CONCURRENCY events.
+
+    Returns:
+        Tuple of (overall_exit_code, worker_results) in worker config order.
+    """
+    research_dir = session_dir / "research"
+    research_dir.mkdir(parents=True, exist_ok=True)
+
+    def report_concurrency(limiter: AdaptiveLimiter, reason: str) -> None:
+        emit_event(
+            "L2", "oresearch", f"CONCURRENCY:{limiter.limit}",
+            detail=f"{reason} in-flight={limiter.in_flight} queued={limiter.queue_depth}",
+        )
+
+    limiter = AdaptiveLimiter(
+        max_concurrency,
+        max(max_concurrency, concurrency_ceiling) if adaptive else max_concurrency,
+        adaptive=adaptive,
+        on_change=report_concurrency,
+    )
+    report_concurrency(limiter, "adaptive" if adaptive else "fixed")
+    total_workers = len(workers)
+    peer_elapsed: list[float] = []
+
+    def hedge_after() -> float | None:
+        if hedge_percentile is None or len(peer_elapsed) < HEDGE_MIN_PEERS:
+            return None
+        return _percentile(peer_elapsed, hedge_percentile)
+
+    async def bounded(worker_idx: int, worker_config: dict) -> dict:
+        domain = worker_config["domain"]
+        epoch = await limiter.acquire()
+        outcome = OUTCOME_FAILURE
+        try:
+            worker_kwargs = dict(
+                domain=domain,
+                topic=topic,
+                output_path=research_dir / f"{domain}-findings.md",
+                model=worker_config.get("model", "medium-tier"),
+                max_depth=max_depth,
+                timeout=timeout_per_worker,
+                refinement_context=refinement_context,
+                cwd=cwd,
+                session_dir=session_dir,
+                worker_counter=f"worker {worker_idx + 1}/{total_workers}",
+                worker_config=worker_config,
+            )
+            if hedge_percentile is None:
+                result = await run_worker(**worker_kwargs)
+            else:
+                model = worker_kwargs["model"]
+                result = await run_hedged_worker(
+                    worker_kwargs, hedge_model or HEDGE_MODEL_ALTERNATES.get(model, model), hedge_after
+                )
+            if result["exit_code"] == EXIT_SUCCESS and "elapsed_seconds" in result:
+                peer_elapsed.append(result["elapsed_seconds"])
+            outcome = _worker_outcome(result)
+            if on_result is not None:
+                on_result(result)
+            return result
+        finally:
+            limiter.release(epoch, outcome)
+
+    tasks = {
+        asyncio.create_task(bounded(idx, worker_config)): worker_config["domain"]
+        for idx, worker_config in enumerate(workers)
+    }
+
+    try:
+        _done, pending = await asyncio.wait(tasks, timeout=timeout_overall)
+    except asyncio.CancelledError:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        return EXIT_INTERRUPTED, [
+            task.result() for task in tasks
+            if not task.cancelled() and task.exception() is None
+        ]
+
+    if pending:
+        emit_event("L2", "oresearch", f"OVERALL_TIMEOUT:{timeout_overall}s")
+        # R-14: Cancel running workers (unlike threads, this stops their agent sessions)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    results = [
+        _collect_worker_result(
+            task, domain,
+            "overall timeout" if task in pending else "exception during collection",
+        )
+        for task, domain in tasks.items()
+    ]
+
+    # Check for non-absorbable exit codes
+    for r in results:
+        if r["exit_code"] in NON_ABSORBABLE_EXIT_CODES:
+            return r["exit_code"], results
+
+    # Determine overall exit code
+    failed_count = sum(1 for r in results if r["exit_code"] != EXIT_SUCCESS)
+    if failed_count == 0:
+        return EXIT_SUCCESS, results
+    if failed_count < len(results):
+        return EXIT_PARTIAL_SUCCESS, results
+    return EXIT_FAILURE, results
+
+
+async def run_consolidation(
+    consolidator_prompt_path: Path,
+    finding_files: list[str],
+    consolidated_output: Path,
+    topic: str,
+    model: str,
+    max_depth: int,
+    cwd: str | None,
+    session_dir: Path | None = None,
+    existing: Path | None = None,
+    label: str = "consolidation",
+) -> tuple[int, str | None]:
+    """Run the consolidator agent (L0 session, no executor hop).
+
+    Returns:
+        Tuple of (exit_code, error_message_or_None).
+    """
+    prompt = build_consolidation_prompt(topic, finding_files, consolidated_output, existing)
+
+    emit_event("L2", label, "STARTING", detail=f"{len(finding_files)} findings")
+    write_live_report(session_dir, "L2", label, "STARTING")
+
+    with Timer(label, layer="L2", attributes={"agentic.tier": model}) as t:
+        try:
+            exit_code, _payload = await asyncio.wait_for(
+                spawn_agent(
+                    prompt,
+                    model=model,
+                    system_prompt_path=consolidator_prompt_path,
+                    max_depth=max_depth,
+                    cwd=cwd,
+                ),
+                timeout=CONSOLIDATION_TIMEOUT,
+            )
+            t.attributes["exit_code"] = exit_code
+        except TimeoutError:
+            t.attributes["exit_code"] = EXIT_TIMEOUT
+            emit_event("L2", label, "TIMEOUT", detail=f"{CONSOLIDATION_TIMEOUT}s limit")
+            signal_completion(session_dir, "L2", label, "fail")
+            return EXIT_TIMEOUT, "consolidation timeout"
+        except asyncio.CancelledError:
+            t.attributes["exit_code"] = EXIT_INTERRUPTED
+            signal_completion(session_dir, "L2", label, "fail")
+            return EXIT_INTERRUPTED, "interrupted"
+
+    if exit_code == EXIT_SUCCESS:
+        emit_event("L2", label, "COMPLETE", elapsed_ms=t.elapsed_ms)
+        signal_completion(session_dir, "L2", label, "done", artifact_path=str(consolidated_output), elapsed_seconds=t.elapsed_seconds)
+        write_live_report(session_dir, "L2", label, "COMPLETE", elapsed_seconds=t.elapsed_seconds)
+        return EXIT_SUCCESS, None
+
+    emit_event("L2", label, f"FAILED:exit={exit_code}", elapsed_ms=t.elapsed_ms)
+    signal_completion(session_dir, "L2", label, "fail", elapsed_seconds=t.elapsed_seconds)
+
+    # Non-absorbable codes propagate
+    if exit_code == EXIT_DEPTH_EXCEEDED:
+        return EXIT_DEPTH_EXCEEDED, "depth limit exceeded"
+    if exit_code == EXIT_INTERRUPTED:
+        return EXIT_INTERRUPTED, "interrupted"
+
+    return exit_code, f"consolidation exit code {exit_code}"
+
+
+async def stream_consolidation(
+    findings: asyncio.Queue,
+    consolidator_prompt_path: Path,
+    consolidated_output: Path,
+    topic: str,
+    model: str,
+    max_depth: int,
+    cwd: str | None,
+    session_dir: Path | None = None,
+) -> tuple[int, str | None, list[list[str]]]:
+    """Consolidate findings as they arrive instead of after the last worker.
+
+    The first pass starts on the first finding; every later pass folds in
+    whatever arrived while the previous pass ran, so the consolidated
+    document always covers every finished worker and the round's tail is one
+    incremental pass rather than a full consolidation. A None on the queue
+    means no more findings.
+
+    Returns:
+        Tuple of (exit_code, error_message_or_None, findings folded per pass).
+    """
+    passes: list[list[str]] = []
+    finished = False
+    while not finished:
+        batch = [await findings.get()]
+        while not findings.empty():
+            batch.append(findings.get_nowait())
+        finished = None in batch
+        batch = [f for f in batch if f is not None]
+        if not batch:
+            continue
+
+        pass_number = len(passes) + 1
+        exit_code, error = await run_consolidation(
+            consolidator_prompt_path=consolidator_prompt_path,
+            finding_files=batch,
+            consolidated_output=consolidated_output,
+            topic=topic,
+            model=model,
+            max_depth=max_depth,
+            cwd=cwd,
+            session_dir=session_dir,
+            existing=consolidated_output if passes else None,
+            label=f"consolidation-pass-{pass_number}",
+        )
+        if exit_code != EXIT_SUCCESS:
+            return exit_code, error, passes
+        passes.append(batch)
+
+    if not passes:
+        return EXIT_FAILURE, "no findings to consolidate", passes
+    signal_completion(session_dir, "L2", "consolidation", "done", artifact_path=str(consolidated_output))
+    return EXIT_SUCCESS, None, passes
+
+
+def format_research_manifest(
+    worker_results: list[dict],
+    consolidated_path: str | None,
+    exit_code: int,
+    round_number: int,
+) -> dict:
+    """Format the oresearch manifest for stdout."""
+    total = len(worker_results)
+    passed = sum(1 for r in worker_results if r["exit_code"] == EXIT_SUCCESS)
+    failed = total - passed
+
+    manifest: dict = {
+        "orchestrator": "oresearch",
+        "round": round_number,
+        "workers": worker_results,
+    }
+    if consolidated_path:
+        manifest["consolidated"] = consolidated_path
+    manifest["summary"] = {
+        "total": total,
+        "passed": passed,
+        "failed": failed,
+        "exit_code": exit_code,
+    }
+    return manifest
+
+
+async def run_oresearch(
+    workers: list[dict],
+    topic: str,
+    session_dir: Path,
+    consolidator_prompt_path: Path,
+    *,
+    max_depth: int = 3,
+    timeout_per_worker: int = 300,
+    timeout_overall: int = 600,
+    max_concurrency: int = 4,
+    adaptive_concurrency: bool = False,
+    concurrency_ceiling: int = DEFAULT_CONCURRENCY_CEILING,
+    refinement_context: str | None = None,
+    consolidation_model: str = "high-tier",
+    cwd: str | None = None,
+    round_number: int = 1,
+    streaming_consolidation: bool = False,
+    hedge_percentile: int | None = None,
+    hedge_model: str | None = None,
+) -> tuple[int, dict]:
+    """L2: fan out research workers, then consolidate (equivalent of oresearch.py).
+
+    With streaming_consolidation, consolidation runs alongside the workers
+    (stream_consolidation); if a streaming pass fails with an absorbable
+    code, one full consolidation over all findings runs as before.
+
+    Returns:
+        Tuple of (exit_code, manifest).
+    """
+    consolidated_output = session_dir / "research" / "consolidated-findings.md"
+    streamer: asyncio.Task | None = None
+    on_result: Callable[[dict], None] | None = None
+    if streaming_consolidation:
+        findings: asyncio.Queue = asyncio.Queue()
+
+        def on_result(result: dict) -> None:
+            if result["exit_code"] == EXIT_SUCCESS and "artifact" in result:
+                findings.put_nowait(result["artifact"])
+
+        streamer = asyncio.create_task(stream_consolidation(
+            findings, consolidator_prompt_path, consolidated_output, topic,
+            consolidation_model, max_depth, cwd, session_dir=session_dir,
+        ))
+
+    worker_exit_code, worker_results = await execute_workers(
+        workers=workers,
+        topic=topic,
+        session_dir=session_dir,
+        max_depth=max_depth,
+        timeout_per_worker=timeout_per_worker,
+        timeout_overall=timeout_overall,
+        refinement_context=refinement_context,
+        cwd=cwd,
+        max_concurrency=max_concurrency,
+        adaptive=adaptive_concurrency,
+        concurrency_ceiling=concurrency_ceiling,
+        on_result=on_result,
+        hedge_percentile=hedge_percentile,
+        hedge_model=hedge_model,
+    )
+
+    # Non-absorbable exit codes propagate immediately
+    if worker_exit_code in (EXIT_DEPTH_EXCEEDED, EXIT_INTERRUPTED):
+        if streamer is not None:
+            streamer.cancel()
+            await asyncio.gather(streamer, return_exceptions=True)
+        return worker_exit_code, format_research_manifest(
+            worker_results, None, worker_exit_code, round_number
+        )
+
+    # All workers failed -- no consolidation possible
+    successful_artifacts = [
+        r["artifact"] for r in worker_results
+        if r["exit_code"] == EXIT_SUCCESS and "artifact" in r
+    ]
+    passes: list[list[str]] | None = None
+    consolidation_exit = EXIT_FAILURE
+    if streamer is not None:
+        findings.put_nowait(None)
+        consolidation_exit, _consolidation_error, passes = await streamer
+        if consolidation_exit != EXIT_SUCCESS and consolidation_exit not in NON_ABSORBABLE_EXIT_CODES and successful_artifacts:
+            emit_event("L2", "consolidation", "STREAMING_FALLBACK", detail=f"exit={consolidation_exit}")
+            passes = None
+
+    if not successful_artifacts:
+        return EXIT_FAILURE, format_research_manifest(
+            worker_results, None, EXIT_FAILURE, round_number
+        )
+
+    if streamer is None or passes is None:
+        consolidation_exit, _consolidation_error = await run_consolidation(
+            consolidator_prompt_path=consolidator_prompt_path,
+            finding_files=successful_artifacts,
+            consolidated_output=consolidated_output,
+            topic=topic,
+            model=consolidation_model,
+            max_depth=max_depth,
+            cwd=cwd,
+            session_dir=session_dir,
+        )
+
+    # Non-absorbable codes from consolidation
+    if consolidation_exit in (EXIT_DEPTH_EXCEEDED, EXIT_INTERRUPTED):
+        return consolidation_exit, format_research_manifest(
+            worker_results, None, consolidation_exit, round_number
+        )
+
+    if consolidation_exit != EXIT_SUCCESS:
+        # Workers partially passed but consolidation failed
+        final_exit = EXIT_PARTIAL_SUCCESS if worker_exit_code == EXIT_SUCCESS else worker_exit_code
+    else:
+        final_exit = worker_exit_code  # EXIT_SUCCESS or EXIT_PARTIAL_SUCCESS
+
+    consolidated_str = str(consolidated_output) if consolidation_exit == EXIT_SUCCESS else None
+    signal_completion(session_dir, "L2", "oresearch", "done" if final_exit == EXIT_SUCCESS else "partial" if final_exit == EXIT_PARTIAL_SUCCESS else "fail")
+    manifest = format_research_manifest(worker_results, consolidated_str, final_exit, round_number)
+    if passes is not None and consolidation_exit == EXIT_SUCCESS:
+        manifest["consolidation_passes"] = [
+            {"pass": number, "findings": batch} for number, batch in enumerate(passes, start=1)
+        ]
+    return final_exit, manifest
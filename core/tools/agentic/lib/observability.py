@@ -2,29 +2,45 @@
 
 Provides 7 composable patterns:
   P1: run_streaming     - Streaming subprocess with stderr forwarding
+                          (stream_process: async core, one loop for all children;
+                          run_streaming_manifest: result via manifest channel)
   P2: signal_completion - Signal file writes at layer boundaries
   P3: get_trace_id / propagate_trace_id / build_child_env_with_trace
-  P4: Timer             - Elapsed time context manager
+                          (+ span ids: current_span_id, OTLP-JSON span file)
+  P4: Timer             - Elapsed time context manager; named Timers are spans
   P5: emit_event        - Structured JSON-line progress events
-  P6: write_live_report - Append-only session live report
+  P6: write_live_report - Append-only session live report (batched per process)
   P7: write_consolidated_report - Post-hoc execution report
+  P8: METRICS           - Histograms/counters fed by emit_event, persisted
+                          per session under .metrics/ (persist_telemetry)
 """
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import codecs
 import fcntl
+import hashlib
 import json
 import os
 import re
+import signal
 import subprocess
 import sys
+import tempfile
+import threading
 import time
+from collections.abc import Callable
+from contextvars import ContextVar, Token
 from datetime import datetime, timezone
 from pathlib import Path
-from threading import Thread
-from typing import IO
+from threading import Event, Lock, Thread
 
-from . import DEPTH_ENV_VAR, write_signal
+from . import DEPTH_ENV_VAR, manifest_channel_env, read_manifest, write_signal
+from .signal_journal import JOURNAL_FILENAME, read_journal
+from .signal_journal import compact as compact_journal
+from .timeline import SPANS_FILENAME, analyze_session, render_markdown
 
 # -- P4: Timer ----------------------------------------------------------------
 
@@ -32,22 +48,57 @@ from . import DEPTH_ENV_VAR, write_signal
 class Timer:
     """Context manager for elapsed time tracking.
 
+    A named Timer is also a trace span (P3): Timers and child processes
+    started inside it record it as their parent, and it is appended to the
+    session's span file on exit. Set attributes inside the block; a non-zero
+    "exit_code" attribute or an exception marks the span as an error.
+
     Usage:
         with Timer() as t:
             do_work()
         print(t.elapsed_ms)
+
+        with Timer("ospec:plan", layer="L2", attributes={"agentic.tier": model}) as t:
+            t.attributes["exit_code"] = run_stage()
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        name: str | None = None,
+        *,
+        layer: str | None = None,
+        attributes: dict[str, object] | None = None,
+    ) -> None:
         self._start: float = 0.0
         self._end: float | None = None
+        self.name = name
+        self.layer = layer
+        self.attributes: dict[str, object] = dict(attributes or {})
+        self.span_id: str | None = None
+        self.parent_span_id: str | None = None
+        self._start_ns = 0
+        self._token: Token | None = None
 
     def __enter__(self) -> Timer:
         self._start = time.monotonic()
+        if self.name is not None:
+            self.parent_span_id = current_span_id()
+            self.span_id = os.urandom(8).hex()
+            self._start_ns = time.time_ns()
+            self._token = _current_span.set(self.span_id)
         return self
 
-    def __exit__(self, *_: object) -> None:
+    def __exit__(self, exc_type: type[BaseException] | None, exc: BaseException | None, _tb: object) -> None:
         self._end = time.monotonic()
+        if self._token is not None:
+            _current_span.reset(self._token)
+            self._token = None
+            error = None
+            if exc_type is not None:
+                error = f"{exc_type.__name__}: {exc}" if str(exc) else exc_type.__name__
+            elif self.attributes.get("exit_code") not in (None, 0):
+                error = f"exit code {self.attributes['exit_code']}"
+            export_span(self, error)
 
     @property
     def elapsed_ms(self) -> int:
@@ -69,13 +120,157 @@ class Timer:
 # -- P1: Streaming Subprocess ------------------------------------------------
 
 
-def _forward_stderr(stream: IO[str], prefix: str) -> None:
-    """Forward stderr line-by-line to parent stderr with prefix."""
-    try:
-        for line in stream:
+STDOUT_SPOOL_MEMORY_BYTES = 1024 * 1024
+STREAM_CHUNK_BYTES = 64 * 1024
+# A single line longer than this is delivered to callbacks in pieces
+MAX_LINE_BYTES = 1024 * 1024
+KILL_GRACE_SECONDS = 5.0
+
+
+class StreamSpool:
+    """Capture for child stdout: held in memory up to max_memory bytes, then
+    spilled to an anonymous temp file, so a chatty child costs bounded RAM
+    until the caller reads the result.
+    """
+
+    def __init__(self, max_memory: int = STDOUT_SPOOL_MEMORY_BYTES):
+        self.max_memory = max_memory
+        self.size = 0
+        self._file = tempfile.SpooledTemporaryFile(max_size=max_memory, mode="w+b")
+
+    @property
+    def spilled(self) -> bool:
+        """True once the captured output has moved to disk."""
+        return self.size > self.max_memory
+
+    def write(self, data: bytes) -> None:
+        self._file.write(data)
+        self.size += len(data)
+
+    def getvalue(self) -> str:
+        self._file.seek(0)
+        text = self._file.read().decode("utf-8", errors="replace")
+        return text.replace("\r\n", "\n")
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _LineSplitter:
+    """Incremental byte-chunk to text-line splitter for per-line callbacks."""
+
+    def __init__(self, callback: Callable[[str], None]):
+        self._callback = callback
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._pending = ""
+
+    def feed(self, data: bytes) -> None:
+        self._pending += self._decoder.decode(data)
+        *lines, self._pending = self._pending.split("\n")
+        for line in lines:
+            self._callback(line.rstrip("\r") + "\n")
+        if len(self._pending) > MAX_LINE_BYTES:
+            self._callback(self._pending)
+            self._pending = ""
+
+    def close(self) -> None:
+        self._pending += self._decoder.decode(b"", final=True)
+        if self._pending:
+            self._callback(self._pending)
+            self._pending = ""
+
+
+def _stderr_forwarder(prefix: str) -> Callable[[str], None]:
+    """Default stderr line handler: forward to parent stderr with prefix."""
+
+    def forward(line: str) -> None:
+        try:
             print(f"{prefix} {line}", end="", file=sys.stderr, flush=True)
-    except (OSError, ValueError):
-        pass
+        except (OSError, ValueError):
+            pass
+
+    return forward
+
+
+async def _pump(
+    stream: asyncio.StreamReader,
+    spool: StreamSpool | None,
+    splitter: _LineSplitter | None,
+) -> None:
+    while chunk := await stream.read(STREAM_CHUNK_BYTES):
+        if spool is not None:
+            spool.write(chunk)
+        if splitter is not None:
+            splitter.feed(chunk)
+    if splitter is not None:
+        splitter.close()
+
+
+async def stream_process(
+    cmd: list[str],
+    *,
+    timeout: float,
+    label: str,
+    env: dict[str, str] | None = None,
+    on_stdout_line: Callable[[str], None] | None = None,
+    on_stderr_line: Callable[[str], None] | None = None,
+    spool_max_memory: int = STDOUT_SPOOL_MEMORY_BYTES,
+) -> tuple[int, str]:
+    """Async core of run_streaming: both pipes are read on the running loop.
+
+    Any number of children can be awaited concurrently on one event loop;
+    no threads are started. Line callbacks run on the loop and must not block.
+
+    Raises:
+        subprocess.TimeoutExpired: If timeout exceeded (child is killed).
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        env=child_env_with_span(env),
+    )
+    spool = StreamSpool(spool_max_memory)
+    stderr_handler = on_stderr_line or _stderr_forwarder(f"[{label}]")
+    stdout_splitter = _LineSplitter(on_stdout_line) if on_stdout_line else None
+    pumps = asyncio.gather(
+        _pump(proc.stdout, spool, stdout_splitter),
+        _pump(proc.stderr, None, _LineSplitter(stderr_handler)),
+    )
+    try:
+        try:
+            async with asyncio.timeout(timeout):
+                await pumps
+                returncode = await proc.wait()
+        except TimeoutError:
+            raise subprocess.TimeoutExpired(cmd, timeout) from None
+        return returncode, spool.getvalue()
+    finally:
+        if proc.returncode is None:
+            proc.kill()
+            try:
+                async with asyncio.timeout(KILL_GRACE_SECONDS):
+                    await proc.wait()
+            except TimeoutError:
+                pass
+        pumps.cancel()
+        spool.close()
+
+
+class _StreamLoop:
+    """Process-wide event loop thread that multiplexes all run_streaming children."""
+
+    _lock = Lock()
+    _loop: asyncio.AbstractEventLoop | None = None
+
+    @classmethod
+    def get(cls) -> asyncio.AbstractEventLoop:
+        with cls._lock:
+            if cls._loop is None or cls._loop.is_closed():
+                loop = asyncio.new_event_loop()
+                Thread(target=loop.run_forever, name="run-streaming-loop", daemon=True).start()
+                cls._loop = loop
+            return cls._loop
 
 
 def run_streaming(
@@ -84,11 +279,20 @@ def run_streaming(
     timeout: int,
     label: str,
     env: dict[str, str] | None = None,
+    on_stdout_line: Callable[[str], None] | None = None,
+    on_stderr_line: Callable[[str], None] | None = None,
+    spool_max_memory: int = STDOUT_SPOOL_MEMORY_BYTES,
 ) -> tuple[int, str]:
     """Run subprocess with streaming stderr and captured stdout.
 
-    Child stderr is forwarded line-by-line to parent stderr with [label] prefix.
-    Child stdout is captured and returned for manifest/JSON parsing.
+    Child stderr is forwarded line-by-line to parent stderr with [label] prefix
+    (or passed to on_stderr_line instead). Child stdout is spooled, spilling to
+    a temp file beyond spool_max_memory bytes, and returned for manifest/JSON
+    parsing; on_stdout_line additionally sees each line as it arrives.
+
+    Concurrent calls from any number of threads share a single event loop
+    thread, so N parallel children do not cost N forwarding threads. Use
+    stream_process() directly from async code.
 
     Returns:
         Tuple of (exit_code, captured_stdout).
@@ -97,31 +301,82 @@ def run_streaming(
         subprocess.TimeoutExpired: If timeout exceeded.
         KeyboardInterrupt: If user interrupts.
     """
-    proc = subprocess.Popen(
-        cmd,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-        env=env,
-    )
-    stderr_thread = Thread(
-        target=_forward_stderr,
-        args=(proc.stderr, f"[{label}]"),
-        daemon=True,
-    )
-    stderr_thread.start()
+    # Resolve the parent span here: the loop thread cannot see this thread's open span
+    env = child_env_with_span(env)
+    finished = Event()
+
+    async def supervised() -> tuple[int, str]:
+        try:
+            return await stream_process(
+                cmd,
+                timeout=timeout,
+                label=label,
+                env=env,
+                on_stdout_line=on_stdout_line,
+                on_stderr_line=on_stderr_line,
+                spool_max_memory=spool_max_memory,
+            )
+        finally:
+            finished.set()
+
+    future = asyncio.run_coroutine_threadsafe(supervised(), _StreamLoop.get())
     try:
-        stdout, _ = proc.communicate(timeout=timeout)
-    except subprocess.TimeoutExpired:
-        proc.kill()
-        proc.wait()
-        raise
+        return future.result()
     except KeyboardInterrupt:
-        proc.kill()
-        proc.wait()
+        # Cancellation kills the child; wait so it is reaped before re-raising
+        future.cancel()
+        finished.wait(KILL_GRACE_SECONDS)
         raise
-    stderr_thread.join(timeout=2)
-    return proc.returncode, stdout or ""
+
+
+def _parse_stdout_manifest(stdout: str) -> dict | None:
+    """Legacy fallback: the whole of stdout as one JSON object."""
+    text = stdout.strip()
+    if not text:
+        return None
+    try:
+        parsed = json.loads(text)
+    except json.JSONDecodeError:
+        return None
+    return parsed if isinstance(parsed, dict) else None
+
+
+def run_streaming_manifest(
+    cmd: list[str],
+    *,
+    timeout: int,
+    label: str,
+    env: dict[str, str] | None = None,
+) -> tuple[int, dict | None]:
+    """Run a child that reports through the manifest channel.
+
+    The child's emit_manifest() writes to a private temp file instead of
+    stdout, so stray prints cannot corrupt the result. Whatever the child
+    does print on stdout is forwarded to stderr with the [label] prefix,
+    like its stderr. Children that predate the channel (or that print an
+    error payload directly) still work: if no manifest file appears,
+    stdout is parsed as JSON.
+
+    Returns:
+        Tuple of (exit_code, manifest or None).
+
+    Raises:
+        subprocess.TimeoutExpired: If timeout exceeded.
+        KeyboardInterrupt: If user interrupts.
+    """
+    with tempfile.TemporaryDirectory(prefix="agentic-manifest-") as tmp_dir:
+        manifest_path = Path(tmp_dir) / "manifest.json"
+        exit_code, stdout = run_streaming(
+            cmd,
+            timeout=timeout,
+            label=label,
+            env=manifest_channel_env(manifest_path, env),
+            on_stdout_line=_stderr_forwarder(f"[{label}]"),
+        )
+        manifest = read_manifest(manifest_path)
+    if manifest is None:
+        manifest = _parse_stdout_manifest(stdout)
+    return exit_code, manifest
 
 
 # -- P3: Trace ID Propagation ------------------------------------------------
@@ -166,10 +421,12 @@ def propagate_trace_id(session_dir: Path | None = None) -> str:
 def build_child_env_with_trace(
     current_depth: int,
     trace_id: str | None = None,
+    parent_span_id: str | None = None,
 ) -> dict[str, str]:
-    """Build subprocess-scoped environment with depth and trace ID.
+    """Build subprocess-scoped environment with depth, trace ID and parent span.
 
-    Does NOT mutate os.environ (fixes R-07 race condition).
+    Does NOT mutate os.environ (fixes R-07 race condition). parent_span_id
+    defaults to current_span_id().
 
     Returns:
         New env dict for subprocess use.
@@ -180,9 +437,136 @@ def build_child_env_with_trace(
         env[TRACE_ENV_VAR] = trace_id
     elif TRACE_ENV_VAR in os.environ:
         env[TRACE_ENV_VAR] = os.environ[TRACE_ENV_VAR]
+    span_id = parent_span_id or current_span_id()
+    if span_id:
+        env[SPAN_ENV_VAR] = span_id
     return env
 
 
+# Span ids: a named Timer is a span. Within a process the innermost open span
+# is tracked per thread/task (contextvar); across processes it travels as
+# AGENTIC_PARENT_SPAN_ID. Finished spans are appended to AGENTIC_SPANS_FILE
+# (set by persist_telemetry) as OTLP-JSON lines: one ExportTraceServiceRequest
+# per line, the OpenTelemetry Collector file exporter layout.
+
+SPAN_ENV_VAR = "AGENTIC_PARENT_SPAN_ID"
+SPANS_FILE_ENV_VAR = "AGENTIC_SPANS_FILE"
+OTLP_SCOPE_NAME = "agentic.observability"
+_SPAN_KIND_INTERNAL = 1
+_STATUS_CODE_ERROR = 2
+
+_current_span: ContextVar[str | None] = ContextVar("agentic_current_span", default=None)
+
+
+def current_span_id() -> str | None:
+    """Innermost open named Timer, else the parent span inherited from the env."""
+    return _current_span.get() or os.environ.get(SPAN_ENV_VAR)
+
+
+def child_env_with_span(env: dict[str, str] | None = None) -> dict[str, str] | None:
+    """Env for a child process with the current span as its parent.
+
+    Returns env unchanged (None keeps inheriting os.environ) when no span is open.
+    """
+    span_id = _current_span.get()
+    if span_id is None:
+        return env
+    child_env = dict(os.environ if env is None else env)
+    child_env[SPAN_ENV_VAR] = span_id
+    return child_env
+
+
+def _otlp_trace_id(trace_id: str) -> str:
+    """32-hex-digit OTLP trace id (16-digit ids are left-padded, as W3C allows)."""
+    if len(trace_id) <= 32 and re.fullmatch(r"[0-9a-fA-F]+", trace_id):
+        return trace_id.lower().rjust(32, "0")
+    return hashlib.sha256(trace_id.encode()).hexdigest()[:32]
+
+
+def _otlp_value(value: object) -> dict[str, object]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: dict[str, object]) -> list[dict[str, object]]:
+    return [{"key": key, "value": _otlp_value(value)} for key, value in attributes.items() if value is not None]
+
+
+def export_span(timer: Timer, error: str | None = None) -> dict | None:
+    """Append a finished named Timer to the span file as one OTLP-JSON line.
+
+    No-op (returns None) without AGENTIC_SPANS_FILE or a trace ID.
+    Best effort: write errors are swallowed.
+
+    Returns:
+        The OTLP span dict that was written.
+    """
+    spans_file = os.environ.get(SPANS_FILE_ENV_VAR)
+    trace_id = get_trace_id()
+    if not spans_file or not trace_id or timer.span_id is None:
+        return None
+
+    attributes: dict[str, object] = {"agentic.layer": timer.layer, "agentic.depth": os.environ.get(DEPTH_ENV_VAR)}
+    attributes.update(timer.attributes)
+    duration_ns = int(((timer._end or time.monotonic()) - timer._start) * 1e9)
+    span: dict[str, object] = {
+        "traceId": _otlp_trace_id(trace_id),
+        "spanId": timer.span_id,
+        "name": timer.name,
+        "kind": _SPAN_KIND_INTERNAL,
+        "startTimeUnixNano": str(timer._start_ns),
+        "endTimeUnixNano": str(timer._start_ns + duration_ns),
+        "attributes": _otlp_attributes(attributes),
+        "status": {"code": _STATUS_CODE_ERROR, "message": error} if error else {},
+    }
+    if timer.parent_span_id:
+        span["parentSpanId"] = timer.parent_span_id
+
+    resource = {
+        "service.name": "agentic",
+        "process.pid": os.getpid(),
+        "process.executable.name": Path(sys.argv[0]).name if sys.argv and sys.argv[0] else None,
+    }
+    line = json.dumps({
+        "resourceSpans": [{
+            "resource": {"attributes": _otlp_attributes(resource)},
+            "scopeSpans": [{"scope": {"name": OTLP_SCOPE_NAME}, "spans": [span]}],
+        }]
+    }, separators=(",", ":"))
+
+    try:
+        with open(spans_file, "a", encoding="utf-8") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            f.write(line + "\n")
+            fcntl.flock(f, fcntl.LOCK_UN)
+    except OSError:
+        return None
+    return span
+
+
+def read_spans(path: Path) -> list[dict]:
+    """All spans in an OTLP-JSON lines file (malformed lines skipped)."""
+    spans: list[dict] = []
+    try:
+        text = Path(path).read_text(encoding="utf-8")
+    except OSError:
+        return spans
+    for line in text.splitlines():
+        try:
+            request = json.loads(line)
+        except ValueError:
+            continue
+        for resource_spans in request.get("resourceSpans", []):
+            for scope_spans in resource_spans.get("scopeSpans", []):
+                spans.extend(scope_spans.get("spans", []))
+    return spans
+
+
 # -- P2: Signal Activation ---------------------------------------------------
 
 
@@ -219,6 +603,7 @@ def signal_completion(
         artifact_path=artifact_path,
         artifact_size=artifact_size,
         trace_id=effective_trace_id,
+        elapsed_seconds=elapsed_seconds,
     )
 
     return signal_path
@@ -226,6 +611,11 @@ def signal_completion(
 
 # -- P5: Structured Progress Events ------------------------------------------
 
+EVENT_FORMAT_ENV_VAR = "AGENTIC_EVENT_FORMAT"
+EVENT_FORMAT_BOTH = "both"
+EVENT_FORMAT_JSON = "json"
+EVENT_FORMAT_HUMAN = "human"
+
 
 def emit_event(
     layer: str,
@@ -235,10 +625,14 @@ def emit_event(
     elapsed_ms: int | None = None,
     detail: str | None = None,
     depth: int | None = None,
+    tier: str | None = None,
 ) -> None:
     """Emit a structured progress event to stderr.
 
-    Writes both a JSON-line (prefixed with @) and a human-readable line.
+    Writes a JSON-line (prefixed with @) and a human-readable line in one
+    write, and records the event in METRICS (tier is the model tier, when
+    known). AGENTIC_EVENT_FORMAT=json drops the human line for machine runs
+    (human drops the JSON line); it is inherited by child processes.
     """
     event: dict[str, object] = {
         "layer": layer,
@@ -255,18 +649,132 @@ def emit_event(
         event["detail"] = detail
     if depth is not None:
         event["depth"] = depth
+    if tier:
+        event["tier"] = tier
 
-    # JSON-line (machine-readable)
-    print(f"@{json.dumps(event, separators=(',', ':'))}", file=sys.stderr, flush=True)
+    METRICS.record_event(layer, stage, status, elapsed_ms=elapsed_ms, tier=tier)
 
-    # Human-readable (backwards compatible)
-    elapsed_str = f" ({elapsed_ms / 1000:.1f}s)" if elapsed_ms is not None else ""
-    detail_str = f" - {detail}" if detail else ""
-    print(f"[{stage}] {status}{elapsed_str}{detail_str}", file=sys.stderr, flush=True)
+    event_format = os.environ.get(EVENT_FORMAT_ENV_VAR, EVENT_FORMAT_BOTH)
+    out = ""
+    if event_format != EVENT_FORMAT_HUMAN:
+        # JSON-line (machine-readable)
+        out += f"@{json.dumps(event, separators=(',', ':'))}\n"
+    if event_format != EVENT_FORMAT_JSON:
+        # Human-readable (backwards compatible)
+        elapsed_str = f" ({elapsed_ms / 1000:.1f}s)" if elapsed_ms is not None else ""
+        detail_str = f" - {detail}" if detail else ""
+        out += f"[{stage}] {status}{elapsed_str}{detail_str}\n"
+    sys.stderr.write(out)
+    sys.stderr.flush()
 
 
 # -- P6: Live Report ---------------------------------------------------------
 
+LIVE_REPORT_FILENAME = ".live-report"
+LIVE_REPORT_FLUSH_INTERVAL = 1.0
+LIVE_REPORT_MAX_BUFFERED_LINES = 256
+_LIVE_REPORT_TIMESTAMP = re.compile(r"^\[(\d{2}):(\d{2}):(\d{2})(?:\.(\d{3}))?\]")
+
+
+class LiveReportSink:
+    """Per-process buffer for .live-report lines.
+
+    Lines are appended to their file in batches (one open + flock per file
+    per flush) instead of one open + flock per event. A batch is written when
+    LIVE_REPORT_MAX_BUFFERED_LINES are pending, by a daemon thread at most
+    LIVE_REPORT_FLUSH_INTERVAL seconds after a line arrives, at exit, and on
+    SIGTERM. Batches from concurrent processes interleave, so lines carry
+    millisecond timestamps and write_consolidated_report orders by them.
+    """
+
+    def __init__(self) -> None:
+        # Not re-entrant: a SIGTERM handler that interrupts a flush must not
+        # re-enter it (the batch is already swapped out), so it skips instead
+        self._lock = Lock()
+        self._pending: dict[Path, list[str]] = {}
+        self._count = 0
+        self._wakeup = Event()
+        self._thread: Thread | None = None
+        self._pid = 0
+
+    def write(self, path: Path, line: str) -> None:
+        with self._lock:
+            self._pending.setdefault(path, []).append(line)
+            self._count += 1
+            full = self._count >= LIVE_REPORT_MAX_BUFFERED_LINES
+            self._start_flusher()
+        if full:
+            self.flush()
+        else:
+            self._wakeup.set()
+
+    def flush(self, blocking: bool = True) -> None:
+        """Write all pending lines (best effort).
+
+        With blocking=False, nothing is written if the buffer lock is held.
+        """
+        if not self._lock.acquire(blocking=blocking):
+            return
+        try:
+            pending, self._pending = self._pending, {}
+            self._count = 0
+            for path, lines in pending.items():
+                try:
+                    with open(path, "a", encoding="utf-8") as f:
+                        fcntl.flock(f, fcntl.LOCK_EX)
+                        f.write("".join(lines))
+                        fcntl.flock(f, fcntl.LOCK_UN)
+                except OSError:
+                    pass  # Best-effort; do not crash on report write failure
+        finally:
+            self._lock.release()
+
+    def _start_flusher(self) -> None:
+        if self._thread is not None and self._pid == os.getpid():
+            return
+        # First line in this process (or first after a fork)
+        self._pid = os.getpid()
+        self._thread = Thread(target=self._run, name="live-report-flush", daemon=True)
+        self._thread.start()
+        _install_sigterm_flush()
+
+    def _run(self) -> None:
+        while True:
+            self._wakeup.wait()
+            time.sleep(LIVE_REPORT_FLUSH_INTERVAL)
+            self._wakeup.clear()
+            self.flush()
+
+
+LIVE_REPORT = LiveReportSink()
+atexit.register(LIVE_REPORT.flush)
+
+
+def flush_telemetry() -> None:
+    """Write buffered live-report lines and the metrics snapshot now."""
+    LIVE_REPORT.flush()
+    METRICS.flush(force=True)
+
+
+def _sigterm_flush(signum: int, _frame: object) -> None:
+    # The handler runs on the main thread between bytecodes, possibly while
+    # that thread holds a telemetry lock: flush only what is not locked
+    LIVE_REPORT.flush(blocking=False)
+    METRICS.flush(force=True, blocking=False)
+    signal.signal(signum, signal.SIG_DFL)
+    os.kill(os.getpid(), signum)
+
+
+def _install_sigterm_flush() -> None:
+    """Flush before dying of SIGTERM, unless the program handles SIGTERM itself."""
+    if threading.current_thread() is not threading.main_thread():
+        return
+    try:
+        if signal.getsignal(signal.SIGTERM) == signal.SIG_DFL:
+            signal.signal(signal.SIGTERM, _sigterm_flush)
+    except ValueError:
+        pass
+
 
 def write_live_report(
     session_dir: Path | None,
@@ -277,31 +785,55 @@ def write_live_report(
     elapsed_seconds: float | None = None,
     detail: str | None = None,
 ) -> None:
-    """Append one line to session/.live-report (thread-safe via flock)."""
+    """Queue one line for session/.live-report (batched by LIVE_REPORT)."""
     if session_dir is None:
         return
 
-    report_path = session_dir / ".live-report"
-    timestamp = datetime.now(timezone.utc).strftime("%H:%M:%S")
+    timestamp = datetime.now(timezone.utc).strftime("%H:%M:%S.%f")[:-3]
     elapsed_str = f" ({elapsed_seconds:.1f}s)" if elapsed_seconds is not None else ""
     detail_str = f" - {detail}" if detail else ""
     line = f"[{timestamp}] [{layer}] [{stage}] {status}{elapsed_str}{detail_str}\n"
+    LIVE_REPORT.write(session_dir / LIVE_REPORT_FILENAME, line)
 
-    try:
-        with open(report_path, "a", encoding="utf-8") as f:
-            fcntl.flock(f, fcntl.LOCK_EX)
-            f.write(line)
-            fcntl.flock(f, fcntl.LOCK_UN)
-    except OSError:
-        pass  # Best-effort; do not crash on report write failure
+
+def order_live_report(text: str) -> list[str]:
+    """Live-report lines in timestamp order.
+
+    Stable: lines without a timestamp, and lines within the same
+    millisecond, keep their file order. A drop of more than 12 hours is read
+    as crossing midnight (timestamps are UTC time of day).
+    """
+    keyed: list[tuple[float, int, str]] = []
+    day = 0
+    previous: float | None = None
+    for index, line in enumerate(text.splitlines()):
+        match = _LIVE_REPORT_TIMESTAMP.match(line)
+        if match is None:
+            key = previous if previous is not None else 0.0
+        else:
+            hours, minutes, seconds, millis = match.groups()
+            clock = int(hours) * 3600 + int(minutes) * 60 + int(seconds) + int(millis or 0) / 1000
+            if previous is not None and clock + day * 86400 < previous - 43200:
+                day += 1
+            key = clock + day * 86400
+            previous = key
+        keyed.append((key, index, line))
+    return [line for _, _, line in sorted(keyed)]
 
 
 # -- P7: Consolidated Execution Report ---------------------------------------
 
+ANALYSIS_FILENAME = "execution-analysis.json"
+
 
-def write_consolidated_report(session_dir: Path) -> Path:
+def write_consolidated_report(session_dir: Path, event_logs: list[Path] | None = None) -> Path:
     """Generate execution-report.md from signals, live-report, and trace.
 
+    When the session has timing data (spans, signals with elapsed_seconds,
+    campaign checkpoints, or captured stderr passed as event_logs), a Time
+    Breakdown section is added and the full lib/timeline.py analysis is
+    written to reports/execution-analysis.json.
+
     Returns:
         Path to the generated report.
     """
@@ -321,35 +853,47 @@ def write_consolidated_report(session_dir: Path) -> Path:
     # Signal summary table
     signals_dir = session_dir / ".signals"
     if signals_dir.is_dir():
-        signal_files = sorted(signals_dir.glob("*"))
-        if signal_files:
+        signals: dict[str, dict] = {}
+        for sf in signals_dir.glob("*"):
+            if sf.name.startswith(".") or sf.name == JOURNAL_FILENAME:
+                continue
+            content: dict[str, str] = {}
+            for sline in sf.read_text(encoding="utf-8").strip().splitlines():
+                if ": " in sline:
+                    k, _, v = sline.partition(": ")
+                    content[k.strip()] = v.strip()
+            signals[sf.name] = content
+        # Journal-format sessions: the report marks the end of the session
+        compact_journal(signals_dir)
+        signals.update(read_journal(signals_dir))
+        if signals:
             lines.append("## Signals")
             lines.append("")
             lines.append("| Layer | Name | Status | Created |")
             lines.append("|-------|------|--------|---------|")
-            for sf in signal_files:
-                if sf.name.startswith("."):
-                    continue
-                content: dict[str, str] = {}
-                for sline in sf.read_text(encoding="utf-8").strip().splitlines():
-                    if ": " in sline:
-                        k, _, v = sline.partition(": ")
-                        content[k.strip()] = v.strip()
+            for key in sorted(signals):
+                content = signals[key]
                 lines.append(
                     f"| {content.get('layer', '?')} "
-                    f"| {content.get('name', sf.name)} "
+                    f"| {content.get('name', key)} "
                     f"| {content.get('status', '?')} "
                     f"| {content.get('created_at', '?')} |"
                 )
             lines.append("")
 
+    analysis = analyze_session(session_dir, event_logs)
+    if analysis["interval_count"] or analysis["states"]:
+        lines.extend(render_markdown(analysis))
+        (reports_dir / ANALYSIS_FILENAME).write_text(json.dumps(analysis, indent=2), encoding="utf-8")
+
     # Live report timeline
-    live_report = session_dir / ".live-report"
+    LIVE_REPORT.flush()
+    live_report = session_dir / LIVE_REPORT_FILENAME
     if live_report.is_file():
         lines.append("## Timeline")
         lines.append("")
         lines.append("```")
-        lines.append(live_report.read_text(encoding="utf-8").rstrip())
+        lines.append("\n".join(order_live_report(live_report.read_text(encoding="utf-8"))))
         lines.append("```")
         lines.append("")
 
@@ -360,6 +904,190 @@ def write_consolidated_report(session_dir: Path) -> Path:
     return report_path
 
 
+# -- P8: Metrics Registry ----------------------------------------------------
+
+METRICS_DIR_ENV_VAR = "AGENTIC_METRICS_DIR"
+METRICS_SUBDIR = ".metrics"
+METRICS_FLUSH_INTERVAL = 5.0
+METRICS_SNAPSHOT_VERSION = 1
+DURATION_BUCKETS = (0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0, 3600.0)
+
+# name -> (type, help); the snapshot carries these so exporters stay generic
+METRIC_TYPES: dict[str, tuple[str, str]] = {
+    "agentic_stage_duration_seconds": ("histogram", "Timer-measured duration of stages, workers, phases and spawns"),
+    "agentic_events_total": ("counter", "Progress events by layer, stage and status"),
+    "agentic_spawns_total": ("counter", "Agent sessions started"),
+    "agentic_retries_total": ("counter", "Stage and phase retries"),
+    "agentic_timeouts_total": ("counter", "Stages, workers and children stopped by their timeout"),
+}
+
+_STATUS_SUFFIX = re.compile(r"[:=].*$")
+
+
+def _event_labels(layer: str, stage: str, status: str, tier: str | None) -> dict[str, str]:
+    """Bounded label set for an event.
+
+    spawn:<tier> and worker:<domain> collapse to their prefix (the tier moves
+    to its own label), and status details such as RETRY:2/3 or
+    FAILED:exit=1 are dropped, so series counts do not grow with topics.
+    """
+    kind, _, rest = stage.partition(":")
+    if kind == "spawn":
+        stage, tier = kind, tier or rest
+    elif kind == "worker":
+        stage = kind
+    return {"layer": layer, "stage": stage, "status": _STATUS_SUFFIX.sub("", status), "tier": tier or ""}
+
+
+class MetricsRegistry:
+    """In-process counters and latency histograms.
+
+    Thread-safe. flush() writes a JSON snapshot to
+    $AGENTIC_METRICS_DIR/metrics-<pid>-<nonce>.json (one file per process,
+    replaced atomically); mux metrics.py merges a session's snapshots and
+    renders them in Prometheus exposition format.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DURATION_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        self._lock = Lock()
+        self._flush_lock = Lock()
+        self._counters: dict[tuple[str, tuple[tuple[str, str], ...]], float] = {}
+        # key -> [per-bucket counts (+Inf last), sum, count]
+        self._histograms: dict[tuple[str, tuple[tuple[str, str], ...]], list] = {}
+        self._dirty = False
+        self._last_flush = 0.0
+        self._filename = f"metrics-{os.getpid()}-{os.urandom(4).hex()}.json"
+
+    def inc(self, name: str, labels: dict[str, str], value: float = 1.0) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0.0) + value
+            self._dirty = True
+
+    def observe(self, name: str, labels: dict[str, str], value: float) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        index = next((i for i, bound in enumerate(self.buckets) if value <= bound), len(self.buckets))
+        with self._lock:
+            entry = self._histograms.get(key)
+            if entry is None:
+                entry = self._histograms[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            entry[0][index] += 1
+            entry[1] += value
+            entry[2] += 1
+            self._dirty = True
+
+    def record_event(
+        self,
+        layer: str,
+        stage: str,
+        status: str,
+        *,
+        elapsed_ms: int | None = None,
+        tier: str | None = None,
+    ) -> None:
+        """Update counters/histograms for one emit_event() call."""
+        labels = _event_labels(layer, stage, status, tier)
+        self.inc("agentic_events_total", labels)
+        if elapsed_ms is not None:
+            self.observe("agentic_stage_duration_seconds", labels, elapsed_ms / 1000.0)
+
+        status_label = labels.pop("status")
+        if labels["stage"] == "spawn" and status_label == "STARTING":
+            self.inc("agentic_spawns_total", labels)
+        elif status_label == "RETRY":
+            self.inc("agentic_retries_total", labels)
+        elif status_label == "TIMEOUT":
+            self.inc("agentic_timeouts_total", labels)
+
+        self.flush()
+
+    def snapshot(self) -> dict:
+        """JSON-serialisable copy of all series."""
+        with self._lock:
+            return self._snapshot()
+
+    def _snapshot(self) -> dict:
+        """snapshot() body; the caller holds self._lock."""
+        counters = [
+            {"name": name, "labels": dict(labels), "value": value}
+            for (name, labels), value in sorted(self._counters.items())
+        ]
+        histograms = [
+            {"name": name, "labels": dict(labels), "counts": list(entry[0]), "sum": entry[1], "count": entry[2]}
+            for (name, labels), entry in sorted(self._histograms.items())
+        ]
+        return {
+            "version": METRICS_SNAPSHOT_VERSION,
+            "pid": os.getpid(),
+            "updated_at": datetime.now(timezone.utc).isoformat(),
+            "buckets": list(self.buckets),
+            "types": {name: {"type": kind, "help": text} for name, (kind, text) in METRIC_TYPES.items()},
+            "counters": counters,
+            "histograms": histograms,
+        }
+
+    def flush(self, force: bool = False, blocking: bool = True) -> Path | None:
+        """Persist a snapshot if metrics changed (at most every METRICS_FLUSH_INTERVAL s).
+
+        No-op when AGENTIC_METRICS_DIR is unset, or with blocking=False when
+        either registry lock is held. Best effort: write errors are swallowed.
+        """
+        metrics_dir = os.environ.get(METRICS_DIR_ENV_VAR)
+        if not metrics_dir or not self._dirty:
+            return None
+        if not self._flush_lock.acquire(blocking=blocking):
+            return None
+        try:
+            now = time.monotonic()
+            if not force and now - self._last_flush < METRICS_FLUSH_INTERVAL:
+                return None
+            if not self._lock.acquire(blocking=blocking):
+                return None
+            try:
+                self._last_flush = now
+                self._dirty = False
+                snapshot = self._snapshot()
+            finally:
+                self._lock.release()
+
+            path = Path(metrics_dir) / self._filename
+            tmp_path = path.with_name(f".{self._filename}.tmp")
+            try:
+                path.parent.mkdir(exist_ok=True)
+                tmp_path.write_text(json.dumps(snapshot), encoding="utf-8")
+                os.replace(tmp_path, path)
+            except OSError:
+                tmp_path.unlink(missing_ok=True)
+                return None
+        finally:
+            self._flush_lock.release()
+        return path
+
+    def reset(self) -> None:
+        """Drop all series (tests)."""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+            self._dirty = False
+
+
+METRICS = MetricsRegistry()
+atexit.register(METRICS.flush, True)
+
+
+def persist_telemetry(session_dir: Path) -> None:
+    """Persist this process's metrics and spans (and its children's) under session_dir.
+
+    Metrics snapshots go to .metrics/ (P8), finished spans to the OTLP-JSON
+    span file (P3). Inherited AGENTIC_METRICS_DIR / AGENTIC_SPANS_FILE win,
+    so a whole L4 -> L0 tree reports into the top-level session, like the
+    trace ID.
+    """
+    os.environ.setdefault(METRICS_DIR_ENV_VAR, str(session_dir / METRICS_SUBDIR))
+    os.environ.setdefault(SPANS_FILE_ENV_VAR, str(session_dir / SPANS_FILENAME))
+
+
 # -- Session initialization ---------------------------------------------------
 
 
@@ -402,6 +1130,7 @@ def init_session(
 
     # Write trace ID
     propagate_trace_id(session_dir)
+    persist_telemetry(session_dir)
 
     # Write session state if provided
     if session_state is not None:
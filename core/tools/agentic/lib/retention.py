@@ -0,0 +1,313 @@
+"""Session retention: archive finished sessions, prune checkpoints, cap disk use.
+
+init_session() creates a timestamped directory per run under tmp/campaigns,
+tmp/swarm, tmp/mux, ... and nothing removes them, so every tool that globs a
+sessions base (the mux dashboard, metrics export, check-signals) slows down
+as they pile up. apply_retention() bounds a sessions base:
+
+1. In every session, checkpoints/cp-*.json beyond the newest `keep_checkpoints`
+   are deleted (resume only reads the newest one).
+2. Finished sessions are packed into <base>/.archive/<session>.tar.gz and
+   removed. A session is finished when its .campaign-state says COMPLETE, or
+   when it has no .campaign-state, has signals, all of them terminal, and
+   nothing in it changed for `min_idle` seconds.
+3. With a budget, the oldest archives are deleted until the base (sessions
+   plus archives) fits. Sessions that are not finished are never touched.
+
+<base>/.archive/index.json lists every archive (session, state, sizes, file
+count, trace id); restore_session() unpacks one again. The archive directory
+starts with "." so session globs (`*-*-*`) skip it.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import shutil
+import tarfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from .signal_journal import read_journal
+
+ARCHIVE_DIRNAME = ".archive"
+ARCHIVE_INDEX_FILENAME = "index.json"
+ARCHIVE_INDEX_VERSION = 1
+CAMPAIGN_STATE_FILENAME = ".campaign-state"
+DEFAULT_KEEP_CHECKPOINTS = 5
+DEFAULT_MIN_IDLE = 3600.0
+TERMINAL_SIGNAL_STATUSES = frozenset({"done", "fail", "partial"})
+SESSION_DIR_PATTERN = re.compile(r"^\d{8}-\d{4}-")
+
+_SIZE_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+
+
+def parse_size(spec: str) -> int:
+    """Parse a byte count such as "500M", "5G" or "1048576"."""
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([KMGT]?)i?B?\s*", spec, re.IGNORECASE)
+    if match is None:
+        raise ValueError(f"Invalid size: {spec!r} (expected e.g. 500M, 5G)")
+    return int(float(match.group(1)) * _SIZE_UNITS[match.group(2).upper()])
+
+
+def session_dirs(sessions_base: Path) -> list[Path]:
+    """Session directories (YYYYMMDD-HHMM-topic), oldest first."""
+    if not sessions_base.is_dir():
+        return []
+    return sorted(p for p in sessions_base.iterdir() if p.is_dir() and SESSION_DIR_PATTERN.match(p.name))
+
+
+def tree_size(path: Path) -> tuple[int, int, float]:
+    """(bytes, file count, newest mtime) of everything under path."""
+    total = files = 0
+    newest = 0.0
+    for root, _, names in os.walk(path):
+        for name in [".", *names]:
+            try:
+                st = os.lstat(os.path.join(root, name))
+            except FileNotFoundError:
+                continue
+            newest = max(newest, st.st_mtime)
+            if name != ".":
+                total += st.st_size
+                files += 1
+    return total, files, newest
+
+
+def _signal_keys(session_dir: Path) -> list[str]:
+    signals_dir = session_dir / ".signals"
+    if not signals_dir.is_dir():
+        return []
+    keys = set(read_journal(signals_dir))
+    keys.update(p.name for p in signals_dir.iterdir() if not p.name.startswith("."))
+    return sorted(keys)
+
+
+def session_state(session_dir: Path, min_idle: float = DEFAULT_MIN_IDLE, now: float | None = None) -> str:
+    """Classify a session as "complete", "active" or "unknown" (no signals yet).
+
+    Campaign sessions go by .campaign-state alone; other sessions are
+    complete once every signal is terminal and the tree has been idle for
+    min_idle seconds.
+    """
+    state_file = session_dir / CAMPAIGN_STATE_FILENAME
+    if state_file.is_file():
+        for line in state_file.read_text(encoding="utf-8").splitlines():
+            key, _, value = line.partition(":")
+            if key.strip() == "state":
+                return "complete" if value.strip() == "COMPLETE" else "active"
+        return "active"
+
+    keys = [k for k in _signal_keys(session_dir) if k != "journal.jsonl"]
+    if not keys:
+        return "unknown"
+    if any(k.rpartition(".")[2] not in TERMINAL_SIGNAL_STATUSES for k in keys):
+        return "active"
+    _, _, newest = tree_size(session_dir)
+    if (now if now is not None else time.time()) - newest < min_idle:
+        return "active"
+    return "complete"
+
+
+def prune_checkpoints(session_dir: Path, keep: int = DEFAULT_KEEP_CHECKPOINTS, dry_run: bool = False) -> list[Path]:
+    """Delete all but the newest `keep` checkpoints. Returns the deleted paths."""
+    checkpoints = sorted((session_dir / "checkpoints").glob("cp-*.json"))
+    stale = checkpoints[: max(len(checkpoints) - keep, 0)]
+    if not dry_run:
+        for path in stale:
+            path.unlink(missing_ok=True)
+    return stale
+
+
+def archive_dir(sessions_base: Path) -> Path:
+    return sessions_base / ARCHIVE_DIRNAME
+
+
+def load_archive_index(sessions_base: Path) -> dict:
+    """The archive manifest ({"version", "archives": [...]}); empty if missing or unreadable."""
+    try:
+        index = json.loads((archive_dir(sessions_base) / ARCHIVE_INDEX_FILENAME).read_text(encoding="utf-8"))
+        if index.get("version") == ARCHIVE_INDEX_VERSION and isinstance(index.get("archives"), list):
+            return index
+    except (OSError, ValueError, AttributeError):
+        pass
+    return {"version": ARCHIVE_INDEX_VERSION, "archives": []}
+
+
+def save_archive_index(sessions_base: Path, index: dict) -> None:
+    """Write the archive manifest atomically."""
+    path = archive_dir(sessions_base) / ARCHIVE_INDEX_FILENAME
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.tmp.{os.getpid()}")
+    tmp_path.write_text(json.dumps(index, indent=2), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+class _ByteCounter:
+    """Write-only file object that only counts what is written."""
+
+    def __init__(self) -> None:
+        self.size = 0
+
+    def write(self, data: bytes) -> int:
+        self.size += len(data)
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+
+def archive_size(session_dir: Path, exclude: list[Path] | tuple[Path, ...] = ()) -> int:
+    """Size archive_session() would produce, without writing it (dry runs).
+
+    exclude lists files left out (e.g. checkpoints a dry run would prune).
+    """
+    skipped = {os.path.join(session_dir.name, path.relative_to(session_dir)) for path in exclude}
+    counter = _ByteCounter()
+    with tarfile.open(fileobj=counter, mode="w:gz") as tar:
+        tar.add(session_dir, arcname=session_dir.name, filter=lambda info: None if info.name in skipped else info)
+    return counter.size
+
+
+def archive_session(session_dir: Path, state: str = "complete") -> dict:
+    """Pack session_dir into <base>/.archive/<name>.tar.gz, then delete it.
+
+    Returns:
+        The manifest entry (not yet added to the index)
+    """
+    sessions_base = session_dir.parent
+    target = archive_dir(sessions_base) / f"{session_dir.name}.tar.gz"
+    target.parent.mkdir(parents=True, exist_ok=True)
+    size, files, _ = tree_size(session_dir)
+    trace_file = session_dir / ".trace"
+    trace_id = trace_file.read_text(encoding="utf-8").strip() if trace_file.is_file() else None
+
+    tmp_path = target.with_name(f".{target.name}.tmp.{os.getpid()}")
+    try:
+        with tarfile.open(tmp_path, "w:gz") as tar:
+            tar.add(session_dir, arcname=session_dir.name)
+        os.replace(tmp_path, target)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    shutil.rmtree(session_dir)
+
+    return {
+        "session": session_dir.name,
+        "archive": target.name,
+        "archived_at": datetime.now(timezone.utc).isoformat(),
+        "state": state,
+        "trace_id": trace_id,
+        "files": files,
+        "bytes": size,
+        "archive_bytes": target.stat().st_size,
+    }
+
+
+def restore_session(sessions_base: Path, session: str) -> Path:
+    """Unpack an archived session back into sessions_base and drop its archive."""
+    index = load_archive_index(sessions_base)
+    entry = next((e for e in index["archives"] if e["session"] == session), None)
+    if entry is None:
+        raise FileNotFoundError(f"No archive for session {session!r} in {archive_dir(sessions_base)}")
+    archive = archive_dir(sessions_base) / entry["archive"]
+    with tarfile.open(archive, "r:gz") as tar:
+        if hasattr(tarfile, "data_filter"):
+            tar.extractall(sessions_base, filter="data")
+        else:  # Python < 3.11.4
+            tar.extractall(sessions_base)
+    archive.unlink()
+    index["archives"].remove(entry)
+    save_archive_index(sessions_base, index)
+    return sessions_base / session
+
+
+def apply_retention(
+    sessions_base: Path,
+    *,
+    keep_checkpoints: int = DEFAULT_KEEP_CHECKPOINTS,
+    min_idle: float = DEFAULT_MIN_IDLE,
+    budget_bytes: int | None = None,
+    archive: bool = True,
+    dry_run: bool = False,
+) -> dict:
+    """Apply checkpoint pruning, archiving and the disk budget to one base.
+
+    Returns:
+        Report: checkpoints_pruned, archived, kept (sessions left in place),
+        evicted (archives deleted for the budget), bytes_before, bytes_after,
+        over_budget (only with a budget)
+    """
+    sessions_base = Path(sessions_base)
+    now = time.time()
+    report: dict = {
+        "sessions_base": str(sessions_base),
+        "dry_run": dry_run,
+        "checkpoints_pruned": 0,
+        "archived": [],
+        "evicted": [],
+        "kept": [],
+    }
+    index = load_archive_index(sessions_base)
+    archives = archive_dir(sessions_base)
+
+    def base_bytes() -> int:
+        return tree_size(sessions_base)[0] if sessions_base.is_dir() else 0
+
+    report["bytes_before"] = base_bytes()
+    projected = report["bytes_before"]
+
+    # Dry run: archives that would be written -> projected size
+    projected_archives: dict[str, int] = {}
+    for session_dir in session_dirs(sessions_base):
+        pruned = prune_checkpoints(session_dir, keep_checkpoints, dry_run=dry_run)
+        report["checkpoints_pruned"] += len(pruned)
+        pruned_bytes = sum(path.stat().st_size for path in pruned) if dry_run else 0
+        projected -= pruned_bytes
+        state = session_state(session_dir, min_idle=min_idle, now=now)
+        if state != "complete" or not archive:
+            report["kept"].append(session_dir.name)
+            continue
+        if dry_run:
+            # The session is replaced by its tarball (which the budget may evict)
+            size = archive_size(session_dir, exclude=pruned)
+            projected += size - (tree_size(session_dir)[0] - pruned_bytes)
+            entry = {"session": session_dir.name, "archive": f"{session_dir.name}.tar.gz"}
+            if (archives / entry["archive"]).is_file():
+                projected -= (archives / entry["archive"]).stat().st_size  # Overwritten
+            index["archives"] = [e for e in index["archives"] if e["session"] != entry["session"]]
+            index["archives"].append(entry)
+            projected_archives[entry["archive"]] = size
+            report["archived"].append(session_dir.name)
+            continue
+        entry = archive_session(session_dir, state)
+        index["archives"] = [e for e in index["archives"] if e["session"] != entry["session"]]
+        index["archives"].append(entry)
+        save_archive_index(sessions_base, index)
+        report["archived"].append(entry["session"])
+
+    if budget_bytes is not None:
+        used = projected if dry_run else base_bytes()
+        # Oldest session first (names start with the creation time)
+        for entry in sorted(index["archives"], key=lambda e: e["session"]):
+            if used <= budget_bytes:
+                break
+            path = archives / entry["archive"]
+            if entry["archive"] in projected_archives:
+                freed = projected_archives[entry["archive"]]
+            else:
+                freed = path.stat().st_size if path.is_file() else 0
+            if not dry_run:
+                path.unlink(missing_ok=True)
+                index["archives"].remove(entry)
+                save_archive_index(sessions_base, index)
+            report["evicted"].append(entry["session"])
+            used -= freed
+        report["over_budget"] = used > budget_bytes
+
+        if dry_run:
+            projected = used
+
+    report["bytes_after"] = projected if dry_run else base_bytes()
+    return report
@@ -0,0 +1,156 @@
+"""Append-only signal journal: one JSONL file per session instead of one file per signal.
+
+The default signal format writes <session>/.signals/<key> per signal, and
+every status check re-globs (and often rglobs) the session tree. In journal
+format, write_signal() appends one JSON line to:
+
+    <session>/.signals/journal.jsonl
+
+Each line is a signal record with a "signal" key equal to the file name the
+signal would have had (e.g. "L2-oresearch.success"); a later record with the
+same key supersedes an earlier one, exactly as os.replace() did for files.
+
+Appends hold an exclusive flock and are a single O_APPEND write, so
+concurrent writers never interleave. compact() rewrites the journal keeping
+the latest record per key, behind a header line with a fresh nonce.
+Readers (JournalReader) remember a byte offset and the journal's first
+line, so each poll parses only what was appended since; after a compaction
+the first line changes and the reader rebuilds from the start.
+
+A session is in journal format if AGENTIC_SIGNAL_FORMAT=journal is set for
+the writer, or once the journal file exists; after that every writer
+appends to it.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import json
+import os
+from pathlib import Path
+
+JOURNAL_FILENAME = "journal.jsonl"
+SIGNAL_FORMAT_ENV_VAR = "AGENTIC_SIGNAL_FORMAT"
+FORMAT_FILES = "files"
+FORMAT_JOURNAL = "journal"
+# Bytes of the first line a reader keeps to recognise its journal
+HEAD_BYTES = 256
+
+
+def journal_path(signals_dir: Path) -> Path:
+    return signals_dir / JOURNAL_FILENAME
+
+
+def journal_enabled(signals_dir: Path) -> bool:
+    """True if signals for this directory go to the journal."""
+    requested = os.environ.get(SIGNAL_FORMAT_ENV_VAR, FORMAT_FILES).strip().lower()
+    return requested == FORMAT_JOURNAL or journal_path(signals_dir).exists()
+
+
+def _open_locked(path: Path) -> int:
+    """Open path for append under LOCK_EX, retrying if compaction swapped the file."""
+    while True:
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            if os.fstat(fd).st_ino == os.stat(path).st_ino:
+                return fd
+        except FileNotFoundError:
+            pass
+        os.close(fd)
+
+
+def append_signal(signals_dir: Path, record: dict) -> Path:
+    """Append one signal record (must include "signal"). Returns the journal path."""
+    signals_dir.mkdir(parents=True, exist_ok=True)
+    path = journal_path(signals_dir)
+    line = (json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8")
+    fd = _open_locked(path)
+    try:
+        os.write(fd, line)
+    finally:
+        os.close(fd)
+    return path
+
+
+def _parse_lines(data: bytes) -> tuple[list[dict], int]:
+    """Parse complete lines; returns (records, bytes consumed).
+
+    A trailing partial line is left unconsumed. Malformed lines are skipped.
+    """
+    end = data.rfind(b"\n") + 1
+    records: list[dict] = []
+    for raw in data[:end].splitlines():
+        try:
+            record = json.loads(raw)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(record, dict) and "signal" in record:
+            records.append(record)
+    return records, end
+
+
+def read_journal(signals_dir: Path) -> dict[str, dict]:
+    """Latest record per signal key (one full read; use JournalReader to poll)."""
+    reader = JournalReader(signals_dir)
+    reader.poll()
+    return reader.signals
+
+
+def compact(signals_dir: Path) -> int:
+    """Rewrite the journal keeping only the latest record per signal.
+
+    Returns:
+        Number of superseded records dropped.
+    """
+    path = journal_path(signals_dir)
+    if not path.exists():
+        return 0
+    fd = _open_locked(path)
+    try:
+        records, _ = _parse_lines(path.read_bytes())
+        latest: dict[str, dict] = {}
+        for record in records:
+            latest.pop(record["signal"], None)
+            latest[record["signal"]] = record
+        tmp_path = signals_dir / f".{JOURNAL_FILENAME}.compact.{os.getpid()}"
+        header = json.dumps({"compacted": os.urandom(8).hex(), "dropped": len(records) - len(latest)})
+        tmp_path.write_text(
+            header + "\n" + "".join(json.dumps(r, separators=(",", ":")) + "\n" for r in latest.values()),
+            encoding="utf-8",
+        )
+        os.replace(tmp_path, path)
+    finally:
+        os.close(fd)
+    return len(records) - len(latest)
+
+
+class JournalReader:
+    """Incremental journal reader: poll() parses only newly appended records."""
+
+    def __init__(self, signals_dir: Path):
+        self.path = journal_path(signals_dir)
+        self.offset = 0
+        self.head = b""
+        self.signals: dict[str, dict] = {}
+
+    def poll(self) -> list[dict]:
+        """Read records appended since the last poll and fold them into signals."""
+        try:
+            f = open(self.path, "rb")
+        except FileNotFoundError:
+            return []
+        with f:
+            if self.offset and f.read(len(self.head)) != self.head:
+                # The journal was compacted or recreated since the last poll
+                self.offset = 0
+                self.signals.clear()
+            f.seek(self.offset)
+            data = f.read()
+        records, consumed = _parse_lines(data)
+        if self.offset == 0 and consumed:
+            self.head = data[: min(data.find(b"\n") + 1, HEAD_BYTES)]
+        self.offset += consumed
+        for record in records:
+            self.signals[record["signal"]] = record
+        return records
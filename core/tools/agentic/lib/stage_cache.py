@@ -0,0 +1,240 @@
+"""Content-addressed cache of successful ospec stage results.
+
+Re-running `ospec.py full <spec> --cache` after a late-stage failure would
+otherwise re-execute every earlier stage even though their work is already
+in the tree. A stage's cache key is the SHA-256 of:
+
+    stage name, spec file bytes and repo root + HEAD, upstream stage
+    artifacts, resolved model id, system prompt file bytes, extra args
+
+Every spec stage edits and commits the spec, so the spec and HEAD in the key
+are a state the stage left behind, never the one it started from: after the
+stage (and again whenever the run ends) its entry is stored under the
+current spec and HEAD. A retry starting from the tree a failed run left
+therefore hits, while a tree reset to before the stage misses and the stage
+re-runs. On a hit the entry's recorded post-stage commit must also still be
+in HEAD's history.
+
+Stages that change the code (UNCACHEABLE_STAGES), and every stage after
+one, are never served from the cache. Outside a git repo nothing is cached.
+
+Each entry is two files named by the key:
+
+    <cache-dir>/<key>.json      manifest entry + metadata
+    <cache-dir>/<key>.artifact  copy of the stage's result file
+
+Entries are only written for successful stages. Lookups touch the entry's
+mtime, and store() evicts least-recently-used entries once the directory
+exceeds max_bytes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+from datetime import datetime, timezone
+from pathlib import Path
+
+CACHE_DIR_ENV_VAR = "AGENTIC_STAGE_CACHE_DIR"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+CACHE_KEY_VERSION = 3
+# Stages that change the code under the spec; never served from the cache
+UNCACHEABLE_STAGES = frozenset({"IMPLEMENT", "FIX", "AMEND", "TEST"})
+
+
+def default_cache_dir() -> Path:
+    """Resolve the stage cache directory.
+
+    Priority: AGENTIC_STAGE_CACHE_DIR env > $XDG_CACHE_HOME > ~/.cache.
+    """
+    env_path = os.environ.get(CACHE_DIR_ENV_VAR)
+    if env_path:
+        return Path(env_path)
+    cache_home = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(cache_home) / "agentic" / "stage-cache"
+
+
+def file_digest(path: Path) -> str:
+    """SHA-256 hex digest of a file's bytes."""
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def repo_state(cwd: str | Path | None = None) -> tuple[str, str] | None:
+    """(repo root, HEAD commit) of the git checkout at cwd, or None outside one."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--show-toplevel", "HEAD"],
+            capture_output=True, text=True, cwd=cwd, timeout=10,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    lines = result.stdout.split()
+    if result.returncode != 0 or len(lines) != 2:
+        return None
+    return lines[0], lines[1]
+
+
+def is_ancestor(commit: str, head: str, cwd: str | Path) -> bool:
+    """Whether commit is head or one of its ancestors."""
+    try:
+        result = subprocess.run(
+            ["git", "merge-base", "--is-ancestor", commit, head],
+            capture_output=True, cwd=cwd, timeout=10,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return False
+    return result.returncode == 0
+
+
+def compute_stage_key(
+    stage: str,
+    spec_digest: str,
+    repo: tuple[str, str],
+    model_id: str,
+    system_prompt_file: Path,
+    extra_args: list[str],
+    artifacts: list[Path] | None = None,
+) -> str | None:
+    """Hash a stage's inputs into a cache key.
+
+    Args:
+        spec_digest: file_digest() of the spec in a state the stage left behind
+        repo: repo_state() in that same state
+
+    Returns:
+        Hex digest, or None if the stage writes to the tree, or the system
+        prompt or an artifact cannot be read (such a stage is never cached).
+    """
+    if stage in UNCACHEABLE_STAGES:
+        return None
+    try:
+        parts = {
+            "version": CACHE_KEY_VERSION,
+            "stage": stage,
+            "spec": spec_digest,
+            "repo_root": repo[0],
+            "head": repo[1],
+            "artifacts": [file_digest(p) for p in artifacts or []],
+            "model_id": model_id,
+            "system_prompt": file_digest(system_prompt_file),
+            "extra_args": list(extra_args),
+        }
+    except OSError:
+        return None
+    return hashlib.sha256(json.dumps(parts, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class StageCache:
+    """Size-bounded LRU store of stage manifest entries and artifacts."""
+
+    def __init__(self, cache_dir: Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        return self.cache_dir / f"{key}.json", self.cache_dir / f"{key}.artifact"
+
+    def lookup(self, key: str, repo: tuple[str, str] | None = None) -> dict | None:
+        """Return the cached manifest entry for key, or None on a miss.
+
+        With repo (root, HEAD), an entry whose post-stage commit is not in
+        HEAD's history is a miss. The entry's artifact (if any) points at
+        the cached copy.
+        """
+        meta_path, artifact_path = self._paths(key)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+        entry = meta.get("entry")
+        if not isinstance(entry, dict):
+            return None
+        head_after = meta.get("head_after")
+        if repo is not None and head_after and not is_ancestor(head_after, repo[1], repo[0]):
+            return None
+        if meta.get("has_artifact"):
+            if not artifact_path.is_file():
+                return None
+            entry["artifact"] = str(artifact_path)
+            os.utime(artifact_path)
+        os.utime(meta_path)
+        return entry
+
+    def store(
+        self, key: str, entry: dict, artifact: str | None = None, after: tuple[str, str] | None = None
+    ) -> dict:
+        """Persist a successful stage result, then enforce the size bound.
+
+        Args:
+            after: (spec digest, HEAD) right after the stage ran
+
+        Returns:
+            The entry with its artifact pointing at the cached copy.
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        meta_path, artifact_path = self._paths(key)
+        entry = dict(entry)
+
+        has_artifact = False
+        if artifact and Path(artifact).is_file():
+            tmp_artifact = artifact_path.with_suffix(f".artifact.tmp.{os.getpid()}")
+            shutil.copyfile(artifact, tmp_artifact)
+            os.replace(tmp_artifact, artifact_path)
+            entry["artifact"] = str(artifact_path)
+            has_artifact = True
+
+        meta = {
+            "key": key,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "has_artifact": has_artifact,
+            "entry": entry,
+        }
+        if after is not None:
+            meta["spec_after"], meta["head_after"] = after
+        tmp_meta = meta_path.with_suffix(f".json.tmp.{os.getpid()}")
+        tmp_meta.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+        os.replace(tmp_meta, meta_path)
+
+        self.evict()
+        return entry
+
+    def evict(self) -> list[str]:
+        """Drop least-recently-used entries until the cache fits max_bytes.
+
+        Returns:
+            Keys of evicted entries.
+        """
+        entries: dict[str, list[Path]] = {}
+        for path in self.cache_dir.glob("*"):
+            if path.suffix in (".json", ".artifact"):
+                entries.setdefault(path.stem, []).append(path)
+
+        def stat(paths: list[Path]) -> tuple[float, int]:
+            mtime, size = 0.0, 0
+            for p in paths:
+                try:
+                    st = p.stat()
+                except OSError:
+                    continue
+                mtime = max(mtime, st.st_mtime)
+                size += st.st_size
+            return mtime, size
+
+        stats = {key: stat(paths) for key, paths in entries.items()}
+        total = sum(size for _, size in stats.values())
+        evicted: list[str] = []
+        for key in sorted(stats, key=lambda k: stats[k][0]):
+            if total <= self.max_bytes:
+                break
+            for p in entries[key]:
+                p.unlink(missing_ok=True)
+            total -= stats[key][1]
+            evicted.append(key)
+        return evicted
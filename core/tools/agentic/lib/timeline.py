@@ -0,0 +1,522 @@
+"""Execution timeline reconstruction and critical-path analysis for a session.
+
+Sources, most precise first:
+  spans        <session>/.spans.otlp.jsonl (observability P3): exact start,
+               end and parent of every named Timer, across processes
+  events       captured stderr containing @-prefixed emit_event lines (P5),
+               possibly behind "[label] " forwarding prefixes: STARTING is
+               paired with the next terminal status of the same layer/stage,
+               and elapsed_ms back-dates the start when STARTING is missing
+  signals      .signals/ records: created_at ends an interval that starts
+               elapsed_seconds earlier (signals without it are only used to
+               bound the session window)
+  checkpoints  campaign state transitions from checkpoints/log.jsonl
+               (lib/checkpoint_log.py), or checkpoints/cp-*.json
+
+An interval reported by several sources (same layer and name, ends within
+DEDUP_TOLERANCE_SECONDS, different sources) is kept once, from the most precise source. Intervals
+without a recorded parent are attached to the smallest enclosing interval of
+a higher layer.
+
+Intervals are plain dicts:
+    {"id", "parent", "name", "layer", "start", "end", "status", "source"}
+with start/end in epoch seconds.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from datetime import datetime
+from pathlib import Path
+
+from .checkpoint_log import CheckpointLog
+from .signal_journal import JOURNAL_FILENAME, read_journal
+
+SPANS_FILENAME = ".spans.otlp.jsonl"
+DEDUP_TOLERANCE_SECONDS = 2.0
+# emit_event timestamps have one-second resolution
+CONTAINMENT_TOLERANCE_SECONDS = 1.0
+IDLE_GAP_MIN_SECONDS = 5.0
+MAX_REPORTED_GAPS = 10
+MAX_REPORTED_PATH_ENTRIES = 15
+
+SOURCE_PRIORITY = {"span": 0, "event": 1, "signal": 2}
+TERMINAL_STATUSES = {
+    "COMPLETE", "FAILED", "TIMEOUT", "INTERRUPTED", "ABORT", "NON-ABSORBABLE", "SKIP",
+}
+_STATUS_SUFFIX = re.compile(r"[:=].*$")
+
+
+def _layer_rank(layer: str | None) -> int:
+    try:
+        return int((layer or "")[1:])
+    except ValueError:
+        return -1
+
+
+def _match_key(layer: str | None, name: str) -> tuple[str, str]:
+    # Signals name stages ospec-plan where events and spans say ospec:plan
+    return layer or "", name.replace(":", "-")
+
+
+def _parse_time(value: object) -> float | None:
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed.timestamp()
+
+
+# -- Sources -------------------------------------------------------------------
+
+
+def load_span_intervals(path: Path) -> list[dict]:
+    """Intervals from an OTLP-JSON lines span file."""
+    intervals: list[dict] = []
+    try:
+        text = path.read_text(encoding="utf-8")
+    except OSError:
+        return intervals
+    for line in text.splitlines():
+        try:
+            request = json.loads(line)
+        except ValueError:
+            continue
+        for resource_spans in request.get("resourceSpans", []):
+            for scope_spans in resource_spans.get("scopeSpans", []):
+                for span in scope_spans.get("spans", []):
+                    attributes = {
+                        a.get("key"): next(iter(a.get("value", {}).values()), None)
+                        for a in span.get("attributes", [])
+                    }
+                    try:
+                        start = int(span["startTimeUnixNano"]) / 1e9
+                        end = int(span["endTimeUnixNano"]) / 1e9
+                    except (KeyError, ValueError):
+                        continue
+                    failed = span.get("status", {}).get("code") == 2
+                    intervals.append({
+                        "id": span.get("spanId"),
+                        "parent": span.get("parentSpanId") or None,
+                        "name": span.get("name", "?"),
+                        "layer": attributes.get("agentic.layer"),
+                        "start": start,
+                        "end": end,
+                        "status": "FAILED" if failed else "COMPLETE",
+                        "source": "span",
+                    })
+    return intervals
+
+
+def parse_event_lines(lines: list[str]) -> list[dict]:
+    """emit_event JSON objects found in captured stderr lines."""
+    events: list[dict] = []
+    for line in lines:
+        index = line.find("@{")
+        if index < 0:
+            continue
+        try:
+            event = json.loads(line[index + 1:])
+        except ValueError:
+            continue
+        if isinstance(event, dict) and "layer" in event and "stage" in event and "status" in event:
+            events.append(event)
+    return events
+
+
+def event_intervals(events: list[dict]) -> list[dict]:
+    """Pair STARTING events with their terminal event."""
+    intervals: list[dict] = []
+    open_starts: dict[tuple, list[float]] = {}
+    for n, event in enumerate(events):
+        ts = _parse_time(event.get("ts"))
+        if ts is None:
+            continue
+        key = (event.get("trace_id"), event["layer"], event["stage"])
+        status = _STATUS_SUFFIX.sub("", str(event["status"]))
+        if status == "STARTING":
+            open_starts.setdefault(key, []).append(ts)
+            continue
+        elapsed_ms = event.get("elapsed_ms")
+        if status not in TERMINAL_STATUSES and elapsed_ms is None:
+            continue
+        starts = open_starts.get(key)
+        started = starts.pop() if starts else None
+        if elapsed_ms is not None:
+            start = ts - elapsed_ms / 1000.0
+        elif started is not None:
+            start = started
+        else:
+            continue
+        intervals.append({
+            "id": f"event-{n}",
+            "parent": None,
+            "name": event["stage"],
+            "layer": event["layer"],
+            "start": start,
+            "end": max(ts, start),
+            "status": status,
+            "source": "event",
+        })
+    return intervals
+
+
+def _read_signal_records(signals_dir: Path) -> dict[str, dict]:
+    records: dict[str, dict] = {}
+    if not signals_dir.is_dir():
+        return records
+    for path in signals_dir.iterdir():
+        if path.name.startswith(".") or path.name == JOURNAL_FILENAME or not path.is_file():
+            continue
+        fields: dict[str, str] = {}
+        try:
+            for line in path.read_text(encoding="utf-8").splitlines():
+                key, sep, value = line.partition(": ")
+                if sep:
+                    fields[key.strip()] = value.strip()
+        except OSError:
+            continue
+        records[path.name] = fields
+    records.update(read_journal(signals_dir))
+    return records
+
+
+def signal_intervals(signals_dir: Path) -> tuple[list[dict], list[float]]:
+    """Intervals from signals recording elapsed_seconds, plus all signal times."""
+    intervals: list[dict] = []
+    times: list[float] = []
+    for key, fields in sorted(_read_signal_records(signals_dir).items()):
+        end = _parse_time(fields.get("created_at"))
+        if end is None:
+            continue
+        times.append(end)
+        try:
+            elapsed = float(fields["elapsed_seconds"])
+        except (KeyError, TypeError, ValueError):
+            continue
+        status = str(fields.get("status", ""))
+        intervals.append({
+            "id": f"signal-{key}",
+            "parent": None,
+            "name": fields.get("name", key),
+            "layer": fields.get("layer"),
+            "start": end - elapsed,
+            "end": end,
+            "status": "FAILED" if status in ("fail", "failure") else "COMPLETE",
+            "source": "signal",
+        })
+    return intervals, times
+
+
+def checkpoint_states(checkpoints_dir: Path) -> list[dict]:
+    """Campaign state timeline: each state lasts until the next transition.
+
+    Transitions are the log records that set "state"; sessions without a log
+    fall back to one mark per cp-*.json checkpoint.
+    """
+    marks: list[tuple[float, str]] = []
+    for record in CheckpointLog(checkpoints_dir).records():
+        created = _parse_time(record.get("ts"))
+        state = record.get("set", {}).get("state")
+        if created is not None and state and (not marks or marks[-1][1] != state):
+            marks.append((created, str(state)))
+    checkpoint_files = [] if marks else sorted(checkpoints_dir.glob("cp-*.json"))
+    for path in checkpoint_files:
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        created = _parse_time(data.get("created_at"))
+        if created is not None and data.get("state"):
+            marks.append((created, str(data["state"])))
+    marks.sort()
+    return [
+        {"state": state, "start": start, "end": marks[i + 1][0] if i + 1 < len(marks) else None}
+        for i, (start, state) in enumerate(marks)
+    ]
+
+
+# -- Reconstruction -------------------------------------------------------------
+
+
+def merge_intervals(intervals: list[dict]) -> list[dict]:
+    """Drop intervals already reported by a more precise source.
+
+    Only intervals from different sources are matched: two spans (or two
+    events) with the same name ending close together are parallel siblings,
+    not one interval seen twice.
+    """
+    kept: list[dict] = []
+    by_key: dict[tuple[str, str], list[dict]] = {}
+    for interval in sorted(intervals, key=lambda i: (SOURCE_PRIORITY.get(i["source"], 9), i["start"])):
+        key = _match_key(interval["layer"], interval["name"])
+        duplicates = by_key.setdefault(key, [])
+        if any(other["source"] != interval["source"]
+               and abs(other["end"] - interval["end"]) <= DEDUP_TOLERANCE_SECONDS for other in duplicates):
+            continue
+        duplicates.append(interval)
+        kept.append(interval)
+    return sorted(kept, key=lambda i: (i["start"], -i["end"]))
+
+
+def link_parents(intervals: list[dict]) -> None:
+    """Attach parentless intervals (and dangling parent ids) by time containment."""
+    ids = {i["id"] for i in intervals}
+    for interval in intervals:
+        if interval["parent"] in ids:
+            continue
+        rank = _layer_rank(interval["layer"])
+        best: dict | None = None
+        for other in intervals:
+            if other is interval or _layer_rank(other["layer"]) <= rank:
+                continue
+            if (other["start"] - CONTAINMENT_TOLERANCE_SECONDS <= interval["start"]
+                    and interval["end"] <= other["end"] + CONTAINMENT_TOLERANCE_SECONDS):
+                if best is None or other["end"] - other["start"] < best["end"] - best["start"]:
+                    best = other
+        interval["parent"] = best["id"] if best is not None else None
+
+
+def build_timeline(session_dir: Path, event_logs: list[Path] | None = None) -> dict:
+    """Collect and link all intervals for a session.
+
+    Returns:
+        Dict with "intervals", "signal_times" and "states".
+    """
+    intervals = load_span_intervals(session_dir / SPANS_FILENAME)
+    for log_path in event_logs or []:
+        try:
+            lines = Path(log_path).read_text(encoding="utf-8", errors="replace").splitlines()
+        except OSError:
+            continue
+        intervals.extend(event_intervals(parse_event_lines(lines)))
+    from_signals, signal_times = signal_intervals(session_dir / ".signals")
+    intervals.extend(from_signals)
+
+    intervals = merge_intervals(intervals)
+    link_parents(intervals)
+    return {
+        "intervals": intervals,
+        "signal_times": sorted(signal_times),
+        "states": checkpoint_states(session_dir / "checkpoints"),
+    }
+
+
+# -- Analysis -------------------------------------------------------------------
+
+
+def _union(segments: list[tuple[float, float]]) -> list[tuple[float, float]]:
+    merged: list[tuple[float, float]] = []
+    for start, end in sorted(segments):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        elif end > start:
+            merged.append((start, end))
+    return merged
+
+
+def _covered(segments: list[tuple[float, float]]) -> float:
+    return sum(end - start for start, end in _union(segments))
+
+
+def critical_path(intervals: list[dict], children: dict[str | None, list[dict]]) -> list[dict]:
+    """Chain of intervals that determined the end time.
+
+    Walks back from the end: inside each interval, the child that finished
+    last is on the path, then whatever finished last before that child
+    started, and so on; time not covered by such a child is the interval's
+    own (self) time. Top-level intervals are handled as children of the
+    session window.
+
+    Returns:
+        Chronological segments {"name", "layer", "start", "end", "seconds", "self"}.
+    """
+    segments: list[dict] = []
+
+    def add(node: dict | None, start: float, end: float) -> None:
+        if node is not None and end > start:
+            segments.append({
+                "name": node["name"], "layer": node["layer"], "start": start, "end": end,
+                "seconds": end - start, "self": True,
+            })
+
+    def walk(node: dict | None, lower: float, limit: float) -> None:
+        kids = children.get(node["id"] if node is not None else None, [])
+        cursor = limit
+        while cursor > lower:
+            candidates = [k for k in kids if k["start"] < cursor and k["end"] > lower]
+            if not candidates:
+                break
+            kid = max(candidates, key=lambda k: min(k["end"], cursor))
+            kid_end = min(kid["end"], cursor)
+            add(node, kid_end, cursor)
+            walk(kid, max(kid["start"], lower), kid_end)
+            cursor = max(kid["start"], lower)
+        add(node, lower, cursor)
+
+    if intervals:
+        walk(None, min(i["start"] for i in intervals), max(i["end"] for i in intervals))
+
+    segments.reverse()
+    merged: list[dict] = []
+    for segment in segments:
+        last = merged[-1] if merged else None
+        if last and (last["name"], last["layer"]) == (segment["name"], segment["layer"]) and abs(last["end"] - segment["start"]) < 1e-6:
+            last["end"] = segment["end"]
+            last["seconds"] = last["end"] - last["start"]
+        else:
+            merged.append(segment)
+    return merged
+
+
+def analyze(timeline: dict) -> dict:
+    """Critical path, per-layer self/wait time, retry overhead and idle gaps."""
+    intervals: list[dict] = timeline["intervals"]
+    children: dict[str | None, list[dict]] = {}
+    for interval in intervals:
+        children.setdefault(interval["parent"], []).append(interval)
+
+    times = [t for i in intervals for t in (i["start"], i["end"])] + timeline.get("signal_times", [])
+    window_start, window_end = (min(times), max(times)) if times else (0.0, 0.0)
+
+    layers: dict[str, dict] = {}
+    for interval in intervals:
+        duration = interval["end"] - interval["start"]
+        wait = _covered([
+            (max(k["start"], interval["start"]), min(k["end"], interval["end"]))
+            for k in children.get(interval["id"], [])
+        ])
+        stats = layers.setdefault(interval["layer"] or "?", {"count": 0, "total_seconds": 0.0, "self_seconds": 0.0, "wait_seconds": 0.0})
+        stats["count"] += 1
+        stats["total_seconds"] += duration
+        stats["wait_seconds"] += wait
+        stats["self_seconds"] += duration - wait
+
+    # Retries: repeated runs of one stage under one parent; all but the last are overhead
+    groups: dict[tuple, list[dict]] = {}
+    for interval in intervals:
+        groups.setdefault((interval["parent"], *_match_key(interval["layer"], interval["name"])), []).append(interval)
+    retries: list[dict] = []
+    for runs in groups.values():
+        if len(runs) < 2:
+            continue
+        runs.sort(key=lambda i: i["start"])
+        wasted = sum(run["end"] - run["start"] for run in runs[:-1])
+        retries.append({"name": runs[0]["name"], "layer": runs[0]["layer"], "attempts": len(runs), "overhead_seconds": wasted})
+    retries.sort(key=lambda r: r["overhead_seconds"], reverse=True)
+
+    # Idle gaps: stretches where nothing below the top-level intervals runs
+    nested = [(i["start"], i["end"]) for i in intervals if i["parent"] is not None] or [
+        (i["start"], i["end"]) for i in intervals
+    ]
+    gaps: list[dict] = []
+    cursor = window_start
+    for start, end in _union(nested) + [(window_end, window_end)]:
+        if start - cursor >= IDLE_GAP_MIN_SECONDS:
+            gaps.append({"start": cursor, "end": start, "seconds": start - cursor})
+        cursor = max(cursor, end)
+    gaps.sort(key=lambda g: g["seconds"], reverse=True)
+
+    path = critical_path(intervals, children)
+    bottlenecks: dict[tuple[str, str], float] = {}
+    for segment in path:
+        key = (segment["layer"] or "?", segment["name"])
+        bottlenecks[key] = bottlenecks.get(key, 0.0) + segment["seconds"]
+
+    return {
+        "window": {"start": window_start, "end": window_end, "wall_seconds": window_end - window_start},
+        "interval_count": len(intervals),
+        "sources": sorted({i["source"] for i in intervals}),
+        "critical_path": path,
+        "critical_path_seconds": sum(s["seconds"] for s in path),
+        "critical_path_by_interval": [
+            {"layer": layer, "name": name, "seconds": seconds}
+            for (layer, name), seconds in sorted(bottlenecks.items(), key=lambda kv: kv[1], reverse=True)
+        ],
+        "layers": dict(sorted(layers.items(), key=lambda kv: _layer_rank(kv[0]), reverse=True)),
+        "retry_overhead_seconds": sum(r["overhead_seconds"] for r in retries),
+        "retries": retries,
+        "idle_gaps": gaps[:MAX_REPORTED_GAPS],
+        "idle_seconds": sum(g["seconds"] for g in gaps),
+        "states": timeline.get("states", []),
+    }
+
+
+def analyze_session(session_dir: Path, event_logs: list[Path] | None = None) -> dict:
+    """build_timeline() + analyze() for one session directory."""
+    return analyze(build_timeline(session_dir, event_logs))
+
+
+# -- Rendering ------------------------------------------------------------------
+
+
+def _clock(ts: float) -> str:
+    return datetime.fromtimestamp(ts).astimezone().strftime("%H:%M:%S")
+
+
+def render_markdown(analysis: dict) -> list[str]:
+    """Report lines for the "Time Breakdown" section of execution-report.md."""
+    window = analysis["window"]
+    lines = [
+        "## Time Breakdown",
+        "",
+        f"**Wall time:** {window['wall_seconds']:.1f}s "
+        f"({analysis['interval_count']} intervals from {', '.join(analysis['sources']) or 'no sources'})  ",
+        f"**Retry overhead:** {analysis['retry_overhead_seconds']:.1f}s  ",
+        f"**Idle (no nested work running):** {analysis['idle_seconds']:.1f}s",
+        "",
+    ]
+
+    if analysis["critical_path_by_interval"]:
+        lines += [
+            "### Critical Path",
+            "",
+            f"{analysis['critical_path_seconds']:.1f}s on the critical path; time per interval:",
+            "",
+            "| Layer | Name | Seconds | Share |",
+            "|-------|------|---------|-------|",
+        ]
+        total = analysis["critical_path_seconds"] or 1.0
+        for entry in analysis["critical_path_by_interval"][:MAX_REPORTED_PATH_ENTRIES]:
+            lines.append(f"| {entry['layer']} | {entry['name']} | {entry['seconds']:.1f} | {entry['seconds'] / total:.0%} |")
+        lines.append("")
+
+    if analysis["layers"]:
+        lines += [
+            "### Per-Layer Time",
+            "",
+            "Self time is spent in the layer itself; wait time is spent with nested work running.",
+            "",
+            "| Layer | Intervals | Total (s) | Self (s) | Wait (s) |",
+            "|-------|-----------|-----------|----------|----------|",
+        ]
+        for layer, stats in analysis["layers"].items():
+            lines.append(
+                f"| {layer} | {stats['count']} | {stats['total_seconds']:.1f} "
+                f"| {stats['self_seconds']:.1f} | {stats['wait_seconds']:.1f} |"
+            )
+        lines.append("")
+
+    if analysis["retries"]:
+        lines += ["### Retries", "", "| Layer | Name | Attempts | Overhead (s) |", "|-------|------|----------|--------------|"]
+        for retry in analysis["retries"]:
+            lines.append(f"| {retry['layer']} | {retry['name']} | {retry['attempts']} | {retry['overhead_seconds']:.1f} |")
+        lines.append("")
+
+    if analysis["idle_gaps"]:
+        lines += ["### Idle Gaps", "", "| From | To | Seconds |", "|------|----|---------|"]
+        for gap in analysis["idle_gaps"]:
+            lines.append(f"| {_clock(gap['start'])} | {_clock(gap['end'])} | {gap['seconds']:.1f} |")
+        lines.append("")
+
+    if analysis["states"]:
+        lines += ["### Campaign States", "", "| State | Started | Seconds |", "|-------|---------|---------|"]
+        for state in analysis["states"]:
+            seconds = f"{state['end'] - state['start']:.1f}" if state["end"] is not None else "-"
+            lines.append(f"| {state['state']} | {_clock(state['start'])} | {seconds} |")
+        lines.append("")
+
+    return lines
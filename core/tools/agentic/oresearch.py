@@ -1,22 +1,41 @@
 #!/usr/bin/env python3
 # /// script
 # requires-python = ">=3.11"
-# dependencies = []
+# dependencies = [
+#     "claude-agent-sdk>=0.1.0",
+# ]
 # ///
 """
 OResearch — Orchestrated Research (Layer 2): fan-out research across domains.
 
-Spawns parallel researcher.py workers (one per domain), waits for completion,
-then consolidates findings via spawn.py. Produces a research manifest (JSON).
+Runs one researcher worker per domain as concurrent tasks on a single event
+loop (lib.engine.run_oresearch: L2 -> L1 researcher -> L0 agent session,
+no interpreter per hop), waits for completion, then consolidates findings.
+Produces a research manifest (JSON).
 
 Unlike ospec.py (sequential), oresearch.py runs workers IN PARALLEL (independent
 domains) then consolidates. Supports refinement rounds from L4.
 
+Worker concurrency starts at max_concurrency and adapts (AIMD, lib.concurrency):
+it grows while workers succeed, up to concurrency_ceiling, and halves on
+timeouts or rate-limit errors. Set "adaptive_concurrency": false in the config
+for a fixed limit.
+
+With --streaming-consolidation the consolidator starts on the first finding and
+folds later findings in incrementally, so the round ends one incremental pass
+after the slowest worker instead of one full consolidation after it.
+
+With --hedge-percentile P, a worker still running past the P-th percentile of
+its finished peers' elapsed times gets a duplicate on another model tier; the
+first to succeed wins and the manifest records both outcomes.
+
 Usage:
     uv run core/tools/agentic/oresearch.py --topic "Feature X" --session-dir tmp/session/
     uv run core/tools/agentic/oresearch.py --topic "Feature X" --session-dir tmp/session/ --domains market,tech
     uv run core/tools/agentic/oresearch.py --topic "Feature X" --session-dir tmp/session/ --refinement-context path/to/refinement.md
     uv run core/tools/agentic/oresearch.py --topic "Feature X" --session-dir tmp/session/ --max-depth 5
+    uv run core/tools/agentic/oresearch.py --topic "Feature X" --session-dir tmp/session/ --streaming-consolidation
+    uv run core/tools/agentic/oresearch.py --topic "Feature X" --session-dir tmp/session/ --hedge-percentile 90
 
 Exit codes:
     0  - all workers passed + consolidation succeeded
@@ -24,341 +43,37 @@ Exit codes:
     2  - depth limit exceeded (passthrough, never absorbed)
     12 - partial success (some workers passed, others failed)
     20 - interrupted
+    21 - worker or overall timeout (EXIT_TIMEOUT, never absorbed)
 """
 
 import argparse
+import asyncio
 import json
-import subprocess
 import sys
-import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 # Import shared library (same package)
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 from lib import (
-    EXIT_DEPTH_EXCEEDED,
     EXIT_FAILURE,
     EXIT_INTERRUPTED,
-    EXIT_PARTIAL_SUCCESS,
-    EXIT_SUCCESS,
-    EXIT_TIMEOUT,
     emit_error,
     emit_manifest,
-    get_project_root,
     load_stage_config,
     resolve_project_file,
 )
-from lib.observability import Timer, emit_event, run_streaming, signal_completion, write_live_report
+from lib.engine import (
+    CONSOLIDATOR_PROMPT_RELATIVE,
+    DEFAULT_CONCURRENCY_CEILING,
+    RESEARCHER_EXECUTOR_RELATIVE,
+    format_research_manifest,
+    run_oresearch,
+)
+from lib.observability import persist_telemetry
 
 # -- Constants ----------------------------------------------------------------
 
 CONFIG_NAME = "oresearch"
-CONSOLIDATOR_PROMPT_RELATIVE = Path("core", "prompts", "executors", "researcher-consolidator.md")
-SPAWN_SCRIPT_RELATIVE = Path("core", "tools", "agentic", "spawn.py")
-
-
-# -- Worker execution --------------------------------------------------------
-
-
-def run_worker(
-    executor_path: Path,
-    domain: str,
-    topic: str,
-    output_path: Path,
-    model: str,
-    max_depth: int,
-    timeout: int,
-    refinement_context: str | None,
-    cwd: str | None,
-    session_dir: Path | None = None,
-    worker_counter: str = "",
-    worker_config: dict | None = None,
-) -> dict:
-    """Execute a single researcher.py worker as a subprocess.
-
-    Returns:
-        Worker result dict with domain, status, exit_code, artifact, and error.
-    """
-    # Build effective_topic with all modifications before constructing cmd
-    effective_topic = topic
-    if refinement_context:
-        effective_topic += f"\n\nRefinement context:\n{refinement_context}"
-
-    # Append focus from worker config if present (was dead field in oresearch.json)
-    if worker_config and worker_config.get("focus"):
-        effective_topic += f"\n\nResearch focus: {worker_config['focus']}"
-
-    cmd: list[str] = [
-        "uv", "run", str(executor_path),
-        "--domain", domain,
-        "--topic", effective_topic,
-        "--output", str(output_path),
-        "--model", model,
-        "--output-format", "json",
-        "--max-depth", str(max_depth),
-    ]
-    if cwd:
-        cmd.extend(["--cwd", cwd])
-
-    emit_event("L2", f"worker:{domain}", "STARTING", detail=worker_counter)
-    write_live_report(session_dir, "L2", f"worker:{domain}", "STARTING", detail=worker_counter)
-
-    with Timer() as t:
-        try:
-            exit_code, stdout = run_streaming(cmd, timeout=timeout, label=f"worker:{domain}")
-        except subprocess.TimeoutExpired:
-            emit_event("L2", f"worker:{domain}", "TIMEOUT", detail=f"{timeout}s limit")
-            signal_completion(session_dir, "L2", f"worker-{domain}", "fail", elapsed_seconds=t.elapsed_seconds)
-            return {
-                "domain": domain,
-                "status": "failed",
-                "exit_code": EXIT_TIMEOUT,
-                "error": "timeout",
-            }
-        except KeyboardInterrupt:
-            signal_completion(session_dir, "L2", f"worker-{domain}", "fail")
-            return {
-                "domain": domain,
-                "status": "failed",
-                "exit_code": EXIT_INTERRUPTED,
-                "error": "interrupted",
-            }
-
-    if exit_code == EXIT_SUCCESS:
-        emit_event("L2", f"worker:{domain}", "COMPLETE", elapsed_ms=t.elapsed_ms, detail=worker_counter)
-        signal_completion(session_dir, "L2", f"worker-{domain}", "done", artifact_path=str(output_path), elapsed_seconds=t.elapsed_seconds)
-        write_live_report(session_dir, "L2", f"worker:{domain}", "COMPLETE", elapsed_seconds=t.elapsed_seconds, detail=worker_counter)
-        return {
-            "domain": domain,
-            "status": "success",
-            "exit_code": exit_code,
-            "artifact": str(output_path),
-            "elapsed_seconds": t.elapsed_seconds,
-        }
-
-    emit_event("L2", f"worker:{domain}", f"FAILED:exit={exit_code}", elapsed_ms=t.elapsed_ms, detail=worker_counter)
-    signal_completion(session_dir, "L2", f"worker-{domain}", "fail", elapsed_seconds=t.elapsed_seconds)
-    write_live_report(session_dir, "L2", f"worker:{domain}", "FAILED", elapsed_seconds=t.elapsed_seconds, detail=worker_counter)
-    error_msg = f"exit code {exit_code}"
-    if stdout.strip():
-        try:
-            parsed = json.loads(stdout)
-            if isinstance(parsed, dict) and "error" in parsed:
-                error_msg = str(parsed["error"])
-        except json.JSONDecodeError:
-            pass
-
-    return {
-        "domain": domain,
-        "status": "failed",
-        "exit_code": exit_code,
-        "error": error_msg,
-        "elapsed_seconds": t.elapsed_seconds,
-    }
-
-
-def execute_workers(
-    executor_path: Path,
-    workers: list[dict],
-    topic: str,
-    session_dir: Path,
-    max_depth: int,
-    timeout_per_worker: int,
-    timeout_overall: int,
-    refinement_context: str | None,
-    cwd: str | None,
-    max_concurrency: int = 4,
-) -> tuple[int, list[dict]]:
-    """Execute all workers in parallel.
-
-    Returns:
-        Tuple of (overall_exit_code, worker_results).
-    """
-    research_dir = session_dir / "research"
-    research_dir.mkdir(parents=True, exist_ok=True)
-
-    results: list[dict] = []
-    interrupted = threading.Event()
-    total_workers = len(workers)
-
-    with ThreadPoolExecutor(max_workers=min(len(workers), max_concurrency)) as executor:
-        future_to_domain: dict = {}
-        for worker_idx, worker_config in enumerate(workers):
-            domain = worker_config["domain"]
-            model = worker_config.get("model", "medium-tier")
-            output_path = research_dir / f"{domain}-findings.md"
-            counter = f"worker {worker_idx + 1}/{total_workers}"
-
-            future = executor.submit(
-                run_worker,
-                executor_path=executor_path,
-                domain=domain,
-                topic=topic,
-                output_path=output_path,
-                model=model,
-                max_depth=max_depth,
-                timeout=timeout_per_worker,
-                refinement_context=refinement_context,
-                cwd=cwd,
-                session_dir=session_dir,
-                worker_counter=counter,
-                worker_config=worker_config,
-            )
-            future_to_domain[future] = domain
-
-        try:
-            for future in as_completed(future_to_domain, timeout=timeout_overall):
-                worker_result = future.result()
-                results.append(worker_result)
-        except TimeoutError:
-            emit_event("L2", "oresearch", f"OVERALL_TIMEOUT:{timeout_overall}s")
-            # R-14: Cancel running futures
-            executor.shutdown(wait=False, cancel_futures=True)
-            # Collect completed results
-            for f in future_to_domain:
-                if f.done():
-                    try:
-                        results.append(f.result())
-                    except Exception:
-                        domain = future_to_domain[f]
-                        results.append({
-                            "domain": domain,
-                            "status": "failed",
-                            "exit_code": EXIT_TIMEOUT,
-                            "error": "exception during collection",
-                        })
-                else:
-                    domain = future_to_domain[f]
-                    results.append({
-                        "domain": domain,
-                        "status": "failed",
-                        "exit_code": EXIT_TIMEOUT,
-                        "error": "overall timeout",
-                    })
-        except KeyboardInterrupt:
-            interrupted.set()
-            executor.shutdown(wait=False, cancel_futures=True)
-
-    if interrupted.is_set():
-        return EXIT_INTERRUPTED, results
-
-    # Check for non-absorbable exit codes
-    for r in results:
-        if r["exit_code"] == EXIT_DEPTH_EXCEEDED:
-            return EXIT_DEPTH_EXCEEDED, results
-        if r["exit_code"] == EXIT_INTERRUPTED:
-            return EXIT_INTERRUPTED, results
-        if r["exit_code"] == EXIT_TIMEOUT:
-            return EXIT_TIMEOUT, results
-
-    # Determine overall exit code
-    failed_count = sum(1 for r in results if r["exit_code"] != EXIT_SUCCESS)
-    if failed_count == 0:
-        return EXIT_SUCCESS, results
-    if failed_count < len(results):
-        return EXIT_PARTIAL_SUCCESS, results
-    return EXIT_FAILURE, results
-
-
-# -- Consolidation -----------------------------------------------------------
-
-
-def run_consolidation(
-    spawn_path: Path,
-    consolidator_prompt_path: Path,
-    finding_files: list[str],
-    consolidated_output: Path,
-    topic: str,
-    model: str,
-    max_depth: int,
-    cwd: str | None,
-    session_dir: Path | None = None,
-) -> tuple[int, str | None]:
-    """Run the consolidator agent via spawn.py.
-
-    Returns:
-        Tuple of (exit_code, error_message_or_None).
-    """
-    findings_list = "\n".join(f"- {f}" for f in finding_files)
-    prompt = (
-        f"Consolidate these research findings into a unified document.\n\n"
-        f"Topic: {topic}\n\n"
-        f"Findings files:\n{findings_list}\n\n"
-        f"Write consolidated output to: {consolidated_output}"
-    )
-
-    cmd: list[str] = [
-        "uv", "run", str(spawn_path),
-        "--prompt", prompt,
-        "--system-prompt", str(consolidator_prompt_path),
-        "--model", model,
-        "--output-format", "json",
-        "--max-depth", str(max_depth),
-    ]
-    if cwd:
-        cmd.extend(["--cwd", cwd])
-
-    emit_event("L2", "consolidation", "STARTING")
-    write_live_report(session_dir, "L2", "consolidation", "STARTING")
-
-    with Timer() as t:
-        try:
-            exit_code, _stdout = run_streaming(cmd, timeout=600, label="consolidation")
-        except subprocess.TimeoutExpired:
-            emit_event("L2", "consolidation", "TIMEOUT", detail="600s limit")
-            signal_completion(session_dir, "L2", "consolidation", "fail")
-            return EXIT_TIMEOUT, "consolidation timeout"
-        except KeyboardInterrupt:
-            signal_completion(session_dir, "L2", "consolidation", "fail")
-            return EXIT_INTERRUPTED, "interrupted"
-
-    if exit_code == EXIT_SUCCESS:
-        emit_event("L2", "consolidation", "COMPLETE", elapsed_ms=t.elapsed_ms)
-        signal_completion(session_dir, "L2", "consolidation", "done", artifact_path=str(consolidated_output), elapsed_seconds=t.elapsed_seconds)
-        write_live_report(session_dir, "L2", "consolidation", "COMPLETE", elapsed_seconds=t.elapsed_seconds)
-        return EXIT_SUCCESS, None
-
-    emit_event("L2", "consolidation", f"FAILED:exit={exit_code}", elapsed_ms=t.elapsed_ms)
-    signal_completion(session_dir, "L2", "consolidation", "fail", elapsed_seconds=t.elapsed_seconds)
-
-    # Non-absorbable codes propagate
-    if exit_code == EXIT_DEPTH_EXCEEDED:
-        return EXIT_DEPTH_EXCEEDED, "depth limit exceeded"
-    if exit_code == EXIT_INTERRUPTED:
-        return EXIT_INTERRUPTED, "interrupted"
-
-    return exit_code, f"consolidation exit code {exit_code}"
-
-
-# -- Manifest formatting -----------------------------------------------------
-
-
-def format_research_manifest(
-    worker_results: list[dict],
-    consolidated_path: str | None,
-    exit_code: int,
-    round_number: int,
-) -> dict:
-    """Format the oresearch manifest for stdout."""
-    total = len(worker_results)
-    passed = sum(1 for r in worker_results if r["exit_code"] == EXIT_SUCCESS)
-    failed = total - passed
-
-    manifest: dict = {
-        "orchestrator": CONFIG_NAME,
-        "round": round_number,
-        "workers": worker_results,
-    }
-    if consolidated_path:
-        manifest["consolidated"] = consolidated_path
-    manifest["summary"] = {
-        "total": total,
-        "passed": passed,
-        "failed": failed,
-        "exit_code": exit_code,
-    }
-    return manifest
 
 
 # -- CLI ----------------------------------------------------------------------
@@ -415,6 +130,28 @@ def build_parser() -> argparse.ArgumentParser:
         default=1,
         help="Research round number for manifest tracking (default: 1)",
     )
+    parser.add_argument(
+        "--streaming-consolidation",
+        dest="streaming_consolidation",
+        action="store_true",
+        default=None,
+        help="Consolidate findings as workers finish instead of after the slowest one "
+        "(default: config streaming_consolidation, off)",
+    )
+    parser.add_argument(
+        "--hedge-percentile",
+        dest="hedge_percentile",
+        type=int,
+        default=None,
+        help="Duplicate a worker still running past this percentile of its peers' "
+        "elapsed times (default: config hedge_percentile, off)",
+    )
+    parser.add_argument(
+        "--hedge-model",
+        dest="hedge_model",
+        default=None,
+        help="Model tier for hedged duplicates (default: a different tier than the worker's)",
+    )
     return parser
 
 
@@ -434,16 +171,13 @@ def main() -> int:
         emit_error("CONFIG_INVALID", f"Invalid JSON in config: {e}")
         return EXIT_FAILURE
 
-    # Resolve executor path
-    try:
-        root = get_project_root(script_dir)
-    except FileNotFoundError as e:
-        emit_error("PROJECT_ROOT_NOT_FOUND", str(e))
-        return EXIT_FAILURE
-
-    executor_path = root / Path(config["executor"])
-    if not executor_path.is_file():
-        emit_error("EXECUTOR_NOT_FOUND", f"Executor not found: {executor_path}")
+    # The engine runs the researcher executor in-process; other executors are not supported
+    executor = Path(config.get("executor", RESEARCHER_EXECUTOR_RELATIVE))
+    if executor != RESEARCHER_EXECUTOR_RELATIVE:
+        emit_error(
+            "EXECUTOR_UNSUPPORTED",
+            f"Executor {executor} not supported (workers run {RESEARCHER_EXECUTOR_RELATIVE} in-process)",
+        )
         return EXIT_FAILURE
 
     # Resolve consolidator prompt
@@ -455,12 +189,6 @@ def main() -> int:
         emit_error("CONSOLIDATOR_PROMPT_NOT_FOUND", str(e))
         return EXIT_FAILURE
 
-    # Resolve spawn.py
-    spawn_path = root / SPAWN_SCRIPT_RELATIVE
-    if not spawn_path.is_file():
-        emit_error("SPAWN_NOT_FOUND", f"spawn.py not found: {spawn_path}")
-        return EXIT_FAILURE
-
     # Filter workers by --domains if specified
     all_workers: list[dict] = config["workers"]
     if args.domains:
@@ -495,86 +223,50 @@ def main() -> int:
         refinement_text = refinement_path.read_text(encoding="utf-8")
 
     session_dir = Path(args.session_dir)
+    persist_telemetry(session_dir)
     timeout_per_worker = config.get("timeout_per_worker", 300)
     timeout_overall = config.get("timeout_overall", 600)
     max_concurrency = config.get("max_concurrency", 4)
+    adaptive_concurrency = config.get("adaptive_concurrency", True)
+    concurrency_ceiling = config.get("concurrency_ceiling", DEFAULT_CONCURRENCY_CEILING)
+    streaming_consolidation = args.streaming_consolidation or config.get("streaming_consolidation", False)
+    hedge_percentile = args.hedge_percentile or config.get("hedge_percentile")
+    hedge_model = args.hedge_model or config.get("hedge_model")
 
-    # Execute workers in parallel
-    worker_exit_code, worker_results = execute_workers(
-        executor_path=executor_path,
-        workers=workers,
-        topic=args.topic,
-        session_dir=session_dir,
-        max_depth=args.max_depth,
-        timeout_per_worker=timeout_per_worker,
-        timeout_overall=timeout_overall,
-        refinement_context=refinement_text,
-        cwd=args.cwd,
-        max_concurrency=max_concurrency,
-    )
-
-    # Non-absorbable exit codes propagate immediately
-    if worker_exit_code in (EXIT_DEPTH_EXCEEDED, EXIT_INTERRUPTED):
-        manifest = format_research_manifest(
-            worker_results, None, worker_exit_code, args.round_number
-        )
-        emit_manifest(manifest)
-        return worker_exit_code
-
-    # All workers failed — no consolidation possible
-    successful_artifacts = [
-        r["artifact"] for r in worker_results
-        if r["exit_code"] == EXIT_SUCCESS and "artifact" in r
-    ]
-
-    if not successful_artifacts:
-        manifest = format_research_manifest(
-            worker_results, None, EXIT_FAILURE, args.round_number
-        )
-        emit_manifest(manifest)
-        return EXIT_FAILURE
-
-    # Run consolidation on successful findings
     consolidation_model = (
         args.consolidation_model or config.get("consolidation_model", "high-tier")
     )
-    consolidated_output = session_dir / "research" / "consolidated-findings.md"
 
-    consolidation_exit, consolidation_error = run_consolidation(
-        spawn_path=spawn_path,
-        consolidator_prompt_path=consolidator_prompt_path,
-        finding_files=successful_artifacts,
-        consolidated_output=consolidated_output,
-        topic=args.topic,
-        model=consolidation_model,
-        max_depth=args.max_depth,
-        cwd=args.cwd,
-        session_dir=session_dir,
-    )
-
-    # Non-absorbable codes from consolidation
-    if consolidation_exit in (EXIT_DEPTH_EXCEEDED, EXIT_INTERRUPTED):
-        manifest = format_research_manifest(
-            worker_results, None, consolidation_exit, args.round_number
+    # Execute workers in parallel, then consolidate
+    try:
+        exit_code, manifest = asyncio.run(
+            run_oresearch(
+                workers,
+                args.topic,
+                session_dir,
+                consolidator_prompt_path,
+                max_depth=args.max_depth,
+                timeout_per_worker=timeout_per_worker,
+                timeout_overall=timeout_overall,
+                max_concurrency=max_concurrency,
+                adaptive_concurrency=adaptive_concurrency,
+                concurrency_ceiling=concurrency_ceiling,
+                refinement_context=refinement_text,
+                consolidation_model=consolidation_model,
+                cwd=args.cwd,
+                round_number=args.round_number,
+                streaming_consolidation=streaming_consolidation,
+                hedge_percentile=hedge_percentile,
+                hedge_model=hedge_model,
+            )
         )
-        emit_manifest(manifest)
-        return consolidation_exit
-
-    # Determine final exit code
-    if consolidation_exit != EXIT_SUCCESS:
-        # Workers partially passed but consolidation failed
-        final_exit = EXIT_PARTIAL_SUCCESS if worker_exit_code == EXIT_SUCCESS else worker_exit_code
-    else:
-        final_exit = worker_exit_code  # EXIT_SUCCESS or EXIT_PARTIAL_SUCCESS
+    except KeyboardInterrupt:
+        exit_code = EXIT_INTERRUPTED
+        manifest = format_research_manifest([], None, exit_code, args.round_number)
 
-    consolidated_str = str(consolidated_output) if consolidation_exit == EXIT_SUCCESS else None
-    signal_completion(session_dir, "L2", "oresearch", "done" if final_exit == EXIT_SUCCESS else "partial" if final_exit == EXIT_PARTIAL_SUCCESS else "fail")
-    manifest = format_research_manifest(
-        worker_results, consolidated_str, final_exit, args.round_number
-    )
     emit_manifest(manifest)
 
-    return final_exit
+    return exit_code
 
 
 if __name__ == "__main__":
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.11"
+# dependencies = []
+# ///
+"""
+Session report: rebuild execution-report.md and its time breakdown.
+
+Coordinator and campaign runs write reports/execution-report.md when they
+finish. Rerun this afterwards to add timing from captured stderr (the
+@-prefixed emit_event lines), or to analyze an interrupted session.
+
+Usage:
+    uv run core/tools/agentic/session_report.py tmp/campaigns/20260301-0900-topic
+    uv run core/tools/agentic/session_report.py <session-dir> --events campaign.stderr.log
+    uv run core/tools/agentic/session_report.py <session-dir> --json
+
+Exit codes:
+    0 - report written
+    1 - session directory not found
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Import shared library (same package)
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from lib import EXIT_FAILURE, EXIT_SUCCESS
+from lib.observability import ANALYSIS_FILENAME, write_consolidated_report
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Rebuild a session's execution report and time breakdown")
+    parser.add_argument("session_dir", help="Session directory")
+    parser.add_argument(
+        "--events", action="append", default=[], metavar="LOG",
+        help="Captured stderr containing @-prefixed event lines (repeatable)",
+    )
+    parser.add_argument("--json", action="store_true", help="Print the analysis JSON instead of the report path")
+    return parser
+
+
+def main() -> int:
+    args = build_parser().parse_args()
+    session_dir = Path(args.session_dir)
+    if not session_dir.is_dir():
+        print(f"ERROR: Session directory not found: {session_dir}", file=sys.stderr)
+        return EXIT_FAILURE
+
+    report_path = write_consolidated_report(session_dir, [Path(p) for p in args.events])
+    analysis_path = report_path.parent / ANALYSIS_FILENAME
+    if args.json:
+        print(analysis_path.read_text(encoding="utf-8") if analysis_path.is_file() else json.dumps({}))
+    else:
+        print(report_path)
+    return EXIT_SUCCESS
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.11"
+# dependencies = []
+# ///
+"""
+Session retention: archive finished sessions, prune checkpoints, cap disk use.
+
+Finished sessions (campaign state COMPLETE, or every signal terminal and idle
+for --min-idle seconds) are packed into <base>/.archive/<session>.tar.gz and
+listed in <base>/.archive/index.json. Checkpoints beyond the newest
+--keep-checkpoints are deleted in every session. With --budget, the oldest
+archives are deleted until the base fits. Running sessions are never touched.
+Safe to run from cron.
+
+Usage:
+    uv run core/tools/agentic/session_retention.py tmp/campaigns tmp/swarm tmp/mux
+    uv run core/tools/agentic/session_retention.py tmp/campaigns --budget 5G --keep-checkpoints 3
+    uv run core/tools/agentic/session_retention.py tmp/campaigns --dry-run --json
+    uv run core/tools/agentic/session_retention.py tmp/campaigns --list
+    uv run core/tools/agentic/session_retention.py tmp/campaigns --restore 20260301-0900-topic
+
+Exit codes:
+    0 - success
+    1 - a base is still over --budget, or --restore found no archive
+    2 - invalid arguments
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Import shared library (same package)
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from lib import EXIT_FAILURE, EXIT_SUCCESS
+from lib.retention import (
+    DEFAULT_KEEP_CHECKPOINTS,
+    DEFAULT_MIN_IDLE,
+    apply_retention,
+    load_archive_index,
+    parse_size,
+    restore_session,
+)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Archive finished sessions and bound session disk use")
+    parser.add_argument("sessions_base", nargs="+", help="Sessions base directory (e.g. tmp/campaigns)")
+    parser.add_argument(
+        "--keep-checkpoints", type=int, default=DEFAULT_KEEP_CHECKPOINTS,
+        help=f"Checkpoints kept per session (default: {DEFAULT_KEEP_CHECKPOINTS})",
+    )
+    parser.add_argument(
+        "--min-idle", type=float, default=DEFAULT_MIN_IDLE,
+        help=f"Seconds without changes before a signal-only session counts as finished (default: {DEFAULT_MIN_IDLE:.0f})",
+    )
+    parser.add_argument("--budget", type=parse_size, help="Max bytes per base, e.g. 500M or 5G")
+    parser.add_argument("--no-archive", action="store_true", help="Only prune checkpoints and enforce the budget")
+    parser.add_argument("--dry-run", action="store_true", help="Report what would change without changing it")
+    parser.add_argument("--json", action="store_true", help="Print reports as JSON")
+    parser.add_argument("--list", action="store_true", help="List archived sessions and exit")
+    parser.add_argument("--restore", metavar="SESSION", help="Unpack an archived session and exit")
+    return parser
+
+
+def main() -> int:
+    args = build_parser().parse_args()
+    bases = [Path(p) for p in args.sessions_base]
+
+    if args.restore:
+        for base in bases:
+            try:
+                print(restore_session(base, args.restore))
+                return EXIT_SUCCESS
+            except FileNotFoundError:
+                continue
+        print(f"ERROR: No archive for {args.restore} in {', '.join(map(str, bases))}", file=sys.stderr)
+        return EXIT_FAILURE
+
+    if args.list:
+        archives = [dict(entry, sessions_base=str(base)) for base in bases for entry in load_archive_index(base)["archives"]]
+        if args.json:
+            print(json.dumps(archives, indent=2))
+        else:
+            for entry in archives:
+                print(f"{entry['sessions_base']}/{entry['session']}  {entry['state']}  "
+                      f"{entry['bytes']} -> {entry['archive_bytes']} bytes  archived {entry['archived_at']}")
+        return EXIT_SUCCESS
+
+    reports = [
+        apply_retention(
+            base,
+            keep_checkpoints=args.keep_checkpoints,
+            min_idle=args.min_idle,
+            budget_bytes=args.budget,
+            archive=not args.no_archive,
+            dry_run=args.dry_run,
+        )
+        for base in bases
+    ]
+    if args.json:
+        print(json.dumps(reports, indent=2))
+    else:
+        prefix = "[dry-run] " if args.dry_run else ""
+        for report in reports:
+            print(
+                f"{prefix}{report['sessions_base']}: archived {len(report['archived'])}, "
+                f"kept {len(report['kept'])}, pruned {report['checkpoints_pruned']} checkpoints, "
+                f"evicted {len(report['evicted'])} archives, "
+                f"{report['bytes_before']} -> {report['bytes_after']} bytes"
+            )
+    if any(report.get("over_budget") for report in reports):
+        print("WARNING: still over budget; only running sessions remain", file=sys.stderr)
+        return EXIT_FAILURE
+    return EXIT_SUCCESS
+
+
+if __name__ == "__main__":
+    sys.exit(main())
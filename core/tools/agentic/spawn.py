@@ -19,6 +19,7 @@ Usage:
     uv run core/tools/agentic/spawn.py --prompt "Do X" --output-format json
     uv run core/tools/agentic/spawn.py --prompt "Do X" --max-depth 3 --current-depth 1
     uv run core/tools/agentic/spawn.py --prompt "Do X" --cwd /path/to/project
+    uv run core/tools/agentic/spawn.py --prompt "Do X" --via-daemon
 
 Output (stdout):
     SPAWN_STATUS=success
@@ -41,8 +42,6 @@ import sys
 import tempfile
 from pathlib import Path
 
-from claude_agent_sdk import ClaudeAgentOptions, ResultMessage, query
-
 # Import shared library (same package)
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 from lib import (
@@ -51,8 +50,20 @@ from lib import (
     EXIT_SUCCESS,
     EXIT_DEPTH_EXCEEDED,
     DEPTH_ENV_VAR,
+    emit_manifest,
+)
+from lib.budget import BudgetSlot, SpawnBudget, budget_env
+from lib.daemon import default_socket_path, send_request, via_daemon_requested
+from lib.observability import (
+    SPAN_ENV_VAR,
+    TRACE_ENV_VAR,
+    Timer,
+    build_child_env_with_trace,
+    current_span_id,
+    emit_event,
+    get_trace_id,
+    signal_completion,
 )
-from lib.observability import Timer, build_child_env_with_trace, emit_event, get_trace_id, signal_completion
 
 # -- Constants ----------------------------------------------------------------
 
@@ -79,6 +90,20 @@ def _cleanup_temps() -> None:
 atexit.register(_cleanup_temps)
 
 
+# -- SDK loading --------------------------------------------------------------
+
+
+def load_sdk() -> tuple:
+    """Import the Claude SDK on first use.
+
+    Deferred so that --via-daemon clients never pay the SDK import cost;
+    spawn_daemon.py calls this once at startup to keep it warm.
+    """
+    from claude_agent_sdk import ClaudeAgentOptions, ResultMessage, query
+
+    return ClaudeAgentOptions, ResultMessage, query
+
+
 # -- Pure functions -----------------------------------------------------------
 
 
@@ -103,6 +128,14 @@ def resolve_depth(current_depth_arg: int | None) -> int:
     return 0
 
 
+def model_tier(model_id: str) -> str:
+    """Map a model ID back to its tier name (raw IDs map to themselves)."""
+    for tier, tier_model_id in MODEL_TIER_MAP.items():
+        if tier_model_id == model_id:
+            return tier
+    return model_id
+
+
 def check_depth_limit(current_depth: int, max_depth: int) -> str | None:
     """Return error message if depth limit exceeded, None otherwise."""
     if current_depth >= max_depth:
@@ -149,6 +182,22 @@ def format_shell_output(
     return "\n".join(lines)
 
 
+def write_result_file(result_text: str, structured_output: dict | None) -> str | None:
+    """Write the agent result to a tracked temp file (removed at exit).
+
+    Returns:
+        Temp file path, or None if the agent produced no output.
+    """
+    if structured_output is None and not result_text:
+        return None
+    result_data = structured_output if structured_output is not None else result_text
+    fd, result_file = tempfile.mkstemp(suffix=".json", prefix="spawn-result-")
+    _temp_files.add(result_file)
+    with os.fdopen(fd, "w") as f:
+        json.dump(result_data, f, indent=2)
+    return result_file
+
+
 def emit_error(code: str, message: str, details: str = "") -> None:
     """Write structured error to stderr."""
     error = {
@@ -163,6 +212,23 @@ def emit_error(code: str, message: str, details: str = "") -> None:
 # -- Core logic ---------------------------------------------------------------
 
 
+async def acquire_budget_slot(budget: SpawnBudget, tier: str, depth: int) -> BudgetSlot:
+    """Take a machine-wide spawn budget slot, reporting any queue wait."""
+    slot = budget.try_acquire(tier, depth)
+    if slot is not None:
+        return slot
+    emit_event(
+        "L0", f"spawn:{tier}", "BUDGET_WAIT",
+        detail=f"all {budget.limit_for(tier)} {tier} slots busy at depth {depth}", depth=depth,
+    )
+    slot, waited = await budget.acquire(tier, depth)
+    emit_event(
+        "L0", f"spawn:{tier}", "BUDGET_ACQUIRED",
+        elapsed_ms=int(waited * 1000), detail=f"slot {slot.index + 1}/{slot.limit}", depth=depth,
+    )
+    return slot
+
+
 async def run_agent(
     prompt: str,
     model_id: str,
@@ -171,20 +237,38 @@ async def run_agent(
     output_format_json: bool,
     cwd: str | None,
     current_depth: int,
+    *,
+    trace_id: str | None = None,
+    parent_span_id: str | None = None,
+    mutate_environ: bool = True,
 ) -> tuple[str, dict | None, str | None]:
     """Execute agent session via Claude SDK.
 
+    Depth, trace ID and parent span (parent_span_id, default: the current
+    span) always reach the agent's subprocesses via the SDK options env.
+    With mutate_environ=False (spawn daemon, many concurrent sessions in one
+    process) os.environ is left untouched.
+
+    A spawn budget slot (lib.budget) for the model's tier is held for the
+    whole session; AGENTIC_SPAWN_BUDGET=off disables it.
+
     Returns:
         Tuple of (result_text, structured_output, error_message).
         On success error_message is None.
     """
+    ClaudeAgentOptions, ResultMessage, query = load_sdk()
+
     # Set depth and trace for child processes (R-07: use build_child_env_with_trace pattern)
-    _child_env = build_child_env_with_trace(current_depth, get_trace_id())
-    os.environ[DEPTH_ENV_VAR] = _child_env[DEPTH_ENV_VAR]
-    if "AGENTIC_TRACE_ID" in _child_env:
-        os.environ["AGENTIC_TRACE_ID"] = _child_env["AGENTIC_TRACE_ID"]
+    _child_env = build_child_env_with_trace(current_depth, trace_id or get_trace_id(), parent_span_id)
+    agent_env = {DEPTH_ENV_VAR: _child_env[DEPTH_ENV_VAR]}
+    for var in (TRACE_ENV_VAR, SPAN_ENV_VAR):
+        if var in _child_env:
+            agent_env[var] = _child_env[var]
+    agent_env.update(budget_env())
+    if mutate_environ:
+        os.environ.update(agent_env)
 
-    options_kwargs: dict = {}
+    options_kwargs: dict = {"env": agent_env}
 
     if allowed_tools:
         options_kwargs["allowed_tools"] = allowed_tools
@@ -217,16 +301,61 @@ async def run_agent(
     result_text = ""
     structured_output = None
 
-    async for message in query(prompt=prompt, options=options):
-        if isinstance(message, ResultMessage):
-            if message.is_error:
-                return "", None, f"Agent returned error: {message.result}"
-            result_text = message.result or ""
-            structured_output = message.structured_output
+    try:
+        budget = SpawnBudget.from_env()
+    except ValueError as e:
+        raise RuntimeError(str(e)) from e
+    slot = await acquire_budget_slot(budget, model_tier(model_id), current_depth) if budget else None
+
+    try:
+        async for message in query(prompt=prompt, options=options):
+            if isinstance(message, ResultMessage):
+                if message.is_error:
+                    return "", None, f"Agent returned error: {message.result}"
+                result_text = message.result or ""
+                structured_output = message.structured_output
+    finally:
+        if slot is not None:
+            slot.release()
 
     return result_text, structured_output, None
 
 
+def run_agent_via_daemon(
+    socket_path: Path,
+    params: dict,
+    trace_id: str | None,
+) -> tuple[str, dict | None, str | None] | None:
+    """Execute agent session on the persistent spawn daemon.
+
+    The daemon runs in its own working directory, so the session's cwd is
+    sent as an absolute path (the caller's working directory if unset).
+
+    Returns:
+        Same tuple as run_agent(), or None if no daemon is listening
+        (caller falls back to in-process execution).
+
+    Raises:
+        RuntimeError: If the daemon accepted the request but could not serve it.
+            Not retried in-process: the agent may already have made edits.
+    """
+    params = {**params, "cwd": os.path.abspath(params.get("cwd") or os.getcwd())}
+    request = {"op": "run_agent", "params": params, "trace_id": trace_id, "parent_span_id": current_span_id()}
+    try:
+        response = send_request(request, socket_path=socket_path)
+    except (OSError, ValueError) as e:
+        raise RuntimeError(f"Spawn daemon request failed: {e}") from e
+    if response is None:
+        return None
+    if response.get("status") != "ok":
+        raise RuntimeError(f"Spawn daemon error: {response.get('error', 'unknown')}")
+    return (
+        response.get("result_text") or "",
+        response.get("structured_output"),
+        response.get("error"),
+    )
+
+
 # -- CLI ----------------------------------------------------------------------
 
 
@@ -306,6 +435,23 @@ def build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Trace ID for observability (optional, auto-detected if not provided)",
     )
+    parser.add_argument(
+        "--via-daemon",
+        dest="via_daemon",
+        action="store_true",
+        default=False,
+        help=(
+            "Run the session on the persistent spawn daemon (spawn_daemon.py), "
+            "falling back to in-process execution if it is not running. "
+            "Also enabled by AGENTIC_SPAWN_VIA_DAEMON=1."
+        ),
+    )
+    parser.add_argument(
+        "--daemon-socket",
+        dest="daemon_socket",
+        default=None,
+        help="Spawn daemon socket path (default: $AGENTIC_SPAWN_SOCKET or per-user runtime dir)",
+    )
     return parser
 
 
@@ -321,7 +467,7 @@ def main() -> int:
     if depth_error:
         emit_error("DEPTH_EXCEEDED", depth_error)
         if args.output_format == "json":
-            print(json.dumps({"status": "error", "error": depth_error}))
+            emit_manifest({"status": "error", "error": depth_error})
         else:
             print(
                 format_shell_output(
@@ -352,20 +498,31 @@ def main() -> int:
 
     # Run agent
     current_depth_val = current_depth
+    agent_params = {
+        "prompt": args.prompt,
+        "model_id": model_id,
+        "system_prompt": system_prompt,
+        "allowed_tools": allowed_tools,
+        "output_format_json": args.output_format == "json",
+        "cwd": args.cwd,
+        "current_depth": current_depth,
+    }
+    use_daemon = args.via_daemon or via_daemon_requested()
     emit_event("L0", f"spawn:{args.model}", "STARTING", depth=current_depth_val)
     try:
-        with Timer() as t:
-            result_text, structured_output, error = asyncio.run(
-                run_agent(
-                    prompt=args.prompt,
-                    model_id=model_id,
-                    system_prompt=system_prompt,
-                    allowed_tools=allowed_tools,
-                    output_format_json=(args.output_format == "json"),
-                    cwd=args.cwd,
-                    current_depth=current_depth,
-                )
-            )
+        with Timer(f"spawn:{args.model}", layer="L0", attributes={"agentic.tier": args.model}) as t:
+            outcome: tuple[str, dict | None, str | None] | None = None
+            if use_daemon:
+                socket_path = Path(args.daemon_socket) if args.daemon_socket else default_socket_path()
+                outcome = run_agent_via_daemon(socket_path, agent_params, args.trace_id or get_trace_id())
+                if outcome is None:
+                    emit_event(
+                        "L0", f"spawn:{args.model}", "DAEMON_UNAVAILABLE",
+                        detail="running in-process", depth=current_depth_val,
+                    )
+            if outcome is None:
+                outcome = asyncio.run(run_agent(**agent_params))
+            result_text, structured_output, error = outcome
     except KeyboardInterrupt:
         emit_error("INTERRUPTED", "Agent session interrupted by user")
         emit_event("L0", f"spawn:{args.model}", "INTERRUPTED", depth=current_depth_val)
@@ -380,7 +537,7 @@ def main() -> int:
     if error:
         emit_error("AGENT_ERROR", error)
         if args.output_format == "json":
-            print(json.dumps({"status": "error", "error": error}))
+            emit_manifest({"status": "error", "error": error})
         else:
             print(
                 format_shell_output(
@@ -393,13 +550,7 @@ def main() -> int:
         return EXIT_FAILURE
 
     # Write result to temp file for structured access
-    result_file: str | None = None
-    if structured_output is not None or result_text:
-        result_data = structured_output if structured_output is not None else result_text
-        fd, result_file = tempfile.mkstemp(suffix=".json", prefix="spawn-result-")
-        _temp_files.add(result_file)
-        with os.fdopen(fd, "w") as f:
-            json.dump(result_data, f, indent=2)
+    result_file = write_result_file(result_text, structured_output)
 
     # Write L0 signal if session_dir and signal_name provided
     if args.session_dir and args.signal_name:
@@ -430,7 +581,7 @@ def main() -> int:
             output["result"] = structured_output
         else:
             output["result"] = result_text
-        print(json.dumps(output, indent=2))
+        emit_manifest(output)
     else:
         print(
             format_shell_output(
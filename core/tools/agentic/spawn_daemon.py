@@ -0,0 +1,402 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.11"
+# dependencies = [
+#     "claude-agent-sdk>=0.1.0",
+# ]
+# ///
+"""
+Spawn daemon: persistent L0 server that keeps the Claude SDK warm.
+
+Every `uv run spawn.py` pays uv environment resolution, interpreter startup
+and the claude_agent_sdk import before the agent does any work. The daemon
+pays that once: it imports the SDK at startup and serves run_agent requests
+from `spawn.py --via-daemon` clients over a Unix socket, running sessions
+concurrently on one asyncio loop. Clients fall back to in-process execution
+when no daemon is listening, so starting it is purely an optimization.
+
+Depth checks, result files and signals stay in the spawn.py client; the
+daemon only runs the SDK session, with depth/trace passed per request.
+
+Usage:
+    uv run core/tools/agentic/spawn_daemon.py serve
+    uv run core/tools/agentic/spawn_daemon.py serve --max-concurrency 16
+    uv run core/tools/agentic/spawn_daemon.py serve --socket /tmp/agentic-spawn.sock
+    uv run core/tools/agentic/spawn_daemon.py status
+    uv run core/tools/agentic/spawn_daemon.py stop
+    uv run core/tools/agentic/spawn_daemon.py bench --iterations 3 --model low-tier
+
+Exit codes:
+    0 - success
+    1 - failure (daemon not running, socket already in use, bench failure)
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import signal
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+# Import shared library (same package)
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from lib import EXIT_FAILURE, EXIT_SUCCESS
+from lib.daemon import (
+    MAX_MESSAGE_BYTES,
+    decode_message,
+    default_socket_path,
+    encode_message,
+    ping,
+    send_request,
+)
+from lib.observability import Timer, emit_event
+from spawn import load_sdk, resolve_model, run_agent
+
+# -- Constants ----------------------------------------------------------------
+
+DEFAULT_MAX_CONCURRENCY = 8
+SPAWN_SCRIPT = Path(__file__).resolve().parent / "spawn.py"
+
+AgentRunner = Callable[..., Awaitable[tuple[str, dict | None, str | None]]]
+
+
+# -- Server -------------------------------------------------------------------
+
+
+async def _wait_for_eof(reader: asyncio.StreamReader) -> None:
+    """Return once the client closes its end of the connection."""
+    while await reader.read(4096):
+        pass
+
+
+class SpawnDaemon:
+    """Unix-socket server executing run_agent requests concurrently.
+
+    Args:
+        socket_path: Path of the Unix socket to listen on.
+        runner: Coroutine function with run_agent()'s signature.
+        max_concurrency: Maximum agent sessions running at once; further
+            requests wait on a semaphore.
+    """
+
+    def __init__(
+        self,
+        socket_path: Path,
+        runner: AgentRunner = run_agent,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> None:
+        self.socket_path = socket_path
+        self.max_concurrency = max_concurrency
+        self.active = 0
+        self.served = 0
+        self._runner = runner
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._started = time.monotonic()
+        self._stopping: asyncio.Event | None = None
+
+    def status(self) -> dict:
+        """Status payload returned for ping requests."""
+        return {
+            "status": "ok",
+            "pid": os.getpid(),
+            "active": self.active,
+            "served": self.served,
+            "max_concurrency": self.max_concurrency,
+            "uptime_seconds": round(time.monotonic() - self._started, 1),
+        }
+
+    def stop(self) -> None:
+        """Ask serve() to close the socket and return."""
+        if self._stopping is not None:
+            self._stopping.set()
+
+    async def serve(self, install_signal_handlers: bool = True) -> None:
+        """Listen until stop() is called (or SIGINT/SIGTERM is received)."""
+        self._stopping = asyncio.Event()
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        server = await asyncio.start_unix_server(
+            self.handle_connection, path=str(self.socket_path), limit=MAX_MESSAGE_BYTES
+        )
+        os.chmod(self.socket_path, 0o600)
+
+        if install_signal_handlers:
+            loop = asyncio.get_running_loop()
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                loop.add_signal_handler(sig, self.stop)
+
+        emit_event("L0", "spawn-daemon", "LISTENING", detail=str(self.socket_path))
+        try:
+            await self._stopping.wait()
+        finally:
+            server.close()
+            await server.wait_closed()
+            self.socket_path.unlink(missing_ok=True)
+            emit_event("L0", "spawn-daemon", "STOPPED", detail=f"served={self.served}")
+
+    async def handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve one request per connection."""
+        try:
+            line = await reader.readline()
+            if not line:
+                return
+            try:
+                request = decode_message(line)
+            except ValueError as e:
+                response: dict | None = {"status": "error", "error": f"bad request: {e}"}
+            else:
+                response = await self.dispatch(request, reader)
+            if response is not None:
+                writer.write(encode_message(response))
+                await writer.drain()
+        except (ConnectionError, asyncio.LimitOverrunError):
+            pass
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def dispatch(self, request: dict, reader: asyncio.StreamReader) -> dict | None:
+        """Route a request by op. Returns None if the client went away."""
+        op = request.get("op")
+        if op == "ping":
+            return self.status()
+        if op == "shutdown":
+            self.stop()
+            return {"status": "ok", "stopping": True}
+        if op == "run_agent":
+            return await self._run_agent(request, reader)
+        return {"status": "error", "error": f"unknown op: {op}"}
+
+    async def _run_agent(self, request: dict, reader: asyncio.StreamReader) -> dict | None:
+        params = request.get("params")
+        if not isinstance(params, dict):
+            return {"status": "error", "error": "run_agent requires a params object"}
+
+        async with self._semaphore:
+            self.active += 1
+            try:
+                with Timer() as t:
+                    run = asyncio.ensure_future(
+                        self._runner(
+                            **params,
+                            trace_id=request.get("trace_id"),
+                            parent_span_id=request.get("parent_span_id"),
+                            mutate_environ=False,
+                        )
+                    )
+                    hangup = asyncio.ensure_future(_wait_for_eof(reader))
+                    done, _ = await asyncio.wait(
+                        {run, hangup}, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    if run not in done:
+                        # Client exited (e.g. Ctrl-C): do not keep an orphan session running
+                        run.cancel()
+                        with contextlib.suppress(asyncio.CancelledError, Exception):
+                            await run
+                        emit_event("L0", "spawn-daemon", "CLIENT_GONE", elapsed_ms=t.elapsed_ms)
+                        return None
+                    hangup.cancel()
+                    result_text, structured_output, error = run.result()
+            except Exception as e:  # daemon must outlive any single session failure
+                return {"status": "error", "error": f"{type(e).__name__}: {e}"}
+            finally:
+                self.active -= 1
+                self.served += 1
+
+        return {
+            "status": "ok",
+            "result_text": result_text,
+            "structured_output": structured_output,
+            "error": error,
+            "elapsed_ms": t.elapsed_ms,
+        }
+
+
+# -- Benchmark ----------------------------------------------------------------
+
+
+def summarize_latencies(samples_ms: list[int]) -> dict:
+    """Summary statistics for a list of latency samples."""
+    if not samples_ms:
+        return {"runs": 0}
+    return {
+        "runs": len(samples_ms),
+        "mean_ms": round(statistics.mean(samples_ms)),
+        "median_ms": round(statistics.median(samples_ms)),
+        "min_ms": min(samples_ms),
+        "max_ms": max(samples_ms),
+    }
+
+
+def _time_command(cmd: list[str]) -> int | None:
+    """Run cmd, return wall time in ms (None on non-zero exit)."""
+    with Timer() as t:
+        result = subprocess.run(
+            cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False
+        )
+    return t.elapsed_ms if result.returncode == EXIT_SUCCESS else None
+
+
+def run_benchmark(socket_path: Path, iterations: int, model: str, prompt: str) -> dict:
+    """Compare cold spawns, daemon-client spawns and direct daemon requests.
+
+    cold:   uv run spawn.py (uv + interpreter + SDK import + session)
+    client: uv run spawn.py --via-daemon (uv + interpreter + session)
+    direct: socket request from this process (session only)
+    """
+    base_cmd = [
+        "uv", "run", str(SPAWN_SCRIPT),
+        "--prompt", prompt,
+        "--model", model,
+        "--output-format", "json",
+    ]
+    client_cmd = base_cmd + ["--via-daemon", "--daemon-socket", str(socket_path)]
+    params = {
+        "prompt": prompt,
+        "model_id": resolve_model(model),
+        "system_prompt": None,
+        "allowed_tools": None,
+        "output_format_json": False,
+        "cwd": None,
+        "current_depth": 0,
+    }
+
+    samples: dict[str, list[int]] = {"cold": [], "client": [], "direct": []}
+    failures: dict[str, int] = {"cold": 0, "client": 0, "direct": 0}
+
+    for i in range(iterations):
+        counter = f"iteration {i + 1}/{iterations}"
+        for mode, cmd in (("cold", base_cmd), ("client", client_cmd)):
+            elapsed = _time_command(cmd)
+            if elapsed is None:
+                failures[mode] += 1
+            else:
+                samples[mode].append(elapsed)
+            emit_event("L0", f"bench:{mode}", "COMPLETE", elapsed_ms=elapsed, detail=counter)
+
+        with Timer() as t:
+            response = send_request({"op": "run_agent", "params": params}, socket_path=socket_path)
+        if response is None or response.get("status") != "ok" or response.get("error"):
+            failures["direct"] += 1
+        else:
+            samples["direct"].append(t.elapsed_ms)
+        emit_event("L0", "bench:direct", "COMPLETE", elapsed_ms=t.elapsed_ms, detail=counter)
+
+    report: dict = {
+        "iterations": iterations,
+        "model": model,
+        "modes": {mode: summarize_latencies(values) for mode, values in samples.items()},
+        "failures": failures,
+    }
+    cold = report["modes"]["cold"].get("median_ms")
+    client = report["modes"]["client"].get("median_ms")
+    if cold is not None and client is not None:
+        report["startup_saved_ms"] = cold - client
+    return report
+
+
+# -- CLI ----------------------------------------------------------------------
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build argument parser for the spawn daemon."""
+    parser = argparse.ArgumentParser(
+        description="Persistent spawn server keeping the Claude SDK warm for spawn.py --via-daemon"
+    )
+    parser.add_argument(
+        "--socket",
+        default=None,
+        help="Unix socket path (default: $AGENTIC_SPAWN_SOCKET or per-user runtime dir)",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = subparsers.add_parser("serve", help="Run the daemon in the foreground")
+    serve_parser.add_argument(
+        "--max-concurrency",
+        dest="max_concurrency",
+        type=int,
+        default=DEFAULT_MAX_CONCURRENCY,
+        help=f"Maximum concurrent agent sessions (default: {DEFAULT_MAX_CONCURRENCY})",
+    )
+
+    subparsers.add_parser("status", help="Print daemon status JSON")
+    subparsers.add_parser("stop", help="Ask a running daemon to shut down")
+
+    bench_parser = subparsers.add_parser(
+        "bench", help="Compare cold vs. warm spawn latency (requires a running daemon)"
+    )
+    bench_parser.add_argument("--iterations", type=int, default=3, help="Runs per mode (default: 3)")
+    bench_parser.add_argument("--model", default="low-tier", help="Model tier (default: low-tier)")
+    bench_parser.add_argument(
+        "--prompt",
+        default="Reply with the single word OK.",
+        help="Prompt used for every run",
+    )
+    return parser
+
+
+def main() -> int:
+    parser = build_parser()
+    args = parser.parse_args()
+
+    socket_path = Path(args.socket) if args.socket else default_socket_path()
+
+    if args.command == "serve":
+        if socket_path.exists():
+            if ping(socket_path) is not None:
+                print(f"ERROR: Spawn daemon already running on {socket_path}", file=sys.stderr)
+                return EXIT_FAILURE
+            socket_path.unlink()  # Stale socket from a crashed daemon
+        with Timer() as t:
+            load_sdk()
+        emit_event("L0", "spawn-daemon", "SDK_LOADED", elapsed_ms=t.elapsed_ms)
+        daemon = SpawnDaemon(socket_path, max_concurrency=args.max_concurrency)
+        asyncio.run(daemon.serve())
+        return EXIT_SUCCESS
+
+    if args.command == "status":
+        status = ping(socket_path)
+        if status is None:
+            print(json.dumps({"status": "not_running", "socket": str(socket_path)}))
+            return EXIT_FAILURE
+        print(json.dumps({**status, "socket": str(socket_path)}))
+        return EXIT_SUCCESS
+
+    if args.command == "stop":
+        try:
+            response = send_request({"op": "shutdown"}, socket_path=socket_path, timeout=5)
+        except (OSError, ValueError) as e:
+            print(f"ERROR: {e}", file=sys.stderr)
+            return EXIT_FAILURE
+        if response is None:
+            print(f"ERROR: No spawn daemon listening on {socket_path}", file=sys.stderr)
+            return EXIT_FAILURE
+        return EXIT_SUCCESS
+
+    if args.command == "bench":
+        if ping(socket_path) is None:
+            print(
+                f"ERROR: No spawn daemon listening on {socket_path}. "
+                "Start one with: uv run core/tools/agentic/spawn_daemon.py serve",
+                file=sys.stderr,
+            )
+            return EXIT_FAILURE
+        report = run_benchmark(socket_path, args.iterations, args.model, args.prompt)
+        print(json.dumps(report, indent=2))
+        return EXIT_SUCCESS if not any(report["failures"].values()) else EXIT_FAILURE
+
+    return EXIT_FAILURE
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,14 +1,17 @@
 #!/usr/bin/env python3
 # /// script
 # requires-python = ">=3.11"
-# dependencies = []
+# dependencies = [
+#     "claude-agent-sdk>=0.1.0",
+# ]
 # ///
 """
-Spec tool: thin wrapper around spawn.py for the /spec workflow.
+Spec tool: thin CLI over the in-process engine for the /spec workflow.
 
 Specializes the generic spawn primitive for spec stage execution.
-Resolves the spec.md command definition as the system prompt and
-delegates to spawn.py with stage-appropriate model defaults.
+Resolves the spec.md command definition as the system prompt and runs
+the agent session in this process (lib.engine.run_spec_stage) with
+stage-appropriate model defaults. Output matches spawn.py.
 
 Usage:
     uv run core/tools/agentic/spec.py RESEARCH specs/2026/02/branch/001-feature.md
@@ -17,107 +20,26 @@ Usage:
     uv run core/tools/agentic/spec.py RESEARCH specs/001.md --max-depth 3
 
 Exit codes:
-    0 - success (from spawn.py)
-    1 - failure (from spawn.py or local error)
-    2 - depth limit exceeded (from spawn.py)
+    0 - success
+    1 - failure
+    2 - depth limit exceeded
+    20 - interrupted
 """
 
 import argparse
-import subprocess
+import asyncio
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent))
-from lib import EXIT_FAILURE, EXIT_INTERRUPTED, EXIT_SUCCESS
-from lib.observability import Timer, emit_event
+from lib import EXIT_INTERRUPTED, emit_manifest
+from lib.engine import format_text_output, run_spec_stage
+from lib.observability import emit_event
 
 # -- Constants ----------------------------------------------------------------
 
 VALID_STAGES = ("RESEARCH", "PLAN", "IMPLEMENT")
 
-# Stage -> default model tier
-STAGE_MODEL_DEFAULTS: dict[str, str] = {
-    "RESEARCH": "medium-tier",
-    "PLAN": "medium-tier",
-    "IMPLEMENT": "high-tier",
-}
-
-SPEC_COMMAND_RELATIVE = Path("core", "commands", "claude", "spec.md")
-SPAWN_SCRIPT_RELATIVE = Path("core", "tools", "agentic", "spawn.py")
-
-
-# -- Path resolution ----------------------------------------------------------
-
-
-def find_project_root(start: Path) -> Path | None:
-    """Walk up from start to find the project root containing core/commands/claude/spec.md."""
-    current = start
-    while current != current.parent:
-        if (current / SPEC_COMMAND_RELATIVE).is_file():
-            return current
-        current = current.parent
-    return None
-
-
-def resolve_spec_command(script_dir: Path) -> Path:
-    """Resolve the spec.md command file path.
-
-    Searches from the script's own directory upward to find the project root.
-    Falls back to CWD-based resolution if script location doesn't work.
-
-    Raises:
-        FileNotFoundError: If spec.md cannot be found.
-    """
-    # Try from script location first
-    root = find_project_root(script_dir)
-    if root is not None:
-        return root / SPEC_COMMAND_RELATIVE
-
-    # Fallback: try from CWD
-    root = find_project_root(Path.cwd())
-    if root is not None:
-        return root / SPEC_COMMAND_RELATIVE
-
-    raise FileNotFoundError(
-        f"Cannot find {SPEC_COMMAND_RELATIVE}. "
-        "Run from within the agentic-config project tree."
-    )
-
-
-def resolve_spawn_script(script_dir: Path) -> Path:
-    """Resolve the spawn.py script path.
-
-    Raises:
-        FileNotFoundError: If spawn.py cannot be found.
-    """
-    root = find_project_root(script_dir)
-    if root is not None:
-        candidate = root / SPAWN_SCRIPT_RELATIVE
-        if candidate.is_file():
-            return candidate
-
-    root = find_project_root(Path.cwd())
-    if root is not None:
-        candidate = root / SPAWN_SCRIPT_RELATIVE
-        if candidate.is_file():
-            return candidate
-
-    raise FileNotFoundError(
-        f"Cannot find {SPAWN_SCRIPT_RELATIVE}. "
-        "Run from within the agentic-config project tree."
-    )
-
-
-# -- Prompt construction -------------------------------------------------------
-
-
-def build_agent_prompt(stage: str, spec: str, extra: list[str] | None) -> str:
-    """Construct the agent prompt: /spec {STAGE} {SPEC} {extra}."""
-    parts = ["/spec", stage, spec]
-    if extra:
-        parts.extend(extra)
-    return " ".join(parts)
-
 
 # -- CLI -----------------------------------------------------------------------
 
@@ -187,60 +109,29 @@ def main() -> int:
     parser = build_parser()
     args = parser.parse_args()
 
-    script_dir = Path(__file__).resolve().parent
-
-    # Resolve paths
     try:
-        spec_command_path = resolve_spec_command(script_dir)
-    except FileNotFoundError as e:
-        print(f"ERROR: {e}", file=sys.stderr)
-        return EXIT_FAILURE
-
-    try:
-        spawn_path = resolve_spawn_script(script_dir)
-    except FileNotFoundError as e:
-        print(f"ERROR: {e}", file=sys.stderr)
-        return EXIT_FAILURE
-
-    # Determine model tier
-    model = args.model if args.model else STAGE_MODEL_DEFAULTS[args.stage]
-
-    # Build agent prompt
-    prompt = build_agent_prompt(args.stage, args.spec, args.extra)
-
-    # Construct spawn.py subprocess command
-    cmd: list[str] = [
-        "uv", "run", str(spawn_path),
-        "--prompt", prompt,
-        "--system-prompt", str(spec_command_path),
-        "--model", model,
-        "--output-format", args.output_format,
-        "--max-depth", str(args.max_depth),
-    ]
-
-    if args.current_depth is not None:
-        cmd.extend(["--current-depth", str(args.current_depth)])
-
-    if args.cwd:
-        cmd.extend(["--cwd", args.cwd])
-
-    # Execute spawn.py, inheriting stdin/stdout/stderr
-    emit_event("L1", f"spec:{args.stage}", "STARTING")
-    try:
-        with Timer() as t:
-            result = subprocess.run(cmd, check=False)
+        exit_code, payload = asyncio.run(
+            run_spec_stage(
+                args.stage,
+                args.spec,
+                args.extra,
+                model=args.model,
+                max_depth=args.max_depth,
+                current_depth=args.current_depth,
+                cwd=args.cwd,
+                output_format_json=args.output_format == "json",
+            )
+        )
     except KeyboardInterrupt:
         print("Interrupted.", file=sys.stderr)
         emit_event("L1", f"spec:{args.stage}", "INTERRUPTED")
         return EXIT_INTERRUPTED
-    except Exception as e:
-        print(f"ERROR: Failed to execute spawn.py: {e}", file=sys.stderr)
-        emit_event("L1", f"spec:{args.stage}", "FAILED")
-        return EXIT_FAILURE
-
-    status = "COMPLETE" if result.returncode == EXIT_SUCCESS else f"FAILED:exit={result.returncode}"
-    emit_event("L1", f"spec:{args.stage}", status, elapsed_ms=t.elapsed_ms)
-    return result.returncode
+
+    if args.output_format == "json":
+        emit_manifest(payload)
+    else:
+        print(format_text_output(exit_code, payload))
+    return exit_code
 
 
 if __name__ == "__main__":
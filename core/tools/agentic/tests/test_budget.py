@@ -0,0 +1,140 @@
+"""Unit tests for lib/budget.py (machine-wide spawn budget)."""
+
+from __future__ import annotations
+
+import asyncio
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+# Ensure lib is importable
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import spawn
+from lib.budget import (
+    BUDGET_DIR_ENV_VAR,
+    BUDGET_ENV_VAR,
+    DEFAULT_TIER_LIMITS,
+    SpawnBudget,
+    budget_env,
+    parse_limits,
+)
+
+
+@pytest.fixture
+def budget(tmp_path):
+    return SpawnBudget(tmp_path, {"high-tier": 2, "*": 1}, wait_timeout=0.3)
+
+
+class TestParseLimits:
+    def test_overrides_defaults(self) -> None:
+        limits = parse_limits("high-tier=2, *=3")
+        assert limits["high-tier"] == 2
+        assert limits["*"] == 3
+        assert limits["low-tier"] == DEFAULT_TIER_LIMITS["low-tier"]
+
+    @pytest.mark.parametrize("spec", ["high-tier", "high-tier=0", "=3", "x=abc"])
+    def test_rejects_malformed(self, spec) -> None:
+        with pytest.raises(ValueError):
+            parse_limits(spec)
+
+    def test_from_env_off(self, monkeypatch) -> None:
+        monkeypatch.setenv(BUDGET_ENV_VAR, "off")
+        assert SpawnBudget.from_env() is None
+
+    def test_from_env_dir(self, monkeypatch, tmp_path) -> None:
+        monkeypatch.setenv(BUDGET_ENV_VAR, "medium-tier=3")
+        monkeypatch.setenv(BUDGET_DIR_ENV_VAR, str(tmp_path))
+        budget = SpawnBudget.from_env()
+        assert budget.budget_dir == tmp_path
+        assert budget.limit_for("medium-tier") == 3
+        assert budget_env() == {BUDGET_ENV_VAR: "medium-tier=3", BUDGET_DIR_ENV_VAR: str(tmp_path)}
+
+
+class TestSlots:
+    def test_limit_per_tier(self, budget) -> None:
+        first = budget.try_acquire("high-tier", 0)
+        second = budget.try_acquire("high-tier", 0)
+        assert first is not None and second is not None
+        assert budget.try_acquire("high-tier", 0) is None
+        assert budget.held("high-tier", 0) == 2
+        first.release()
+        assert budget.try_acquire("high-tier", 0) is not None
+
+    def test_unknown_tier_uses_default(self, budget) -> None:
+        assert budget.try_acquire("claude-raw-id", 0) is not None
+        assert budget.try_acquire("claude-raw-id", 0) is None
+
+    def test_depth_levels_independent(self, budget) -> None:
+        assert budget.try_acquire("low-tier", 1) is not None
+        assert budget.try_acquire("low-tier", 2) is not None
+
+    def test_acquire_waits_for_release(self, budget) -> None:
+        async def scenario():
+            held = budget.try_acquire("low-tier", 0)
+            asyncio.get_running_loop().call_later(0.1, held.release)
+            slot, waited = await budget.acquire("low-tier", 0)
+            slot.release()
+            return waited
+
+        assert asyncio.run(scenario()) >= 0.05
+
+    def test_acquire_times_out(self, budget) -> None:
+        budget.try_acquire("low-tier", 0)
+        with pytest.raises(RuntimeError, match="no low-tier slot"):
+            asyncio.run(budget.acquire("low-tier", 0))
+
+    def test_shared_across_processes(self, budget, tmp_path) -> None:
+        script = textwrap.dedent(f"""
+            import sys, time
+            sys.path.insert(0, {str(Path(__file__).resolve().parent.parent)!r})
+            from pathlib import Path
+            from lib.budget import SpawnBudget
+            slot = SpawnBudget(Path({str(tmp_path)!r}), {{"*": 1}}).try_acquire("low-tier", 0)
+            print("held" if slot else "busy", flush=True)
+            sys.stdin.readline()
+        """)
+        child = subprocess.Popen(
+            [sys.executable, "-c", script], stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True
+        )
+        try:
+            assert child.stdout.readline().strip() == "held"
+            assert budget.try_acquire("low-tier", 0) is None
+        finally:
+            child.communicate("\n", timeout=10)
+        # Lock is released when the holder exits
+        assert budget.try_acquire("low-tier", 0) is not None
+
+
+class _FakeResult:
+    def __init__(self, result: str):
+        self.is_error = False
+        self.result = result
+        self.structured_output = None
+
+
+class TestRunAgentBudget:
+    def test_slot_held_during_query(self, monkeypatch, tmp_path) -> None:
+        monkeypatch.setenv(BUDGET_ENV_VAR, "low-tier=1")
+        monkeypatch.setenv(BUDGET_DIR_ENV_VAR, str(tmp_path))
+        seen: dict = {}
+
+        async def fake_query(prompt, options):
+            seen["held"] = SpawnBudget(tmp_path).held("low-tier", 0)
+            seen["env"] = options["env"]
+            yield _FakeResult("ok")
+
+        monkeypatch.setattr(spawn, "load_sdk", lambda: (dict, _FakeResult, fake_query))
+        result = asyncio.run(spawn.run_agent(
+            "hi", spawn.resolve_model("low-tier"), None, None, False, None, 0, mutate_environ=False,
+        ))
+        assert result == ("ok", None, None)
+        assert seen["held"] == 1
+        assert seen["env"][BUDGET_DIR_ENV_VAR] == str(tmp_path)
+        assert SpawnBudget(tmp_path).held("low-tier", 0) == 0
+
+    def test_model_tier_reverse_map(self) -> None:
+        assert spawn.model_tier(spawn.resolve_model("high-tier")) == "high-tier"
+        assert spawn.model_tier("claude-custom") == "claude-custom"
@@ -0,0 +1,115 @@
+"""Unit tests for lib/checkpoint_log.py and campaign state on top of it."""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Ensure lib and campaign.py are importable
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import campaign
+from lib import checkpoint_log as checkpoint_log_module
+from lib.checkpoint_log import CheckpointLog
+from lib.timeline import checkpoint_states
+
+
+class TestCheckpointLog:
+    def test_deltas_carry_only_changes(self, tmp_path: Path) -> None:
+        log = CheckpointLog(tmp_path)
+        log.append({"state": "PLAN", "topic": "x", "round": "1"})
+        log.append({"state": "PLAN", "topic": "x", "round": "2"})
+        log.append({"state": "EXECUTE"}, unset=["round"])
+        assert log.append({"state": "EXECUTE"}) == 3  # Unchanged: no record
+
+        records = log.records()
+        assert [r["set"] for r in records] == [
+            {"state": "PLAN", "topic": "x", "round": "1"},
+            {"round": "2"},
+            {"state": "EXECUTE"},
+        ]
+        assert records[2]["unset"] == ["round"]
+        assert CheckpointLog(tmp_path).load() == {"state": "EXECUTE", "topic": "x"}
+
+    def test_snapshot_plus_tail(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(checkpoint_log_module, "SNAPSHOT_INTERVAL", 4)
+        log = CheckpointLog(tmp_path)
+        for n in range(10):
+            log.append({"n": n})
+        snapshot = json.loads((tmp_path / "snapshot.json").read_text())
+        assert snapshot["seq"] == 8
+        assert snapshot["document"] == {"n": 7}
+
+        # A reader starts from the snapshot offset, not the beginning
+        reader = CheckpointLog(tmp_path)
+        reader._read_snapshot()
+        reader._loaded = True
+        assert reader.offset == snapshot["offset"] > 0
+        assert reader.load() == {"n": 9}
+        assert reader.seq == 10
+
+    def test_torn_last_line_ignored(self, tmp_path: Path) -> None:
+        log = CheckpointLog(tmp_path)
+        log.append({"state": "PLAN"})
+        with open(tmp_path / "log.jsonl", "a") as f:
+            f.write('{"seq":2,"set":{"state":"EXE')
+        assert CheckpointLog(tmp_path).load() == {"state": "PLAN"}
+
+    def test_append_after_torn_write_resumes(self, tmp_path: Path) -> None:
+        log = CheckpointLog(tmp_path)
+        log.append({"state": "PLAN"})
+        log.append({"state": "EXECUTE"})
+        with open(tmp_path / "log.jsonl", "a") as f:
+            f.write('{"seq":3,"ts":"x","se')
+
+        assert CheckpointLog(tmp_path).append({"state": "EVALUATE"}) == 3
+        assert (tmp_path / "log.jsonl").read_bytes().endswith(b"\n")
+        assert [r["seq"] for r in CheckpointLog(tmp_path).records()] == [1, 2, 3]
+        assert CheckpointLog(tmp_path).load() == {"state": "EVALUATE"}
+
+    def test_large_values_stored_once_as_blobs(self, tmp_path: Path) -> None:
+        manifest = {"workers": [{"id": n, "summary": "x" * 100} for n in range(100)]}
+        log = CheckpointLog(tmp_path)
+        log.append({"checkpoint": {"state": "EXECUTE", "manifest": manifest}})
+        log.append({"checkpoint": {"state": "EVALUATE", "manifest": manifest}})
+
+        assert len(list((tmp_path / "blobs").iterdir())) == 1
+        assert (tmp_path / "log.jsonl").stat().st_size < 1000
+        checkpoint = log.load()["checkpoint"]
+        assert set(checkpoint["manifest"]) == {"$blob"}
+        assert log.resolve(checkpoint)["manifest"] == manifest
+
+
+class TestCampaignState:
+    def test_state_round_trip_and_mirror(self, tmp_path: Path) -> None:
+        campaign.write_state(tmp_path, {"state": "PLAN_RESEARCH", "topic": "x", "research_round": "2"})
+        campaign.write_state(tmp_path, {"state": "PLAN_CONSOLIDATE", "topic": "x"})
+        campaign.write_checkpoint(tmp_path, "PLAN_CONSOLIDATE", {"roadmap_path": "roadmap.md"})
+
+        # Fresh process view: rebuilt from the log alone
+        campaign._checkpoint_logs.clear()
+        assert campaign.read_state(tmp_path) == {"state": "PLAN_CONSOLIDATE", "topic": "x"}
+        assert "state: PLAN_CONSOLIDATE" in (tmp_path / ".campaign-state").read_text()
+        assert campaign.latest_checkpoint(tmp_path)["roadmap_path"] == "roadmap.md"
+        assert not list((tmp_path / "checkpoints").glob("cp-*.json"))
+
+    def test_legacy_state_file_still_read(self, tmp_path: Path) -> None:
+        (tmp_path / ".campaign-state").write_text("state: EXECUTE\ntopic: old\n")
+        assert campaign.read_state(tmp_path)["state"] == "EXECUTE"
+
+    def test_find_latest_unfinished_session(self, tmp_path: Path) -> None:
+        for name, state in [("20260301-0900-a", "EXECUTE"), ("20260301-1000-b", "EVALUATE"), ("20260301-1100-c", "COMPLETE")]:
+            (tmp_path / name).mkdir()
+            campaign.write_state(tmp_path / name, {"state": state, "topic": name})
+        (tmp_path / "20260301-1200-empty").mkdir()
+        assert campaign.find_latest_session(tmp_path) == tmp_path / "20260301-1000-b"
+
+    def test_state_timeline_from_log(self, tmp_path: Path) -> None:
+        campaign.write_state(tmp_path, {"state": "PLAN_RESEARCH", "topic": "x"})
+        campaign.write_state(tmp_path, {"state": "PLAN_RESEARCH", "topic": "x", "research_round": "2"})
+        campaign.write_state(tmp_path, {"state": "EXECUTE", "topic": "x"})
+        states = checkpoint_states(tmp_path / "checkpoints")
+        assert [s["state"] for s in states] == ["PLAN_RESEARCH", "EXECUTE"]
+        assert states[1]["end"] is None
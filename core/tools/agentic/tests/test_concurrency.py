@@ -0,0 +1,100 @@
+"""Unit tests for lib/concurrency.py (AIMD adaptive limiter)."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+# Ensure lib is importable
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from lib.concurrency import (
+    OUTCOME_FAILURE,
+    OUTCOME_OVERLOAD,
+    OUTCOME_SUCCESS,
+    AdaptiveLimiter,
+)
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+class TestAdaptiveLimiter:
+    def test_initial_clamped(self) -> None:
+        assert AdaptiveLimiter(10, 4).limit == 4
+        assert AdaptiveLimiter(0, 4).limit == 1
+
+    def test_additive_increase(self) -> None:
+        async def scenario():
+            limiter = AdaptiveLimiter(2, 3)
+            for _ in range(3):
+                limiter.release(await limiter.acquire(), OUTCOME_SUCCESS)
+            return limiter.limit
+
+        assert _run(scenario()) == 3
+
+    def test_multiplicative_decrease_once_per_epoch(self) -> None:
+        async def scenario():
+            limiter = AdaptiveLimiter(8, 8)
+            tokens = [await limiter.acquire() for _ in range(4)]
+            for token in tokens:
+                limiter.release(token, OUTCOME_OVERLOAD)
+            return limiter.limit
+
+        # Four overloads from the same epoch halve the limit once
+        assert _run(scenario()) == 4
+
+    def test_failure_is_neutral(self) -> None:
+        async def scenario():
+            limiter = AdaptiveLimiter(4, 8)
+            limiter.release(await limiter.acquire(), OUTCOME_FAILURE)
+            return limiter.limit
+
+        assert _run(scenario()) == 4
+
+    def test_fixed_mode_never_changes(self) -> None:
+        async def scenario():
+            limiter = AdaptiveLimiter(2, 2, adaptive=False)
+            limiter.release(await limiter.acquire(), OUTCOME_SUCCESS)
+            limiter.release(await limiter.acquire(), OUTCOME_OVERLOAD)
+            return limiter.limit
+
+        assert _run(scenario()) == 2
+
+    def test_queue_depth_and_wake(self) -> None:
+        events: list[tuple[str, int, int]] = []
+
+        async def scenario():
+            limiter = AdaptiveLimiter(1, 4, on_change=lambda lim, reason: events.append((reason, lim.limit, lim.queue_depth)))
+            first = await limiter.acquire()
+            waiter = asyncio.create_task(limiter.acquire())
+            await asyncio.sleep(0)
+            assert limiter.queue_depth == 1
+            limiter.release(first, OUTCOME_SUCCESS)
+            await waiter
+            return limiter
+
+        limiter = _run(scenario())
+        assert limiter.in_flight == 1
+        assert limiter.queue_depth == 0
+        assert events[0] == ("queued", 1, 1)
+        assert ("increase", 2, 0) in events
+
+    def test_cancelled_waiter_leaves_queue(self) -> None:
+        async def scenario():
+            limiter = AdaptiveLimiter(1, 1)
+            token = await limiter.acquire()
+            waiter = asyncio.create_task(limiter.acquire())
+            await asyncio.sleep(0)
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+            limiter.release(token, OUTCOME_SUCCESS)
+            return limiter
+
+        limiter = _run(scenario())
+        assert limiter.queue_depth == 0
+        assert limiter.in_flight == 0
@@ -0,0 +1,195 @@
+"""Unit tests for the L3 coordinator DAG scheduler."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Ensure lib is importable
+import sys
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import coordinator
+from coordinator import compute_critical_paths, execute_phases, load_latest_checkpoint
+from lib import EXIT_FAILURE, EXIT_PARTIAL_SUCCESS, EXIT_SUCCESS, EXIT_TIMEOUT
+
+
+class FakeOrchestrator:
+    """Stand-in for coordinator.run_orchestrator recording order and concurrency."""
+
+    def __init__(self, *, delay: float = 0.05, exit_codes: dict[str, int] | None = None):
+        self.delay = delay
+        self.exit_codes = exit_codes or {}
+        self.started: list[str] = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, orchestrator_path, modifier, target, max_depth, cwd, session_dir=None, timeout=None):
+        with self._lock:
+            self.started.append(target)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delay)
+            return self.exit_codes.get(target, EXIT_SUCCESS), {"orchestrator": "fake", "target": target}
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def _phase(name: str, depends_on: list[str] | None = None, timeout: int = 600) -> dict:
+    return {
+        "name": name,
+        "orchestrator": "orch.py",
+        "target": name,
+        "depends_on": depends_on or [],
+        "timeout": timeout,
+    }
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / "orch.py").write_text("")
+    return tmp_path
+
+
+def _use(monkeypatch, fake: FakeOrchestrator) -> FakeOrchestrator:
+    monkeypatch.setattr(coordinator, "run_orchestrator", fake)
+    return fake
+
+
+# A -> (B, C) -> D, plus an independent E
+DIAMOND = [
+    _phase("A"),
+    _phase("B", ["A"]),
+    _phase("C", ["A"], timeout=3600),
+    _phase("D", ["B", "C"]),
+    _phase("E"),
+]
+
+
+class TestCriticalPaths:
+    def test_longest_path_to_sink(self) -> None:
+        critical = compute_critical_paths(DIAMOND)
+        assert critical["D"] == 600
+        assert critical["C"] == 4200
+        assert critical["B"] == 1200
+        assert critical["A"] == 4800
+        assert critical["E"] == 600
+
+    def test_cycle_gets_own_cost(self) -> None:
+        critical = compute_critical_paths([_phase("X", ["Y"]), _phase("Y", ["X"])])
+        assert critical == {"X": 600, "Y": 600}
+
+
+class TestExecutePhases:
+    def test_independent_phases_run_concurrently(self, monkeypatch, project) -> None:
+        fake = _use(monkeypatch, FakeOrchestrator())
+        exit_code, results = execute_phases(DIAMOND, project, 5, None, None)
+        assert exit_code == EXIT_SUCCESS
+        assert fake.max_active >= 2
+        assert [r["name"] for r in results] == ["A", "B", "C", "D", "E"]
+        assert fake.started.index("D") > max(fake.started.index("B"), fake.started.index("C"))
+
+    def test_max_parallel_one_is_sequential(self, monkeypatch, project) -> None:
+        fake = _use(monkeypatch, FakeOrchestrator(delay=0.01))
+        execute_phases(DIAMOND, project, 5, None, None, max_parallel_phases=1)
+        assert fake.max_active == 1
+
+    def test_critical_path_first(self, monkeypatch, project) -> None:
+        fake = _use(monkeypatch, FakeOrchestrator(delay=0.01))
+        execute_phases(DIAMOND, project, 5, None, None, max_parallel_phases=1)
+        # A (4800) before E (600); C (4200) before B (1200)
+        assert fake.started == ["A", "C", "B", "D", "E"]
+
+    def test_failed_ancestor_skips_descendants(self, monkeypatch, project, tmp_path) -> None:
+        fake = _use(monkeypatch, FakeOrchestrator(exit_codes={"A": EXIT_FAILURE}))
+        exit_code, results = execute_phases(DIAMOND, project, 5, None, tmp_path)
+        by_name = {r["name"]: r for r in results}
+        assert exit_code == EXIT_PARTIAL_SUCCESS
+        assert fake.started.count("A") == 2  # initial + 1 retry
+        assert by_name["B"]["status"] == "skipped"
+        assert by_name["D"]["status"] == "skipped"
+        assert by_name["E"]["status"] == "success"
+        assert "D" not in fake.started
+        assert (tmp_path / ".signals" / "L3-A.fail").is_file()
+
+    def test_unknown_dependency_skipped(self, monkeypatch, project) -> None:
+        _use(monkeypatch, FakeOrchestrator(delay=0))
+        exit_code, results = execute_phases([_phase("A", ["ghost"])], project, 5, None, None)
+        assert exit_code == EXIT_FAILURE
+        assert results[0]["error"] == "unmet deps: ['ghost']"
+
+    def test_concurrent_phases_get_own_session_dirs(self, monkeypatch, project, tmp_path) -> None:
+        fake = FakeOrchestrator()
+
+        def oresearch(orchestrator_path, modifier, target, max_depth, cwd, session_dir=None, timeout=None):
+            # oresearch writes fixed paths under its --session-dir
+            (session_dir / "research").mkdir(parents=True, exist_ok=True)
+            findings = session_dir / "research" / "consolidated-findings.md"
+            findings.write_text(f"# {target}\n")
+            exit_code, _ = fake(orchestrator_path, modifier, target, max_depth, cwd, session_dir, timeout)
+            return exit_code, {"orchestrator": "oresearch", "consolidated": str(findings)}
+
+        monkeypatch.setattr(coordinator, "run_orchestrator", oresearch)
+        session = tmp_path / "session"
+        phases = [dict(_phase(name), modifier="full") for name in ("auth", "billing")]
+        exit_code, results = execute_phases(phases, project, 5, None, session)
+
+        assert exit_code == EXIT_SUCCESS
+        assert fake.max_active == 2
+        for result in results:
+            findings = Path(result["manifest"]["consolidated"])
+            assert findings == session / "phases" / result["name"] / "research" / "consolidated-findings.md"
+            assert findings.read_text() == f"# {result['name']}\n"
+        assert (session / ".signals" / "L3-auth.done").is_file()
+
+    def test_non_absorbable_stops_new_launches(self, monkeypatch, project) -> None:
+        fake = _use(monkeypatch, FakeOrchestrator(exit_codes={"A": EXIT_TIMEOUT}))
+        exit_code, results = execute_phases(DIAMOND, project, 5, None, None, max_parallel_phases=1)
+        assert exit_code == EXIT_TIMEOUT
+        assert fake.started == ["A"]
+        assert results == [{"name": "A", "status": "failed", "exit_code": EXIT_TIMEOUT}]
+
+
+class TestCheckpoints:
+    def test_records_in_flight_frontier(self, monkeypatch, project, tmp_path) -> None:
+        _use(monkeypatch, FakeOrchestrator(delay=0.01))
+        session = tmp_path / "session"
+        writes: list[dict] = []
+        real_write = coordinator.write_checkpoint
+
+        def spy(session_dir, completed, pending, depth_used, depth_max, in_flight=None):
+            writes.append({"completed": [c["name"] for c in completed], "pending": pending, "in_flight": in_flight})
+            return real_write(session_dir, completed, pending, depth_used, depth_max, in_flight)
+
+        monkeypatch.setattr(coordinator, "write_checkpoint", spy)
+        execute_phases(DIAMOND, project, 5, None, session)
+
+        assert writes[0]["in_flight"] == ["A", "E"]
+        assert "D" in writes[0]["pending"]
+        assert writes[-1]["in_flight"] == []
+        checkpoint = load_latest_checkpoint(session)
+        assert checkpoint["checkpoint_version"] == 2
+        assert checkpoint["pending_phases"] == []
+        assert {p["name"] for p in checkpoint["completed_phases"]} == {"A", "B", "C", "D", "E"}
+
+    def test_resume_skips_completed(self, monkeypatch, project) -> None:
+        fake = _use(monkeypatch, FakeOrchestrator(delay=0))
+        completed = [
+            {"name": "A", "status": "success", "exit_code": EXIT_SUCCESS},
+            {"name": "C", "status": "success", "exit_code": EXIT_SUCCESS},
+        ]
+        exit_code, results = execute_phases(DIAMOND, project, 5, None, None, resume_completed=completed)
+        assert exit_code == EXIT_SUCCESS
+        assert sorted(fake.started) == ["B", "D", "E"]
+        assert len(results) == 5
+
+    def test_load_latest_ignores_unknown_version(self, tmp_path) -> None:
+        (tmp_path / "checkpoints").mkdir()
+        (tmp_path / "checkpoints" / "cp-20260101T000000.json").write_text(json.dumps({"checkpoint_version": 99}))
+        assert load_latest_checkpoint(tmp_path) is None
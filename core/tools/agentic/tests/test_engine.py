@@ -0,0 +1,353 @@
+"""Unit tests for lib/engine.py (in-process L0-L2 orchestration)."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Ensure lib is importable
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import spawn
+from lib import (
+    DEPTH_ENV_VAR,
+    EXIT_DEPTH_EXCEEDED,
+    EXIT_FAILURE,
+    EXIT_PARTIAL_SUCCESS,
+    EXIT_SUCCESS,
+    EXIT_TIMEOUT,
+)
+from lib import engine
+from lib.observability import SPANS_FILE_ENV_VAR, read_spans
+from lib.engine import (
+    build_spec_prompt,
+    execute_workers,
+    format_text_output,
+    run_oresearch,
+    run_ospec,
+    run_spec_stage,
+    spawn_agent,
+)
+
+WORKERS = [
+    {"domain": "market", "model": "medium-tier"},
+    {"domain": "ux", "model": "medium-tier"},
+    {"domain": "tech", "model": "medium-tier"},
+]
+
+
+class FakeAgent:
+    """Stand-in for spawn.run_agent recording calls and concurrency."""
+
+    def __init__(self, *, fail_on: str | None = None, delay: float = 0.0, hang_on: str | None = None):
+        self.calls: list[dict] = []
+        self.fail_on = fail_on
+        self.hang_on = hang_on
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+
+    async def __call__(self, **kwargs):
+        self.calls.append(kwargs)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            if self.hang_on and self.hang_on in kwargs["prompt"]:
+                await asyncio.sleep(3600)
+            await asyncio.sleep(self.delay)
+            if self.fail_on and self.fail_on in kwargs["prompt"]:
+                return "", None, "boom"
+            return "done", {"result": "ok"}, None
+        finally:
+            self.active -= 1
+
+
+@pytest.fixture
+def agent(monkeypatch):
+    fake = FakeAgent()
+    monkeypatch.setattr(spawn, "run_agent", fake)
+    monkeypatch.delenv(DEPTH_ENV_VAR, raising=False)
+    return fake
+
+
+def _use(monkeypatch, fake: FakeAgent) -> FakeAgent:
+    monkeypatch.setattr(spawn, "run_agent", fake)
+    monkeypatch.delenv(DEPTH_ENV_VAR, raising=False)
+    return fake
+
+
+# -- L0 -----------------------------------------------------------------------
+
+
+class TestSpawnAgent:
+    def test_success_payload(self, agent, tmp_path):
+        exit_code, payload = asyncio.run(
+            spawn_agent("hi", model="low-tier", session_dir=tmp_path, signal_name="probe")
+        )
+        assert exit_code == EXIT_SUCCESS
+        assert payload["status"] == "success"
+        assert payload["model_id"] == spawn.resolve_model("low-tier")
+        assert payload["result"] == {"result": "ok"}
+        assert Path(payload["result_file"]).is_file()
+        assert (tmp_path / ".signals" / "L0-probe.success").is_file()
+
+    def test_never_mutates_environ(self, agent):
+        asyncio.run(spawn_agent("hi"))
+        assert agent.calls[0]["mutate_environ"] is False
+        assert DEPTH_ENV_VAR not in os.environ
+
+    def test_depth_exceeded_skips_agent(self, agent):
+        exit_code, payload = asyncio.run(spawn_agent("hi", max_depth=2, current_depth=2))
+        assert exit_code == EXIT_DEPTH_EXCEEDED
+        assert payload["status"] == "error"
+        assert agent.calls == []
+
+    def test_depth_from_env(self, agent, monkeypatch):
+        monkeypatch.setenv(DEPTH_ENV_VAR, "1")
+        asyncio.run(spawn_agent("hi"))
+        assert agent.calls[0]["current_depth"] == 1
+
+    def test_agent_error(self, monkeypatch, tmp_path):
+        _use(monkeypatch, FakeAgent(fail_on="hi"))
+        monkeypatch.setenv(SPANS_FILE_ENV_VAR, str(tmp_path / "spans.jsonl"))
+        monkeypatch.setenv("AGENTIC_TRACE_ID", "4bf92f3577b34da6")
+        exit_code, payload = asyncio.run(spawn_agent("hi"))
+        assert exit_code == EXIT_FAILURE
+        assert payload["error"] == "boom"
+        (span,) = read_spans(tmp_path / "spans.jsonl")
+        assert span["status"]["code"] == 2
+
+    def test_missing_system_prompt(self, agent, tmp_path):
+        exit_code, _ = asyncio.run(spawn_agent("hi", system_prompt_path=tmp_path / "nope.md"))
+        assert exit_code == EXIT_FAILURE
+        assert agent.calls == []
+
+
+class TestExecutors:
+    def test_spec_stage_prompt_and_model_default(self, agent):
+        exit_code, _ = asyncio.run(run_spec_stage("IMPLEMENT", "specs/001.md", ["focus"]))
+        assert exit_code == EXIT_SUCCESS
+        call = agent.calls[0]
+        assert call["prompt"] == build_spec_prompt("IMPLEMENT", "specs/001.md", ["focus"])
+        assert call["model_id"] == spawn.resolve_model("high-tier")
+        assert call["system_prompt"]
+
+    def test_text_output(self, agent):
+        exit_code, payload = asyncio.run(run_spec_stage("PLAN", "s.md", output_format_json=False))
+        text = format_text_output(exit_code, payload)
+        assert "SPAWN_STATUS=success" in text
+        assert "SPAWN_MODEL=medium-tier" in text
+
+    def test_text_output_depth_error(self):
+        text = format_text_output(EXIT_DEPTH_EXCEEDED, {"status": "error", "error": "x", "depth": 3, "model": "m"})
+        assert "SPAWN_ERROR=depth_limit_exceeded" in text
+
+
+# -- L2 -----------------------------------------------------------------------
+
+
+class TestRunOspec:
+    STAGES = [
+        {"name": "PLAN", "model": "medium-tier", "retry": 1, "required": True},
+        {"name": "IMPLEMENT", "model": "high-tier", "retry": 0, "required": True},
+    ]
+
+    def test_all_stages_pass(self, agent, tmp_path):
+        exit_code, manifest = asyncio.run(run_ospec(self.STAGES, "s.md", session_dir=tmp_path))
+        assert exit_code == EXIT_SUCCESS
+        assert manifest["orchestrator"] == "ospec"
+        assert [s["name"] for s in manifest["stages"]] == ["PLAN", "IMPLEMENT"]
+        assert (tmp_path / ".signals" / "L2-ospec.done").is_file()
+
+    def test_required_failure_stops_after_retries(self, monkeypatch, tmp_path):
+        fake = _use(monkeypatch, FakeAgent(fail_on="PLAN"))
+        exit_code, manifest = asyncio.run(run_ospec(self.STAGES, "s.md", session_dir=tmp_path))
+        assert exit_code == EXIT_FAILURE
+        assert len(fake.calls) == 2  # initial + 1 retry, IMPLEMENT never runs
+        assert (tmp_path / ".signals" / "L2-ospec-PLAN.fail").is_file()
+
+    def test_depth_exceeded_is_not_absorbed(self, agent, monkeypatch):
+        monkeypatch.setenv(DEPTH_ENV_VAR, "3")
+        exit_code, manifest = asyncio.run(run_ospec(self.STAGES, "s.md", max_depth=3))
+        assert exit_code == EXIT_DEPTH_EXCEEDED
+        assert manifest["summary"]["exit_code"] == EXIT_DEPTH_EXCEEDED
+        assert agent.calls == []
+
+
+class TestOresearch:
+    def _run_workers(self, tmp_path, **kwargs):
+        defaults = dict(
+            workers=WORKERS, topic="T", session_dir=tmp_path, max_depth=3,
+            timeout_per_worker=30, timeout_overall=60, refinement_context=None, cwd=None,
+        )
+        defaults.update(kwargs)
+        return asyncio.run(execute_workers(**defaults))
+
+    def test_workers_run_concurrently(self, monkeypatch, tmp_path):
+        fake = _use(monkeypatch, FakeAgent(delay=0.05))
+        exit_code, results = self._run_workers(tmp_path)
+        assert exit_code == EXIT_SUCCESS
+        assert fake.max_active == 3
+        assert [r["domain"] for r in results] == ["market", "ux", "tech"]
+
+    def test_max_concurrency_bound(self, monkeypatch, tmp_path):
+        fake = _use(monkeypatch, FakeAgent(delay=0.02))
+        self._run_workers(tmp_path, max_concurrency=1)
+        assert fake.max_active == 1
+
+    def test_adaptive_grows_on_success(self, monkeypatch, tmp_path, capsys):
+        fake = _use(monkeypatch, FakeAgent(delay=0.02))
+        exit_code, _ = self._run_workers(tmp_path, workers=WORKERS * 2, max_concurrency=1, adaptive=True)
+        assert exit_code == EXIT_SUCCESS
+        assert fake.max_active > 1
+        assert "CONCURRENCY:2" in capsys.readouterr().err
+
+    def test_adaptive_backs_off_on_rate_limit(self, monkeypatch, tmp_path, capsys):
+        async def rate_limited(**kwargs):
+            return "", None, "Error 429: rate limit exceeded"
+
+        monkeypatch.setattr(spawn, "run_agent", rate_limited)
+        monkeypatch.delenv(DEPTH_ENV_VAR, raising=False)
+        exit_code, _ = self._run_workers(tmp_path, max_concurrency=4, adaptive=True)
+        assert exit_code == EXIT_FAILURE
+        assert "CONCURRENCY:2" in capsys.readouterr().err
+
+    def test_partial_failure(self, monkeypatch, tmp_path):
+        _use(monkeypatch, FakeAgent(fail_on="domain: ux"))
+        exit_code, results = self._run_workers(tmp_path)
+        assert exit_code == EXIT_PARTIAL_SUCCESS
+        assert results[1]["error"] == "boom"
+        assert (tmp_path / ".signals" / "L2-worker-ux.fail").is_file()
+
+    def test_worker_timeout_cancels_session(self, monkeypatch, tmp_path):
+        fake = _use(monkeypatch, FakeAgent(hang_on="domain: tech"))
+        exit_code, results = self._run_workers(tmp_path, timeout_per_worker=0.1)
+        assert exit_code == EXIT_TIMEOUT
+        assert results[2]["error"] == "timeout"
+        assert fake.active == 0
+
+    def test_overall_timeout(self, monkeypatch, tmp_path):
+        _use(monkeypatch, FakeAgent(hang_on="domain: tech"))
+        exit_code, results = self._run_workers(tmp_path, timeout_overall=0.1)
+        assert exit_code == EXIT_TIMEOUT
+        assert results[2]["error"] == "overall timeout"
+        assert results[0]["status"] == "success"
+
+    def test_consolidation_manifest(self, agent, tmp_path):
+        prompt_path = engine.resolve_project_file(engine.CONSOLIDATOR_PROMPT_RELATIVE, engine._AGENTIC_DIR)
+        exit_code, manifest = asyncio.run(
+            run_oresearch(WORKERS[:2], "T", tmp_path, prompt_path, round_number=2)
+        )
+        assert exit_code == EXIT_SUCCESS
+        assert manifest["round"] == 2
+        assert manifest["consolidated"].endswith("consolidated-findings.md")
+        assert manifest["summary"]["passed"] == 2
+        assert len(agent.calls) == 3  # 2 workers + consolidator
+        assert (tmp_path / ".signals" / "L2-oresearch.done").is_file()
+
+
+class TestStreamingConsolidation:
+    @staticmethod
+    def _prompt_path():
+        return engine.resolve_project_file(engine.CONSOLIDATOR_PROMPT_RELATIVE, engine._AGENTIC_DIR)
+
+    def test_consolidates_before_slowest_worker(self, monkeypatch, tmp_path):
+        order: list[str] = []
+
+        async def staggered(**kwargs):
+            prompt = kwargs["prompt"]
+            if "domain: tech" in prompt:
+                await asyncio.sleep(0.2)
+            order.append("tech" if "domain: tech" in prompt else "consolidate" if "onsolidat" in prompt else "worker")
+            return "done", {"result": "ok"}, None
+
+        monkeypatch.setattr(spawn, "run_agent", staggered)
+        monkeypatch.delenv(DEPTH_ENV_VAR, raising=False)
+        exit_code, manifest = asyncio.run(
+            run_oresearch(WORKERS, "T", tmp_path, self._prompt_path(), streaming_consolidation=True)
+        )
+        assert exit_code == EXIT_SUCCESS
+        assert order.index("consolidate") < order.index("tech")
+        passes = manifest["consolidation_passes"]
+        assert len(passes) == 2
+        assert passes[-1]["findings"] == [str(tmp_path / "research" / "tech-findings.md")]
+        assert sum(len(p["findings"]) for p in passes) == 3
+        assert (tmp_path / ".signals" / "L2-consolidation.done").is_file()
+
+    def test_incremental_prompt_folds_into_existing(self, tmp_path):
+        output = tmp_path / "consolidated.md"
+        prompt = engine.build_consolidation_prompt("T", ["late.md"], output, existing=output)
+        assert f"existing consolidated document at {output}" in prompt
+        assert "late.md" in prompt
+
+    def test_failed_pass_falls_back_to_full(self, monkeypatch, tmp_path):
+        calls: list[str] = []
+
+        async def failing_fold(**kwargs):
+            calls.append(kwargs["prompt"])
+            if "domain: tech" in kwargs["prompt"]:
+                await asyncio.sleep(0.1)
+            if kwargs["prompt"].startswith("Fold"):
+                return "", None, "boom"
+            return "done", {"result": "ok"}, None
+
+        monkeypatch.setattr(spawn, "run_agent", failing_fold)
+        monkeypatch.delenv(DEPTH_ENV_VAR, raising=False)
+        exit_code, manifest = asyncio.run(
+            run_oresearch(WORKERS, "T", tmp_path, self._prompt_path(), streaming_consolidation=True)
+        )
+        assert exit_code == EXIT_SUCCESS
+        assert "consolidation_passes" not in manifest
+        full = [c for c in calls if c.startswith("Consolidate")]
+        assert all(f"{d}-findings.md" in full[-1] for d in ("market", "ux", "tech"))
+
+
+class TestHedgedWorkers:
+    def _run(self, tmp_path, **kwargs):
+        defaults = dict(
+            workers=WORKERS, topic="T", session_dir=tmp_path, max_depth=3,
+            timeout_per_worker=30, timeout_overall=60, refinement_context=None, cwd=None,
+            hedge_percentile=90,
+        )
+        defaults.update(kwargs)
+        return asyncio.run(execute_workers(**defaults))
+
+    def test_straggler_hedged_on_other_tier(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(engine, "HEDGE_POLL_INTERVAL", 0.01)
+        models: list[str] = []
+
+        async def straggler(**kwargs):
+            models.append(kwargs["model_id"])
+            if "domain: tech" in kwargs["prompt"] and kwargs["model_id"] == spawn.resolve_model("medium-tier"):
+                await asyncio.sleep(3600)
+            await asyncio.sleep(0.02)
+            return "done", {"result": "ok"}, None
+
+        monkeypatch.setattr(spawn, "run_agent", straggler)
+        monkeypatch.delenv(DEPTH_ENV_VAR, raising=False)
+        exit_code, results = self._run(tmp_path)
+        assert exit_code == EXIT_SUCCESS
+        tech = results[2]
+        assert tech["hedge"]["winner"] == "hedge"
+        assert tech["hedge"]["model"] == "high-tier"
+        assert tech["hedge"]["primary"] == {"status": "cancelled"}
+        assert tech["hedge"]["hedge"]["status"] == "success"
+        assert tech["artifact"].endswith("tech-findings.md")
+        assert spawn.resolve_model("high-tier") in models
+        assert (tmp_path / ".signals" / "L2-worker-tech.done").is_file()
+        assert "hedge" not in results[0]
+
+    def test_no_hedge_without_peer_data(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(engine, "HEDGE_POLL_INTERVAL", 0.01)
+        fake = _use(monkeypatch, FakeAgent(delay=0.02))
+        exit_code, results = self._run(tmp_path, workers=WORKERS[:2], max_concurrency=1)
+        assert exit_code == EXIT_SUCCESS
+        assert len(fake.calls) == 2  # fewer than HEDGE_MIN_PEERS finished peers
+        assert all("hedge" not in r for r in results)
+
+    def test_percentile_nearest_rank(self):
+        assert engine._percentile([1.0, 2.0, 3.0, 4.0], 50) == 2.0
+        assert engine._percentile([1.0, 2.0, 3.0, 4.0], 90) == 4.0
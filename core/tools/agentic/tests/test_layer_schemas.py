@@ -366,6 +366,15 @@ class TestValidateL2OresearchConfig:
         w = validate_l2_oresearch_config({"max_concurrency": 10})
         assert any("1-8" in x for x in w)
 
+    def test_adaptive_concurrency_keys(self) -> None:
+        assert validate_l2_oresearch_config(
+            {"adaptive_concurrency": True, "concurrency_ceiling": 16}
+        ) == []
+        w = validate_l2_oresearch_config({"concurrency_ceiling": 64})
+        assert any("1-32" in x for x in w)
+        w = validate_l2_oresearch_config({"adaptive_concurrency": "yes"})
+        assert any("adaptive_concurrency" in x for x in w)
+
     def test_duplicate_worker_domain(self) -> None:
         w = validate_l2_oresearch_config(
             {
@@ -440,6 +449,11 @@ class TestValidateL3Config:
         w = validate_l3_config({"future": 1})
         assert any("Unknown L3 key" in x for x in w)
 
+    def test_max_parallel_phases_range(self) -> None:
+        assert validate_l3_config({"max_parallel_phases": 4}) == []
+        w = validate_l3_config({"max_parallel_phases": 0})
+        assert any("L3.max_parallel_phases" in x for x in w)
+
     def test_dag_forward_reference(self) -> None:
         """depends_on referencing a phase not yet seen produces warning."""
         config = {
@@ -1,25 +1,45 @@
-"""Unit tests for lib/observability.py patterns P1-P7."""
+"""Unit tests for lib/observability.py patterns P1-P8."""
 
 from __future__ import annotations
 
+import asyncio
+import json
 import os
+import subprocess
 import sys
+import threading
 import time
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
+AGENTIC_DIR = str(Path(__file__).resolve().parent.parent)
+
 # Ensure lib is importable
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from lib import observability
 from lib.observability import (
+    EVENT_FORMAT_ENV_VAR,
+    LIVE_REPORT,
+    METRICS_DIR_ENV_VAR,
+    SPAN_ENV_VAR,
+    SPANS_FILE_ENV_VAR,
+    MetricsRegistry,
+    StreamSpool,
     Timer,
     build_child_env_with_trace,
     emit_event,
+    flush_telemetry,
     get_trace_id,
+    init_session,
+    order_live_report,
     propagate_trace_id,
+    read_spans,
     run_streaming,
+    run_streaming_manifest,
     signal_completion,
+    stream_process,
     write_consolidated_report,
     write_live_report,
 )
@@ -91,6 +111,119 @@ class TestRunStreaming:
         )
         assert exit_code == 42
 
+    def test_line_callbacks(self) -> None:
+        out_lines: list[str] = []
+        err_lines: list[str] = []
+        script = "import sys; print('a'); print('b'); print('oops', file=sys.stderr); sys.stdout.write('tail')"
+        exit_code, stdout = run_streaming(
+            ["python3", "-c", script],
+            timeout=10,
+            label="test",
+            on_stdout_line=out_lines.append,
+            on_stderr_line=err_lines.append,
+        )
+        assert exit_code == 0
+        assert stdout == "a\nb\ntail"
+        assert out_lines == ["a\n", "b\n", "tail"]
+        assert err_lines == ["oops\n"]
+
+    def test_large_stdout_spills_to_disk(self) -> None:
+        spool = StreamSpool(max_memory=16)
+        spool.write(b"x" * 10)
+        assert not spool.spilled
+        spool.write(b"y" * 10)
+        assert spool.spilled
+        assert spool.getvalue() == "x" * 10 + "y" * 10
+        spool.close()
+
+        exit_code, stdout = run_streaming(
+            ["python3", "-c", "print('z' * 200000)"],
+            timeout=10,
+            label="test",
+            spool_max_memory=4096,
+        )
+        assert exit_code == 0
+        assert len(stdout) == 200001
+
+    def test_parallel_calls_share_one_loop_thread(self) -> None:
+        results: list[tuple[int, str]] = []
+        callers = [
+            threading.Thread(target=lambda i=i: results.append(run_streaming(
+                ["python3", "-c", f"import time; time.sleep(0.3); print({i})"],
+                timeout=10,
+                label=f"w{i}",
+            )))
+            for i in range(4)
+        ]
+        for caller in callers:
+            caller.start()
+        time.sleep(0.15)
+        loop_threads = [t for t in threading.enumerate() if t.name == "run-streaming-loop"]
+        for caller in callers:
+            caller.join()
+        assert len(loop_threads) == 1
+        assert sorted(stdout.strip() for _, stdout in results) == ["0", "1", "2", "3"]
+
+    def test_stream_process_concurrent_on_one_loop(self) -> None:
+        async def scenario():
+            started = time.monotonic()
+            results = await asyncio.gather(*(
+                stream_process(["python3", "-c", "import time; time.sleep(0.5); print('ok')"], timeout=10, label="t")
+                for _ in range(3)
+            ))
+            return results, time.monotonic() - started
+
+        results, elapsed = asyncio.run(scenario())
+        assert results == [(0, "ok\n")] * 3
+        assert elapsed < 1.4
+
+    def test_stream_process_timeout_kills_child(self) -> None:
+        import subprocess
+        with pytest.raises(subprocess.TimeoutExpired):
+            asyncio.run(stream_process(["python3", "-c", "import time; time.sleep(10)"], timeout=0.5, label="t"))
+
+
+class TestManifestChannel:
+    @staticmethod
+    def _child(body: str) -> list[str]:
+        script = f"import sys; sys.path.insert(0, {AGENTIC_DIR!r}); from lib import emit_manifest; {body}"
+        return ["python3", "-c", script]
+
+    def test_manifest_separate_from_stdout(self, capsys: pytest.CaptureFixture[str]) -> None:
+        exit_code, manifest = run_streaming_manifest(
+            self._child("print('progress {'); emit_manifest({'ok': True}); print('done')"),
+            timeout=10,
+            label="child",
+        )
+        assert exit_code == 0
+        assert manifest == {"ok": True}
+        # Human output is forwarded, not parsed
+        assert "[child] progress {" in capsys.readouterr().err
+
+    def test_falls_back_to_stdout_json(self) -> None:
+        exit_code, manifest = run_streaming_manifest(
+            ["python3", "-c", "import json; print(json.dumps({'legacy': 1}))"],
+            timeout=10,
+            label="child",
+        )
+        assert exit_code == 0
+        assert manifest == {"legacy": 1}
+
+    def test_no_manifest(self) -> None:
+        _, manifest = run_streaming_manifest(["python3", "-c", "print('plain')"], timeout=10, label="child")
+        assert manifest is None
+
+    def test_deeper_process_ignores_channel(self, tmp_path: Path) -> None:
+        """An agent session's tools run one level deeper and must not clobber the file."""
+        env = {**os.environ, "AGENTIC_MANIFEST_FILE": str(tmp_path / "m.json"),
+               "AGENTIC_MANIFEST_DEPTH": "1", "AGENTIC_SPAWN_DEPTH": "2"}
+        exit_code, stdout = run_streaming(
+            self._child("emit_manifest({'nested': True})"), timeout=10, label="child", env=env,
+        )
+        assert exit_code == 0
+        assert '"nested": true' in stdout
+        assert not (tmp_path / "m.json").exists()
+
 
 # -- P3: Trace ID Propagation ------------------------------------------------
 
@@ -127,6 +260,64 @@ class TestTraceId:
         assert os.environ.get("AGENTIC_SPAWN_DEPTH") != "3"
 
 
+class TestSpans:
+    @pytest.fixture
+    def spans_file(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+        path = tmp_path / "spans.jsonl"
+        monkeypatch.setenv(SPANS_FILE_ENV_VAR, str(path))
+        monkeypatch.setenv("AGENTIC_TRACE_ID", "4bf92f3577b34da6")
+        monkeypatch.delenv(SPAN_ENV_VAR, raising=False)
+        return path
+
+    def test_nested_timers_form_a_tree(self, spans_file: Path) -> None:
+        with Timer("phase", layer="L3") as outer:
+            with Timer("ospec:plan", layer="L2", attributes={"agentic.tier": "low-tier"}) as inner:
+                pass
+            with Timer():  # unnamed: timing only
+                pass
+        spans = {span["name"]: span for span in read_spans(spans_file)}
+        assert set(spans) == {"phase", "ospec:plan"}
+        assert spans["ospec:plan"]["parentSpanId"] == outer.span_id == inner.parent_span_id
+        assert "parentSpanId" not in spans["phase"]
+        assert spans["phase"]["traceId"] == "0000000000000000" + "4bf92f3577b34da6"
+        assert int(spans["phase"]["endTimeUnixNano"]) >= int(spans["ospec:plan"]["endTimeUnixNano"])
+        attributes = {a["key"]: a["value"] for a in spans["ospec:plan"]["attributes"]}
+        assert attributes["agentic.tier"] == {"stringValue": "low-tier"}
+        assert attributes["agentic.layer"] == {"stringValue": "L2"}
+
+    def test_error_status(self, spans_file: Path) -> None:
+        with Timer("stage") as t:
+            t.attributes["exit_code"] = 21
+        with pytest.raises(ValueError):
+            with Timer("boom"):
+                raise ValueError("bad")
+        statuses = {span["name"]: span["status"] for span in read_spans(spans_file)}
+        assert statuses["stage"] == {"code": 2, "message": "exit code 21"}
+        assert statuses["boom"] == {"code": 2, "message": "ValueError: bad"}
+
+    def test_inherited_parent_span(self, spans_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv(SPAN_ENV_VAR, "00f067aa0ba902b7")
+        with Timer("child-root"):
+            pass
+        (span,) = read_spans(spans_file)
+        assert span["parentSpanId"] == "00f067aa0ba902b7"
+
+    def test_child_process_gets_current_span(self, spans_file: Path) -> None:
+        cmd = [sys.executable, "-c", f"import os; print(os.environ.get({SPAN_ENV_VAR!r}))"]
+        with Timer("campaign:coordinator", layer="L4") as t:
+            _, stdout = run_streaming(cmd, timeout=30, label="child")
+            env = build_child_env_with_trace(0)
+        assert stdout.strip() == t.span_id
+        assert env[SPAN_ENV_VAR] == t.span_id
+
+    def test_no_file_without_env(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv(SPANS_FILE_ENV_VAR, raising=False)
+        with Timer("quiet") as t:
+            pass
+        assert t.span_id is not None
+        assert list(tmp_path.iterdir()) == []
+
+
 # -- P2: Signal Completion ---------------------------------------------------
 
 
@@ -156,6 +347,18 @@ class TestEmitEvent:
         assert "@{" in captured.err  # JSON line
         assert "[test-stage] COMPLETE (1.5s) - ok" in captured.err
 
+    def test_json_only_format(self, capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv(EVENT_FORMAT_ENV_VAR, "json")
+        emit_event("L2", "test-stage", "COMPLETE", elapsed_ms=1500)
+        lines = capsys.readouterr().err.splitlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0][1:])["stage"] == "test-stage"
+
+    def test_human_only_format(self, capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv(EVENT_FORMAT_ENV_VAR, "human")
+        emit_event("L2", "test-stage", "STARTING")
+        assert capsys.readouterr().err == "[test-stage] STARTING\n"
+
 
 # -- P6: Live Report ---------------------------------------------------------
 
@@ -164,6 +367,7 @@ class TestWriteLiveReport:
     def test_appends_to_file(self, tmp_path: Path) -> None:
         write_live_report(tmp_path, "L2", "stage1", "STARTING")
         write_live_report(tmp_path, "L2", "stage1", "COMPLETE", elapsed_seconds=2.5)
+        flush_telemetry()
         content = (tmp_path / ".live-report").read_text()
         assert "STARTING" in content
         assert "COMPLETE" in content
@@ -173,6 +377,59 @@ class TestWriteLiveReport:
     def test_noop_when_none(self) -> None:
         write_live_report(None, "L2", "stage1", "STARTING")  # Should not raise
 
+    def test_buffered_until_flush(self, tmp_path: Path) -> None:
+        LIVE_REPORT.flush()
+        write_live_report(tmp_path, "L2", "stage1", "STARTING")
+        assert not (tmp_path / ".live-report").exists()
+        LIVE_REPORT.flush()
+        assert (tmp_path / ".live-report").read_text().count("\n") == 1
+
+    def test_flushes_when_buffer_full(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        LIVE_REPORT.flush()
+        monkeypatch.setattr(observability, "LIVE_REPORT_MAX_BUFFERED_LINES", 3)
+        for n in range(3):
+            write_live_report(tmp_path, "L2", f"stage{n}", "STARTING")
+        lines = (tmp_path / ".live-report").read_text().splitlines()
+        assert [line.split("] [")[2].split("]")[0] for line in lines] == ["stage0", "stage1", "stage2"]
+
+    def test_non_blocking_flush_keeps_batch_while_locked(self, tmp_path: Path) -> None:
+        LIVE_REPORT.flush()
+        write_live_report(tmp_path, "L2", "stage1", "STARTING")
+        with LIVE_REPORT._lock:
+            LIVE_REPORT.flush(blocking=False)
+        assert not (tmp_path / ".live-report").exists()
+        LIVE_REPORT.flush()
+        assert (tmp_path / ".live-report").read_text().count("\n") == 1
+
+    def test_background_flush(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(observability, "LIVE_REPORT_FLUSH_INTERVAL", 0.01)
+        write_live_report(tmp_path, "L3", "phase-a", "STARTING")
+        deadline = time.monotonic() + 5
+        while not (tmp_path / ".live-report").exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert "phase-a" in (tmp_path / ".live-report").read_text()
+
+    def test_flushed_at_exit(self, tmp_path: Path) -> None:
+        script = (
+            f"import sys; sys.path.insert(0, {AGENTIC_DIR!r})\n"
+            "from pathlib import Path\n"
+            "from lib.observability import write_live_report\n"
+            f"write_live_report(Path({str(tmp_path)!r}), 'L4', 'campaign', 'STARTING')\n"
+        )
+        subprocess.run([sys.executable, "-c", script], check=True, timeout=30)
+        assert "[L4] [campaign] STARTING" in (tmp_path / ".live-report").read_text()
+
+    def test_order_by_timestamp(self) -> None:
+        text = "\n".join([
+            "[09:00:01.500] [L2] [b] STARTING",
+            "[09:00:01.200] [L2] [a] STARTING",
+            "[09:00:01.200] [L2] [a2] STARTING",
+            "[23:59:59.900] [L3] [late] STARTING",
+            "[00:00:00.100] [L3] [after-midnight] COMPLETE",
+        ])
+        names = [line.split("] [")[2].split("]")[0] for line in order_live_report(text)]
+        assert names == ["a", "a2", "b", "late", "after-midnight"]
+
 
 # -- P7: Consolidated Report -------------------------------------------------
 
@@ -192,3 +449,82 @@ class TestWriteConsolidatedReport:
         assert "L2" in content
         assert "stage1" in content
         assert "Timeline" in content
+
+
+# -- P8: Metrics Registry ----------------------------------------------------
+
+
+def _series(snapshot: dict, kind: str, name: str) -> dict[tuple, dict]:
+    return {
+        tuple(sorted(entry["labels"].items())): entry
+        for entry in snapshot[kind]
+        if entry["name"] == name
+    }
+
+
+class TestMetricsRegistry:
+    def test_event_labels_and_counters(self) -> None:
+        registry = MetricsRegistry()
+        registry.record_event("L0", "spawn:high-tier", "STARTING")
+        registry.record_event("L2", "worker:security", "TIMEOUT", tier="low-tier")
+        registry.record_event("L2", "ospec:plan", "RETRY:1/2", tier="medium-tier")
+        registry.record_event("L2", "ospec:plan", "FAILED:exit=1", elapsed_ms=1200, tier="medium-tier")
+        snapshot = registry.snapshot()
+
+        spawns = _series(snapshot, "counters", "agentic_spawns_total")
+        assert list(spawns) == [(("layer", "L0"), ("stage", "spawn"), ("tier", "high-tier"))]
+        timeouts = _series(snapshot, "counters", "agentic_timeouts_total")
+        assert list(timeouts) == [(("layer", "L2"), ("stage", "worker"), ("tier", "low-tier"))]
+        assert len(_series(snapshot, "counters", "agentic_retries_total")) == 1
+
+        statuses = {dict(k)["status"] for k in _series(snapshot, "counters", "agentic_events_total")}
+        assert statuses == {"STARTING", "TIMEOUT", "RETRY", "FAILED"}
+
+    def test_histogram_buckets(self) -> None:
+        registry = MetricsRegistry(buckets=(1.0, 10.0))
+        for elapsed_ms in (200, 900, 4000, 60000):
+            registry.record_event("L3", "phase-1", "COMPLETE", elapsed_ms=elapsed_ms)
+        (entry,) = registry.snapshot()["histograms"]
+        assert entry["name"] == "agentic_stage_duration_seconds"
+        assert entry["counts"] == [2, 1, 1]
+        assert entry["count"] == 4
+        assert entry["sum"] == pytest.approx(65.1)
+
+    def test_flush_requires_metrics_dir(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        registry = MetricsRegistry()
+        monkeypatch.delenv(METRICS_DIR_ENV_VAR, raising=False)
+        registry.inc("agentic_events_total", {"layer": "L2"})
+        assert registry.flush(force=True) is None
+
+        monkeypatch.setenv(METRICS_DIR_ENV_VAR, str(tmp_path / ".metrics"))
+        path = registry.flush(force=True)
+        assert path is not None and path.parent == tmp_path / ".metrics"
+        assert json.loads(path.read_text())["counters"][0]["value"] == 1.0
+        # Nothing changed since: no rewrite
+        assert registry.flush(force=True) is None
+
+    def test_non_blocking_flush_skips_held_lock(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        # What the SIGTERM handler does when it interrupts emit_event mid-update
+        registry = MetricsRegistry()
+        monkeypatch.setenv(METRICS_DIR_ENV_VAR, str(tmp_path / ".metrics"))
+        registry.inc("agentic_events_total", {"layer": "L2"})
+        with registry._lock:
+            assert registry.flush(force=True, blocking=False) is None
+        assert registry.flush(force=True, blocking=False) is not None
+
+    def test_emit_event_persists_under_session(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        from lib import observability
+
+        registry = MetricsRegistry()
+        monkeypatch.setattr(observability, "METRICS", registry)
+        monkeypatch.delenv(METRICS_DIR_ENV_VAR, raising=False)
+        monkeypatch.delenv(SPANS_FILE_ENV_VAR, raising=False)
+        monkeypatch.delenv("AGENTIC_TRACE_ID", raising=False)
+        session_dir = init_session(tmp_path, "metrics")
+        assert os.environ[METRICS_DIR_ENV_VAR] == str(session_dir / ".metrics")
+
+        emit_event("L2", "ospec:plan", "COMPLETE", elapsed_ms=300, tier="medium-tier")
+        (snapshot_file,) = (session_dir / ".metrics").glob("metrics-*.json")
+        (entry,) = json.loads(snapshot_file.read_text())["histograms"]
+        assert entry["labels"]["stage"] == "ospec:plan"
+        assert entry["labels"]["tier"] == "medium-tier"
@@ -0,0 +1,160 @@
+"""Unit tests for lib/retention.py (session archiving, checkpoint pruning, disk budget)."""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+AGENTIC_DIR = Path(__file__).resolve().parent.parent
+
+# Ensure lib is importable
+sys.path.insert(0, str(AGENTIC_DIR))
+from lib import write_signal
+from lib.retention import (
+    apply_retention,
+    load_archive_index,
+    parse_size,
+    prune_checkpoints,
+    restore_session,
+    session_state,
+)
+
+OLD = time.time() - 7200
+
+
+def _age(path: Path, mtime: float = OLD) -> None:
+    for root, dirs, files in os.walk(path):
+        for name in [*dirs, *files]:
+            os.utime(os.path.join(root, name), (mtime, mtime))
+    os.utime(path, (mtime, mtime))
+
+
+def _campaign(base: Path, name: str, state: str, payload: int = 0) -> Path:
+    session_dir = base / name
+    (session_dir / "checkpoints").mkdir(parents=True)
+    (session_dir / ".campaign-state").write_text(f"state: {state}\nphase: 2\n")
+    (session_dir / ".trace").write_text("4bf92f3577b34da6\n")
+    (session_dir / "research").mkdir()
+    (session_dir / "research" / "notes.md").write_bytes(os.urandom(payload))
+    return session_dir
+
+
+class TestSessionState:
+    def test_campaign_state_decides(self, tmp_path: Path) -> None:
+        assert session_state(_campaign(tmp_path, "20260301-0900-a", "COMPLETE")) == "complete"
+        assert session_state(_campaign(tmp_path, "20260301-0900-b", "EXECUTE")) == "active"
+
+    def test_signal_sessions_need_idle_time(self, tmp_path: Path) -> None:
+        session_dir = tmp_path / "20260301-0900-swarm"
+        write_signal(session_dir, "L2", "worker-a", "done")
+        write_signal(session_dir, "L2", "worker-b", "fail")
+        assert session_state(session_dir) == "active"  # Just written
+        _age(session_dir)
+        assert session_state(session_dir) == "complete"
+
+        (session_dir / ".signals" / "L2-worker-c.running").write_text("")
+        _age(session_dir)
+        assert session_state(session_dir) == "active"
+
+    def test_no_signals_is_unknown(self, tmp_path: Path) -> None:
+        (tmp_path / "20260301-0900-empty").mkdir()
+        assert session_state(tmp_path / "20260301-0900-empty", min_idle=0) == "unknown"
+
+
+def test_prune_keeps_newest_checkpoints(tmp_path: Path) -> None:
+    session_dir = _campaign(tmp_path, "20260301-0900-a", "EXECUTE")
+    for n in range(7):
+        (session_dir / "checkpoints" / f"cp-20260301T09000{n}.json").write_text("{}")
+    pruned = prune_checkpoints(session_dir, keep=2)
+    assert len(pruned) == 5
+    remaining = sorted(p.name for p in (session_dir / "checkpoints").iterdir())
+    assert remaining == ["cp-20260301T090005.json", "cp-20260301T090006.json"]
+
+
+def test_archive_and_restore_round_trip(tmp_path: Path) -> None:
+    done = _campaign(tmp_path, "20260301-0900-done", "COMPLETE", payload=1000)
+    running = _campaign(tmp_path, "20260301-1000-running", "EXECUTE")
+    for n in range(3):
+        (running / "checkpoints" / f"cp-20260301T10000{n}.json").write_text("{}")
+
+    report = apply_retention(tmp_path, keep_checkpoints=1)
+    assert report["archived"] == ["20260301-0900-done"]
+    assert report["kept"] == ["20260301-1000-running"]
+    assert report["checkpoints_pruned"] == 2
+    assert not done.exists()
+    assert running.exists()
+
+    (entry,) = load_archive_index(tmp_path)["archives"]
+    assert entry["trace_id"] == "4bf92f3577b34da6"
+    assert entry["bytes"] >= 1000
+    assert (tmp_path / ".archive" / entry["archive"]).is_file()
+
+    restored = restore_session(tmp_path, "20260301-0900-done")
+    assert (restored / "research" / "notes.md").stat().st_size == 1000
+    assert load_archive_index(tmp_path)["archives"] == []
+
+
+def test_dry_run_changes_nothing(tmp_path: Path) -> None:
+    session_dir = _campaign(tmp_path, "20260301-0900-done", "COMPLETE")
+    for n in range(3):
+        (session_dir / "checkpoints" / f"cp-20260301T09000{n}.json").write_text("{}")
+    report = apply_retention(tmp_path, keep_checkpoints=1, dry_run=True)
+    assert report["archived"] == ["20260301-0900-done"]
+    assert report["checkpoints_pruned"] == 2
+    assert len(list((session_dir / "checkpoints").iterdir())) == 3
+    assert not (tmp_path / ".archive").exists()
+
+
+def test_dry_run_projects_archives_into_budget(tmp_path: Path) -> None:
+    for hour in ("07", "08", "09"):
+        _campaign(tmp_path, f"20260301-{hour}00-done", "COMPLETE", payload=20_000)
+    _campaign(tmp_path, "20260301-1000-running", "EXECUTE", payload=20_000)
+
+    dry = apply_retention(tmp_path, budget_bytes=45_000, dry_run=True)
+    assert not (tmp_path / ".archive").exists()
+    real = apply_retention(tmp_path, budget_bytes=45_000)
+    assert dry["evicted"] == real["evicted"] == ["20260301-0700-done", "20260301-0800-done"]
+    assert dry["over_budget"] == real["over_budget"] is False
+    assert dry["bytes_after"] == pytest.approx(real["bytes_after"], abs=1_000)
+
+
+def test_budget_evicts_oldest_archives_only(tmp_path: Path) -> None:
+    for hour in ("07", "08", "09"):
+        _campaign(tmp_path, f"20260301-{hour}00-done", "COMPLETE", payload=20_000)
+    running = _campaign(tmp_path, "20260301-1000-running", "EXECUTE", payload=20_000)
+
+    report = apply_retention(tmp_path, budget_bytes=45_000)
+    assert report["evicted"] == ["20260301-0700-done", "20260301-0800-done"]
+    assert not report["over_budget"]
+    assert [e["session"] for e in load_archive_index(tmp_path)["archives"]] == ["20260301-0900-done"]
+    assert running.exists()
+
+    # Running sessions alone exceed the budget: reported, never deleted
+    report = apply_retention(tmp_path, budget_bytes=1_000)
+    assert report["over_budget"]
+    assert running.exists()
+
+
+def test_parse_size() -> None:
+    assert parse_size("1048576") == 1048576
+    assert parse_size("500M") == 500 * 1024**2
+    assert parse_size("1.5g") == int(1.5 * 1024**3)
+    with pytest.raises(ValueError):
+        parse_size("lots")
+
+
+def test_cli_json_report(tmp_path: Path) -> None:
+    _campaign(tmp_path, "20260301-0900-done", "COMPLETE")
+    result = subprocess.run(
+        [sys.executable, str(AGENTIC_DIR / "session_retention.py"), str(tmp_path), "--json"],
+        capture_output=True, text=True, timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+    (report,) = json.loads(result.stdout)
+    assert report["archived"] == ["20260301-0900-done"]
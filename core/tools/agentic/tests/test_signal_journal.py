@@ -0,0 +1,125 @@
+"""Unit tests for lib/signal_journal.py (append-only signal journal)."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Ensure lib is importable
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from lib import write_signal
+from lib.observability import write_consolidated_report
+from lib.signal_journal import (
+    JOURNAL_FILENAME,
+    SIGNAL_FORMAT_ENV_VAR,
+    JournalReader,
+    append_signal,
+    compact,
+    journal_enabled,
+    read_journal,
+)
+
+
+@pytest.fixture
+def signals_dir(tmp_path):
+    return tmp_path / ".signals"
+
+
+class TestWriteSignal:
+    def test_default_format_is_files(self, tmp_path, monkeypatch) -> None:
+        monkeypatch.delenv(SIGNAL_FORMAT_ENV_VAR, raising=False)
+        path = write_signal(tmp_path, "L2", "stage", "success")
+        assert path.name == "L2-stage.success"
+        assert not (tmp_path / ".signals" / JOURNAL_FILENAME).exists()
+
+    def test_journal_format_appends(self, tmp_path, monkeypatch) -> None:
+        monkeypatch.setenv(SIGNAL_FORMAT_ENV_VAR, "journal")
+        path = write_signal(tmp_path, "L2", "stage", "success", artifact_path="/a.md", artifact_size=7)
+        write_signal(tmp_path, "L1", "worker", "failure")
+        assert path.name == JOURNAL_FILENAME
+        assert list((tmp_path / ".signals").iterdir()) == [path]
+        signals = read_journal(tmp_path / ".signals")
+        assert signals["L2-stage.success"]["size"] == 7
+        assert signals["L1-worker.failure"]["status"] == "failure"
+
+    def test_existing_journal_wins_without_env(self, signals_dir, monkeypatch) -> None:
+        monkeypatch.delenv(SIGNAL_FORMAT_ENV_VAR, raising=False)
+        append_signal(signals_dir, {"signal": "L0-x.success"})
+        assert journal_enabled(signals_dir)
+        write_signal(signals_dir.parent, "L0", "y", "success")
+        assert set(read_journal(signals_dir)) == {"L0-x.success", "L0-y.success"}
+
+
+class TestJournalReader:
+    def test_poll_returns_only_new_records(self, signals_dir) -> None:
+        reader = JournalReader(signals_dir)
+        assert reader.poll() == []
+        append_signal(signals_dir, {"signal": "a.done"})
+        append_signal(signals_dir, {"signal": "b.done"})
+        assert [r["signal"] for r in reader.poll()] == ["a.done", "b.done"]
+        append_signal(signals_dir, {"signal": "c.fail"})
+        assert [r["signal"] for r in reader.poll()] == ["c.fail"]
+        assert reader.poll() == []
+        assert set(reader.signals) == {"a.done", "b.done", "c.fail"}
+
+    def test_later_record_supersedes(self, signals_dir) -> None:
+        append_signal(signals_dir, {"signal": "a.done", "size": 1})
+        append_signal(signals_dir, {"signal": "a.done", "size": 2})
+        assert read_journal(signals_dir)["a.done"]["size"] == 2
+
+    def test_partial_line_left_for_next_poll(self, signals_dir) -> None:
+        signals_dir.mkdir()
+        journal = signals_dir / JOURNAL_FILENAME
+        journal.write_bytes(b'{"signal": "a.done"}\n{"signal": "b.')
+        reader = JournalReader(signals_dir)
+        assert [r["signal"] for r in reader.poll()] == ["a.done"]
+        with journal.open("ab") as f:
+            f.write(b'done"}\nnot json\n')
+        assert [r["signal"] for r in reader.poll()] == ["b.done"]
+
+    def test_rebuilds_after_compaction(self, signals_dir) -> None:
+        for size in range(3):
+            append_signal(signals_dir, {"signal": "a.done", "size": size})
+        append_signal(signals_dir, {"signal": "b.done"})
+        reader = JournalReader(signals_dir)
+        reader.poll()
+
+        assert compact(signals_dir) == 2
+        append_signal(signals_dir, {"signal": "c.done"})
+        reader.poll()
+        assert set(reader.signals) == {"a.done", "b.done", "c.done"}
+        assert reader.signals["a.done"]["size"] == 2
+        lines = (signals_dir / JOURNAL_FILENAME).read_text().splitlines()
+        assert "compacted" in json.loads(lines[0])
+        assert len(lines) == 4
+
+
+class TestConcurrentAppends:
+    def test_processes_never_interleave(self, signals_dir) -> None:
+        script = (
+            f"import sys; sys.path.insert(0, {str(Path(__file__).resolve().parent.parent)!r}); "
+            "from pathlib import Path; from lib.signal_journal import append_signal; "
+            f"[append_signal(Path({str(signals_dir)!r}), {{'signal': f'{{sys.argv[1]}}-{{i}}.done', 'pad': 'x' * 2000}}) "
+            "for i in range(50)]"
+        )
+        children = [subprocess.Popen([sys.executable, "-c", script, str(n)]) for n in range(4)]
+        for child in children:
+            assert child.wait(timeout=30) == 0
+        lines = (signals_dir / JOURNAL_FILENAME).read_text().splitlines()
+        assert len(lines) == 200
+        assert all(json.loads(line)["pad"] == "x" * 2000 for line in lines)
+
+
+def test_consolidated_report_reads_journal(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv(SIGNAL_FORMAT_ENV_VAR, "journal")
+    write_signal(tmp_path, "L2", "stage", "failure")
+    write_signal(tmp_path, "L2", "stage", "failure")
+    report = write_consolidated_report(tmp_path).read_text()
+    assert "| L2 | stage | failure |" in report
+    assert JOURNAL_FILENAME not in report
+    # The report compacts the finished session's journal
+    assert len((tmp_path / ".signals" / JOURNAL_FILENAME).read_text().splitlines()) == 2
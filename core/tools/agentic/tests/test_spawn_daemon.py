@@ -0,0 +1,243 @@
+"""Unit tests for the spawn daemon (lib/daemon.py client + spawn_daemon.py server)."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# Ensure lib is importable
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from lib.daemon import (
+    SOCKET_ENV_VAR,
+    VIA_DAEMON_ENV_VAR,
+    decode_message,
+    default_socket_path,
+    encode_message,
+    ping,
+    send_request,
+    via_daemon_requested,
+)
+from spawn import run_agent_via_daemon
+from spawn_daemon import SpawnDaemon, summarize_latencies
+
+
+@pytest.fixture
+def socket_path():
+    # AF_UNIX paths are limited to ~108 bytes; pytest's tmp_path can exceed that
+    with tempfile.TemporaryDirectory(prefix="spawnd-") as d:
+        yield Path(d) / "spawn.sock"
+
+
+async def _fake_runner(prompt, model_id, system_prompt, allowed_tools,
+                       output_format_json, cwd, current_depth, *,
+                       trace_id=None, parent_span_id=None, mutate_environ=True):
+    if prompt == "boom":
+        raise RuntimeError("sdk exploded")
+    if prompt == "cwd":
+        return cwd, None, None
+    if prompt == "slow":
+        await asyncio.sleep(0.2)
+    structured = {"depth": current_depth, "trace": trace_id, "mutate": mutate_environ}
+    if parent_span_id:
+        structured["parent_span"] = parent_span_id
+    return f"echo: {prompt}", structured, None
+
+
+def _params(prompt: str) -> dict:
+    return {
+        "prompt": prompt,
+        "model_id": "test-model",
+        "system_prompt": None,
+        "allowed_tools": None,
+        "output_format_json": True,
+        "cwd": None,
+        "current_depth": 1,
+    }
+
+
+def _with_daemon(socket_path: Path, client_fn, max_concurrency: int = 8):
+    """Run a daemon on a background task while client_fn runs in a worker thread."""
+
+    async def scenario():
+        daemon = SpawnDaemon(socket_path, runner=_fake_runner, max_concurrency=max_concurrency)
+        server = asyncio.create_task(daemon.serve(install_signal_handlers=False))
+        while not socket_path.exists():
+            await asyncio.sleep(0.01)
+        try:
+            return await asyncio.to_thread(client_fn)
+        finally:
+            daemon.stop()
+            await server
+
+    return asyncio.run(scenario())
+
+
+# -- Protocol -----------------------------------------------------------------
+
+
+class TestProtocol:
+    def test_roundtrip(self):
+        msg = {"op": "run_agent", "params": {"prompt": "hi\nthere"}}
+        encoded = encode_message(msg)
+        assert encoded.endswith(b"\n")
+        assert encoded.count(b"\n") == 1
+        assert decode_message(encoded) == msg
+
+    def test_decode_rejects_non_object(self):
+        with pytest.raises(ValueError):
+            decode_message(b"[1, 2]\n")
+
+    def test_socket_path_from_env(self, monkeypatch):
+        monkeypatch.setenv(SOCKET_ENV_VAR, "/tmp/custom.sock")
+        assert default_socket_path() == Path("/tmp/custom.sock")
+
+    def test_socket_path_default_is_per_user(self, monkeypatch):
+        monkeypatch.delenv(SOCKET_ENV_VAR, raising=False)
+        assert default_socket_path().name == f"agentic-spawn-{os.getuid()}.sock"
+
+    @pytest.mark.parametrize("value,expected", [("1", True), ("true", True), ("", False), ("0", False)])
+    def test_via_daemon_env(self, monkeypatch, value, expected):
+        monkeypatch.setenv(VIA_DAEMON_ENV_VAR, value)
+        assert via_daemon_requested() is expected
+
+
+class TestNoDaemon:
+    def test_send_request_missing_socket(self, socket_path):
+        assert send_request({"op": "ping"}, socket_path=socket_path) is None
+
+    def test_ping_stale_socket_file(self, socket_path):
+        socket_path.touch()
+        assert ping(socket_path) is None
+
+    def test_spawn_client_falls_back(self, socket_path):
+        assert run_agent_via_daemon(socket_path, _params("hi"), None) is None
+
+
+# -- Server -------------------------------------------------------------------
+
+
+class TestSpawnDaemon:
+    def test_ping(self, socket_path):
+        status = _with_daemon(socket_path, lambda: ping(socket_path), max_concurrency=3)
+        assert status["status"] == "ok"
+        assert status["pid"] == os.getpid()
+        assert status["max_concurrency"] == 3
+        assert status["active"] == 0
+
+    def test_socket_removed_on_stop(self, socket_path):
+        _with_daemon(socket_path, lambda: None)
+        assert not socket_path.exists()
+
+    def test_run_agent_roundtrip(self, socket_path):
+        response = _with_daemon(
+            socket_path,
+            lambda: send_request(
+                {"op": "run_agent", "params": _params("hi"), "trace_id": "abcd1234"},
+                socket_path=socket_path,
+            ),
+        )
+        assert response["status"] == "ok"
+        assert response["result_text"] == "echo: hi"
+        assert response["error"] is None
+        assert isinstance(response["elapsed_ms"], int)
+        # Daemon must never touch its own os.environ on behalf of a client
+        assert response["structured_output"] == {"depth": 1, "trace": "abcd1234", "mutate": False}
+
+    def test_run_agent_forwards_parent_span(self, socket_path):
+        response = _with_daemon(
+            socket_path,
+            lambda: send_request(
+                {"op": "run_agent", "params": _params("hi"), "trace_id": "t1", "parent_span_id": "00f067aa0ba902b7"},
+                socket_path=socket_path,
+            ),
+        )
+        assert response["structured_output"]["parent_span"] == "00f067aa0ba902b7"
+
+    def test_spawn_client_unpacks_result(self, socket_path):
+        result = _with_daemon(
+            socket_path, lambda: run_agent_via_daemon(socket_path, _params("hi"), "t1")
+        )
+        assert result == ("echo: hi", {"depth": 1, "trace": "t1", "mutate": False}, None)
+
+    def test_spawn_client_sends_absolute_cwd(self, socket_path, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "repo").mkdir()
+        unset = _with_daemon(socket_path, lambda: run_agent_via_daemon(socket_path, _params("cwd"), "t1"))
+        assert unset[0] == str(tmp_path)
+        relative = _with_daemon(
+            socket_path, lambda: run_agent_via_daemon(socket_path, {**_params("cwd"), "cwd": "repo"}, "t1")
+        )
+        assert relative[0] == str(tmp_path / "repo")
+
+    def test_runner_exception_reported(self, socket_path):
+        response = _with_daemon(
+            socket_path,
+            lambda: send_request({"op": "run_agent", "params": _params("boom")}, socket_path=socket_path),
+        )
+        assert response["status"] == "error"
+        assert "sdk exploded" in response["error"]
+
+    def test_spawn_client_raises_on_daemon_error(self, socket_path):
+        def client():
+            with pytest.raises(RuntimeError, match="sdk exploded"):
+                run_agent_via_daemon(socket_path, _params("boom"), None)
+
+        _with_daemon(socket_path, client)
+
+    def test_concurrent_sessions(self, socket_path):
+        from concurrent.futures import ThreadPoolExecutor
+
+        def client():
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                futures = [
+                    pool.submit(
+                        send_request,
+                        {"op": "run_agent", "params": _params("slow")},
+                        socket_path=socket_path,
+                    )
+                    for _ in range(4)
+                ]
+                responses = [f.result() for f in futures]
+            return responses, ping(socket_path)
+
+        responses, status = _with_daemon(socket_path, client)
+        assert all(r["status"] == "ok" for r in responses)
+        assert status["served"] == 4
+
+    def test_unknown_op(self, socket_path):
+        response = _with_daemon(socket_path, lambda: send_request({"op": "nope"}, socket_path=socket_path))
+        assert response["status"] == "error"
+        assert "unknown op" in response["error"]
+
+    def test_bad_params(self, socket_path):
+        response = _with_daemon(
+            socket_path, lambda: send_request({"op": "run_agent", "params": "x"}, socket_path=socket_path)
+        )
+        assert response["status"] == "error"
+
+    def test_shutdown_op(self, socket_path):
+        async def scenario():
+            daemon = SpawnDaemon(socket_path, runner=_fake_runner)
+            server = asyncio.create_task(daemon.serve(install_signal_handlers=False))
+            while not socket_path.exists():
+                await asyncio.sleep(0.01)
+            response = await asyncio.to_thread(send_request, {"op": "shutdown"}, socket_path=socket_path)
+            await asyncio.wait_for(server, timeout=5)
+            return response
+
+        assert asyncio.run(scenario())["stopping"] is True
+        assert not socket_path.exists()
+
+
+class TestSummarize:
+    def test_empty(self):
+        assert summarize_latencies([]) == {"runs": 0}
+
+    def test_stats(self):
+        stats = summarize_latencies([100, 200, 600])
+        assert stats == {"runs": 3, "mean_ms": 300, "median_ms": 200, "min_ms": 100, "max_ms": 600}
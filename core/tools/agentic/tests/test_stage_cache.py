@@ -0,0 +1,274 @@
+"""Unit tests for lib/stage_cache.py and cached ospec stages."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Ensure lib is importable
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import spawn
+from lib import DEPTH_ENV_VAR, EXIT_FAILURE, EXIT_SUCCESS
+from lib.engine import run_ospec
+from lib.stage_cache import StageCache, compute_stage_key, default_cache_dir, file_digest, repo_state
+
+REPO = ("/repo", "0" * 40)
+
+
+@pytest.fixture
+def inputs(tmp_path):
+    spec = tmp_path / "spec.md"
+    spec.write_text("# Spec\n")
+    prompt = tmp_path / "prompt.md"
+    prompt.write_text("system\n")
+    return spec, prompt
+
+
+def _git(path: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", "-c", "user.email=t@t", "-c", "user.name=t", *args], cwd=path, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+def _git_repo(path: Path) -> None:
+    _git(path, "init", "-q")
+    _git(path, "commit", "-q", "--allow-empty", "-m", "init")
+
+
+class TestComputeStageKey:
+    def test_stable(self, inputs) -> None:
+        spec, prompt = inputs
+        digest = file_digest(spec)
+        assert compute_stage_key("PLAN", digest, REPO, "m", prompt, []) == compute_stage_key("PLAN", digest, REPO, "m", prompt, [])
+
+    @pytest.mark.parametrize("field", ["stage", "model", "extra", "spec", "repo", "head", "prompt", "artifact"])
+    def test_each_input_changes_key(self, inputs, tmp_path, field) -> None:
+        spec, prompt = inputs
+        artifact = tmp_path / "a.txt"
+        artifact.write_text("one")
+        base = compute_stage_key("PLAN", file_digest(spec), REPO, "m", prompt, ["x"], [artifact])
+        args = dict(stage="PLAN", model_id="m", extra_args=["x"], repo=REPO)
+        if field == "stage":
+            args["stage"] = "RESEARCH"
+        elif field == "model":
+            args["model_id"] = "other"
+        elif field == "extra":
+            args["extra_args"] = ["y"]
+        elif field == "spec":
+            spec.write_text("# Changed\n")
+        elif field == "repo":
+            args["repo"] = ("/other-checkout", REPO[1])
+        elif field == "head":
+            args["repo"] = (REPO[0], "1" * 40)
+        elif field == "prompt":
+            prompt.write_text("changed\n")
+        else:
+            artifact.write_text("two")
+        key = compute_stage_key(
+            args["stage"], file_digest(spec), args["repo"], args["model_id"], prompt, args["extra_args"], [artifact]
+        )
+        assert key != base
+
+    @pytest.mark.parametrize("stage", ["IMPLEMENT", "FIX", "AMEND", "TEST"])
+    def test_tree_writing_stages_are_uncacheable(self, inputs, stage) -> None:
+        spec, prompt = inputs
+        assert compute_stage_key(stage, file_digest(spec), REPO, "m", prompt, []) is None
+
+    def test_missing_artifact_is_uncacheable(self, inputs, tmp_path) -> None:
+        spec, prompt = inputs
+        assert compute_stage_key("PLAN", file_digest(spec), REPO, "m", prompt, [], [tmp_path / "nope"]) is None
+
+    def test_repo_state(self, tmp_path) -> None:
+        assert repo_state(tmp_path) is None
+        _git_repo(tmp_path)
+        root, head = repo_state(tmp_path)
+        assert Path(root).resolve() == tmp_path.resolve()
+        assert len(head) == 40
+
+    def test_default_dir_env_override(self, monkeypatch, tmp_path) -> None:
+        monkeypatch.setenv("AGENTIC_STAGE_CACHE_DIR", str(tmp_path))
+        assert default_cache_dir() == tmp_path
+
+
+class TestStageCache:
+    def test_store_and_lookup(self, tmp_path) -> None:
+        cache = StageCache(tmp_path / "cache")
+        artifact = tmp_path / "result.txt"
+        artifact.write_text("output")
+        stored = cache.store("k1", {"name": "PLAN", "status": "success", "exit_code": 0}, str(artifact))
+        artifact.unlink()  # original result file is temporary
+        hit = cache.lookup("k1")
+        assert hit["name"] == "PLAN"
+        assert hit["artifact"] == stored["artifact"]
+        assert Path(hit["artifact"]).read_text() == "output"
+
+    def test_lookup_requires_post_stage_commit_in_history(self, tmp_path) -> None:
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        _git_repo(repo)
+        first = _git(repo, "rev-parse", "HEAD")
+        _git(repo, "commit", "-q", "--allow-empty", "-m", "stage")
+        second = _git(repo, "rev-parse", "HEAD")
+        cache = StageCache(tmp_path / "cache")
+        cache.store("k1", {"name": "PLAN"}, after=("spec", second))
+        assert cache.lookup("k1", (str(repo), second)) is not None
+        assert cache.lookup("k1", (str(repo), first)) is None
+
+    def test_miss(self, tmp_path) -> None:
+        assert StageCache(tmp_path).lookup("absent") is None
+
+    def test_lru_eviction(self, tmp_path) -> None:
+        cache = StageCache(tmp_path, max_bytes=1_000_000)
+        for stamp, key in enumerate(("old", "used", "new"), start=1_000_000):
+            artifact = tmp_path / f"{key}.src"
+            artifact.write_bytes(b"x" * 4000)
+            cache.store(key, {"name": key}, str(artifact))
+            for p in tmp_path.glob(f"{key}.*"):
+                os.utime(p, (stamp, stamp))
+        cache.lookup("old")  # most recently used now
+        cache.max_bytes = 10_000
+        assert cache.evict() == ["used"]
+        assert cache.lookup("old") is not None
+        assert cache.lookup("new") is not None
+
+    def test_store_enforces_bound(self, tmp_path) -> None:
+        cache = StageCache(tmp_path, max_bytes=100)
+        artifact = tmp_path / "big.src"
+        artifact.write_bytes(b"x" * 4000)
+        cache.store("big", {"name": "big"}, str(artifact))
+        assert cache.lookup("big") is None
+
+
+class _Calls(list):
+    """Stand-in for spawn.run_agent recording prompts."""
+
+    fail_on: str | None = None
+
+    async def __call__(self, **kwargs):
+        self.append(kwargs["prompt"])
+        if self.fail_on and self.fail_on in kwargs["prompt"]:
+            return "", None, "boom"
+        return "done", {"result": "ok"}, None
+
+
+class TestCachedOspec:
+    STAGES = [
+        {"name": "RESEARCH", "model": "medium-tier", "retry": 0, "required": True},
+        {"name": "PLAN", "model": "medium-tier", "retry": 0, "required": True},
+        {"name": "IMPLEMENT", "model": "high-tier", "retry": 0, "required": True},
+    ]
+
+    @pytest.fixture
+    def calls(self, monkeypatch):
+        calls = _Calls()
+        monkeypatch.setattr(spawn, "run_agent", calls)
+        monkeypatch.delenv(DEPTH_ENV_VAR, raising=False)
+        return calls
+
+    @pytest.fixture
+    def spec(self, tmp_path):
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        _git_repo(repo)
+        spec = repo / "spec.md"
+        spec.write_text("# Spec\n")
+        return spec
+
+    def test_rerun_after_late_failure_reuses_read_only_stages(self, calls, spec, tmp_path, capsys) -> None:
+        cache = StageCache(tmp_path / "cache")
+
+        calls.fail_on = "IMPLEMENT"
+        exit_code, _ = asyncio.run(run_ospec(self.STAGES, str(spec), cache=cache))
+        assert exit_code == EXIT_FAILURE
+        assert len(calls) == 3
+
+        calls.fail_on = None
+        exit_code, manifest = asyncio.run(run_ospec(self.STAGES, str(spec), cache=cache))
+        assert exit_code == EXIT_SUCCESS
+        assert len(calls) == 4  # only IMPLEMENT re-ran
+        assert [s.get("cached") for s in manifest["stages"]] == [True, True, None]
+        stderr = capsys.readouterr().err
+        assert "CACHE_HIT" in stderr and "CACHE_MISS" in stderr
+
+    def test_implement_never_replayed(self, calls, spec, tmp_path) -> None:
+        cache = StageCache(tmp_path / "cache")
+        asyncio.run(run_ospec(self.STAGES, str(spec), cache=cache))
+        asyncio.run(run_ospec(self.STAGES, str(spec), cache=cache))
+        assert sum("IMPLEMENT" in prompt for prompt in calls) == 2
+
+    def test_stage_after_implement_not_cached(self, calls, spec, tmp_path) -> None:
+        stages = [self.STAGES[2], {"name": "REVIEW", "model": "medium-tier", "retry": 0, "required": True}]
+        cache = StageCache(tmp_path / "cache")
+        asyncio.run(run_ospec(stages, str(spec), cache=cache))
+        asyncio.run(run_ospec(stages, str(spec), cache=cache))
+        assert len(calls) == 4
+
+    def _committing_agent(self, calls, spec, fail_on: str | None = None):
+        """Stages edit and commit the spec, as the real RESEARCH/PLAN/IMPLEMENT do."""
+
+        async def agent(**kwargs):
+            calls.append(kwargs["prompt"])
+            stage = next(s["name"] for s in self.STAGES if s["name"] in kwargs["prompt"])
+            spec.write_text(spec.read_text() + f"{stage} notes {len(calls)}\n")
+            _git(spec.parent, "commit", "-q", "-am", stage)
+            if stage == fail_on:
+                return "", None, "boom"
+            return "done", {"result": "ok"}, None
+
+        return agent
+
+    def test_retry_after_spec_committing_stages(self, calls, spec, tmp_path, monkeypatch) -> None:
+        """A retry from the tree a failed run left skips the stages it already committed."""
+        cache = StageCache(tmp_path / "cache")
+        _git(spec.parent, "add", "spec.md")
+        _git(spec.parent, "commit", "-q", "-m", "spec")
+        start = _git(spec.parent, "rev-parse", "HEAD")
+
+        monkeypatch.setattr(spawn, "run_agent", self._committing_agent(calls, spec, fail_on="IMPLEMENT"))
+        exit_code, _ = asyncio.run(run_ospec(self.STAGES, str(spec), cache=cache))
+        assert exit_code == EXIT_FAILURE
+        assert len(calls) == 3
+
+        monkeypatch.setattr(spawn, "run_agent", self._committing_agent(calls, spec))
+        exit_code, manifest = asyncio.run(run_ospec(self.STAGES, str(spec), cache=cache))
+        assert exit_code == EXIT_SUCCESS
+        assert [s.get("cached") for s in manifest["stages"]] == [True, True, None]
+        assert len(calls) == 4
+
+        # Later retries (after the re-run IMPLEMENT committed) still skip them
+        _, manifest = asyncio.run(run_ospec(self.STAGES, str(spec), cache=cache))
+        assert [s.get("cached") for s in manifest["stages"]] == [True, True, None]
+
+        # Back before the stages' commits: their spec edits are missing, so they re-run
+        _git(spec.parent, "reset", "-q", "--hard", start)
+        _, manifest = asyncio.run(run_ospec(self.STAGES, str(spec), cache=cache))
+        assert [s.get("cached") for s in manifest["stages"]] == [None, None, None]
+        assert "RESEARCH notes" in spec.read_text()
+
+    def test_head_change_invalidates(self, calls, spec, tmp_path) -> None:
+        cache = StageCache(tmp_path / "cache")
+        asyncio.run(run_ospec(self.STAGES[:2], str(spec), cache=cache))
+        subprocess.run(
+            ["git", "-c", "user.email=t@t", "-c", "user.name=t", "commit", "-q", "--allow-empty", "-m", "next"],
+            cwd=spec.parent, check=True,
+        )
+        asyncio.run(run_ospec(self.STAGES[:2], str(spec), cache=cache))
+        assert len(calls) == 4
+
+    def test_outside_git_repo_not_cached(self, calls, tmp_path) -> None:
+        spec = tmp_path / "spec.md"
+        spec.write_text("# Spec\n")
+        cache = StageCache(tmp_path / "cache")
+        asyncio.run(run_ospec(self.STAGES[:2], str(spec), cache=cache))
+        asyncio.run(run_ospec(self.STAGES[:2], str(spec), cache=cache))
+        assert len(calls) == 4
+
+    def test_no_cache_runs_everything(self, calls, spec) -> None:
+        asyncio.run(run_ospec(self.STAGES, str(spec)))
+        asyncio.run(run_ospec(self.STAGES, str(spec)))
+        assert len(calls) == 6
@@ -0,0 +1,173 @@
+"""Unit tests for lib/timeline.py (critical path and time breakdown)."""
+
+from __future__ import annotations
+
+import json
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+# Ensure lib is importable
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from lib import write_signal
+from lib.observability import ANALYSIS_FILENAME, write_consolidated_report
+from lib.timeline import (
+    SPANS_FILENAME,
+    analyze,
+    analyze_session,
+    build_timeline,
+    event_intervals,
+    link_parents,
+    parse_event_lines,
+)
+
+T0 = 1_770_000_000.0
+
+
+def _span(span_id: str, name: str, layer: str, start: float, end: float, parent: str | None = None, error: bool = False) -> dict:
+    span = {
+        "traceId": "0" * 16 + "4bf92f3577b34da6",
+        "spanId": span_id,
+        "name": name,
+        "startTimeUnixNano": str(int((T0 + start) * 1e9)),
+        "endTimeUnixNano": str(int((T0 + end) * 1e9)),
+        "attributes": [{"key": "agentic.layer", "value": {"stringValue": layer}}],
+        "status": {"code": 2, "message": "exit code 1"} if error else {},
+    }
+    if parent:
+        span["parentSpanId"] = parent
+    return span
+
+
+def _write_spans(session_dir: Path, spans: list[dict]) -> None:
+    with (session_dir / SPANS_FILENAME).open("w") as f:
+        for span in spans:
+            f.write(json.dumps({"resourceSpans": [{"scopeSpans": [{"spans": [span]}]}]}) + "\n")
+
+
+@pytest.fixture
+def campaign(tmp_path: Path) -> Path:
+    """L4 run with two parallel L3 phases; phase-b contains a long L2 stage."""
+    _write_spans(tmp_path, [
+        _span("root", "coordinator", "L4", 0, 100),
+        _span("a", "phase-a", "L3", 0, 60, "root"),
+        _span("b", "phase-b", "L3", 10, 90, "root"),
+        _span("s", "ospec:plan", "L2", 15, 85, "b"),
+    ])
+    return tmp_path
+
+
+class TestCriticalPath:
+    def test_follows_last_finisher(self, campaign: Path) -> None:
+        analysis = analyze_session(campaign)
+        path = [(s["name"], s["start"] - T0, s["end"] - T0) for s in analysis["critical_path"]]
+        assert path == [
+            ("phase-a", 0, 10),
+            ("phase-b", 10, 15),
+            ("ospec:plan", 15, 85),
+            ("phase-b", 85, 90),
+            ("coordinator", 90, 100),
+        ]
+        assert analysis["critical_path_seconds"] == pytest.approx(100)
+        assert analysis["critical_path_by_interval"][0]["name"] == "ospec:plan"
+
+    def test_self_and_wait_per_layer(self, campaign: Path) -> None:
+        layers = analyze_session(campaign)["layers"]
+        assert list(layers) == ["L4", "L3", "L2"]
+        assert layers["L4"]["wait_seconds"] == pytest.approx(90)
+        assert layers["L4"]["self_seconds"] == pytest.approx(10)
+        assert layers["L3"]["self_seconds"] == pytest.approx(60 + 10)
+        assert layers["L2"]["self_seconds"] == pytest.approx(70)
+
+
+class TestOverheads:
+    def test_retry_overhead_and_idle_gaps(self, tmp_path: Path) -> None:
+        _write_spans(tmp_path, [
+            _span("root", "coordinator", "L4", 0, 100),
+            _span("c1", "phase-c", "L3", 0, 10, "root", error=True),
+            _span("c2", "phase-c", "L3", 50, 60, "root"),
+        ])
+        analysis = analyze_session(tmp_path)
+        assert analysis["retries"] == [
+            {"name": "phase-c", "layer": "L3", "attempts": 2, "overhead_seconds": pytest.approx(10)}
+        ]
+        gaps = [(g["start"] - T0, g["end"] - T0) for g in analysis["idle_gaps"]]
+        assert sorted(gaps) == [(10, 50), (60, 100)]
+        assert analysis["idle_seconds"] == pytest.approx(80)
+
+
+class TestSources:
+    def test_event_lines_pair_and_backdate(self) -> None:
+        lines = [
+            '[coordinator] @{"layer":"L3","stage":"phase-a","status":"STARTING","ts":"2026-03-01T09:00:00Z"}',
+            "[phase-a] human readable noise",
+            '[coordinator] [orchestrator:ospec] @{"layer":"L2","stage":"ospec:plan","status":"COMPLETE",'
+            '"ts":"2026-03-01T09:00:50Z","elapsed_ms":40000}',
+            '@{"layer":"L3","stage":"phase-a","status":"FAILED:exit=1","ts":"2026-03-01T09:01:00Z"}',
+            "@{not json",
+        ]
+        intervals = {i["name"]: i for i in event_intervals(parse_event_lines(lines))}
+        assert intervals["phase-a"]["end"] - intervals["phase-a"]["start"] == 60
+        assert intervals["phase-a"]["status"] == "FAILED"
+        assert intervals["ospec:plan"]["end"] - intervals["ospec:plan"]["start"] == 40
+
+        timeline = {"intervals": list(intervals.values()), "signal_times": [], "states": []}
+        link_parents(timeline["intervals"])
+        assert intervals["ospec:plan"]["parent"] == intervals["phase-a"]["id"]
+        assert analyze(timeline)["layers"]["L3"]["wait_seconds"] == 40
+
+    def test_spans_win_over_signals(self, campaign: Path) -> None:
+        # The same stage seen via its signal: kept once, from the span
+        plan = json.loads((campaign / SPANS_FILENAME).read_text().splitlines()[3])
+        end = int(plan["resourceSpans"][0]["scopeSpans"][0]["spans"][0]["endTimeUnixNano"]) / 1e9
+        signals_dir = campaign / ".signals"
+        signals_dir.mkdir()
+        created = datetime.fromtimestamp(end, timezone.utc).isoformat()
+        (signals_dir / "L2-ospec-plan.done").write_text(
+            f"status: done\ncreated_at: {created}\nlayer: L2\nname: ospec-plan\nelapsed_seconds: 70.0\n"
+        )
+        timeline = build_timeline(campaign)
+        assert [i["source"] for i in timeline["intervals"]].count("signal") == 0
+        assert len(timeline["intervals"]) == 4
+
+    def test_parallel_sibling_spans_kept(self, tmp_path: Path) -> None:
+        _write_spans(tmp_path, [
+            _span("root", "coordinator", "L4", 0, 200),
+            _span("a", "worker", "L2", 0, 100, "root"),
+            _span("b", "worker", "L2", 5, 101, "other"),
+        ])
+        intervals = build_timeline(tmp_path)["intervals"]
+        assert sorted(i["id"] for i in intervals if i["name"] == "worker") == ["a", "b"]
+
+    def test_signal_elapsed_recorded(self, tmp_path: Path) -> None:
+        write_signal(tmp_path, "L2", "worker-a", "done", elapsed_seconds=12.5)
+        (interval,) = build_timeline(tmp_path)["intervals"]
+        assert interval["source"] == "signal"
+        assert interval["end"] - interval["start"] == pytest.approx(12.5)
+
+    def test_checkpoint_states(self, tmp_path: Path) -> None:
+        checkpoints = tmp_path / "checkpoints"
+        checkpoints.mkdir()
+        for n, (state, ts) in enumerate([("PLAN", "09:00:00"), ("EXECUTE", "09:05:00")]):
+            (checkpoints / f"cp-2026030{n}.json").write_text(
+                json.dumps({"state": state, "created_at": f"2026-03-01T{ts}+00:00"})
+            )
+        states = build_timeline(tmp_path)["states"]
+        assert [s["state"] for s in states] == ["PLAN", "EXECUTE"]
+        assert states[0]["end"] - states[0]["start"] == 300
+        assert states[1]["end"] is None
+
+
+def test_consolidated_report_includes_breakdown(campaign: Path) -> None:
+    report = write_consolidated_report(campaign).read_text()
+    assert "## Time Breakdown" in report
+    assert "| L2 | ospec:plan | 70.0 | 70% |" in report
+    analysis = json.loads((campaign / "reports" / ANALYSIS_FILENAME).read_text())
+    assert analysis["window"]["wall_seconds"] == pytest.approx(100)
+
+
+def test_report_without_timing_has_no_breakdown(tmp_path: Path) -> None:
+    assert "Time Breakdown" not in write_consolidated_report(tmp_path).read_text()
+    assert not (tmp_path / "reports" / ANALYSIS_FILENAME).exists()